@@ -16,10 +16,10 @@ from typing import Any, Dict, List, Optional, Tuple
 from apps.cli.legacy.core.google_sheets_client import GoogleSheetsClient, normalize_job_url # type: ignore
 from apps.cli.legacy.core.llm_router import LLMRouter # type: ignore
 from apps.cli.legacy.core.config import get_evaluation_config, get_learning_config # type: ignore
-from apps.cli.legacy.core.job_filters import passes_evaluation_prefilter # type: ignore
+from apps.cli.legacy.core.job_filters import evaluation_prefilter_many, passes_evaluation_prefilter # type: ignore
 from apps.cli.legacy.core.schemas import JobEvaluationSchema # type: ignore
 from apps.cli.legacy.core.learning_schemas import DecisionAudit # type: ignore
-from apps.cli.legacy.core.score_calibrator import apply_calibration, _load_patterns # type: ignore
+from apps.cli.legacy.core.score_calibrator import apply_calibration, load_calibration_model # type: ignore
 
 RESUME_AGENT_BASE_DIR = os.path.join("core_agents", "resume_agent", ".agent")
 TPM_OVERLAY_PATH = os.path.join(RESUME_AGENT_BASE_DIR, "overlays", "tpm_product.yaml")
@@ -310,7 +310,7 @@ class JobEvaluator:
             max_delta = int(learn_cfg.get("max_abs_delta", 15))
             pp = learn_cfg.get("patterns_path", "data/learned_patterns.yaml")
             ppath = pp if os.path.isabs(pp) else os.path.join(os.getcwd(), pp)
-            patterns = _load_patterns(ppath)
+            patterns = load_calibration_model(ppath)
             final_score, audit = apply_calibration(
                 base_score,
                 jd_text,
@@ -1224,6 +1224,18 @@ class JobEvaluator:
             score += 10
         return score
 
+    def _prompt_jd(self, job_link: str, jd_text: str) -> str:
+        """Boilerplate-stripped JD for LLM prompts (jd_normalizer.py); full JD when disabled or unavailable."""
+        if not getattr(self, "_compact_jd_prompts", True):
+            return jd_text
+        getter = getattr(self.sheets_client, "get_prompt_jd_for_url", None)
+        if getter is None:
+            return jd_text
+        try:
+            return (getter(job_link) or "").strip() or jd_text
+        except Exception:
+            return jd_text
+
     def _retry_single_job_eval_raw(
         self,
         job: Any,
@@ -1239,7 +1251,8 @@ class JobEvaluator:
             return "", "FAILED"
         company = job.get("Company") or ""
         location = job.get("Location") or ""
-        jd_prompt = _clip_jd_for_batch_prompt(jd_text, jd_cap) if jd_cap > 0 else jd_text
+        jd_prompt = self._prompt_jd(job_link, jd_text)
+        jd_prompt = _clip_jd_for_batch_prompt(jd_prompt, jd_cap) if jd_cap > 0 else jd_prompt
         sponsor_info = self.get_verified_sponsorship(company)
         priority = self.get_strategic_priority(location)
         overlap = self.count_skill_overlap(jd_text, profile_keywords)
@@ -1267,6 +1280,7 @@ class JobEvaluator:
         sheet_batch_size = eval_cfg.get("sheet_batch_size", SHEET_BATCH_SIZE_DEFAULT)
         batch_size = eval_cfg.get("batch_eval_size", BATCH_EVAL_SIZE_DEFAULT)
         jd_cap_batch = int(eval_cfg.get("batch_jd_max_chars", 0) or 0)
+        self._compact_jd_prompts = bool(eval_cfg.get("compact_jd_in_prompts", True))
         skip_llm_below = int(eval_cfg.get("skip_llm_if_fallback_below", 0) or 0)
         snippet_first_enabled = bool(eval_cfg.get("snippet_first_enabled", False))
         snippet_first_chars = int(eval_cfg.get("snippet_first_chars", 2200) or 2200)
@@ -1358,9 +1372,9 @@ class JobEvaluator:
 
         # --- 1. FAST FILTER ---
         new_to_eval = []
-        for job in to_eval:
+        prefilter = evaluation_prefilter_many(to_eval) if mode == "NEW" else [(True, "")] * len(to_eval)
+        for job, (passed, reject_reason) in zip(to_eval, prefilter):
             if mode == "NEW":
-                passed, reject_reason = self.passes_initial_filter(job)
                 if not passed:
                     print(f"  Filtered: {job.get('Role Title')} -> {reject_reason}")
                     target_ws = job.get("_worksheet") or worksheet
@@ -1446,7 +1460,7 @@ class JobEvaluator:
                 
                 overlap = self.count_skill_overlap(jd_text, profile_keywords)
                 nudge = f"\n[Pre-check: {overlap} skill overlap.]"
-                jd_for_prompt = _clip_jd_for_batch_prompt(jd_text, jd_cap_batch)
+                jd_for_prompt = _clip_jd_for_batch_prompt(self._prompt_jd(job_link, jd_text), jd_cap_batch)
                 if snippet_first_enabled and snippet_first_chars > 0 and len(jd_for_prompt) > snippet_first_chars:
                     jd_for_prompt = jd_for_prompt[:snippet_first_chars]
                     try:
@@ -1658,7 +1672,7 @@ class JobEvaluator:
                     max_delta = int(learn_cfg.get("max_abs_delta", 15))
                     pp = learn_cfg.get("patterns_path", "data/learned_patterns.yaml")
                     ppath = pp if os.path.isabs(pp) else os.path.join(os.getcwd(), pp)
-                    patterns = _load_patterns(ppath)
+                    patterns = load_calibration_model(ppath)
                     final_score, audit = apply_calibration(
                         base_score,
                         jd_text,
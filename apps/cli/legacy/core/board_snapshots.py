@@ -0,0 +1,106 @@
+"""
+Per-board posting snapshots for incremental ATS sync (ATS_Scraper: Greenhouse, Lever).
+
+Most postings on a board are unchanged from one run to the next and were already filtered / saved,
+so each sync compares the board's current postings (id -> version: Greenhouse updated_at, Lever a
+content hash) with the last snapshot and only emits new or changed ones. Every
+sourcing.ats_full_resync_days (default 7; 0 = incremental sync off) a board is emitted in full once,
+so postings lost downstream (failed save, cleared sheet) come back. ATS_Scraper commits a board's
+snapshot through sync_batch.defer_until_saved, i.e. only after its postings were saved.
+
+Path: sourcing.ats_snapshot_path or ATS_SNAPSHOT_DB.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+from apps.cli.legacy.core.config import get_sourcing_config
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+
+DEFAULT_DB_PATH = "data/ats_board_snapshots.db"
+DEFAULT_RESYNC_DAYS = 7.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    board TEXT NOT NULL,
+    posting_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (board, posting_id)
+);
+CREATE TABLE IF NOT EXISTS boards (
+    board TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL
+);
+"""
+
+
+def resolve_snapshot_db_path() -> str:
+    """Absolute path to the board snapshot database."""
+    return resolve_db_path("ATS_SNAPSHOT_DB", "ats_snapshot_path", DEFAULT_DB_PATH)
+
+
+class BoardSnapshotStore:
+    def __init__(self, db_path: str | None = None, resync_days: float = DEFAULT_RESYNC_DAYS):
+        self.db_path = db_path
+        self.resync_sec = max(0.0, float(resync_days)) * 86400.0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = open_wal_db(self.db_path or resolve_snapshot_db_path(), SCHEMA)
+        return self._conn
+
+    def diff(self, board: str, versions: dict[str, str]) -> tuple[set[str], bool]:
+        """
+        (ids to emit, full): ids that are new or whose version changed since the last commit, or every
+        id when the board has no snapshot yet / is due for its periodic full sync (full=True).
+        """
+        if self.resync_sec <= 0:
+            return set(versions), True
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT full_synced_at FROM boards WHERE board = ?", (board,)).fetchone()
+            if row is None or time.time() - row[0] >= self.resync_sec:
+                return set(versions), True
+            known = dict(conn.execute("SELECT posting_id, version FROM postings WHERE board = ?", (board,)))
+        return {pid for pid, version in versions.items() if known.get(pid) != version}, False
+
+    def commit(self, board: str, versions: dict[str, str], full: bool) -> None:
+        """Replace the board's snapshot with versions (postings that left the board are dropped)."""
+        if self.resync_sec <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM postings WHERE board = ?", (board,))
+            conn.executemany(
+                "INSERT INTO postings (board, posting_id, version) VALUES (?, ?, ?)",
+                [(board, pid, version) for pid, version in versions.items()],
+            )
+            conn.execute(
+                "INSERT INTO boards (board, synced_at, full_synced_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(board) DO UPDATE SET synced_at = excluded.synced_at,"
+                " full_synced_at = CASE WHEN ? THEN excluded.full_synced_at ELSE boards.full_synced_at END",
+                (board, now, now, int(full)),
+            )
+            conn.commit()
+
+
+_STORE: BoardSnapshotStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_board_snapshots() -> BoardSnapshotStore:
+    """Process-wide BoardSnapshotStore at the configured path / resync interval."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            cfg = get_sourcing_config()
+            _STORE = BoardSnapshotStore(
+                resync_days=float(cfg.get("ats_full_resync_days", DEFAULT_RESYNC_DAYS) or 0)
+            )
+        return _STORE
@@ -0,0 +1,258 @@
+"""
+Long-lived headless Chromium pool for deep JD fetches (SourcingAgent._fetch_jd_playwright).
+
+Launching Chromium for every URL whose static fetch missed dominated that path. BrowserPool starts
+one browser lazily on the first fetch and keeps `size` browser contexts, each with one reusable
+page; a page is closed and replaced after `page_max_uses` navigations so long runs do not
+accumulate renderer memory. Playwright objects are bound to the thread that created them, so the
+pool drives the async API on its own daemon thread / event loop and fetch() is a blocking,
+thread-safe call: up to `size` fetches from different worker threads run in parallel.
+
+Image, font and media requests are aborted. After DOMContentLoaded a fetch waits until one of the
+JD selectors holds text (instead of networkidle + a fixed 2s sleep), then picks the first selector
+in JD_SELECTORS order, like the static fetch. A browser that has disconnected (Chromium crashed or
+was OOM-killed mid-run) is dropped and relaunched on the next fetch. The browser is closed at
+process exit.
+
+Optional dependency: playwright (pip install playwright && playwright install chromium).
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Iterable
+
+from apps.cli.legacy.core.config import get_sourcing_config
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+    PlaywrightTimeoutError = TimeoutError  # type: ignore[assignment,misc]
+
+# Common ATS description containers (also used by the static fetch), most specific first.
+JD_SELECTORS = (
+    ".job-description", "#job-description", ".description",
+    ".posting-description", "#content", "main", "[data-automation-id='job-posting-description']",
+    ".jd-content", ".careers-job-description",
+)
+MIN_JD_CHARS = 100
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_PAGE_MAX_USES = 50
+DEFAULT_NAV_TIMEOUT_MS = 20000
+DEFAULT_SELECTOR_TIMEOUT_MS = 10000
+
+# True once one element of the selector list holds more than n characters of text.
+_HAS_JD_JS = "([sels, n]) => sels.some(s => { const e = document.querySelector(s); return !!e && (e.innerText || '').length > n; })"
+
+
+def playwright_available() -> bool:
+    return async_playwright is not None
+
+
+async def _block_assets(route: Any) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _Slot:
+    """One browser context with its reusable page."""
+
+    __slots__ = ("context", "page", "uses")
+
+    def __init__(self) -> None:
+        self.context: Any = None
+        self.page: Any = None
+        self.uses = 0
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        page_max_uses: int = DEFAULT_PAGE_MAX_USES,
+        nav_timeout_ms: int = DEFAULT_NAV_TIMEOUT_MS,
+        selector_timeout_ms: int = DEFAULT_SELECTOR_TIMEOUT_MS,
+    ):
+        self.size = max(1, int(size))
+        self.page_max_uses = max(1, int(page_max_uses))
+        self.nav_timeout_ms = int(nav_timeout_ms)
+        self.selector_timeout_ms = int(selector_timeout_ms)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # Owned by the pool thread.
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._browser_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Queue | None = None
+        self._all_slots: list[_Slot] = []
+        self.launches = 0
+
+    def fetch(self, url: str, selectors: Iterable[str] = JD_SELECTORS) -> tuple[str, str]:
+        """(text, selector) for the first selector holding more than MIN_JD_CHARS, else ("", "")."""
+        if async_playwright is None:
+            raise RuntimeError("playwright is not installed")
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, tuple(selectors)), loop).result()
+
+    async def _ensure_browser(self) -> None:
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is not None:
+                if self._browser.is_connected():
+                    return
+                await self._discard_browser()
+            pw = await async_playwright().start()
+            try:
+                self._browser = await pw.chromium.launch(headless=True)
+            except BaseException:
+                await pw.stop()
+                raise
+            self._playwright = pw
+            self.launches += 1
+            self._all_slots = [_Slot() for _ in range(self.size)]
+            self._slots = asyncio.Queue()
+            for slot in self._all_slots:
+                self._slots.put_nowait(slot)
+
+    async def _discard_browser(self) -> None:
+        """Drop a crashed browser with its contexts / pages so _ensure_browser relaunches."""
+        print("  ⚠ Playwright browser disconnected; relaunching.")
+        for slot in self._all_slots:
+            if slot.context is not None:
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+            slot.context = slot.page = None
+        self._all_slots = []
+        self._slots = None
+        self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def _page(self, slot: _Slot) -> Any:
+        if slot.context is None:
+            slot.context = await self._browser.new_context()
+            await slot.context.route("**/*", _block_assets)
+        if slot.page is not None and slot.uses >= self.page_max_uses:
+            await slot.page.close()
+            slot.page = None
+        if slot.page is None:
+            slot.page = await slot.context.new_page()
+            slot.uses = 0
+        slot.uses += 1
+        return slot.page
+
+    async def _fetch(self, url: str, selectors: tuple[str, ...]) -> tuple[str, str]:
+        await self._ensure_browser()
+        # Fetches in flight when the browser is replaced return their slot to the old queue.
+        slots = self._slots
+        assert slots is not None
+        slot = await slots.get()
+        try:
+            page = await self._page(slot)
+            await page.goto(url, wait_until="domcontentloaded", timeout=self.nav_timeout_ms)
+            try:
+                await page.wait_for_function(
+                    _HAS_JD_JS, arg=[list(selectors), MIN_JD_CHARS], timeout=self.selector_timeout_ms
+                )
+            except PlaywrightTimeoutError:
+                return "", ""
+            for selector in selectors:
+                element = await page.query_selector(selector)
+                if element:
+                    text = await element.inner_text()
+                    if len(text) > MIN_JD_CHARS:
+                        return text, selector
+            return "", ""
+        except BaseException:
+            # Navigation errors can leave the page mid-load; start the next fetch on a fresh one.
+            if slot.page is not None:
+                try:
+                    await slot.page.close()
+                except Exception:
+                    pass
+                slot.page = None
+            raise
+        finally:
+            slots.put_nowait(slot)
+
+    async def _shutdown(self) -> None:
+        for slot in self._all_slots:
+            if slot.context is not None:
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+        self._all_slots = []
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        """Close the browser and stop the pool thread; a later fetch starts a new browser."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=15)
+        except Exception:
+            pass
+        self._browser_lock = None
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+_POOL: BrowserPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide BrowserPool sized from sourcing.playwright_pool_size / playwright_page_max_uses."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            cfg = get_sourcing_config()
+            _POOL = BrowserPool(
+                size=int(cfg.get("playwright_pool_size", DEFAULT_POOL_SIZE) or 1),
+                page_max_uses=int(cfg.get("playwright_page_max_uses", DEFAULT_PAGE_MAX_USES) or 1),
+            )
+        return _POOL
+
+
+def close_browser_pool() -> None:
+    """Tear down the process-wide pool (atexit; tests)."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_browser_pool)
@@ -1,4 +1,10 @@
-"""Load pipeline config from config/pipeline.yaml (optional)."""
+"""
+Load pipeline config from config/pipeline.yaml (optional).
+
+The get_*_config() getters are called per job and per LLM call, so parsed files are memoized by
+path + mtime and handed out as read-only snapshots (FrozenDict / FrozenList). Editing the YAML takes
+effect on the next call; reload() drops every snapshot explicitly.
+"""
 import copy
 import os
 import yaml
@@ -18,6 +24,29 @@ _default = {
         },
         "max_workers": 4,
         "use_ai_filter": False,
+        # Max concurrent AI sniff / tag LLM calls in normalize_and_save (1 = serial).
+        "ai_max_in_flight": 4,
+        # Jobs per batched sniff + tag prompt; jobs missing from an answer are retried alone (<= 1: per-job prompts).
+        "ai_batch_size": 10,
+        # Content-addressed sniff / tag result cache (sourcing_ai_cache.py); 0 days = off.
+        "ai_cache_ttl_days": 7,
+        "ai_cache_path": "data/sourcing_ai_cache.db",
+        # Deep JD fetch browser pool (browser_pool.py): parallel contexts, navigations per page before recycling.
+        "playwright_pool_size": 2,
+        "playwright_page_max_uses": 50,
+        # Concurrent JD resolution in normalize_and_save: static fetch threads and max requests per host.
+        "jd_fetch_workers": 8,
+        "jd_fetch_per_host": 2,
+        # Conditional GET validators for board / feed polling (http_client.py); 0 days = always full fetch.
+        "http_validator_ttl_days": 7,
+        "http_validators_path": "data/http_validators.db",
+        # ATS board fan-out (scrapers/board_fanout.py): concurrent boards, request starts per second per provider.
+        "board_workers": 8,
+        "board_rate_limits": {"greenhouse": 5, "lever": 5, "ashby": 5, "smartrecruiters": 2, "recruitee": 5},
+        # Greenhouse / Lever boards only emit postings new or updated since the last sync; every N days
+        # a board is emitted in full (0 = always full).
+        "ats_full_resync_days": 7,
+        "ats_snapshot_path": "data/ats_board_snapshots.db",
         "jobspy_sites": ["linkedin", "indeed", "google", "zip_recruiter"],
         "ats_boards": {
             "greenhouse": ["canva", "discord", "figma"],
@@ -68,6 +97,8 @@ _default = {
         "limit": 300,
         # Cap JD chars per job in multi-job LLM calls (0 = no cap). Prevents truncation → NEEDS_REVIEW.
         "batch_jd_max_chars": 12000,
+        # Send the boilerplate-stripped JD variant (EEO / benefits / about-us removed) in eval prompts.
+        "compact_jd_in_prompts": True,
         # Optional token-saver: before LLM call, compute deterministic fallback score and skip
         # rows below this threshold (0 disables). Example: 70 means "don't spend LLM tokens < 70".
         "skip_llm_if_fallback_below": 0,
@@ -151,6 +182,28 @@ _default = {
         "worksheet_tab_date_fixed": None,
         # Same workbook: optional tab to paste JD URLs for tailoring (ensure_manual_jd_tailor_worksheet).
         "manual_jd_tailor_tab": "Manual_JD_Tailor",
+        # Dedupe URL sets (existing / applied / evaluated) come from one batched read of the Job Link,
+        # Status and Applied columns of every tab; re-read after this many seconds (0 = every call).
+        "url_snapshot_ttl_sec": 600,
+        # Local URL-status index (sheet_url_index.py): canonical URL -> tab/row/status/applied/score.
+        # Only the current tab and tabs whose grid changed are re-read; all tabs every full_resync_hours.
+        "url_index_enabled": True,
+        "url_index_path": "data/sheet_url_index.db",
+        "url_index_recent_days": 0,
+        "url_index_full_resync_hours": 168,
+        # Row-1 headers are cached per worksheet (column name -> index without API calls); missing
+        # evaluation / resume columns are added in one batch_update at connect. Re-read after this TTL.
+        "header_cache_ttl_sec": 900,
+        # sort_daily_jobs: "server" = Sort Key helper column + one sortRange request (rows are never
+        # cleared); "rewrite" = legacy download, sort, clear and re-upload of the whole tab.
+        "sort_mode": "server",
+        # Cell writes are coalesced per worksheet into one values batchUpdate (sheet_write_buffer.py);
+        # held up to this many seconds (0 = sent at the end of each update call, still one request).
+        "write_coalesce_sec": 0,
+        # Per-minute Sheets API quotas (sheet_quota.py token buckets; 0 = no pacing).
+        "quota_read_per_min": 60,
+        "quota_write_per_min": 60,
+        "quota_burst_sec": 10,
     },
     "local_store": {
         # SQLite outbox when Google Sheets append/update fails after retries (see sheet_outbox.py).
@@ -164,6 +217,9 @@ _default = {
         "ambiguous_default": "reject",
         "snippet_max_chars": 1200,
         "disambiguation_model": None,
+        "llm_batch_size": 20,
+        "llm_cache_ttl_days": 14,
+        "llm_cache_path": "data/title_fit_verdicts.db",
     },
     # Resume tailoring (TailorAgent, tailor_from_urls.py): profile folder under .agent/data/<profile>/
     "resume": {
@@ -174,12 +230,106 @@ _default = {
 }
 
 
-def load_pipeline_config():
-    """Load config from config/pipeline.yaml. Falls back to defaults if missing."""
+class FrozenDict(dict):
+    """Read-only dict returned by the config getters (copy.deepcopy() gives a mutable copy)."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config snapshots are read-only; copy.deepcopy() the value to modify it")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list counterpart of FrozenDict (isinstance(x, list) still holds)."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config snapshots are read-only; copy.deepcopy() the value to modify it")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+for _dumper in (yaml.Dumper, yaml.SafeDumper):
+    yaml.add_representer(FrozenDict, lambda d, v: d.represent_dict(v), Dumper=_dumper)
+    yaml.add_representer(FrozenList, lambda d, v: d.represent_list(v), Dumper=_dumper)
+
+
+def freeze(value):
+    """Recursively convert dicts / lists to FrozenDict / FrozenList."""
+    if isinstance(value, dict):
+        return value if isinstance(value, FrozenDict) else FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+# Parsed config snapshots keyed by absolute path, invalidated by (mtime_ns, size); see reload().
+_SNAPSHOTS = {}
+
+
+def _file_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached(name, path, build):
+    """Memoize build() for path until its mtime / size changes (missing file -> key None)."""
+    path = os.path.abspath(path)
+    key = _file_key(path)
+    hit = _SNAPSHOTS.get((name, path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = freeze(build(path if key is not None else None))
+    _SNAPSHOTS[(name, path)] = (key, value)
+    return value
+
+
+def reload():
+    """Drop every cached config snapshot; the next get_*_config() re-reads the YAML files."""
+    global _sourcing_merged
+    _SNAPSHOTS.clear()
+    _sourcing_merged = (None, None, None)
+
+
+def _pipeline_config_path():
     path = os.environ.get("PIPELINE_CONFIG")
     if not path:
         path = os.path.join(os.getcwd(), "config", "pipeline.yaml")
-    if not os.path.isfile(path):
+    return path
+
+
+def load_pipeline_config():
+    """
+    Load config from config/pipeline.yaml. Falls back to defaults if missing.
+    Parsed once per file version (path + mtime) and returned as a read-only snapshot.
+    """
+    return _cached("pipeline", _pipeline_config_path(), _parse_pipeline_config)
+
+
+def _parse_pipeline_config(path):
+    if path is None:
         return _default
     try:
         with open(path, "r") as f:
@@ -212,19 +362,26 @@ def load_pipeline_config():
         return _default
 
 
-def _merge_portal_seeds_into_sourcing(sourcing_dict):
-    """Extend ats_boards slugs from config/portal_seeds.yml (career-ops–style seed list)."""
-    if not isinstance(sourcing_dict, dict):
-        return sourcing_dict
-    path = os.path.join(os.getcwd(), "config", "portal_seeds.yml")
-    if not os.path.isfile(path):
-        return sourcing_dict
+def _load_portal_seeds(path):
+    if path is None:
+        return {}
     try:
         with open(path, "r", encoding="utf-8") as f:
             seeds = yaml.safe_load(f) or {}
     except Exception:
+        return {}
+    return seeds if isinstance(seeds, dict) else {}
+
+
+def _merge_portal_seeds_into_sourcing(sourcing_dict, seeds=None):
+    """Extend ats_boards slugs from config/portal_seeds.yml (career-ops–style seed list)."""
+    if not isinstance(sourcing_dict, dict):
+        return sourcing_dict
+    if seeds is None:
+        seeds = _cached("portal_seeds", os.path.join(os.getcwd(), "config", "portal_seeds.yml"), _load_portal_seeds)
+    if not seeds:
         return sourcing_dict
-    seed_ats = (seeds.get("ats_boards") or {}) if isinstance(seeds, dict) else {}
+    seed_ats = seeds.get("ats_boards") or {}
     ats = dict(sourcing_dict.get("ats_boards") or {})
     for key in ("greenhouse", "lever", "ashby"):
         base = [str(x).strip() for x in (ats.get(key) or []) if str(x).strip()]
@@ -242,9 +399,19 @@ def _merge_portal_seeds_into_sourcing(sourcing_dict):
     return out
 
 
+# Last merged sourcing snapshot, valid while both source snapshots are the same objects.
+_sourcing_merged = (None, None, None)
+
+
 def get_sourcing_config():
+    """sourcing block with portal_seeds.yml boards merged in; read-only, rebuilt only when either file changes."""
+    global _sourcing_merged
     base = load_pipeline_config().get("sourcing", _default["sourcing"])
-    merged = _merge_portal_seeds_into_sourcing(copy.deepcopy(base))
+    seeds = _cached("portal_seeds", os.path.join(os.getcwd(), "config", "portal_seeds.yml"), _load_portal_seeds)
+    cached_base, cached_seeds, merged = _sourcing_merged
+    if merged is None or cached_base is not base or cached_seeds is not seeds:
+        merged = freeze(_merge_portal_seeds_into_sourcing(base, seeds))
+        _sourcing_merged = (base, seeds, merged)
     return merged
 
 
@@ -0,0 +1,168 @@
+"""
+Compiled keyword matchers for job_filters.passes_sourcing_filter / passes_evaluation_prefilter.
+
+The rule functions used to build and search one r"\\b" + re.escape(kw) + r"\\b" pattern per keyword
+per job (inclusions, seniority, unrelated, forbidden locations, ...). CompiledJobFilters merges each
+keyword list into one alternation regex, compiled once per filters-config snapshot. Where a reject
+reason names the keyword ("Unrelated field (cdl)", "Location exclusion (india)"), the merged regex only
+answers "any hit?"; the reported keyword is then found by scanning the list in config order with
+precompiled per-keyword patterns, so reasons are identical to the per-keyword loops.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Pattern
+
+# Never matches (empty keyword lists).
+NO_MATCH = re.compile(r"(?!x)x")
+
+
+def word_pattern(kw: str) -> str:
+    return r"\b" + re.escape(kw) + r"\b"
+
+
+def any_of(parts: Iterable[str]) -> Pattern[str]:
+    parts = list(parts)
+    if not parts:
+        return NO_MATCH
+    return re.compile("|".join(f"(?:{p})" for p in parts))
+
+
+class OrderedMatcher:
+    """First keyword (in list order) whose pattern matches; merged regex as the fast negative path."""
+
+    def __init__(self, entries: list[tuple[Any, str]]):
+        self._entries = [(label, re.compile(p)) for label, p in entries]
+        self._any = any_of(p for _, p in entries)
+
+    def search(self, *texts: str) -> Any | None:
+        if not any(self._any.search(t) for t in texts):
+            return None
+        for label, pattern in self._entries:
+            if any(pattern.search(t) for t in texts):
+                return label
+        return None
+
+
+class CompiledJobFilters:
+    """Matchers for one resolved filter settings dict (job_filters._filter_settings())."""
+
+    def __init__(self, fs: dict[str, Any]):
+        inclusions = [str(x) for x in fs["inclusions"]]
+        self._inclusions = any_of(
+            [word_pattern(inc) for inc in inclusions if len(inc) <= 3]
+            + [re.escape(inc.lower()) for inc in inclusions if len(inc) > 3]
+        )
+
+        soft = {str(x).strip().lower() for x in fs["seniority_soft_exclusions"]}
+        strict = [str(k) for k in fs["seniority_exclusions"] if str(k).lower() not in soft]
+        self._senior_strict = any_of(word_pattern(k) for k in strict)
+        self._senior_soft = any_of(word_pattern(k) for k in soft)
+        self._soft_bypass = any_of(re.escape(str(b).lower()) for b in fs["seniority_soft_bypass_substrings"])
+
+        self._level = any_of(re.escape(str(kw)) for kw in fs["level_exclusions"])
+        self._clearance = any_of(re.escape(str(kw)) for kw in fs["clearance_keywords"])
+        self._allowed_locations = any_of(re.escape(str(loc)) for loc in fs["allowed_locations"])
+
+        forbidden = []
+        for exc in fs["forbidden_locations"]:
+            e = str(exc).strip().lower()
+            if e:
+                forbidden.append((exc, re.escape(e) if " " in e else word_pattern(e)))
+        self._forbidden = OrderedMatcher(forbidden)
+
+        self._unrelated_title = OrderedMatcher([(kw, word_pattern(str(kw))) for kw in fs["unrelated_keywords"]])
+
+        unrelated_text = []
+        for keyword in fs["unrelated_text_keywords"]:
+            kw = str(keyword or "").strip().lower()
+            if kw:
+                unrelated_text.append((keyword, re.escape(kw) if " " in kw else word_pattern(kw)))
+        self._unrelated_text = OrderedMatcher(unrelated_text)
+
+    def title_included(self, title_lower: str) -> bool:
+        return self._inclusions.search(title_lower) is not None
+
+    def is_senior(self, title_lower: str) -> bool:
+        if self._senior_strict.search(title_lower):
+            return True
+        return bool(self._senior_soft.search(title_lower)) and not self._soft_bypass.search(title_lower)
+
+    def has_level_exclusion(self, title_lower: str) -> bool:
+        return self._level.search(title_lower) is not None
+
+    def has_clearance(self, text: str) -> bool:
+        return bool(text) and self._clearance.search(text.lower()) is not None
+
+    def location_allowed(self, location_norm: str) -> bool:
+        return self._allowed_locations.search(location_norm) is not None
+
+    def forbidden_location(self, location_norm: str, title_lower: str) -> str | None:
+        return self._forbidden.search(location_norm, title_lower)
+
+    def unrelated_in_title(self, title_lower: str) -> str | None:
+        return self._unrelated_title.search(title_lower)
+
+    def unrelated_in_text(self, text: str) -> str | None:
+        text_lower = str(text or "").lower()
+        return self._unrelated_text.search(text_lower) if text_lower else None
+
+    def frame_reasons(self, title_lower, location_norm, desc_lower, non_us_markers: Iterable[str]):
+        """
+        Keyword-stage reject reason per row of pandas Series (object dtype, Python re semantics) in
+        passes_sourcing_filter order; "" for rows that pass these stages. Each stage only scans the
+        rows still pending after the previous ones.
+        """
+        reasons = title_lower.map(lambda _: "")
+        pending = title_lower.index
+
+        def col(series):
+            return series.loc[pending]
+
+        def has(series, pattern):
+            return col(series).str.contains(pattern, regex=True)
+
+        def both(a, b):
+            t = col(title_lower)
+            return t.str.contains(a, regex=False) & t.str.contains(b, regex=False)
+
+        def reject(hit, reason):
+            nonlocal pending
+            rows = hit.index[hit.to_numpy(dtype=bool)]
+            if len(rows):
+                reasons.loc[rows] = reason(rows) if callable(reason) else reason
+                pending = hit.index[~hit.to_numpy(dtype=bool)]
+
+        included = (
+            has(title_lower, self._inclusions)
+            | both("business", "analyst")
+            | both("product", "manager")
+            | both("product", "director")
+            | both("program", "director")
+        )
+        reject(~included, "Title match fail")
+        reject(has(title_lower, any_of(re.escape(m) for m in non_us_markers)), "Non-US marker in title")
+        reject(
+            has(title_lower, self._senior_strict)
+            | (has(title_lower, self._senior_soft) & ~has(title_lower, self._soft_bypass)),
+            "Seniority exclusion",
+        )
+        reject(has(title_lower, self._level), "Intern/level exclusion")
+        reject(~has(location_norm, self._allowed_locations), "Location region mismatch")
+        reject(
+            has(location_norm, self._forbidden._any) | has(title_lower, self._forbidden._any),
+            lambda rows: [
+                f"Location exclusion ({self.forbidden_location(loc, t)})"
+                for loc, t in zip(location_norm.loc[rows], title_lower.loc[rows])
+            ],
+        )
+        reject(has(title_lower + " " + desc_lower, self._clearance), "Requires security clearance")
+        reject(
+            has(title_lower, self._unrelated_title._any),
+            lambda rows: [f"Unrelated field ({self.unrelated_in_title(t)})" for t in title_lower.loc[rows]],
+        )
+        reject(
+            has(desc_lower, self._unrelated_text._any),
+            lambda rows: [f"Unrelated field text ({self.unrelated_in_text(d)})" for d in desc_lower.loc[rows]],
+        )
+        return reasons
@@ -1,9 +1,12 @@
+import atexit
 import json
 import logging
 import os
 import re
 import sys
 import time
+import weakref
+from collections import Counter
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 import gspread
@@ -13,8 +16,44 @@ from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime
 import pandas as pd
 from apps.cli.legacy.core.utils import cleanup_jd_cache
+from apps.cli.legacy.core.jd_normalizer import (
+    BoilerplateModel,
+    compact_cache_path,
+    compact_entries,
+    get_boilerplate_model,
+    source_key,
+)
+from apps.cli.legacy.core.jd_store import JDStore, get_jd_store
 from apps.cli.legacy.core.config import get_sheet_config, get_worksheet_tab_date
 from apps.cli.legacy.core import sheet_outbox
+from apps.cli.legacy.core.sheet_query import (
+    ROW_FETCH_MAX_RANGES,
+    column_letter,
+    header_positions,
+    matching_rows,
+    records_from_rows,
+    row_runs,
+)
+from apps.cli.legacy.core.sheet_schema import (
+    DAILY_TAB_COLUMNS,
+    EVALUATION_COLUMNS,
+    GRID_GROWTH_HEADROOM,
+    HEADER_CACHE_DEFAULT_TTL_SEC,
+    RESUME_COLUMNS,
+    SORT_KEY_COLUMN,
+    append_headers_requests,
+    column_positions,
+    missing_columns,
+)
+from apps.cli.legacy.core.sheet_quota import get_sheets_quota
+from apps.cli.legacy.core.sheet_sort import SORT_INPUT_COLUMNS, changed_sort_keys, sort_range_request
+from apps.cli.legacy.core.sheet_snapshot import (
+    DEFAULT_TTL_SEC as URL_SNAPSHOT_DEFAULT_TTL_SEC,
+    WorkbookUrlSnapshot,
+    fetch_workbook_url_snapshot,
+)
+from apps.cli.legacy.core.sheet_url_index import load_url_snapshot, sync_url_index
+from apps.cli.legacy.core.sheet_write_buffer import SheetWriteBuffer, payload_bytes, value_ranges
 from apps.cli.legacy.core.learning_schemas import (
     SHEET_COL_ACTION_LINK,
     SHEET_COL_BASE_LLM_SCORE,
@@ -29,7 +68,8 @@ from apps.cli.legacy.core.learning_schemas import (
     SHEET_COL_JD_VERIFIED,
 )
 
-# Local JD cache path (JDs used for evaluation only; not stored in Sheets)
+# Local JD cache path (JDs used for evaluation only; not stored in Sheets).
+# The indexed store keeps jd_cache.jdlog / jd_cache.jdidx beside it and imports this JSON once (jd_store.py).
 DEFAULT_JD_CACHE_PATH = os.path.join(os.getcwd(), "config", "jd_cache.json")
 
 # When append_rows (or pre-append reads) fail, jobs are written here for offline replay.
@@ -119,10 +159,29 @@ SORT_PRIORITY_MAP = {
 }
 
 
+# Clients with queued cell writes are flushed at interpreter exit (sheet.write_coalesce_sec > 0).
+_LIVE_CLIENTS: "weakref.WeakSet[GoogleSheetsClient]" = weakref.WeakSet()
+
+
+def _flush_live_clients() -> None:
+    for client in list(_LIVE_CLIENTS):
+        try:
+            client.flush_writes()
+        except Exception as e:
+            logger.warning("could not flush queued Sheets writes at exit: %s", e)
+
+
+atexit.register(_flush_live_clients)
+
+
 class SheetsReadError(RuntimeError):
     """Raised when Google Sheets reads fail after retries (e.g. persistent 429 quota)."""
 
 
+class SheetsWriteError(RuntimeError):
+    """Raised by flush_writes when queued cell writes fail after retries (the cells stay queued)."""
+
+
 def normalize_job_url(url):
     """
     Canonical form for duplicate detection: strip fragment, tracking params, trailing slash.
@@ -184,7 +243,12 @@ class GoogleSheetsClient:
         self._cached_existing_urls = None
         self._cached_applied_urls = None
         self._cached_evaluated_or_applied_urls = None
+        self._workbook_snapshot = None
         self._worksheet_header_row_cache = {}
+        self._sort_pending = True
+        self._write_buffer = SheetWriteBuffer()
+        self._quota = get_sheets_quota()
+        _LIVE_CLIENTS.add(self)
         self._last_sheets_call_end_monotonic = 0.0
 
         cfg_sheet = get_sheet_config()
@@ -194,11 +258,12 @@ class GoogleSheetsClient:
         if raw is None:
             raw = cfg_sheet.get("spreadsheet_id") or cfg_sheet.get("spreadsheet_url")
         self.spreadsheet_id = parse_spreadsheet_id(raw)
-        
-        # Run Janitor
-        removed, migrated = cleanup_jd_cache(self.jd_cache_path)
-        if removed > 0 or migrated > 0:
-            print(f"🧹 JD Cache Janitor: Removed {removed} old entries, migrated {migrated} to new format.")
+        self._url_snapshot_ttl_sec = float(cfg_sheet.get("url_snapshot_ttl_sec", URL_SNAPSHOT_DEFAULT_TTL_SEC) or 0)
+        self._url_index_enabled = bool(cfg_sheet.get("url_index_enabled", True))
+        self._write_coalesce_sec = float(cfg_sheet.get("write_coalesce_sec", 0) or 0)
+        self._header_cache_ttl_sec = float(cfg_sheet.get("header_cache_ttl_sec", HEADER_CACHE_DEFAULT_TTL_SEC) or 0)
+        # JD cache janitor (TTL eviction + compaction) runs on first JD store access.
+        self._jd_janitor_done = False
 
     @staticmethod
     def invalidate_sheet_url_caches(client: "GoogleSheetsClient") -> None:
@@ -206,6 +271,7 @@ class GoogleSheetsClient:
         client._cached_existing_urls = None
         client._cached_applied_urls = None
         client._cached_evaluated_or_applied_urls = None
+        client._workbook_snapshot = None
         client._worksheet_header_row_cache = {}
 
     def _manual_jd_tailor_tab_title(self) -> str:
@@ -261,7 +327,7 @@ class GoogleSheetsClient:
         Older Manual_JD_Tailor tabs had no Recommended Resume column.
         Appends a new column at the end with header 'Recommended Resume' when missing.
         """
-        row1 = self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_header_row") or []
+        row1 = self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_header_row", kind="read") or []
         labels = [str(x).strip().lower() for x in row1 if str(x).strip()]
         if "recommended resume" in labels:
             return
@@ -273,16 +339,16 @@ class GoogleSheetsClient:
         if new_col > ws.col_count:
             self._with_retries(
                 lambda: ws.resize(rows=max(ws.row_count, 100), cols=new_col),
-                op_name="manual_tailor_resize_cols",
+                op_name="manual_tailor_resize_cols", kind="write",
             )
         self._with_retries(
             lambda: ws.update_cell(1, new_col, "Recommended Resume"),
-            op_name="manual_tailor_add_header",
+            op_name="manual_tailor_add_header", kind="write",
         )
         a1 = rowcol_to_a1(1, new_col)
         self._with_retries(
             lambda: ws.format(a1, {"textFormat": {"bold": True}}),
-            op_name="manual_tailor_format_header",
+            op_name="manual_tailor_format_header", kind="write",
         )
         print(
             "[Manual_JD_Tailor] Added column 'Recommended Resume' at the end of row 1. "
@@ -295,7 +361,7 @@ class GoogleSheetsClient:
         Ensure a rightmost 'Resume (PDF)' column exists (output artifact path).
         Legacy tabs may still have 'Tailored YAML'; we append Resume (PDF) at the end if missing.
         """
-        row1 = self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_header_resume") or []
+        row1 = self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_header_resume", kind="read") or []
         labels = [str(x).strip() for x in row1 if str(x).strip()]
         low = [x.lower() for x in labels]
         if MANUAL_TAILOR_RESUME_COL.lower() in low:
@@ -306,16 +372,16 @@ class GoogleSheetsClient:
         if new_col > ws.col_count:
             self._with_retries(
                 lambda: ws.resize(rows=max(ws.row_count, 100), cols=new_col),
-                op_name="manual_tailor_resize_resume_col",
+                op_name="manual_tailor_resize_resume_col", kind="write",
             )
         self._with_retries(
             lambda: ws.update_cell(1, new_col, MANUAL_TAILOR_RESUME_COL),
-            op_name="manual_tailor_add_resume_col",
+            op_name="manual_tailor_add_resume_col", kind="write",
         )
         a1 = rowcol_to_a1(1, new_col)
         self._with_retries(
             lambda: ws.format(a1, {"textFormat": {"bold": True}}),
-            op_name="manual_tailor_format_resume_header",
+            op_name="manual_tailor_format_resume_header", kind="write",
         )
         print(
             f"[Manual_JD_Tailor] Added final column '{MANUAL_TAILOR_RESUME_COL}' for PDF path. "
@@ -339,11 +405,11 @@ class GoogleSheetsClient:
 
         def _fetch_grid(vro: ValueRenderOption | None) -> list[list]:
             if vro is None:
-                raw = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values")
+                raw = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values", kind="read")
             else:
                 raw = self._with_retries(
                     lambda v=vro: ws.get_all_values(value_render_option=v),
-                    op_name="manual_tailor_get_all_values",
+                    op_name="manual_tailor_get_all_values", kind="read",
                 )
             return _as_list_of_lists(raw)
 
@@ -377,11 +443,11 @@ class GoogleSheetsClient:
 
         def _fetch_grid(vro: ValueRenderOption | None) -> list[list]:
             if vro is None:
-                raw = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values")
+                raw = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values", kind="read")
             else:
                 raw = self._with_retries(
                     lambda v=vro: ws.get_all_values(value_render_option=v),
-                    op_name="manual_tailor_get_all_values",
+                    op_name="manual_tailor_get_all_values", kind="read",
                 )
             return _as_list_of_lists(raw)
 
@@ -414,22 +480,40 @@ class GoogleSheetsClient:
         if not self.client:
             self.connect()
         ws = self._open_workbook().worksheet(self._manual_jd_tailor_tab_title())
-        headers = [h.strip() for h in (self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_headers") or [])]
-        if not headers:
+        if not self._header_row(ws):
             return False
 
-        status_col = self._get_or_create_col_index(ws, "Status", headers)
-        link_col = self._get_or_create_col_index(ws, "Job Link", headers)
-        last_col = self._get_or_create_col_index(ws, "Last processed", headers)
-        err_col = self._get_or_create_col_index(ws, "Error", headers)
-        vv_col = self._get_or_create_col_index(ws, "Validation Verdict", headers)
-        vr_col = self._get_or_create_col_index(ws, "Validation Reason", headers)
-        ts_col = self._get_or_create_col_index(ws, "Tailored Score", headers)
-        gs_col = self._get_or_create_col_index(ws, "Generic Score", headers)
-        ur_col = self._get_or_create_col_index(ws, "Use Resume", headers)
-        resume_col = self._get_or_create_col_index(ws, MANUAL_TAILOR_RESUME_COL, headers)
-
-        values = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values") or []
+        cols = self.ensure_columns(
+            ws,
+            (
+                "Status",
+                "Job Link",
+                "Last processed",
+                "Error",
+                "Validation Verdict",
+                "Validation Reason",
+                "Tailored Score",
+                "Generic Score",
+                "Use Resume",
+                MANUAL_TAILOR_RESUME_COL,
+            ),
+        )
+        status_col = cols["Status"]
+        link_col = cols["Job Link"]
+        last_col = cols["Last processed"]
+        err_col = cols["Error"]
+        vv_col = cols["Validation Verdict"]
+        vr_col = cols["Validation Reason"]
+        ts_col = cols["Tailored Score"]
+        gs_col = cols["Generic Score"]
+        ur_col = cols["Use Resume"]
+        resume_col = cols[MANUAL_TAILOR_RESUME_COL]
+
+        self.flush_writes(ws, raise_errors=False)
+        values = (
+            self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values", kind="read")
+            or []
+        )
         if len(values) <= 1:
             return False
 
@@ -460,7 +544,7 @@ class GoogleSheetsClient:
             gspread.Cell(row_idx, ur_col, use_resume or ""),
             gspread.Cell(row_idx, resume_col, resume_path or ""),
         ]
-        self._with_retries(lambda: ws.update_cells(cells), op_name="manual_tailor_update_result")
+        self._write_cells(ws, cells, force_flush=True)
         return True
 
     def update_manual_jd_tailor_validation_only(
@@ -480,19 +564,34 @@ class GoogleSheetsClient:
         if not self.client:
             self.connect()
         ws = self._open_workbook().worksheet(self._manual_jd_tailor_tab_title())
-        headers = [h.strip() for h in (self._with_retries(lambda: ws.row_values(1), op_name="manual_tailor_headers_v") or [])]
-        if not headers:
+        if not self._header_row(ws):
             return False
 
-        link_col = self._get_or_create_col_index(ws, "Job Link", headers)
-        last_col = self._get_or_create_col_index(ws, "Last processed", headers)
-        vv_col = self._get_or_create_col_index(ws, "Validation Verdict", headers)
-        vr_col = self._get_or_create_col_index(ws, "Validation Reason", headers)
-        ts_col = self._get_or_create_col_index(ws, "Tailored Score", headers)
-        gs_col = self._get_or_create_col_index(ws, "Generic Score", headers)
-        ur_col = self._get_or_create_col_index(ws, "Use Resume", headers)
-
-        values = self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values_v") or []
+        cols = self.ensure_columns(
+            ws,
+            (
+                "Job Link",
+                "Last processed",
+                "Validation Verdict",
+                "Validation Reason",
+                "Tailored Score",
+                "Generic Score",
+                "Use Resume",
+            ),
+        )
+        link_col = cols["Job Link"]
+        last_col = cols["Last processed"]
+        vv_col = cols["Validation Verdict"]
+        vr_col = cols["Validation Reason"]
+        ts_col = cols["Tailored Score"]
+        gs_col = cols["Generic Score"]
+        ur_col = cols["Use Resume"]
+
+        self.flush_writes(ws, raise_errors=False)
+        values = (
+            self._with_retries(lambda: ws.get_all_values(), op_name="manual_tailor_get_all_values_v", kind="read")
+            or []
+        )
         if len(values) <= 1:
             return False
 
@@ -520,7 +619,7 @@ class GoogleSheetsClient:
             gspread.Cell(row_idx, gs_col, generic_score or ""),
             gspread.Cell(row_idx, ur_col, use_resume or ""),
         ]
-        self._with_retries(lambda: ws.update_cells(cells), op_name="manual_tailor_update_validation")
+        self._write_cells(ws, cells, force_flush=True)
         return True
 
     def _manual_tailor_column_indices(self, header_row: list) -> tuple[int, int]:
@@ -592,31 +691,72 @@ class GoogleSheetsClient:
             return self.client.open_by_key(self.spreadsheet_id)
         return self.client.open(self.sheet_name)
 
+    def _jd_store(self) -> JDStore:
+        """Process-lifetime indexed JD store for jd_cache_path (lazy; imports legacy JSON on first use)."""
+        store = get_jd_store(self.jd_cache_path)
+        if not getattr(self, "_jd_janitor_done", True):
+            self._jd_janitor_done = True
+            removed, migrated = cleanup_jd_cache(self.jd_cache_path)
+            if removed > 0 or migrated > 0:
+                print(f"🧹 JD Cache Janitor: Removed {removed} old entries, migrated {migrated} to new format.")
+        return store
+
     def _load_jd_cache(self):
-        """Load JD cache from file (canonical_url -> description)."""
-        if not os.path.isfile(self.jd_cache_path):
-            return {}
+        """Materialize the whole JD cache (canonical_url -> {"jd", "timestamp"}). Diagnostics only."""
         try:
-            with open(self.jd_cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self._jd_store().to_dict()
         except Exception:
             return {}
 
+    def _jd_compact_store(self) -> JDStore:
+        """Sibling store holding the boilerplate-stripped prompt variant of each JD (jd_normalizer.py)."""
+        return get_jd_store(compact_cache_path(self.jd_cache_path))
+
+    def _boilerplate_model(self) -> BoilerplateModel:
+        return get_boilerplate_model(self.jd_cache_path, seed_store=self._jd_store())
+
     def _save_jd_cache(self, cache):
-        os.makedirs(os.path.dirname(self.jd_cache_path) or ".", exist_ok=True)
-        with open(self.jd_cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache, f, ensure_ascii=False, indent=0)
+        """
+        Write-through upsert of canonical_url -> {"jd", "timestamp"[, "company"]} entries (only the
+        given URLs). The raw JD goes to the main store; its normalized, boilerplate-stripped variant
+        is derived once here and written to the compact store for prompt building.
+        """
+        model = self._boilerplate_model()  # seeded from entries cached before this batch
+        self._jd_store().put_many(cache)
+        try:
+            self._jd_compact_store().put_many(compact_entries(cache, model))
+        except Exception as e:
+            logger.warning("JD compaction failed; prompts fall back to the full JD: %s", e)
 
     def get_jd_for_url(self, url):
-        """Return full JD for evaluation. Not stored in Sheets; read from local cache."""
+        """Return full JD for evaluation. Not stored in Sheets; read from the indexed local JD store."""
         canonical = normalize_job_url(url or "")
         if not canonical:
             return ""
-        cache = self._load_jd_cache()
-        data = cache.get(canonical, "")
-        if isinstance(data, dict):
-            return data.get("jd", "")
-        return str(data) # Fallback for old format if somehow not migrated
+        return self._jd_store().get_jd(canonical)
+
+    def get_prompt_jd_for_url(self, url):
+        """
+        Return the boilerplate-stripped JD for LLM prompts (full JD when no compact variant can be made).
+        Entries cached before compaction existed are compacted on first read and stored.
+        """
+        canonical = normalize_job_url(url or "")
+        if not canonical:
+            return ""
+        compact_store = self._jd_compact_store()
+        compact = compact_store.get_jd(canonical)
+        if compact:
+            return compact
+        entry = self._jd_store().get(canonical)
+        if not entry or not entry.get("jd"):
+            return ""
+        try:
+            compact = self._boilerplate_model().compact(entry["jd"], source_key(None, canonical))
+            compact_store.put(canonical, compact, entry.get("timestamp"))
+        except Exception as e:
+            logger.warning("JD compaction failed for %s: %s", canonical, e)
+            return entry["jd"]
+        return compact
 
     def connect(self):
         """Authenticates with Google Sheets API and selects today's tab."""
@@ -696,10 +836,15 @@ class GoogleSheetsClient:
                 # Format headers
                 last_col_a1 = rowcol_to_a1(1, len(headers))
                 self.sheet.format(f"A1:{last_col_a1}", {'textFormat': {'bold': True}})
+                self._worksheet_header_row_cache[self._worksheet_cache_key(self.sheet)] = (list(headers), time.monotonic())
 
+            # One batch_update for any evaluation / resume columns missing on older tabs; later
+            # writes resolve column indices from the cached header row.
+            try:
+                self.ensure_columns(self.sheet, DAILY_TAB_COLUMNS)
+            except Exception as e:
+                logger.warning("could not ensure daily tab columns at connect: %s", e)
 
-
-                
         except FileNotFoundError:
             raise FileNotFoundError(f"Credentials file not found at {self.credentials_path}. Please place your Google Service Account JSON key here.")
 
@@ -709,63 +854,77 @@ class GoogleSheetsClient:
             self.connect()
         if self.sheet is None:
             raise RuntimeError("Worksheet unavailable after connect()")
+        self.flush_writes(self.sheet, raise_errors=False)
         return self.sheet.get_all_records()
 
+    def _url_caches_fresh(self) -> bool:
+        snap = getattr(self, "_workbook_snapshot", None)
+        return snap is None or snap.is_fresh(getattr(self, "_url_snapshot_ttl_sec", URL_SNAPSHOT_DEFAULT_TTL_SEC))
+
+    def _workbook_url_snapshot(self, use_cache: bool = True) -> WorkbookUrlSnapshot:
+        """
+        Dedupe URL sets shared by the three URL-set methods until sheet.url_snapshot_ttl_sec expires.
+        Served from the local URL-status index (sheet_url_index.py: only the current tab and changed
+        tabs are re-read); with sheet.url_index_enabled false, from one batched read of the Job Link /
+        Status / Applied columns of every tab (sheet_snapshot.py).
+        """
+        snap = getattr(self, "_workbook_snapshot", None)
+        if use_cache and snap is not None and self._url_caches_fresh():
+            return snap
+        self.flush_writes(raise_errors=False)
+        spreadsheet = self._open_workbook()
+        call = lambda fn, op_name: self._with_retries(fn, op_name=op_name, kind="read")  # noqa: E731
+        snap = None
+        if getattr(self, "_url_index_enabled", False):
+            try:
+                current_tab = getattr(getattr(self, "sheet", None), "title", None) or get_worksheet_tab_date()
+                stats = sync_url_index(spreadsheet, current_tab, normalize_job_url, call=call)
+                logger.info("url index sync: %s", stats)
+                snap = load_url_snapshot()
+            except SheetsReadError:
+                raise
+            except Exception as e:
+                logger.warning("url index unavailable, reading the whole workbook instead: %s", e)
+        if snap is None:
+            snap = fetch_workbook_url_snapshot(spreadsheet, normalize_job_url, call=call)
+        logger.info(
+            "workbook snapshot: tabs=%s urls=%s applied=%s evaluated_or_applied=%s",
+            snap.tabs,
+            len(snap.existing_urls),
+            len(snap.applied_urls),
+            len(snap.evaluated_or_applied_urls),
+        )
+        self._workbook_snapshot = snap
+        self._cached_existing_urls = set(snap.existing_urls)
+        self._cached_applied_urls = set(snap.applied_urls)
+        self._cached_evaluated_or_applied_urls = set(snap.evaluated_or_applied_urls)
+        return snap
+
     def get_existing_urls(self, use_cache=True):
         """Returns a set of canonical (normalized) Job Links from all tabs. Used to avoid adding duplicates."""
         if not self.client:
             self.connect()
-        if use_cache and self._cached_existing_urls is not None:
+        if use_cache and self._cached_existing_urls is not None and self._url_caches_fresh():
             return self._cached_existing_urls
-        existing_urls = set()
         try:
-            spreadsheet = self._open_workbook()
-            for worksheet in spreadsheet.worksheets():
-                values = worksheet.get_all_values()
-                if not values:
-                    continue
-                headers = values[0]
-                url_index = next((i for i, h in enumerate(headers) if str(h).strip().lower() == "job link"), -1)
-                if url_index != -1:
-                    for row in values[1:]:
-                        if len(row) > url_index and row[url_index]:
-                            existing_urls.add(normalize_job_url(row[url_index]))
+            self._workbook_url_snapshot(use_cache=use_cache)
         except Exception as e:
             print(f"Error fetching existing URLs: {e}")
-        self._cached_existing_urls = existing_urls
-        return existing_urls
+            return set()
+        return self._cached_existing_urls
 
     def get_applied_urls(self, use_cache: bool = True):
         """Returns a set of canonical Job Links where user marked Applied? (Y/N) = Y. So we never re-add or re-evaluate those."""
         if not self.client:
             self.connect()
-        if use_cache and self._cached_applied_urls is not None:
+        if use_cache and self._cached_applied_urls is not None and self._url_caches_fresh():
             return self._cached_applied_urls
-        applied = set()
         try:
-            spreadsheet = self._open_workbook()
-            applied_col = None
-            url_index = None
-            for worksheet in spreadsheet.worksheets():
-                values = worksheet.get_all_values()
-                if not values:
-                    continue
-                headers = [str(h).strip().lower() for h in values[0]]
-                url_index = next((i for i, h in enumerate(headers) if h == "job link"), -1)
-                applied_col = next((i for i, h in enumerate(values[0]) if "applied" in str(h).lower()), -1)
-                if url_index == -1 or applied_col == -1:
-                    continue
-                for row in values[1:]:
-                    if len(row) > max(url_index, applied_col):
-                        applied_val = str(row[applied_col]).strip().upper()
-                        if applied_val == "Y" or applied_val.startswith("Y"):
-                            link = row[url_index]
-                            if link:
-                                applied.add(normalize_job_url(link))
+            self._workbook_url_snapshot(use_cache=use_cache)
         except Exception as e:
             print(f"Error fetching applied URLs: {e}")
-        self._cached_applied_urls = applied
-        return applied
+            return set()
+        return self._cached_applied_urls
 
     def get_already_evaluated_or_applied_canonical_urls(self, use_cache: bool = True):
         """
@@ -774,48 +933,31 @@ class GoogleSheetsClient:
         """
         if not self.client:
             self.connect()
-        if use_cache and self._cached_evaluated_or_applied_urls is not None:
+        if use_cache and self._cached_evaluated_or_applied_urls is not None and self._url_caches_fresh():
             return self._cached_evaluated_or_applied_urls
-        seen = set()
         try:
-            spreadsheet = self._open_workbook()
-            for worksheet in spreadsheet.worksheets():
-                values = worksheet.get_all_values()
-                if not values:
-                    continue
-                headers = [str(h).strip() for h in values[0]]
-                url_idx = next((i for i, h in enumerate(headers) if h.lower() == "job link"), -1)
-                status_idx = next((i for i, h in enumerate(headers) if h.lower() == "status"), -1)
-                applied_idx = next((i for i, h in enumerate(headers) if "applied" in h.lower()), -1)
-                if url_idx == -1:
-                    continue
-                for row in values[1:]:
-                    if len(row) <= url_idx or not row[url_idx]:
-                        continue
-                    status = str(row[status_idx]).strip().upper() if status_idx >= 0 and len(row) > status_idx else ""
-                    applied = str(row[applied_idx]).strip().upper() if applied_idx >= 0 and len(row) > applied_idx else ""
-                    if status == "EVALUATED" or applied.startswith("Y"):
-                        seen.add(normalize_job_url(row[url_idx]))
+            self._workbook_url_snapshot(use_cache=use_cache)
         except Exception as e:
             print(f"Error fetching already-seen URLs: {e}")
-        self._cached_evaluated_or_applied_urls = seen
-        return seen
+            return set()
+        return self._cached_evaluated_or_applied_urls
 
     def _get_or_create_col_index(self, worksheet, col_name, headers=None):
-        """Helper to find or create a column by name and return its 1-based index."""
-        if headers is None:
-            headers = [h.strip() for h in worksheet.row_values(1)]
-        
-        if col_name in headers:
-            return headers.index(col_name) + 1
-        else:
+        """
+        Helper to find or create a column by name and return its 1-based index. A caller-supplied
+        headers list (fresh row 1) seeds the header cache and is extended when the column is added.
+        """
+        if headers is not None:
+            if col_name in headers:
+                return headers.index(col_name) + 1
+            cache = getattr(self, "_worksheet_header_row_cache", None)
+            if cache is None:
+                cache = self._worksheet_header_row_cache = {}
+            cache[self._worksheet_cache_key(worksheet)] = (list(headers), time.monotonic())
+        col_idx = self.ensure_columns(worksheet, [col_name])[col_name]
+        if headers is not None and col_name not in headers:
             headers.append(col_name)
-            col_idx = len(headers)
-            if col_idx > worksheet.col_count:
-                worksheet.resize(cols=max(col_idx + 2, DEFAULT_NEW_WORKSHEET_COLS))
-            worksheet.update_cell(1, col_idx, col_name)
-            worksheet.format(f'{gspread.utils.rowcol_to_a1(1, col_idx)}', {'textFormat': {'bold': True}})
-            return col_idx
+        return col_idx
 
     def _job_dict_for_fallback(self, job: dict) -> dict:
         out: dict = {}
@@ -877,6 +1019,7 @@ class GoogleSheetsClient:
                     jd_cache_updates[canonical] = {
                         "jd": desc[:50000],
                         "timestamp": datetime.now().strftime("%Y-%m-%d"),
+                        "company": job.get("company", ""),
                     }
 
                 row = [""] * 17
@@ -919,12 +1062,12 @@ class GoogleSheetsClient:
                 tab_date,
             )
             if jd_cache_updates:
-                cache = self._load_jd_cache()
-                cache.update(jd_cache_updates)
-                self._save_jd_cache(cache)
+                self._save_jd_cache(jd_cache_updates)
 
             to_save = pending_jobs
-            self._with_retries(lambda: worksheet.append_rows(new_rows), op_name="append_rows")
+            self._count_payload(new_rows)
+            self._with_retries(lambda: worksheet.append_rows(new_rows), op_name="append_rows", kind="write")
+            self._sort_pending = True
             self._cached_existing_urls = seen
             print(f"Added {len(new_rows)} new jobs.")
         except Exception as e:
@@ -934,33 +1077,146 @@ class GoogleSheetsClient:
                 sheet_outbox.enqueue_outbox("add_jobs", tab_date, {"jobs": to_save}, str(e))
             raise
 
-    def count_evaluated_jobs_min_score(self, min_score: float = 80.0) -> int:
-        """Count rows on the active daily tab where Status=EVALUATED and Apply Score >= min_score."""
+    def _daily_worksheet(self, tab=None):
+        """Worksheet for tab (default: active daily tab); reuses the connected tab without a reopen."""
         if not self.client:
             self.connect()
-        tab_date_str = get_worksheet_tab_date()
+        tab = tab or get_worksheet_tab_date()
+        sheet = getattr(self, "sheet", None)
+        if sheet is not None and getattr(sheet, "title", None) == tab:
+            return sheet
+        return self._open_workbook().worksheet(tab)
+
+    @staticmethod
+    def _worksheet_cache_key(worksheet):
+        key = getattr(worksheet, "id", None)
+        return worksheet.title if key is None else key
 
-        def _read_records():
-            worksheet = self._open_workbook().worksheet(tab_date_str)
-            return worksheet.get_all_records()
+    def _header_row(self, worksheet, refresh=False):
+        """
+        Row 1 of worksheet, cached per worksheet for sheet.header_cache_ttl_sec (columns inserted by hand
+        mid-run are picked up after that). Cleared by invalidate_sheet_url_caches.
+        """
+        cache = getattr(self, "_worksheet_header_row_cache", None)
+        if cache is None:
+            cache = self._worksheet_header_row_cache = {}
+        key = self._worksheet_cache_key(worksheet)
+        entry = cache.get(key)
+        ttl = getattr(self, "_header_cache_ttl_sec", HEADER_CACHE_DEFAULT_TTL_SEC)
+        if refresh or entry is None or (ttl > 0 and time.monotonic() - entry[1] > ttl):
+            headers = list(self._with_retries(lambda: worksheet.row_values(1), op_name="header_row", kind="read") or [])
+            entry = cache[key] = (headers, time.monotonic())
+        return entry[0]
+
+    def ensure_columns(self, worksheet, names):
+        """
+        Map column names to 1-based indices, appending any missing headers to row 1 in a single
+        batch_update (sheet_schema.py); a grid too narrow for them is first widened with resize(),
+        which keeps gspread's col_count in step. With a warm header cache this makes no API calls.
+        """
+        headers = self._header_row(worksheet)
+        missing = missing_columns(headers, names)
+        if missing:
+            first_col0 = len(headers)
+            col_count = int(getattr(worksheet, "col_count", 0) or 0)
+            if first_col0 + len(missing) > col_count:
+                col_count = first_col0 + len(missing) + GRID_GROWTH_HEADROOM
+                self._with_retries(
+                    lambda: worksheet.resize(cols=col_count), op_name="ensure_columns_resize", kind="write"
+                )
+            body = {"requests": append_headers_requests(worksheet.id, first_col0, missing, col_count)}
+            self._with_retries(
+                lambda: worksheet.client.batch_update(worksheet.spreadsheet_id, body),
+                op_name="ensure_columns", kind="write",
+            )
+            headers = headers + missing
+            self._worksheet_header_row_cache[self._worksheet_cache_key(worksheet)] = (headers, time.monotonic())
+            print(f"Added columns to '{getattr(worksheet, 'title', '')}': {', '.join(missing)}")
+        return column_positions(headers, names)
+
+    def _read_columns(self, worksheet, names):
+        """{header: data-row values} for the named columns, in one batch_get (missing headers omitted)."""
+        self.flush_writes(worksheet, raise_errors=False)
+        pos = header_positions(self._header_row(worksheet), names)
+        if not pos:
+            return {}
+        found = list(pos)
+        ranges = [f"{column_letter(pos[n])}2:{column_letter(pos[n])}" for n in found]
+        value_ranges = self._with_retries(
+            lambda: worksheet.batch_get(ranges, major_dimension="COLUMNS"),
+            op_name="batch_get_columns", kind="read",
+        ) or []
+        out = {}
+        for name, vr in zip(found, value_ranges):
+            out[name] = list(vr[0]) if vr else []
+        return out
+
+    def _read_rows(self, worksheet, rows):
+        """{sheet_row: values} for the given rows; contiguous rows are fetched as one range."""
+        self.flush_writes(worksheet, raise_errors=False)
+        headers = self._header_row(worksheet)
+        last_col = column_letter(max(0, len(headers) - 1))
+        runs = row_runs(sorted(rows))
+        out = {}
+        for start in range(0, len(runs), ROW_FETCH_MAX_RANGES):
+            chunk = runs[start : start + ROW_FETCH_MAX_RANGES]
+            ranges = [f"A{a}:{last_col}{b}" for a, b in chunk]
+            value_ranges = self._with_retries(
+                lambda r=ranges: worksheet.batch_get(r),
+                op_name="batch_get_rows", kind="read",
+            ) or []
+            for (a, b), vr in zip(chunk, value_ranges):
+                for offset, values in enumerate(list(vr or [])[: b - a + 1]):
+                    out[a + offset] = list(values)
+        for r in rows:
+            out.setdefault(r, [])
+        return out
 
+    def select_rows(self, where=None, min_values=None, columns=None, tab=None, limit=None, worksheet=None):
+        """
+        Column-projected query on a daily tab (sheet_query.py): rows where each `where` column equals
+        its value (strip, case-insensitive; Match Type ignores '*') and each `min_values` column is a
+        number >= its floor. Only the filter columns are downloaded, then:
+          columns=None  -> get_all_records()-style dicts for the matching rows only (+ _row_index);
+          columns=[...] -> just those columns (+ _row_index), with no further reads.
+        """
+        ws = worksheet or self._daily_worksheet(tab)
+        names = list(where or {}) + [k for k in (min_values or {}) if k not in (where or {})]
+        names += [c for c in (columns or []) if c not in names]
+        cols = self._read_columns(ws, names)
+        rows = matching_rows(cols, where, min_values, limit)
+        if columns is not None:
+            out = []
+            for r in rows:
+                rec = {c: ((cols.get(c) or [])[r - 2] if r - 2 < len(cols.get(c) or []) else "") for c in columns}
+                rec["_row_index"] = r
+                out.append(rec)
+            return out
+        if not rows:
+            return []
+        return records_from_rows(self._header_row(ws), self._read_rows(ws, rows))
+
+    def count_rows(self, where=None, min_values=None, tab=None):
+        """Number of rows matching a select_rows() filter; downloads only the filter columns."""
+        ws = self._daily_worksheet(tab)
+        names = list(where or {}) + [k for k in (min_values or {}) if k not in (where or {})]
+        return len(matching_rows(self._read_columns(ws, names), where, min_values))
+
+    def count_by_column(self, column, tab=None):
+        """Counter of stripped, upper-cased values in one column of a daily tab (e.g. Status backlog)."""
+        ws = self._daily_worksheet(tab)
+        values = self._read_columns(ws, [column]).get(column) or []
+        return Counter(str(v).strip().upper() for v in values)
+
+    def count_evaluated_jobs_min_score(self, min_score: float = 80.0) -> int:
+        """Count rows on the active daily tab where Status=EVALUATED and Apply Score >= min_score."""
+        if not self.client:
+            self.connect()
         try:
-            records = self._with_retries(_read_records, op_name="count_evaluated_records")
+            return self.count_rows(where={"Status": "EVALUATED"}, min_values={"Apply Score": float(min_score)})
         except Exception as e:
             raise SheetsReadError(str(e)) from e
 
-        n = 0
-        for r in records or []:
-            if str(r.get("Status", "")).strip().upper() != "EVALUATED":
-                continue
-            try:
-                s = float(str(r.get("Apply Score", "0") or "0").strip())
-            except ValueError:
-                s = 0.0
-            if s >= float(min_score):
-                n += 1
-        return n
-
     def get_new_jobs(self, limit=100):
         """Fetches up to `limit` jobs that have the 'NEW' status from today's tab."""
         return self._get_jobs_by_criteria({"Status": "NEW"}, limit)
@@ -1015,34 +1271,11 @@ class GoogleSheetsClient:
         if not self.client:
             self.connect()
 
-        tab_str = get_worksheet_tab_date()
         try:
-            worksheet = self._open_workbook().worksheet(tab_str)
-            records = self._with_retries(
-                lambda: worksheet.get_all_records(),
-                op_name="get_all_records",
-            ) or []
-
-            filtered_jobs = []
-            for i, record in enumerate(records):
-                match = True
-                for key, val in criteria.items():
-                    actual = str(record.get(key, "")).strip()
-                    target = str(val).strip()
-
-                    if key == "Match Type":
-                        actual = actual.replace("*", "")
-
-                    if actual.lower() != target.lower():
-                        match = False
-                        break
-
-                if match:
-                    record["_row_index"] = i + 2
-                    record["_worksheet"] = worksheet
-                    filtered_jobs.append(record)
-                    if len(filtered_jobs) >= limit:
-                        break
+            worksheet = self._daily_worksheet()
+            filtered_jobs = self.select_rows(where=criteria, limit=limit, worksheet=worksheet)
+            for record in filtered_jobs:
+                record["_worksheet"] = worksheet
             return filtered_jobs, worksheet
 
         except Exception as e:
@@ -1175,31 +1408,27 @@ class GoogleSheetsClient:
         Batch updates evaluated jobs to avoid rate limits.
         Supports legacy 8-tuples or extended 11-tuples (calibration + audit).
         """
-        headers = [h.strip() for h in worksheet.row_values(1)]
-
-        match_col = self._get_or_create_col_index(worksheet, "Match Type", headers)
-        score_col = self._get_or_create_col_index(worksheet, "Apply Score", headers)
-        resume_col = self._get_or_create_col_index(worksheet, "Recommended Resume", headers)
-        h1b_col = self._get_or_create_col_index(worksheet, "H1B Sponsorship", headers)
-        reason_col = self._get_or_create_col_index(worksheet, "Reasoning", headers)
-        skills_col = self._get_or_create_col_index(worksheet, "Missing Skills", headers)
-        cal_col = self._get_or_create_col_index(worksheet, SHEET_COL_CALIBRATION_DELTA, headers)
-        audit_col = self._get_or_create_col_index(worksheet, SHEET_COL_DECISION_AUDIT, headers)
-        base_col = self._get_or_create_col_index(worksheet, SHEET_COL_BASE_LLM_SCORE, headers)
-        ev_col = self._get_or_create_col_index(worksheet, SHEET_COL_EVIDENCE_JSON, headers)
-        fb_col = self._get_or_create_col_index(worksheet, SHEET_COL_FEEDBACK, headers)
-        fn_col = self._get_or_create_col_index(worksheet, SHEET_COL_FEEDBACK_NOTE, headers)
-        dig_col = self._get_or_create_col_index(worksheet, SHEET_COL_DIGEST_STATUS, headers)
-        act_col = self._get_or_create_col_index(worksheet, SHEET_COL_ACTION_LINK, headers)
-        # New: bucketization column derived from Apply Score.
-        bucket_col = self._get_or_create_col_index(worksheet, "Apply Bucket", headers)
-
-        # New judge + ATS columns (created lazily; safe for old sheets)
-        rj_score_col = self._get_or_create_col_index(worksheet, "Role Judge Score", headers)
-        rj_verdict_col = self._get_or_create_col_index(worksheet, "Role Judge Verdict", headers)
-        rj_notes_col = self._get_or_create_col_index(worksheet, "Role Judge Notes", headers)
-        ats_match_col = self._get_or_create_col_index(worksheet, "ATS Match %", headers)
-        ats_gaps_col = self._get_or_create_col_index(worksheet, "ATS Critical Gaps", headers)
+        cols = self.ensure_columns(worksheet, EVALUATION_COLUMNS)
+        match_col = cols["Match Type"]
+        score_col = cols["Apply Score"]
+        resume_col = cols["Recommended Resume"]
+        h1b_col = cols["H1B Sponsorship"]
+        reason_col = cols["Reasoning"]
+        skills_col = cols["Missing Skills"]
+        cal_col = cols[SHEET_COL_CALIBRATION_DELTA]
+        audit_col = cols[SHEET_COL_DECISION_AUDIT]
+        base_col = cols[SHEET_COL_BASE_LLM_SCORE]
+        ev_col = cols[SHEET_COL_EVIDENCE_JSON]
+        fb_col = cols[SHEET_COL_FEEDBACK]
+        fn_col = cols[SHEET_COL_FEEDBACK_NOTE]
+        dig_col = cols[SHEET_COL_DIGEST_STATUS]
+        act_col = cols[SHEET_COL_ACTION_LINK]
+        bucket_col = cols["Apply Bucket"]
+        rj_score_col = cols["Role Judge Score"]
+        rj_verdict_col = cols["Role Judge Verdict"]
+        rj_notes_col = cols["Role Judge Notes"]
+        ats_match_col = cols["ATS Match %"]
+        ats_gaps_col = cols["ATS Critical Gaps"]
 
         cells_to_update = []
         for raw in updates:
@@ -1288,7 +1517,8 @@ class GoogleSheetsClient:
             cells_to_update.append(gspread.Cell(row=row_index, col=ats_gaps_col, value=u.get("ats_critical_gaps") or ""))
 
         if cells_to_update:
-            self._with_retries(lambda: worksheet.update_cells(cells_to_update), op_name="update_cells")
+            self._write_cells(worksheet, cells_to_update)
+            self._sort_pending = True
             print(f"Successfully updated {len(updates)} jobs with evaluations.")
 
     def get_sort_key_for_row(self, row, headers):
@@ -1326,44 +1556,74 @@ class GoogleSheetsClient:
         pm_boost = 0 if is_pm else 1
         return (-score, status_priority, pm_boost)
 
-    def sort_daily_jobs(self):
+    def sort_daily_jobs(self, force: bool = False):
         """
         Sorts today's sheet rows based on the 'Match Type' evaluation priority.
         Primary sort: Apply Score (desc). Secondary: Match Type (incl. 🔥/✅/⚖️/❌). Tertiary: PM boost.
+
+        Server-side (sheet_sort.py): refresh the Sort Key helper cells that changed, then one sortRange
+        request. Skipped when this client wrote no rows since its last sort, unless force=True.
+        sheet.sort_mode: "rewrite" restores the old download / clear / re-upload sort.
         """
         if not self.client:
             self.connect()
-            
+        if not force and not getattr(self, "_sort_pending", True):
+            logger.info("sort_daily_jobs: no rows written since the last sort; skipping")
+            return
+
         tab_str = get_worksheet_tab_date()
         try:
-            worksheet = self._open_workbook().worksheet(tab_str)
-            values = worksheet.get_all_values()
-            
-            if len(values) <= 1:
-                return # Only headers or empty
-                
-            headers = values[0]
-            rows = values[1:]
-            
-            if "Match Type" not in headers:
-                print("No 'Match Type' column found. Skipping sort.")
-                return
+            self.flush_writes()
+            worksheet = self._daily_worksheet(tab_str)
+            if str(get_sheet_config().get("sort_mode") or "server").strip().lower() == "rewrite":
+                self._sort_daily_jobs_rewrite(worksheet)
+            else:
+                self._sort_daily_jobs_server(worksheet)
+            self._sort_pending = False
+        except Exception as e:
+            print(f"Error sorting jobs: {e}")
 
-            rows.sort(key=lambda row: self.get_sort_key_for_row(row, headers))
+    def _sort_daily_jobs_server(self, worksheet):
+        if "Match Type" not in [str(h).strip() for h in self._header_row(worksheet)]:
+            print("No 'Match Type' column found. Skipping sort.")
+            return
+        sort_col = self.ensure_columns(worksheet, (SORT_KEY_COLUMN,))[SORT_KEY_COLUMN]
+        columns = self._read_columns(worksheet, SORT_INPUT_COLUMNS + (SORT_KEY_COLUMN,))
+        changed = changed_sort_keys(columns, self.get_sort_key_for_row)
+        if changed:
+            cells = [gspread.Cell(row=r, col=sort_col, value=key) for r, key in changed]
+            self._write_cells(worksheet, cells, force_flush=True)
+        body = {"requests": [sort_range_request(worksheet.id, sort_col - 1)]}
+        self._with_retries(
+            lambda: worksheet.client.batch_update(worksheet.spreadsheet_id, body),
+            op_name="sort_range", kind="write",
+        )
+        print(f"Successfully sorted Google Sheet by Evaluation Match Type ({len(changed)} sort keys updated).")
 
-            
-            # Clear existing data and rewrite sorted data
-            self._with_retries(lambda: worksheet.clear(), op_name="worksheet_clear")
-            self._with_retries(lambda: worksheet.update([headers] + rows), op_name="worksheet_update")
-            
-            # Re-apply bold styling to headers
-            last_col = max(1, len(headers))
-            worksheet.format(f"A1:{rowcol_to_a1(1, last_col)}", {'textFormat': {'bold': True}})
+    def _sort_daily_jobs_rewrite(self, worksheet):
+        values = worksheet.get_all_values()
 
-            print("Successfully sorted Google Sheet by Evaluation Match Type.")
-            
-        except Exception as e:
-            print(f"Error sorting jobs: {e}")
+        if len(values) <= 1:
+            return # Only headers or empty
+
+        headers = values[0]
+        rows = values[1:]
+
+        if "Match Type" not in headers:
+            print("No 'Match Type' column found. Skipping sort.")
+            return
+
+        rows.sort(key=lambda row: self.get_sort_key_for_row(row, headers))
+
+        # Clear existing data and rewrite sorted data
+        self._with_retries(lambda: worksheet.clear(), op_name="worksheet_clear", kind="write")
+        self._with_retries(lambda: worksheet.update([headers] + rows), op_name="worksheet_update", kind="write")
+
+        # Re-apply bold styling to headers
+        last_col = max(1, len(headers))
+        worksheet.format(f"A1:{rowcol_to_a1(1, last_col)}", {'textFormat': {'bold': True}})
+
+        print("Successfully sorted Google Sheet by Evaluation Match Type.")
 
     def update_resume_for_row(
         self,
@@ -1379,11 +1639,10 @@ class GoogleSheetsClient:
         This is used by the TailorAgent orchestration after generating a
         tailored resume artifact for a specific job.
         """
-        headers = [h.strip() for h in worksheet.row_values(1)]
-
-        resume_status_col = self._get_or_create_col_index(worksheet, "Resume Status", headers)
-        resume_path_col = self._get_or_create_col_index(worksheet, "Resume Path", headers)
-        reviewer_notes_col = self._get_or_create_col_index(worksheet, "Reviewer Notes", headers)
+        cols = self.ensure_columns(worksheet, RESUME_COLUMNS)
+        resume_status_col = cols["Resume Status"]
+        resume_path_col = cols["Resume Path"]
+        reviewer_notes_col = cols["Reviewer Notes"]
 
         cells = [
             gspread.Cell(row=row_index, col=resume_status_col, value=resume_status),
@@ -1391,15 +1650,68 @@ class GoogleSheetsClient:
             gspread.Cell(row=row_index, col=reviewer_notes_col, value=reviewer_notes or ""),
         ]
 
-        self._with_retries(
-            lambda: worksheet.update_cells(cells),
-            op_name="update_resume_for_row",
-        )
+        self._write_cells(worksheet, cells)
+
+    def _write_cells(self, worksheet, cells, force_flush=False):
+        """
+        Queue gspread.Cell writes for worksheet (sheet_write_buffer.py). They are sent in one values
+        batchUpdate per worksheet when sheet.write_coalesce_sec has elapsed (0 = now), before any read
+        through this client, or on flush_writes().
+        """
+        buf = getattr(self, "_write_buffer", None)
+        if buf is None:
+            buf = self._write_buffer = SheetWriteBuffer()
+        buf.add(worksheet, cells)
+        if force_flush or buf.due(getattr(self, "_write_coalesce_sec", 0.0)):
+            self.flush_writes()
+
+    def flush_writes(self, worksheet=None, raise_errors=True):
+        """
+        Send queued cell writes (all worksheets, or just worksheet). A worksheet whose write fails keeps
+        its cells queued and the others are still sent; then one SheetsWriteError covers the failures.
+        Reads flush with raise_errors=False: a failing write is logged and retried on the next flush
+        instead of failing the read.
+        """
+        buf = getattr(self, "_write_buffer", None)
+        if buf is None:
+            return
+        failed = []
+        for ws, cells in buf.take(worksheet):
+            data = value_ranges(cells)
+            self._count_payload(data)
+            try:
+                self._with_retries(
+                    lambda ws=ws, data=data: ws.batch_update(data, raw=True), op_name="flush_writes", kind="write"
+                )
+            except Exception as e:
+                buf.requeue(ws, cells)
+                failed.append((getattr(ws, "title", ""), e))
+                continue
+            logger.info("flushed %s cells to '%s' in %s ranges", len(cells), getattr(ws, "title", ""), len(data))
+        if not failed:
+            return
+        msg = "; ".join(f"'{title}': {e}" for title, e in failed)
+        if not raise_errors:
+            logger.warning("queued Sheets writes failed (kept for the next flush): %s", msg)
+            return
+        raise SheetsWriteError(f"queued Sheets writes failed (kept for the next flush): {msg}") from failed[0][1]
+
+    def _count_payload(self, data) -> None:
+        quota = getattr(self, "_quota", None)
+        if quota is not None:
+            quota.add_bytes(payload_bytes(data))
+
+    def sheets_call_stats(self) -> dict:
+        """Process-wide Sheets API counters: reads, writes, requests, bytes_sent, throttle_wait_sec, quota_errors."""
+        quota = getattr(self, "_quota", None) or get_sheets_quota()
+        return quota.stats.as_dict()
 
-    def _with_retries(self, fn, op_name="operation", retries=None, base_sleep=None, **kwargs):
+    def _with_retries(self, fn, op_name="operation", retries=None, base_sleep=None, kind=None, **kwargs):
         """
         Retry wrapper for transient Sheets API failures.
         Env: SHEETS_RETRY_MAX, SHEETS_BASE_SLEEP, SHEETS_MIN_REQUEST_INTERVAL_SEC (pacing between calls).
+        Each attempt first takes a token from the read / write quota bucket (sheet_quota.py): kind="read" /
+        "write" picks it, otherwise it is guessed from op_name.
         Raises SheetsReadError on persistent quota (429) after retries.
         """
         if kwargs:
@@ -1409,6 +1721,7 @@ class GoogleSheetsClient:
         if base_sleep is None:
             base_sleep = float(os.environ.get("SHEETS_BASE_SLEEP", "1.5") or "1.5")
         min_interval = float(os.environ.get("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0") or "0")
+        quota = getattr(self, "_quota", None)
 
         last_error = None
         for attempt in range(1, max(1, retries) + 1):
@@ -1418,9 +1731,13 @@ class GoogleSheetsClient:
                     elapsed = time.monotonic() - last_end
                     if elapsed < min_interval:
                         time.sleep(min_interval - elapsed)
+            if quota is not None:
+                quota.acquire(op_name, kind)
             try:
                 out = fn()
                 self._last_sheets_call_end_monotonic = time.monotonic()
+                if quota is not None:
+                    quota.record(op_name, kind)
                 return out
             except Exception as e:
                 last_error = e
@@ -1434,6 +1751,8 @@ class GoogleSheetsClient:
                 low = str(e).lower()
                 if "429" in low or "quota" in low:
                     is_quota = True
+                if is_quota and quota is not None:
+                    quota.on_quota_error(op_name, kind)
                 if attempt >= retries:
                     if is_quota:
                         raise SheetsReadError(str(e)) from e
@@ -0,0 +1,209 @@
+"""
+Shared HTTP layer for the sourcing scrapers and the static JD fetch (SourcingAgent._fetch_jd_static).
+
+- One requests.Session per host, shared across threads: keep-alive connections instead of a new
+  TCP + TLS handshake per request (pool_maxsize covers the concurrent JD / board fan-out).
+- urllib3 Retry for GET / HEAD: connection errors and 429 / 5xx are retried with exponential
+  backoff (0.5s, 1s, 2s); Retry-After is not honoured so a misbehaving API cannot stall a run.
+- A default (connect, read) timeout when the caller passes none.
+- Conditional GET for feeds and board APIs polled every run (conditional=True): the ETag /
+  Last-Modified of the last 200 is persisted and sent back as If-None-Match / If-Modified-Since.
+  An unchanged board answers 304 with no body; callers treat not_modified(response) as
+  "nothing new since the last sync". A 200's validators are only persisted when the enclosing
+  sync_batch.staged_sync() batch commits, i.e. after its postings were saved (SourcingAgent).
+
+Validators path: sourcing.http_validators_path or HTTP_VALIDATOR_DB; entries older than
+sourcing.http_validator_ttl_days (default 7; 0 = conditional GET off) are ignored, which forces a
+periodic full fetch.
+"""
+from __future__ import annotations
+
+import atexit
+import functools
+import sqlite3
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry
+
+from apps.cli.legacy.core.config import get_sourcing_config
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+from apps.cli.legacy.core.sync_batch import defer_until_saved
+
+DEFAULT_TIMEOUT = (5, 30)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POOL_MAXSIZE = 16
+
+DEFAULT_DB_PATH = "data/http_validators.db"
+DEFAULT_TTL_DAYS = 7.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT NOT NULL,
+    last_modified TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _new_session() -> requests.Session:
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def session_for(url: str) -> requests.Session:
+    """Process-wide pooled session for the URL's host."""
+    host = urlparse(url).netloc.lower()
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = _SESSIONS[host] = _new_session()
+        return session
+
+
+def resolve_validator_db_path() -> str:
+    """Absolute path to the ETag / Last-Modified database."""
+    return resolve_db_path("HTTP_VALIDATOR_DB", "http_validators_path", DEFAULT_DB_PATH)
+
+
+class ValidatorStore:
+    def __init__(self, db_path: str | None = None, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_sec = max(0.0, float(ttl_days)) * 86400.0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = open_wal_db(self.db_path or resolve_validator_db_path(), SCHEMA)
+        return self._conn
+
+    def get(self, url: str) -> tuple[str, str] | None:
+        """(etag, last_modified) of the last 200 for url, if fresh."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT etag, last_modified, updated_at FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+        if not row or time.time() - row[2] >= self.ttl_sec:
+            return None
+        return row[0], row[1]
+
+    def put(self, url: str, etag: str, last_modified: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connect()
+            if etag or last_modified:
+                conn.execute(
+                    "INSERT OR REPLACE INTO validators (url, etag, last_modified, updated_at) VALUES (?, ?, ?, ?)",
+                    (url, etag, last_modified, time.time()),
+                )
+            else:
+                conn.execute("DELETE FROM validators WHERE url = ?", (url,))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_STORE: ValidatorStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_validator_store() -> ValidatorStore:
+    """Process-wide ValidatorStore at the configured path / TTL."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            cfg = get_sourcing_config()
+            _STORE = ValidatorStore(ttl_days=float(cfg.get("http_validator_ttl_days", DEFAULT_TTL_DAYS) or 0))
+        return _STORE
+
+
+def http_get(
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: Any = None,
+    conditional: bool = False,
+) -> requests.Response:
+    """
+    GET through the host's pooled session (retries + default timeout). With conditional=True the
+    stored validators are sent and a 200's ETag / Last-Modified are stored once the current
+    staged_sync() batch commits (never outside one); check not_modified().
+    """
+    hdrs = dict(headers or {})
+    store = get_validator_store() if conditional else None
+    key = ""
+    if store is not None and store.enabled:
+        key = requests.Request("GET", url, params=params).prepare().url or url
+        validators = store.get(key)
+        if validators:
+            etag, last_modified = validators
+            if etag:
+                hdrs["If-None-Match"] = etag
+            if last_modified:
+                hdrs["If-Modified-Since"] = last_modified
+    response = session_for(url).get(url, params=params, headers=hdrs, timeout=timeout or DEFAULT_TIMEOUT)
+    if key and response.status_code == 200:
+        defer_until_saved(
+            functools.partial(
+                store.put, key, response.headers.get("ETag", ""), response.headers.get("Last-Modified", "")
+            )
+        )
+    return response
+
+
+def not_modified(response: requests.Response) -> bool:
+    """True for a 304 to a conditional GET: the resource is unchanged since the last 200."""
+    return response.status_code == 304
+
+
+def close_sessions() -> None:
+    """Close pooled sessions and the validator store (atexit; tests)."""
+    global _STORE
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
+    with _STORE_LOCK:
+        store, _STORE = _STORE, None
+    if store is not None:
+        store.close()
+
+
+atexit.register(close_sessions)
@@ -1,4 +1,4 @@
-"""Fetch JD text into config/jd_cache.json for arbitrary job URLs (eval / tailoring)."""
+"""Fetch JD text into the local JD store (config/jd_cache.*) for arbitrary job URLs (eval / tailoring)."""
 from __future__ import annotations
 
 import os
@@ -32,10 +32,12 @@ def ensure_jd_cached(client: "GoogleSheetsClient", url: str, *, project_root: st
     desc, ok, method = agent._fetch_jd_manually(url)
     if not ok or not (desc or "").strip():
         return False, f"JD fetch failed ({method})"
-    cache = client._load_jd_cache()
-    cache[canon] = {
-        "jd": desc.strip()[:50000],
-        "timestamp": datetime.now().strftime("%Y-%m-%d"),
-    }
-    client._save_jd_cache(cache)
+    client._save_jd_cache(
+        {
+            canon: {
+                "jd": desc.strip()[:50000],
+                "timestamp": datetime.now().strftime("%Y-%m-%d"),
+            }
+        }
+    )
     return True, f"fetched via {method} ({len(desc)} chars)"
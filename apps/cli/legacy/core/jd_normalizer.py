@@ -0,0 +1,310 @@
+"""
+JD normalization + boilerplate stripping, run once when a JD is written to the local cache.
+
+Most JD text is EEO / legal / benefits / "about us" copy that recurs across postings and tells the
+evaluator nothing about fit, yet it is sent to the LLM for every job. This module keeps a small
+shingle model of the cached corpus and derives a compact "prompt" variant of each JD:
+
+  - text is split into blocks (long lines stand alone; runs of short lines, e.g. benefit bullets,
+    are grouped), each block is reduced to 5-word shingles and hashed;
+  - the model records, per shingle hash, the distinct sources (companies) it was seen in;
+  - a block is boilerplate when most of its shingles were seen at >= MIN_SOURCES companies.
+    Counting companies rather than documents keeps a role reposted for several locations from
+    being mistaken for boilerplate;
+  - blocks mentioning sponsorship / visa / clearance / pay / work mode / years of experience are
+    never dropped (the evaluator scores on them), and a compact JD that would fall below
+    MIN_COMPACT_CHARS is discarded in favour of the normalized full text.
+
+Runs of dropped blocks are replaced by OMITTED_MARKER. The raw JD stays in the main store
+(jd_cache.*.jdlog); the compact variant lives in a sibling store (jd_cache_compact.*.jdlog) and is
+what GoogleSheetsClient.get_prompt_jd_for_url returns. The model is persisted as
+jd_cache.jdshingles beside the store; it is bounded to MAX_TRACKED_SHINGLES by dropping
+single-source shingles (lossy counting), and bootstrapped from the existing store when missing.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Iterable
+from urllib.parse import urlparse
+
+from apps.cli.legacy.core.jd_store import JDStore, store_base_path
+
+logger = logging.getLogger(__name__)
+
+MODEL_SUFFIX = ".jdshingles"
+MODEL_VERSION = 1
+COMPACT_STORE_SUFFIX = "_compact"
+
+SHINGLE_WORDS = 5
+# Lines shorter than this are grouped with neighbouring short lines before classification.
+MIN_BLOCK_WORDS = 8
+# A shingle is "common" once seen in JDs from this many distinct companies.
+MIN_SOURCES = 5
+# Fraction of a block's shingles that must be common for the block to be dropped.
+BOILERPLATE_SHINGLE_FRACTION = 0.7
+# Never shrink a JD below this many characters of kept text; fall back to the full JD instead.
+MIN_COMPACT_CHARS = 300
+MAX_TRACKED_SHINGLES = 200_000
+BOOTSTRAP_MAX_DOCS = 2000
+
+OMITTED_MARKER = "[standard company / benefits / EEO boilerplate omitted]"
+
+# Blocks the evaluator relies on: keep even when the wording is generic.
+_PROTECT_RE = re.compile(
+    r"sponsor|visa|h-?1b|\bopt\b|\bcpt\b|clearance|citizen|authori[sz]ed to work|salary|compensation|"
+    r"pay range|base pay|\$\s?\d|\bremote\b|hybrid|on-?site|in[- ]office|relocat|\d+\+?\s*years?|years? of",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"[a-z][a-z']+")
+_INVISIBLE_RE = re.compile(r"[\u200b-\u200d\u2060\ufeff]")
+
+
+def compact_cache_path(jd_cache_path: str) -> str:
+    """Legacy-style path of the compact-variant store (config/jd_cache.json -> config/jd_cache_compact.json)."""
+    return store_base_path(jd_cache_path) + COMPACT_STORE_SUFFIX + ".json"
+
+
+def model_path(jd_cache_path: str) -> str:
+    return store_base_path(jd_cache_path) + MODEL_SUFFIX
+
+
+def source_key(company: str | None, url: str = "") -> str:
+    """Company name, or the posting host + first path segment (ATS board) when unknown."""
+    name = (company or "").strip().lower()
+    if name:
+        return name
+    try:
+        parsed = urlparse(url or "")
+    except ValueError:
+        return ""
+    first = (parsed.path or "/").strip("/").split("/", 1)[0]
+    return f"{parsed.netloc.lower()}/{first.lower()}"
+
+
+def normalize_whitespace(text: str) -> str:
+    """Strip invisible characters, non-breaking spaces and trailing blanks; collapse blank-line runs."""
+    text = _INVISIBLE_RE.sub("", (text or "").replace("\r\n", "\n").replace("\r", "\n").replace("\xa0", " "))
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r" *\n *", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def split_blocks(text: str) -> list[str]:
+    """Split normalized JD text into classification blocks (see module docstring)."""
+    blocks: list[str] = []
+    run: list[str] = []
+    for line in text.split("\n"):
+        if not line.strip():
+            if run:
+                blocks.append("\n".join(run))
+                run = []
+            blocks.append("")
+            continue
+        if len(line.split()) >= MIN_BLOCK_WORDS:
+            if run:
+                blocks.append("\n".join(run))
+                run = []
+            blocks.append(line)
+        else:
+            run.append(line)
+    if run:
+        blocks.append("\n".join(run))
+    return blocks
+
+
+def _mask_words(source: str) -> set[str]:
+    return set(re.findall(r"[a-z]{3,}", (source or "").lower()))
+
+
+def shingle_hashes(block: str, source: str = "") -> set[int]:
+    """32-bit hashes of the block's 5-word shingles; the source's own name is masked out."""
+    mask = _mask_words(source)
+    words = ["_" if w in mask else w for w in _WORD_RE.findall(block.lower())]
+    if len(words) < SHINGLE_WORDS:
+        return set()
+    out: set[int] = set()
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        digest = hashlib.blake2b(" ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8"), digest_size=4).digest()
+        out.add(int.from_bytes(digest, "big"))
+    return out
+
+
+def _source_hash(source: str) -> int:
+    return int.from_bytes(hashlib.blake2b(source.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+class BoilerplateModel:
+    """Shingle hash -> distinct source hashes (capped at MIN_SOURCES), persisted as JSON."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._sources: dict[int, list[int]] = {}
+        self.docs = 0
+        self._dirty = False
+        self.existed = self._load()
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning("jd_normalizer: ignoring unreadable model %s: %s", self.path, e)
+            return False
+        if not isinstance(data, dict) or data.get("version") != MODEL_VERSION:
+            return False
+        self.docs = int(data.get("docs") or 0)
+        self._sources = {int(h): list(v) for h, v in (data.get("shingles") or {}).items()}
+        return True
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def observe(self, text: str, source: str) -> None:
+        """Count one JD's shingles toward their distinct-source totals."""
+        src = _source_hash(source)
+        hashes: set[int] = set()
+        for block in split_blocks(normalize_whitespace(text)):
+            hashes |= shingle_hashes(block, source)
+        if not hashes:
+            return
+        with self._lock:
+            for h in hashes:
+                seen = self._sources.get(h)
+                if seen is None:
+                    self._sources[h] = [src]
+                elif len(seen) < MIN_SOURCES and src not in seen:
+                    seen.append(src)
+            self.docs += 1
+            self._dirty = True
+            if len(self._sources) > MAX_TRACKED_SHINGLES:
+                self._prune()
+
+    def _prune(self) -> None:
+        floor = 2
+        while len(self._sources) > MAX_TRACKED_SHINGLES * 3 // 4 and floor <= MIN_SOURCES:
+            self._sources = {h: v for h, v in self._sources.items() if len(v) >= floor}
+            floor += 1
+
+    def is_boilerplate(self, block: str, source: str = "") -> bool:
+        if not block.strip() or _PROTECT_RE.search(block):
+            return False
+        hashes = shingle_hashes(block, source)
+        if not hashes:
+            return False
+        with self._lock:
+            common = sum(1 for h in hashes if len(self._sources.get(h, ())) >= MIN_SOURCES)
+        return common >= BOILERPLATE_SHINGLE_FRACTION * len(hashes)
+
+    def compact(self, text: str, source: str = "") -> str:
+        """Normalized JD with boilerplate blocks replaced by OMITTED_MARKER (once per run)."""
+        normalized = normalize_whitespace(text)
+        kept: list[str] = []
+        kept_chars = 0
+        dropped_any = False
+        for block in split_blocks(normalized):
+            if self.is_boilerplate(block, source):
+                dropped_any = True
+                if not kept or kept[-1] != OMITTED_MARKER:
+                    kept.append(OMITTED_MARKER)
+                continue
+            kept.append(block)
+            kept_chars += len(block)
+        if not dropped_any or kept_chars < min(MIN_COMPACT_CHARS, len(normalized)):
+            return normalized
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": MODEL_VERSION,
+                "docs": self.docs,
+                "shingles": {str(h): v for h, v in self._sources.items()},
+            }
+            self._dirty = False
+        tmp = f"{self.path}.tmp.{os.getpid()}"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("jd_normalizer: could not persist model %s: %s", self.path, e)
+
+
+def compact_entries(entries: dict[str, Any], model: BoilerplateModel) -> dict[str, dict[str, str]]:
+    """
+    Observe then compact {url: {"jd", "timestamp"[, "company"]}} cache entries (legacy string values
+    allowed). Returns {url: {"jd": compact, "timestamp"}} for the compact store.
+    """
+    rows: list[tuple[str, str, str, str]] = []
+    for url, data in (entries or {}).items():
+        if isinstance(data, dict):
+            jd, ts, company = str(data.get("jd") or ""), str(data.get("timestamp") or ""), data.get("company")
+        else:
+            jd, ts, company = str(data or ""), "", None
+        if url and jd.strip():
+            rows.append((url, jd, ts, source_key(company, url)))
+    for _url, jd, _ts, source in rows:
+        model.observe(jd, source)
+    out: dict[str, dict[str, str]] = {}
+    for url, jd, ts, source in rows:
+        entry = {"jd": model.compact(jd, source)}
+        if ts:
+            entry["timestamp"] = ts
+        out[url] = entry
+    return out
+
+
+def bootstrap_model(model: BoilerplateModel, urls_and_jds: Iterable[tuple[str, str]]) -> int:
+    """Seed an empty model from already-cached JDs (source = posting host). Returns JDs observed."""
+    n = 0
+    for url, jd in urls_and_jds:
+        if n >= BOOTSTRAP_MAX_DOCS:
+            break
+        if jd:
+            model.observe(jd, source_key(None, url))
+            n += 1
+    return n
+
+
+_MODELS: dict[str, BoilerplateModel] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def get_boilerplate_model(jd_cache_path: str, seed_store: JDStore | None = None) -> BoilerplateModel:
+    """Process-lifetime model for a JD cache path; seeded from seed_store when no model file exists."""
+    key = os.path.abspath(model_path(jd_cache_path))
+    with _MODELS_LOCK:
+        model = _MODELS.get(key)
+        if model is None:
+            model = BoilerplateModel(key)
+            _MODELS[key] = model
+            if not model.existed and seed_store is not None and len(seed_store):
+                n = bootstrap_model(model, ((u, seed_store.get_jd(u)) for u in list(seed_store.keys())))
+                logger.info("jd_normalizer: bootstrapped boilerplate model from %s cached JDs", n)
+        return model
+
+
+def close_all_models() -> None:
+    """Persist registered models and drop them (atexit; tests)."""
+    with _MODELS_LOCK:
+        models = list(_MODELS.values())
+        _MODELS.clear()
+    for model in models:
+        model.flush()
+
+
+atexit.register(close_all_models)
@@ -0,0 +1,770 @@
+"""
+Indexed JD store (canonical job URL -> full JD text) used by GoogleSheetsClient.
+
+Replaces whole-file reloads of config/jd_cache.json. On-disk layout, next to the legacy JSON path:
+
+  jd_cache.000001.jdlog, ...   append-only log segments: one JSON header line ({"u", "t", "n", "c"})
+                               + n payload bytes + "\\n" per record; {"u", "t", "n": 0, "d": 1}
+                               is a tombstone (entry evicted)
+  jd_cache.<id>.jddict         shared zlib preset dictionaries (trained from recurring JD lines)
+  jd_cache.jdidx               offset index snapshot: canonical_url -> [segment, offset, length, timestamp, codec]
+  jd_cache.jdlock              advisory lock file (appends / compaction across processes)
+
+Reads slice the mmap'd segment at the indexed offset, so a lookup never parses other entries.
+Writes append one record to the active segment (O(size of that JD)); the active segment rotates at
+SEGMENT_MAX_BYTES. Compaction rewrites live entries into fresh segments and drops superseded and
+TTL-expired records (evict_expired appends tombstones, see utils.cleanup_jd_cache); it runs when garbage outweighs
+live data. The index is loaded lazily on first access and kept for the process lifetime
+(see get_jd_store); records appended after the last snapshot (or by another process) are replayed
+from the segments. Legacy jd_cache.json ({url: {"jd", "timestamp"}} or {url: "text"}) is imported
+on first open.
+
+Payloads are compressed per record (codec "c": "" = raw UTF-8, "z" = zlib, "zd:<id>" = zlib with the
+shared preset dictionary <id>). JD text is mostly repeated EEO / benefits / "about us" boilerplate, so a
+global dictionary trained from lines that recur across cached JDs (train_zlib_dictionary) lets each
+record reference it instead of repeating it. Decompression is transparent in get(). The dictionary is
+(re)trained at compaction once the store has grown enough; JD_STORE_CODEC=none disables compression.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import atexit
+import contextlib
+import glob
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+LOG_SUFFIX = ".jdlog"
+INDEX_SUFFIX = ".jdidx"
+LOCK_SUFFIX = ".jdlock"
+DICT_SUFFIX = ".jddict"
+INDEX_VERSION = 3
+
+# Rotate the active segment past this size; sealed segments are only rewritten by compaction.
+SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+# Compact when dead bytes exceed live bytes, once the log is at least this large.
+COMPACT_MIN_BYTES = 1 * 1024 * 1024
+DEFAULT_TTL_DAYS = 30
+
+# zlib preset dictionaries are limited to the 32 KB window.
+DICT_MAX_BYTES = 32 * 1024
+# Train once the store holds this many JDs; retrain when it has doubled since.
+DICT_TRAIN_MIN_ENTRIES = 200
+DICT_TRAIN_SAMPLE = 2000
+# A line must recur in at least this many sampled JDs to be dictionary material.
+DICT_MIN_DOC_FREQ = 3
+ZLIB_LEVEL = 6
+
+# Decoded JDs kept in memory; evaluate_all reads the same URL 2-3 times per job.
+HOT_CACHE_MAX_ENTRIES = 256
+
+_SEGMENT_RE = re.compile(r"\.(\d{6})" + re.escape(LOG_SUFFIX) + r"$")
+
+
+def store_base_path(jd_cache_path: str) -> str:
+    """config/jd_cache.json -> config/jd_cache (segment/index files get suffixes)."""
+    base, ext = os.path.splitext(jd_cache_path)
+    return base if ext.lower() == ".json" else jd_cache_path
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _entry_from_legacy(data: Any) -> tuple[str, str] | None:
+    """Return (jd, timestamp) for a legacy JSON cache value, or None if unusable."""
+    if isinstance(data, str):
+        return data, _today()
+    if isinstance(data, dict):
+        return str(data.get("jd") or ""), str(data.get("timestamp") or _today())
+    return None
+
+
+def train_zlib_dictionary(
+    texts: Iterable[str],
+    max_bytes: int = DICT_MAX_BYTES,
+    min_doc_freq: int = DICT_MIN_DOC_FREQ,
+) -> bytes:
+    """
+    Build a zlib preset dictionary from lines that recur across JDs (boilerplate).
+    Most frequent lines go last: zlib encodes matches near the end of the dictionary most cheaply.
+    """
+    doc_freq: Counter[str] = Counter()
+    for text in texts:
+        doc_freq.update({ln.strip() for ln in (text or "").splitlines() if len(ln.strip()) >= 20})
+    common = sorted(
+        ((n, ln) for ln, n in doc_freq.items() if n >= min_doc_freq),
+        key=lambda x: (-x[0], x[1]),
+    )
+    chosen: list[bytes] = []
+    size = 0
+    for _, ln in common:
+        b = (ln + "\n").encode("utf-8")
+        if size + len(b) > max_bytes:
+            continue
+        chosen.append(b)
+        size += len(b)
+    return b"".join(reversed(chosen))
+
+
+def _compress(jd: str, codec: str, dict_id: str, zdict: bytes | None) -> tuple[bytes, str]:
+    """Return (payload, codec tag); falls back to raw when compression does not help."""
+    raw = jd.encode("utf-8")
+    if codec != "zlib" or len(raw) < 64:
+        return raw, ""
+    if zdict:
+        c = zlib.compressobj(ZLIB_LEVEL, zdict=zdict)
+        tag = f"zd:{dict_id}"
+    else:
+        c = zlib.compressobj(ZLIB_LEVEL)
+        tag = "z"
+    packed = c.compress(raw) + c.flush()
+    return (packed, tag) if len(packed) < len(raw) else (raw, "")
+
+
+def _encode_record(url: str, jd: str, timestamp: str, codec: str = "", dict_id: str = "", zdict: bytes | None = None) -> tuple[bytes, bytes, str]:
+    payload, tag = _compress(jd, codec, dict_id, zdict)
+    h: dict[str, Any] = {"u": url, "t": timestamp, "n": len(payload)}
+    if tag:
+        h["c"] = tag
+    header = (json.dumps(h, ensure_ascii=False) + "\n").encode("utf-8")
+    return header, payload, tag
+
+
+def _encode_tombstone(url: str, timestamp: str) -> bytes:
+    return (json.dumps({"u": url, "t": timestamp, "n": 0, "d": 1}, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class JDStore:
+    """
+    Segmented append-only JD log with an in-memory offset index.
+
+    Keys are canonical URLs (callers normalize with normalize_job_url). Values are
+    {"jd": str, "timestamp": "YYYY-MM-DD"}, the same shape as the legacy JSON cache.
+    Safe to share between threads; appends and compaction also take a file lock so
+    concurrent pipeline / API processes do not interleave records.
+    """
+
+    def __init__(self, jd_cache_path: str):
+        self.legacy_json_path = jd_cache_path
+        self.base_path = store_base_path(jd_cache_path)
+        self.index_path = self.base_path + INDEX_SUFFIX
+        self.lock_path = self.base_path + LOCK_SUFFIX
+        self._lock = threading.RLock()
+        self._index: dict[str, list] | None = None
+        # segment seq -> bytes indexed so far
+        self._segments: dict[int, int] = {}
+        self._compacted_below = 0
+        # Bytes of superseded / evicted records still on disk (reclaimed by compaction).
+        self._garbage_bytes = 0
+        # (active segment, its size, next segment exists) as of the last sync; see _disk_signature.
+        self._disk_sig: tuple | None = None
+        self._dirty = False
+        self._migrated_json: dict[str, Any] = {}
+        self.imported_legacy = 0
+        self.codec = (os.environ.get("JD_STORE_CODEC") or "zlib").strip().lower()
+        self._dict_id = ""
+        self._dict_trained_entries = 0
+        self._dicts: dict[str, bytes] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._hot: OrderedDict[str, str] = OrderedDict()
+
+    # --- paths / locking -----------------------------------------------------
+
+    def segment_path(self, seq: int) -> str:
+        return f"{self.base_path}.{seq:06d}{LOG_SUFFIX}"
+
+    def _segments_on_disk(self) -> dict[int, int]:
+        out: dict[int, int] = {}
+        for p in glob.glob(glob.escape(self.base_path) + ".*" + LOG_SUFFIX):
+            m = _SEGMENT_RE.search(p)
+            if m:
+                out[int(m.group(1))] = os.path.getsize(p)
+        return out
+
+    def _disk_signature(self) -> tuple:
+        """
+        Cheap change check for get() misses: other processes only ever append to the newest segment
+        or create the next one (rotation, compaction), so two stats tell whether a resync is needed.
+        """
+        seq = max(self._segments) if self._segments else None
+        try:
+            size = os.path.getsize(self.segment_path(seq)) if seq is not None else -1
+        except OSError:
+            size = -1
+        nxt = seq + 1 if seq is not None else 1
+        return seq, size, os.path.exists(self.segment_path(nxt))
+
+    def dict_path(self, dict_id: str) -> str:
+        return f"{self.base_path}.{dict_id}{DICT_SUFFIX}"
+
+    @property
+    def log_paths(self) -> list[str]:
+        return [self.segment_path(seq) for seq in sorted(self._segments)]
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        with open(self.lock_path, "a") as lf:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+    # --- loading -------------------------------------------------------------
+
+    def _ensure_loaded(self) -> dict[str, list]:
+        if self._index is not None:
+            return self._index
+        with self._lock:
+            if self._index is None:
+                self._load()
+        assert self._index is not None
+        return self._index
+
+    def _load(self) -> None:
+        self._adopt_unsegmented_log()
+        self._index = {}
+        self._segments = {}
+        if os.path.isfile(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    snap = json.load(f)
+                if snap.get("version") == INDEX_VERSION:
+                    self._index = {k: list(v) for k, v in (snap.get("entries") or {}).items()}
+                    self._segments = {int(k): int(v) for k, v in (snap.get("segments") or {}).items()}
+                    self._compacted_below = int(snap.get("compacted_below", 0))
+                    self._garbage_bytes = int(snap.get("garbage_bytes", 0))
+                    self._migrated_json = dict(snap.get("migrated_json") or {})
+                    self._dict_id = str(snap.get("dict_id") or "")
+                    self._dict_trained_entries = int(snap.get("dict_trained_entries", 0))
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.warning("JD store index unreadable (%s); rebuilding from segments", e)
+                self._index, self._segments, self._garbage_bytes = {}, {}, 0
+        with self._file_lock():
+            self._sync_from_disk()
+        self._migrate_legacy_json()
+
+    def _adopt_unsegmented_log(self) -> None:
+        """Earlier single-file layout (jd_cache.jdlog) becomes segment 0."""
+        old = self.base_path + LOG_SUFFIX
+        if os.path.isfile(old) and not os.path.exists(self.segment_path(0)):
+            os.replace(old, self.segment_path(0))
+
+    def _sync_from_disk(self) -> None:
+        """Bring the index up to date with segments written since the snapshot (or by another process)."""
+        assert self._index is not None
+        on_disk = self._segments_on_disk()
+        for seq in [s for s in on_disk if s < self._compacted_below and s not in self._segments]:
+            # Left behind by a compaction that crashed before deleting its inputs.
+            with contextlib.suppress(OSError):
+                os.remove(self.segment_path(seq))
+            on_disk.pop(seq)
+        if any(seq not in on_disk or on_disk[seq] < size for seq, size in self._segments.items()):
+            logger.warning("JD store: segments changed under the index snapshot; rebuilding %s", self.base_path)
+            self._index, self._segments, self._garbage_bytes = {}, {}, 0
+            self._close_maps()
+        last = max(on_disk) if on_disk else None
+        for seq in sorted(on_disk):
+            start = self._segments.get(seq, 0)
+            if start < on_disk[seq]:
+                self._segments[seq] = self._replay(seq, start, on_disk[seq], truncate_torn=seq == last)
+                self._dirty = True
+            else:
+                self._segments.setdefault(seq, on_disk[seq])
+        self._disk_sig = self._disk_signature()
+
+    def _replay(self, seq: int, start: int, size: int, truncate_torn: bool) -> int:
+        """Index records of one segment from byte `start`; returns the end of the last complete record."""
+        assert self._index is not None
+        path = self.segment_path(seq)
+        good_end = start
+        with open(path, "rb") as f:
+            f.seek(start)
+            pos = start
+            while pos < size:
+                header = f.readline()
+                if not header:
+                    break
+                try:
+                    h = json.loads(header)
+                    n = int(h["n"])
+                    url = str(h["u"])
+                except (ValueError, KeyError, TypeError):
+                    break
+                data_off = pos + len(header)
+                f.seek(n, os.SEEK_CUR)
+                if f.read(1) != b"\n":
+                    break
+                pos = data_off + n + 1
+                self._mark_garbage(url)
+                if h.get("d"):
+                    self._index.pop(url, None)
+                    self._garbage_bytes += len(header) + 1
+                else:
+                    self._index[url] = [seq, data_off, n, str(h.get("t") or ""), str(h.get("c") or "")]
+                self._hot.pop(url, None)
+                good_end = pos
+        if good_end < size:
+            if truncate_torn:
+                logger.warning("JD store: truncating torn record at offset %s in %s", good_end, path)
+                self._drop_map(seq)
+                with open(path, "r+b") as f:
+                    f.truncate(good_end)
+            else:
+                logger.warning("JD store: unreadable record at offset %s in sealed %s", good_end, path)
+        return good_end
+
+    def _migrate_legacy_json(self) -> None:
+        """Import jd_cache.json entries not already in the store (re-runs only when the JSON changes)."""
+        path = self.legacy_json_path
+        if not path or not os.path.isfile(path):
+            return
+        st = os.stat(path)
+        sig = {"size": st.st_size, "mtime": int(st.st_mtime)}
+        if self._migrated_json == sig:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("JD store: could not read legacy cache %s: %s", path, e)
+            return
+        batch: list[tuple[str, str, str]] = []
+        if isinstance(legacy, dict):
+            assert self._index is not None
+            for url, data in legacy.items():
+                if url in self._index:
+                    continue
+                entry = _entry_from_legacy(data)
+                if entry is not None:
+                    batch.append((str(url), entry[0], entry[1]))
+        self._append_many(batch)
+        self.imported_legacy += len(batch)
+        self._migrated_json = sig
+        self._dirty = True
+        self.flush()
+        if batch:
+            print(f"JD store: imported {len(batch)} entries from {os.path.basename(path)}.")
+            self._maybe_train_dictionary()
+
+    # --- low-level I/O -------------------------------------------------------
+
+    def _append_many(self, records: list[tuple[str, str | None, str]]) -> None:
+        """
+        Append (url, jd, timestamp) records to the active segment under the file lock.
+        jd=None appends a tombstone for url, skipped unless url is still indexed at that timestamp
+        (another process may have re-put it since).
+        """
+        if not records:
+            return
+        assert self._index is not None
+        os.makedirs(os.path.dirname(self.base_path) or ".", exist_ok=True)
+        with self._file_lock():
+            self._sync_from_disk()
+            seq = max(self._segments) if self._segments else 1
+            if self._segments.get(seq, 0) >= SEGMENT_MAX_BYTES:
+                seq += 1
+            if self.codec == "zlib":
+                self._dict_id = self._current_dict_on_disk()
+            zdict = self._load_dict(self._dict_id) if self._dict_id else None
+            f = open(self.segment_path(seq), "ab")
+            try:
+                offset = f.tell()
+                for url, jd, ts in records:
+                    if offset >= SEGMENT_MAX_BYTES:
+                        f.close()
+                        seq += 1
+                        f = open(self.segment_path(seq), "ab")
+                        offset = f.tell()
+                    if jd is None:
+                        loc = self._index.get(url)
+                        if loc is None or loc[3] != ts:
+                            continue
+                        record = _encode_tombstone(url, ts) + b"\n"
+                        f.write(record)
+                        self._mark_garbage(url)
+                        del self._index[url]
+                        self._garbage_bytes += len(record)
+                    else:
+                        header, payload, tag = _encode_record(url, jd, ts, self.codec, self._dict_id, zdict)
+                        record = header + payload + b"\n"
+                        f.write(record)
+                        self._mark_garbage(url)
+                        self._index[url] = [seq, offset + len(header), len(payload), ts, tag]
+                    self._hot.pop(url, None)
+                    offset += len(record)
+                    self._segments[seq] = offset
+            finally:
+                f.close()
+            self._disk_sig = self._disk_signature()
+        self._dirty = True
+
+    def _mark_garbage(self, url: str) -> None:
+        """Account the on-disk bytes of url's current record (about to be superseded or dropped)."""
+        assert self._index is not None
+        loc = self._index.get(url)
+        if loc is None:
+            return
+        h: dict[str, Any] = {"u": url, "t": loc[3], "n": loc[2]}
+        if len(loc) > 4 and loc[4]:
+            h["c"] = loc[4]
+        self._garbage_bytes += len(json.dumps(h, ensure_ascii=False).encode("utf-8")) + 2 + int(loc[2])
+
+    def _read(self, seq: int, offset: int, length: int, codec: str = "") -> str:
+        if length == 0:
+            return ""
+        mm = self._maps.get(seq)
+        if mm is None or offset + length > len(mm):
+            self._drop_map(seq)
+            with open(self.segment_path(seq), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[seq] = mm
+        payload = mm[offset : offset + length]
+        if codec == "z":
+            payload = zlib.decompress(payload)
+        elif codec.startswith("zd:"):
+            d = zlib.decompressobj(zdict=self._load_dict(codec[3:]))
+            payload = d.decompress(payload) + d.flush()
+        return payload.decode("utf-8")
+
+    def _read_loc(self, loc: list) -> str:
+        return self._read(loc[0], loc[1], loc[2], loc[4] if len(loc) > 4 else "")
+
+    def _current_dict_on_disk(self) -> str:
+        """Newest dictionary file (compaction deletes the others); another process may have retrained."""
+        paths = glob.glob(glob.escape(self.base_path) + ".*" + DICT_SUFFIX)
+        if not paths:
+            return ""
+        newest = max(paths, key=os.path.getmtime)
+        return os.path.basename(newest)[len(os.path.basename(self.base_path)) + 1 : -len(DICT_SUFFIX)]
+
+    def _load_dict(self, dict_id: str) -> bytes:
+        zdict = self._dicts.get(dict_id)
+        if zdict is None:
+            with open(self.dict_path(dict_id), "rb") as f:
+                zdict = f.read()
+            self._dicts[dict_id] = zdict
+        return zdict
+
+    def _drop_map(self, seq: int) -> None:
+        mm = self._maps.pop(seq, None)
+        if mm is not None:
+            mm.close()
+
+    def _close_maps(self) -> None:
+        for seq in list(self._maps):
+            self._drop_map(seq)
+
+    # --- public API ----------------------------------------------------------
+
+    def get(self, url: str) -> dict[str, str] | None:
+        """Return {"jd", "timestamp"} for a canonical URL, or None."""
+        self._ensure_loaded()
+        with self._lock:
+            assert self._index is not None
+            loc = self._index.get(url)
+            if loc is None:
+                # Another process may have appended (or compacted) since we indexed; only resync
+                # when the segments actually changed, since most lookups are genuine misses.
+                if self._disk_signature() == self._disk_sig:
+                    return None
+                with self._file_lock():
+                    self._sync_from_disk()
+                loc = self._index.get(url)
+                if loc is None:
+                    return None
+            jd = self._hot.get(url)
+            if jd is None:
+                try:
+                    jd = self._read_loc(loc)
+                except OSError:
+                    with self._file_lock():
+                        self._index, self._segments, self._garbage_bytes = {}, {}, 0
+                        self._close_maps()
+                        self._sync_from_disk()
+                    loc = self._index.get(url)
+                    if loc is None:
+                        return None
+                    jd = self._read_loc(loc)
+                self._hot[url] = jd
+                if len(self._hot) > HOT_CACHE_MAX_ENTRIES:
+                    self._hot.popitem(last=False)
+            else:
+                self._hot.move_to_end(url)
+            return {"jd": jd, "timestamp": loc[3]}
+
+    def get_jd(self, url: str) -> str:
+        entry = self.get(url)
+        return entry["jd"] if entry else ""
+
+    def put(self, url: str, jd: str, timestamp: str | None = None) -> None:
+        """Write-through upsert of one entry."""
+        self.put_many({url: {"jd": jd or "", "timestamp": timestamp or _today()}})
+
+    def put_many(self, entries: dict[str, Any]) -> None:
+        """
+        Upsert {url: {"jd", "timestamp"}} (or legacy {url: "text"}) entries in one append.
+        Entries whose stored JD is identical are skipped, so re-saving is free.
+        """
+        index = self._ensure_loaded()
+        with self._lock:
+            batch: list[tuple[str, str, str]] = []
+            for url, data in (entries or {}).items():
+                entry = _entry_from_legacy(data)
+                if not url or entry is None:
+                    continue
+                jd, ts = entry
+                loc = index.get(url)
+                if loc is not None and self.get_jd(url) == jd:
+                    continue
+                batch.append((str(url), jd, ts))
+            self._append_many(batch)
+            if not self._maybe_train_dictionary():
+                self.maybe_compact()
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._ensure_loaded()
+
+    def __len__(self) -> int:
+        return len(self._ensure_loaded())
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._ensure_loaded().keys()))
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """Materialize every entry (diagnostics / export only; the hot path uses get)."""
+        out: dict[str, dict[str, str]] = {}
+        for url in self.keys():
+            entry = self.get(url)
+            if entry is not None:
+                out[url] = entry
+        return out
+
+    # --- eviction / compaction -----------------------------------------------
+
+    def stats(self) -> dict[str, int]:
+        index = self._ensure_loaded()
+        with self._lock:
+            total = sum(self._segments.values())
+            return {
+                "entries": len(index),
+                "segments": len(self._segments),
+                "total_bytes": total,
+                "live_payload_bytes": sum(int(loc[2]) for loc in index.values()),
+                "garbage_bytes": min(total, self._garbage_bytes),
+            }
+
+    def evict_expired(self, ttl_days: int = DEFAULT_TTL_DAYS) -> int:
+        """
+        Drop entries whose timestamp is older than ttl_days (unparseable timestamps are kept).
+        Each drop appends a tombstone, so a rebuild from the segments (or another process replaying
+        them) does not bring the entry back; the dead records are reclaimed by the next compaction.
+        Returns the count removed.
+        """
+        index = self._ensure_loaded()
+        cutoff = datetime.now() - timedelta(days=ttl_days)
+        with self._lock:
+            expired: list[tuple[str, str | None, str]] = []
+            for url, loc in list(index.items()):
+                try:
+                    ts = datetime.strptime(str(loc[3]), "%Y-%m-%d")
+                except (ValueError, TypeError):
+                    continue
+                if ts < cutoff:
+                    expired.append((url, None, str(loc[3])))
+            before = len(self._index or {})
+            self._append_many(expired)
+            removed = before - len(self._index or {})
+            if removed:
+                self._dirty = True
+                self.flush()
+                self.maybe_compact()
+        return removed
+
+    def maybe_compact(self) -> bool:
+        """Compact when dead bytes outweigh live ones (and the log is big enough to matter)."""
+        s = self.stats()
+        garbage = s["garbage_bytes"]
+        if s["total_bytes"] >= COMPACT_MIN_BYTES and garbage > s["total_bytes"] - garbage:
+            self.compact()
+            return True
+        return False
+
+    def _maybe_train_dictionary(self) -> bool:
+        """Train (and compact with) a new shared dictionary once the store has grown enough."""
+        n = len(self._ensure_loaded())
+        if self.codec != "zlib" or n < DICT_TRAIN_MIN_ENTRIES:
+            return False
+        # Doubling rule applies to failed attempts too (no recurring boilerplate in the sample).
+        if self._dict_trained_entries and n < 2 * self._dict_trained_entries:
+            return False
+        return self.train_dictionary()
+
+    def train_dictionary(self, sample_size: int = DICT_TRAIN_SAMPLE) -> bool:
+        """
+        Train a shared zlib dictionary from a sample of live JDs and re-encode the store with it
+        (via compact). Returns False when the sample has no recurring boilerplate; the attempt is
+        still recorded so the next one waits until the store has doubled.
+        """
+        index = self._ensure_loaded()
+        with self._lock:
+            urls = list(index)
+            step = max(1, len(urls) // max(1, sample_size))
+            zdict = train_zlib_dictionary(self.get_jd(u) for u in urls[::step])
+            if not zdict:
+                self._dict_trained_entries = len(urls)
+                self._dirty = True
+                self.flush()
+                return False
+            dict_id = hashlib.sha1(zdict).hexdigest()[:12]
+            with self._file_lock():
+                if not os.path.isfile(self.dict_path(dict_id)):
+                    tmp = f"{self.dict_path(dict_id)}.{os.getpid()}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(zdict)
+                    os.replace(tmp, self.dict_path(dict_id))
+            self._dicts[dict_id] = zdict
+            self._dict_id = dict_id
+            self._dict_trained_entries = len(urls)
+            self._dirty = True
+            self.compact()
+            return True
+
+    def compact(self) -> None:
+        """
+        Rewrite live entries into fresh segments (re-encoded with the current dictionary),
+        then delete the old segments and unreferenced dictionaries.
+        The snapshot written in between records compacted_below, so a crash before the deletes
+        cannot resurrect superseded records.
+        """
+        self._ensure_loaded()
+        with self._lock, self._file_lock():
+            self._sync_from_disk()
+            assert self._index is not None
+            old_segments = sorted(self._segments)
+            live = sorted(self._index.items(), key=lambda kv: (kv[1][0], kv[1][1]))
+            first_new = (old_segments[-1] + 1) if old_segments else 1
+            zdict = self._load_dict(self._dict_id) if self._dict_id else None
+            new_index: dict[str, list] = {}
+            new_segments: dict[int, int] = {}
+            seq, f, offset = first_new, None, 0
+            try:
+                for url, loc in live:
+                    jd, ts = self._read_loc(loc), loc[3]
+                    if f is None or offset >= SEGMENT_MAX_BYTES:
+                        if f is not None:
+                            f.flush()
+                            os.fsync(f.fileno())
+                            f.close()
+                            seq += 1
+                        f = open(self.segment_path(seq), "wb")
+                        offset = 0
+                    header, payload, tag = _encode_record(url, jd, ts, self.codec, self._dict_id, zdict)
+                    f.write(header + payload + b"\n")
+                    new_index[url] = [seq, offset + len(header), len(payload), ts, tag]
+                    offset += len(header) + len(payload) + 1
+                    new_segments[seq] = offset
+                if f is not None:
+                    f.flush()
+                    os.fsync(f.fileno())
+            finally:
+                if f is not None:
+                    f.close()
+            self._close_maps()
+            self._index = new_index
+            self._segments = new_segments
+            self._compacted_below = first_new
+            self._garbage_bytes = 0
+            self._hot.clear()
+            self._dirty = True
+            self.flush()
+            for old in old_segments:
+                with contextlib.suppress(OSError):
+                    os.remove(self.segment_path(old))
+            for p in glob.glob(glob.escape(self.base_path) + ".*" + DICT_SUFFIX):
+                if p != self.dict_path(self._dict_id):
+                    with contextlib.suppress(OSError):
+                        os.remove(p)
+            self._disk_sig = self._disk_signature()
+        logger.info("JD store: compacted %s segment(s) into %s", len(old_segments), len(new_segments))
+
+    # --- persistence ---------------------------------------------------------
+
+    def flush(self) -> None:
+        """Persist the offset index snapshot (atomic replace)."""
+        with self._lock:
+            if self._index is None or not self._dirty:
+                return
+            snap = {
+                "version": INDEX_VERSION,
+                "segments": {str(k): v for k, v in self._segments.items()},
+                "compacted_below": self._compacted_below,
+                "garbage_bytes": self._garbage_bytes,
+                "migrated_json": self._migrated_json,
+                "dict_id": self._dict_id,
+                "dict_trained_entries": self._dict_trained_entries,
+                "entries": self._index,
+            }
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            tmp = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+            self._dirty = False
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning("JD store: could not write index %s: %s", self.index_path, e)
+            self._close_maps()
+
+
+_STORES: dict[str, JDStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_jd_store(jd_cache_path: str) -> JDStore:
+    """Process-lifetime JDStore for a cache path (shared by every GoogleSheetsClient in the process)."""
+    key = os.path.abspath(jd_cache_path)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = JDStore(key)
+            _STORES[key] = store
+        return store
+
+
+def close_all_stores() -> None:
+    """Flush index snapshots and drop registered stores (atexit; tests)."""
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+        _STORES.clear()
+    for store in stores:
+        store.close()
+
+
+atexit.register(close_all_stores)
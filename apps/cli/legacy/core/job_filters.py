@@ -4,17 +4,18 @@ Single source of truth so both pipelines stay in sync.
 """
 from __future__ import annotations
 
-import re
 import logging
 from collections import Counter
 from typing import Any
 
 from apps.cli.legacy.core.config import get_filters_config, get_sourcing_config, get_title_fit_config
+from apps.cli.legacy.core.filter_engine import CompiledJobFilters
 from apps.cli.legacy.core.sourcing_learned_blocks import (
+    LearnedBlockMatcher,
     learned_block_hit,
-    load_learned_blocked_phrases_for_filter,
+    load_learned_block_matcher,
 )
-from apps.cli.legacy.core.title_fit_gate import evaluate_title_fit
+from apps.cli.legacy.core.title_fit_gate import get_title_fit_engine
 
 # Defaults used when config/pipeline.yaml omits keys (also for tests)
 _DEFAULT_INCLUSIONS = [
@@ -92,21 +93,6 @@ def normalize_sourcing_location(location: str, title: str = "") -> str:
     return loc.strip()
 
 
-def _forbidden_location_hits(location_norm: str, title_lower: str, forbidden_list: list[str]) -> str | None:
-    """Return forbidden token that matched, or None. Single-token entries use word boundaries (avoids India vs Indiana)."""
-    for exc in forbidden_list:
-        e = exc.strip().lower()
-        if not e:
-            continue
-        if " " in e:
-            pattern = re.escape(e)
-        else:
-            pattern = r"\b" + re.escape(e) + r"\b"
-        if re.search(pattern, location_norm) or re.search(pattern, title_lower):
-            return exc
-    return None
-
-
 def _filter_settings() -> dict[str, Any]:
     f = get_filters_config()
     return {
@@ -125,86 +111,54 @@ def _filter_settings() -> dict[str, Any]:
     }
 
 
-def _has_senior_in_title(title: str, cfg: dict[str, Any] | None = None) -> bool:
-    """True if title should be excluded for seniority (strict + soft rules with bypass)."""
-    title_lower = title.lower()
-    fconf = cfg or _filter_settings()
-    all_kw = fconf["seniority_exclusions"]
-    soft = {x.strip().lower() for x in fconf["seniority_soft_exclusions"]}
-    bypass = [b.lower() for b in fconf["seniority_soft_bypass_substrings"]]
-    strict = [k for k in all_kw if k.lower() not in soft]
-
-    for keyword in strict:
-        if re.search(r"\b" + re.escape(keyword) + r"\b", title_lower):
-            return True
-    for keyword in soft:
-        if re.search(r"\b" + re.escape(keyword) + r"\b", title_lower):
-            if any(b in title_lower for b in bypass):
-                continue
-            return True
-    return False
-
-
-def _has_level_exclusion_in_title(title: str, level_exclusions: list[str]) -> bool:
-    title_lower = title.lower()
-    return any(kw in title_lower for kw in level_exclusions)
-
-
-def _has_clearance_in_text(text: str, clearance_keywords: list[str]) -> bool:
-    if not text:
-        return False
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in clearance_keywords)
-
-
-def _has_unrelated_in_title(title: str, unrelated_keywords: list[str]) -> tuple[bool, str | None]:
-    title_lower = title.lower()
-    for keyword in unrelated_keywords:
-        if re.search(r"\b" + re.escape(keyword) + r"\b", title_lower):
-            return True, keyword
-    return False, None
-
-
-def _has_unrelated_in_text(text: str, unrelated_keywords: list[str]) -> tuple[bool, str | None]:
-    text_lower = str(text or "").lower()
-    if not text_lower:
-        return False, None
-    for keyword in unrelated_keywords:
-        kw = str(keyword or "").strip().lower()
-        if not kw:
-            continue
-        if " " in kw:
-            if kw in text_lower:
-                return True, keyword
-            continue
-        if re.search(r"\b" + re.escape(kw) + r"\b", text_lower):
-            return True, keyword
-    return False, None
-
-
-def passes_sourcing_filter(job: dict, *, log_fn=None) -> tuple[bool, str]:
+# (filters config snapshot, CompiledJobFilters) -- rebuilt when config/pipeline.yaml changes.
+_compiled_cache: tuple[Any, CompiledJobFilters | None] = (None, None)
+
+
+def compiled_filters() -> CompiledJobFilters:
+    """Keyword matchers for the current filters config, compiled once per config snapshot."""
+    global _compiled_cache
+    snapshot = get_filters_config()
+    cached_snapshot, compiled = _compiled_cache
+    if compiled is None or cached_snapshot is not snapshot:
+        compiled = CompiledJobFilters(_filter_settings())
+        _compiled_cache = (snapshot, compiled)
+    return compiled
+
+
+def passes_sourcing_filter(
+    job: dict,
+    *,
+    log_fn=None,
+    filters: CompiledJobFilters | None = None,
+    learned_phrases: list[str] | LearnedBlockMatcher | None = None,
+    title_fit_cfg: dict | None = None,
+) -> tuple[bool, str]:
     """
     Rule-based filter for sourcing. Job must have keys: title, location, description.
     Returns (True, "") if job passes, (False, "reason") if excluded.
+    filters / learned_phrases / title_fit_cfg let batch callers (filter_sourcing_jobs) resolve them once.
     """
-    fs = _filter_settings()
+    reason = _sourcing_rules_reason(job, filters or compiled_filters(), learned_phrases)
+    if not reason:
+        tf_cfg = title_fit_cfg if title_fit_cfg is not None else get_title_fit_config()
+        reason = _title_fit_reasons(
+            [str(job.get("title", "") or "")], [str(job.get("description", "") or "")], tf_cfg, "Title fit"
+        )[0]
+    return (False, reason) if reason else (True, "")
+
+
+def _sourcing_rules_reason(
+    job: dict, cf: CompiledJobFilters, learned_phrases: list[str] | LearnedBlockMatcher | None
+) -> str:
+    """Sourcing stages before the title-fit gate (keyword rules, learned title blocks); "" on pass."""
     title = str(job.get("title", "")).lower()
     title_display = str(job.get("title", ""))
     location_raw = str(job.get("location", ""))
     location = normalize_sourcing_location(location_raw, title_display)
     desc = (str(job.get("description", "")) + " " + str(job.get("url", ""))).lower()
 
-    title_inclusions = fs["inclusions"]
-
-    found_match = False
-    for inc in title_inclusions:
-        if len(inc) <= 3:
-            if re.search(r"\b" + re.escape(inc) + r"\b", title):
-                found_match = True
-                break
-        elif inc.lower() in title:
-            found_match = True
-            break
+    found_match = cf.title_included(title)
 
     if not found_match:
         if "business" in title and "analyst" in title:
@@ -217,52 +171,48 @@ def passes_sourcing_filter(job: dict, *, log_fn=None) -> tuple[bool, str]:
             found_match = True
 
     if not found_match:
-        return False, "Title match fail"
+        return "Title match fail"
 
     if any(marker in title for marker in TITLE_NON_US_MARKERS):
-        return False, "Non-US marker in title"
+        return "Non-US marker in title"
 
-    if _has_senior_in_title(title, fs):
-        return False, "Seniority exclusion"
+    if cf.is_senior(title):
+        return "Seniority exclusion"
 
-    if _has_level_exclusion_in_title(title, fs["level_exclusions"]):
-        return False, "Intern/level exclusion"
+    if cf.has_level_exclusion(title):
+        return "Intern/level exclusion"
 
-    if not any(loc in location for loc in fs["allowed_locations"]):
-        return False, "Location region mismatch"
+    if not cf.location_allowed(location):
+        return "Location region mismatch"
 
-    forbidden_hit = _forbidden_location_hits(location, title, fs["forbidden_locations"])
+    forbidden_hit = cf.forbidden_location(location, title)
     if forbidden_hit:
-        return False, f"Location exclusion ({forbidden_hit})"
+        return f"Location exclusion ({forbidden_hit})"
 
-    if _has_clearance_in_text(title + " " + desc, fs["clearance_keywords"]):
-        return False, "Requires security clearance"
+    if cf.has_clearance(title + " " + desc):
+        return "Requires security clearance"
 
-    has_unrelated, keyword = _has_unrelated_in_title(title, fs["unrelated_keywords"])
-    if has_unrelated:
-        return False, f"Unrelated field ({keyword})"
-    has_unrelated_text, text_kw = _has_unrelated_in_text(desc, fs["unrelated_text_keywords"])
-    if has_unrelated_text:
-        return False, f"Unrelated field text ({text_kw})"
+    keyword = cf.unrelated_in_title(title)
+    if keyword is not None:
+        return f"Unrelated field ({keyword})"
+    text_kw = cf.unrelated_in_text(desc)
+    if text_kw is not None:
+        return f"Unrelated field text ({text_kw})"
 
-    s_cfg = get_sourcing_config()
-    learned_phrases = load_learned_blocked_phrases_for_filter(sourcing_cfg=s_cfg)
+    if learned_phrases is None:
+        learned_phrases = load_learned_block_matcher(sourcing_cfg=get_sourcing_config())
     lb = learned_block_hit(str(job.get("title", "") or ""), learned_phrases)
     if lb:
-        return False, f"Learned title block ({lb})"
-
-    tf_cfg = get_title_fit_config()
-    if tf_cfg.get("enabled"):
-        snippet = str(job.get("description", "") or "")
-        ok_tf, reason_tf, _ = evaluate_title_fit(
-            str(job.get("title", "") or ""),
-            snippet,
-            title_fit_cfg=tf_cfg,
-        )
-        if not ok_tf:
-            return False, reason_tf or "Title fit"
+        return f"Learned title block ({lb})"
+    return ""
+
 
-    return True, ""
+def _title_fit_reasons(titles: list[str], snippets: list[str], tf_cfg: dict, fallback: str) -> list[str]:
+    """Title-fit gate for a batch (one engine, evaluate_many); reject reason per job, "" on pass."""
+    if not titles or not tf_cfg.get("enabled"):
+        return [""] * len(titles)
+    results = get_title_fit_engine(tf_cfg).evaluate_many(titles, snippets)
+    return ["" if ok else (reason or fallback) for ok, reason, _ in results]
 
 
 def passes_evaluation_prefilter(job: dict) -> tuple[bool, str]:
@@ -270,47 +220,65 @@ def passes_evaluation_prefilter(job: dict) -> tuple[bool, str]:
     Fast rule-based filter before LLM evaluation. Job should have keys:
     Role Title, Job Description, url (url used as fallback when JD is empty).
     """
+    return evaluation_prefilter_many([job])[0]
+
+
+def evaluation_prefilter_many(jobs: list[dict]) -> list[tuple[bool, str]]:
+    """passes_evaluation_prefilter for a batch: keyword rules per job, then one title-fit evaluate_many."""
+    cf = compiled_filters()
+    reasons = [_evaluation_rules_reason(job, cf) for job in jobs]
+    pending = [i for i, r in enumerate(reasons) if not r]
+    fit = _title_fit_reasons(
+        [str(jobs[i].get("Role Title", "") or jobs[i].get("title", "") or "") for i in pending],
+        [str(jobs[i].get("Job Description", "") or jobs[i].get("description", "") or "") for i in pending],
+        get_title_fit_config(),
+        "Skip: Title fit",
+    )
+    for i, r in zip(pending, fit):
+        reasons[i] = r
+    return [(False, r) if r else (True, "") for r in reasons]
+
+
+def _evaluation_rules_reason(job: dict, cf: CompiledJobFilters) -> str:
     ts = str(job.get("Role Title", "") or job.get("title", ""))
     title = ts.lower()
     jd = str(job.get("Job Description", "") or job.get("description", "") or "")
     url = str(job.get("url", "") or job.get("Job Link", "") or "")
     text_for_clearance = (jd + " " + url).lower()
-    fs = _filter_settings()
-
-    if _has_senior_in_title(title, fs):
-        return False, "Skip: Senior/Lead Role"
-
-    if _has_clearance_in_text(title + " " + text_for_clearance, fs["clearance_keywords"]):
-        return False, "Skip: Requires Security Clearance"
-
-    has_unrelated, keyword = _has_unrelated_in_title(title, fs["unrelated_keywords"])
-    if has_unrelated:
-        return False, f"Skip: Unrelated Field ({keyword})"
-    has_unrelated_text, text_kw = _has_unrelated_in_text(text_for_clearance, fs["unrelated_text_keywords"])
-    if has_unrelated_text:
-        return False, f"Skip: Unrelated Field Text ({text_kw})"
-
-    tf_cfg = get_title_fit_config()
-    if tf_cfg.get("enabled"):
-        snippet = str(job.get("Job Description", "") or job.get("description", "") or "")
-        ok_tf, reason_tf, _ = evaluate_title_fit(
-            str(job.get("Role Title", "") or job.get("title", "") or ""),
-            snippet,
-            title_fit_cfg=tf_cfg,
-        )
-        if not ok_tf:
-            return False, reason_tf or "Skip: Title fit"
 
-    return True, ""
+    if cf.is_senior(title):
+        return "Skip: Senior/Lead Role"
+
+    if cf.has_clearance(title + " " + text_for_clearance):
+        return "Skip: Requires Security Clearance"
+
+    keyword = cf.unrelated_in_title(title)
+    if keyword is not None:
+        return f"Skip: Unrelated Field ({keyword})"
+    text_kw = cf.unrelated_in_text(text_for_clearance)
+    if text_kw is not None:
+        return f"Skip: Unrelated Field Text ({text_kw})"
+    return ""
 
 
 def filter_sourcing_jobs(jobs: list, log_each: bool = False) -> tuple[list, dict[str, int]]:
     """Apply passes_sourcing_filter to each job; return (passed, reject_reason_counts)."""
     out = []
     counts: Counter[str] = Counter()
-    for job in jobs:
-        passed, reason = passes_sourcing_filter(job)
-        if passed:
+    cf = compiled_filters()
+    learned_phrases = load_learned_block_matcher(sourcing_cfg=get_sourcing_config())
+    reasons = [_sourcing_rules_reason(job, cf, learned_phrases) for job in jobs]
+    pending = [i for i, r in enumerate(reasons) if not r]
+    fit = _title_fit_reasons(
+        [str(jobs[i].get("title", "") or "") for i in pending],
+        [str(jobs[i].get("description", "") or "") for i in pending],
+        get_title_fit_config(),
+        "Title fit",
+    )
+    for i, r in zip(pending, fit):
+        reasons[i] = r
+    for job, reason in zip(jobs, reasons):
+        if not reason:
             out.append(job)
         else:
             counts[reason] += 1
@@ -319,6 +287,56 @@ def filter_sourcing_jobs(jobs: list, log_each: bool = False) -> tuple[list, dict
     return out, dict(counts)
 
 
+def filter_sourcing_frame(frame) -> tuple[Any, Any]:
+    """
+    Columnar passes_sourcing_filter for a DataFrame with string columns title / location /
+    description / url (e.g. a JobSpy result). The keyword rules run as vectorized str.contains over
+    whole columns (CompiledJobFilters.frame_reasons); learned blocks and one title-fit evaluate_many
+    run only for the rows that survive them. Returns (pass mask, reject reason Series with "" for passes).
+    """
+    cf = compiled_filters()
+    title_display = frame["title"].astype(object)
+    title = title_display.str.lower()
+    location = _normalize_location_column(frame["location"].astype(object), title)
+    desc = (frame["description"].astype(object) + " " + frame["url"].astype(object)).str.lower()
+    reasons = cf.frame_reasons(title, location, desc, TITLE_NON_US_MARKERS)
+
+    survivors = reasons.index[reasons == ""]
+    if len(survivors):
+        learned_phrases = load_learned_block_matcher(sourcing_cfg=get_sourcing_config())
+        reasons.loc[survivors] = [
+            f"Learned title block ({lb})" if (lb := learned_block_hit(t, learned_phrases)) else ""
+            for t in title_display.loc[survivors]
+        ]
+    survivors = reasons.index[reasons == ""]
+    if len(survivors):
+        reasons.loc[survivors] = _title_fit_reasons(
+            list(title_display.loc[survivors]),
+            list(frame["description"].astype(object).loc[survivors]),
+            get_title_fit_config(),
+            "Title fit",
+        )
+    return reasons == "", reasons
+
+
+def _normalize_location_column(location, title_lower):
+    """normalize_sourcing_location over a Series of raw locations."""
+    loc = location.str.lower().str.split().str.join(" ")
+    remote_title = (
+        title_lower.str.contains("remote", regex=False)
+        | title_lower.str.contains("work from home", regex=False)
+        | title_lower.str.contains("wfh", regex=False)
+    )
+    loc = loc.mask((loc == "") & remote_title, "remote")
+    for a, b in (
+        ("united states of america", "united states"),
+        ("u.s.a.", "usa"),
+        ("u.s.", "usa"),
+    ):
+        loc = loc.str.replace(a, b, regex=False)
+    return loc.str.strip()
+
+
 def print_sourcing_filter_summary(
     static_rejects: dict[str, int],
     *,
@@ -326,6 +344,8 @@ def print_sourcing_filter_summary(
     after_static: int,
     ai_rejected: int = 0,
     saved_count: int = 0,
+    ai_cache_hits: int = 0,
+    ai_cache_misses: int = 0,
 ) -> None:
     """Single-line-friendly summary for operators and agents."""
     print("\n--- Sourcing filter summary ---")
@@ -346,5 +366,7 @@ def print_sourcing_filter_summary(
             print(f"  Rejected ({reason}): {n}")
     if ai_rejected:
         print(f"  Rejected (AI sniffer): {ai_rejected}")
+    if ai_cache_hits or ai_cache_misses:
+        print(f"  AI sniff/tag cache: {ai_cache_hits} hits, {ai_cache_misses} misses")
     print(f"  Proceeding to sheet/tagging: {saved_count}")
     print("--- End sourcing summary ---\n")
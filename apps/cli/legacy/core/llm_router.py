@@ -4,6 +4,7 @@ import hashlib
 import json
 import time
 import sys
+import threading
 from datetime import datetime, timezone
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 import requests # type: ignore
@@ -18,6 +19,23 @@ def get_evaluation_config():
     return get_evaluation_config()
 
 
+# Gemini request pacing shared by every router and thread in the process: concurrent callers
+# (sourcing sniff/tag workers) queue for start slots instead of each sleeping independently.
+_GEMINI_PACE_LOCK = threading.Lock()
+_gemini_next_slot = 0.0
+
+
+def _wait_gemini_slot(delay: float) -> None:
+    """Block until at least `delay` seconds have passed since the previous Gemini request started."""
+    global _gemini_next_slot
+    with _GEMINI_PACE_LOCK:
+        now = time.monotonic()
+        start = max(now, _gemini_next_slot)
+        _gemini_next_slot = start + delay
+    if start > now:
+        time.sleep(start - now)
+
+
 class LLMRouter:
     @staticmethod
     def _parse_google_rfc3339_utc(value: Any) -> datetime | None:
@@ -79,6 +97,11 @@ class LLMRouter:
             
         self._session = requests.Session()
         self.cache_registry_path = "data/gemini_context_caches.json"
+        # One router is shared by the sourcing agent's ai_max_in_flight workers: _cache_lock guards the
+        # context-cache registry (held while creating a cache so workers do not create duplicates),
+        # _state_lock the stickiness counters and fail streaks. Neither is held across a model call.
+        self._cache_lock = threading.RLock()
+        self._state_lock = threading.Lock()
         self._cache_registry: Dict[str, Any] = self._load_cache_registry()
         self._sticky_provider: str | None = None
         self._sticky_remaining_calls: int = 0
@@ -97,12 +120,46 @@ class LLMRouter:
 
     def _save_cache_registry(self):
         """Saves current cache IDs to disk."""
-        try:
-            os.makedirs(os.path.dirname(self.cache_registry_path), exist_ok=True)
-            with open(self.cache_registry_path, "w") as f:
-                json.dump(self._cache_registry, f, indent=2)
-        except:
-            pass
+        with self._cache_lock:
+            try:
+                os.makedirs(os.path.dirname(self.cache_registry_path), exist_ok=True)
+                with open(self.cache_registry_path, "w") as f:
+                    json.dump(self._cache_registry, f, indent=2)
+            except:
+                pass
+
+    def _drop_cached_content(self, cache_name: str) -> None:
+        """Forget a cachedContent the API rejected (expired / 403)."""
+        with self._cache_lock:
+            self._cache_registry = {
+                k: v
+                for k, v in self._cache_registry.items()
+                if not (isinstance(v, dict) and v.get("name") == cache_name)
+            }
+            self._save_cache_registry()
+
+    def _consume_sticky_call(self) -> None:
+        with self._state_lock:
+            self._sticky_remaining_calls = max(0, self._sticky_remaining_calls - 1)
+            if self._sticky_remaining_calls == 0:
+                self._sticky_provider = None
+
+    def _reset_fail_streak(self, attr: str) -> None:
+        with self._state_lock:
+            setattr(self, attr, 0)
+
+    def _bump_fail_streak(
+        self, attr: str, stick_to: str | None, stick_failures: int, stick_calls: int
+    ) -> tuple[int, bool]:
+        """Count one more failure; (streak, True) when it activates stickiness to stick_to."""
+        with self._state_lock:
+            streak = getattr(self, attr) + 1
+            setattr(self, attr, streak)
+            if stick_to and stick_failures > 0 and stick_calls > 0 and streak >= stick_failures:
+                self._sticky_provider = stick_to
+                self._sticky_remaining_calls = stick_calls
+                return streak, True
+            return streak, False
 
     def _get_or_create_cache(self, system_prompt: str, model_name: str) -> str | None:
         """
@@ -121,6 +178,11 @@ class LLMRouter:
         content_hash = hashlib.sha256(system_prompt.encode()).hexdigest()
         
         # 3. Check registry for existing cache (skip entries past expireTime — avoids 403 every call)
+        with self._cache_lock:
+            return self._cached_content_locked(content_hash, clean_model, system_prompt)
+
+    def _cached_content_locked(self, content_hash: str, clean_model: str, system_prompt: str) -> str | None:
+        """_get_or_create_cache body; caller holds _cache_lock."""
         cached = self._cache_registry.get(content_hash)
         if cached:
             if cached.get("model") == clean_model:
@@ -361,13 +423,14 @@ class LLMRouter:
             max_retries = 3
             backoff = 3
 
-            # Optional throttle (default 0.5s) for strict RPM limits; set GEMINI_REQUEST_DELAY_SEC=0 on paid tiers.
+            # Optional throttle (default 0.5s between request starts, process-wide) for strict RPM limits;
+            # set GEMINI_REQUEST_DELAY_SEC=0 on paid tiers.
             try:
                 req_delay = float(os.environ.get("GEMINI_REQUEST_DELAY_SEC", "0.5"))
             except ValueError:
                 req_delay = 0.5
             if req_delay > 0:
-                time.sleep(req_delay)
+                _wait_gemini_slot(req_delay)
             
             for attempt in range(max_retries):
                 r = self._session.post(url, headers=headers, json=payload, timeout=60)
@@ -376,8 +439,7 @@ class LLMRouter:
                 if r.status_code in (404, 410) and cache_name:
                     print("  ⚠ Context cache expired. Retrying without cache...")
                     # Remove from registry
-                    self._cache_registry = {k: v for k, v in self._cache_registry.items() if (isinstance(v, dict) and v.get("name") != cache_name)}
-                    self._save_cache_registry()
+                    self._drop_cached_content(cache_name)
                     # Fallback payload update
                     payload.pop("cachedContent", None) # type: ignore
                     payload["contents"][0]["parts"].insert(0, {"text": f"System Instruction:\n{system_prompt}\n\nTask:\n"}) # type: ignore
@@ -391,13 +453,7 @@ class LLMRouter:
                         "  ⚠ Gemini 403 while using context cache. Retrying without cachedContent "
                         "(registry entry removed; set GEMINI_USE_CONTEXT_CACHE=0 to disable caching)."
                     )
-                    dead_name = cache_in_flight
-                    self._cache_registry = {
-                        k: v
-                        for k, v in self._cache_registry.items()
-                        if not (isinstance(v, dict) and v.get("name") == dead_name)
-                    }
-                    self._save_cache_registry()
+                    self._drop_cached_content(cache_in_flight)
                     payload.pop("cachedContent", None) # type: ignore
                     if not any(
                         isinstance(p, dict)
@@ -509,20 +565,22 @@ class LLMRouter:
         stick_calls = int(eval_cfg.get("provider_stickiness_calls", 20) or 20)
         using_sticky = False
         openrouter_sticky_fallback = False
-        if stick_enabled and self._sticky_provider and self._sticky_remaining_calls > 0:
-            if self._sticky_provider == "openrouter_fallback" and base_provider == "openrouter":
+        with self._state_lock:
+            sticky_provider, sticky_left = self._sticky_provider, self._sticky_remaining_calls
+        if stick_enabled and sticky_provider and sticky_left > 0:
+            if sticky_provider == "openrouter_fallback" and base_provider == "openrouter":
                 openrouter_sticky_fallback = True
                 using_sticky = True
                 print(
                     f"  -> Provider stickiness active: OpenRouter fallback model "
-                    f"({self._sticky_remaining_calls} call(s) remaining)."
+                    f"({sticky_left} call(s) remaining)."
                 )
             else:
-                provider = self._sticky_provider
+                provider = sticky_provider
                 using_sticky = True
                 print(
                     f"  -> Provider stickiness active: {provider} "
-                    f"({self._sticky_remaining_calls} call(s) remaining)."
+                    f"({sticky_left} call(s) remaining)."
                 )
         fb_raw = eval_cfg.get("fallback_provider")
         fb_env = os.environ.get("EVAL_FALLBACK_PROVIDER")
@@ -575,17 +633,13 @@ class LLMRouter:
             if openrouter_sticky_fallback:
                 if not fb_model:
                     print("  ⚠ OpenRouter stickiness active but openrouter_fallback_model is empty.")
-                    self._sticky_remaining_calls = max(0, self._sticky_remaining_calls - 1)
-                    if self._sticky_remaining_calls == 0:
-                        self._sticky_provider = None
+                    self._consume_sticky_call()
                     return "", "FAILED"
                 print("  -> OpenRouter (sticky fallback model)...")
                 text = _one_or(fb_model, fast_429=False, label="OpenRouter")
-                self._sticky_remaining_calls = max(0, self._sticky_remaining_calls - 1)
-                if self._sticky_remaining_calls == 0:
-                    self._sticky_provider = None
+                self._consume_sticky_call()
                 if text:
-                    self._openrouter_fail_streak = 0
+                    self._reset_fail_streak("_openrouter_fail_streak")
                     return text, "OPENROUTER_FALLBACK"
                 print("  ⚠ No valid response from OpenRouter fallback (sticky).")
                 return "", "FAILED"
@@ -596,7 +650,7 @@ class LLMRouter:
             fast_429 = self._openrouter_429_should_fast_fallback()
             text = _one_or(model_name, fast_429=fast_429, label="OpenRouter")
             if text:
-                self._openrouter_fail_streak = 0
+                self._reset_fail_streak("_openrouter_fail_streak")
                 return text, "OPENROUTER"
 
             if (
@@ -607,22 +661,18 @@ class LLMRouter:
                 print("  -> OpenRouter primary empty; trying openrouter_fallback_model...")
                 text2 = _one_or(fb_model, fast_429=False, label="OpenRouter fallback")
                 if text2:
-                    self._openrouter_fail_streak = 0
+                    self._reset_fail_streak("_openrouter_fail_streak")
                     return text2, "OPENROUTER_FALLBACK"
 
-            self._openrouter_fail_streak += 1
-            if (
-                stick_enabled
-                and stick_failures > 0
-                and self._openrouter_fail_streak >= stick_failures
-                and stick_calls > 0
-                and fb_model
-                and not fallback_explicitly_off
-            ):
-                self._sticky_provider = "openrouter_fallback"
-                self._sticky_remaining_calls = stick_calls
+            streak, stuck = self._bump_fail_streak(
+                "_openrouter_fail_streak",
+                "openrouter_fallback" if stick_enabled and fb_model and not fallback_explicitly_off else None,
+                stick_failures,
+                stick_calls,
+            )
+            if stuck:
                 print(
-                    f"  ⚠ OpenRouter primary failed {self._openrouter_fail_streak} time(s); "
+                    f"  ⚠ OpenRouter primary failed {streak} time(s); "
                     f"activating fallback-model stickiness for {stick_calls} call(s)."
                 )
 
@@ -636,9 +686,7 @@ class LLMRouter:
                 system_prompt, user_prompt, formatting_instruction=formatting_instruction, model=None
             )
             if using_sticky:
-                self._sticky_remaining_calls = max(0, self._sticky_remaining_calls - 1)
-                if self._sticky_remaining_calls == 0:
-                    self._sticky_provider = None
+                self._consume_sticky_call()
             if text:
                 return text, "OPENAI"
             print("  ⚠ No valid response received from OpenAI.")
@@ -652,20 +700,17 @@ class LLMRouter:
             system_prompt, user_prompt, formatting_instruction=formatting_instruction, model=model
         )
         if text:
-            self._gemini_fail_streak = 0
+            self._reset_fail_streak("_gemini_fail_streak")
             return text, "GEMINI"
-        self._gemini_fail_streak += 1
-        if (
-            stick_enabled
-            and stick_failures > 0
-            and self._gemini_fail_streak >= stick_failures
-            and stick_calls > 0
-            and (os.environ.get("OPENAI_API_KEY") or "").strip()
-        ):
-            self._sticky_provider = "openai"
-            self._sticky_remaining_calls = stick_calls
+        streak, stuck = self._bump_fail_streak(
+            "_gemini_fail_streak",
+            "openai" if stick_enabled and (os.environ.get("OPENAI_API_KEY") or "").strip() else None,
+            stick_failures,
+            stick_calls,
+        )
+        if stuck:
             print(
-                f"  ⚠ Gemini failed {self._gemini_fail_streak} time(s); "
+                f"  ⚠ Gemini failed {streak} time(s); "
                 f"activating OpenAI stickiness for {stick_calls} call(s)."
             )
 
@@ -0,0 +1,68 @@
+"""
+Aho-Corasick multi-pattern substring matcher (stdlib only).
+
+Used where many literal phrases are tested against one text: learned title blocks
+(sourcing_learned_blocks.LearnedBlockMatcher) and calibration patterns (score_calibrator).
+Building is O(total pattern length); one scan of a text is O(len(text) + matches), independent
+of the number of patterns. A merged re alternation does not help here: re tries every
+alternative at every position.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class AhoCorasick:
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    out.append([])
+                    nxt = len(goto) - 1
+                    goto[node][ch] = nxt
+                node = nxt
+            out[node].append(idx)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out = [tuple(o) for o in out]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """(end position, pattern index) for every occurrence of every pattern in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for idx in out[node]:
+                yield pos, idx
+
+    def matched(self, text: str) -> set[int]:
+        """Indexes of the patterns that occur in text (pattern in text)."""
+        return {idx for _, idx in self.iter_matches(text)}
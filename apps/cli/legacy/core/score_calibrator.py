@@ -1,15 +1,27 @@
-"""Post-LLM score calibration from learned patterns (bounded 0-100)."""
+"""
+Post-LLM score calibration from learned patterns (bounded 0-100).
+
+CalibrationModel compiles every pattern_value into one Aho-Corasick automaton, so a JD is scanned
+once however many patterns ingest_feedback has learned; load_calibration_model caches the model per
+patterns-file version (path, mtime, size) for evaluate_all's per-job calls.
+"""
 from __future__ import annotations
 
 import os
+import threading
 from typing import Any, Dict, List, Tuple
 
 import yaml
 
 from apps.cli.legacy.core.learning_schemas import DecisionAudit, LearnedPattern
+from apps.cli.legacy.core.phrase_automaton import AhoCorasick
 
 DEFAULT_PATTERNS_PATH = os.path.join(os.getcwd(), "data", "learned_patterns.yaml")
 
+# Below this many patterns, str `in` per pattern (C speed) beats the pure-Python automaton scan
+# of a ~5 KB JD; from a few hundred patterns on the automaton wins and its cost stays flat.
+AUTOMATON_MIN_PATTERNS = 256
+
 
 def _coerce_sheet_text(val: Any) -> str:
     """Sheets / pandas often surface empty cells as float NaN; str() alone breaks str.join."""
@@ -45,17 +57,88 @@ def _load_patterns(path: str | None = None) -> List[LearnedPattern]:
         return []
 
 
+class CalibrationModel:
+    """Learned patterns compiled for compute_calibration_delta (one automaton scan per haystack)."""
+
+    def __init__(self, patterns: List[LearnedPattern]):
+        self.patterns = list(patterns)
+        # Contribution per pattern, in file order (float sums stay in the same order as before).
+        self._entries: List[Tuple[LearnedPattern, float]] = []
+        values: List[str] = []
+        for pat in self.patterns:
+            pv = (pat.pattern_value or "").strip().lower()
+            if len(pv) < 2:
+                continue
+            values.append(pv)
+            self._entries.append((pat, pat.weight_adjustment * max(0.1, min(1.0, pat.confidence))))
+        self._values = values
+        self._automaton = AhoCorasick(values) if len(values) >= AUTOMATON_MIN_PATTERNS else None
+
+    def _matched(self, hay: str) -> List[int]:
+        if self._automaton is None:
+            return [i for i, pv in enumerate(self._values) if pv in hay]
+        return sorted(self._automaton.matched(hay))
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def delta(self, hay: str, max_abs_delta: int) -> Tuple[int, List[Dict[str, Any]]]:
+        delta = 0.0
+        matched: List[Dict[str, Any]] = []
+        for idx in self._matched(hay):
+            pat, w = self._entries[idx]
+            if pat.pattern_type == "penalize":
+                delta -= w
+            else:
+                delta += w
+            matched.append(
+                {
+                    "pattern_type": pat.pattern_type,
+                    "pattern_value": pat.pattern_value,
+                    "contribution": round(w, 4) if pat.pattern_type == "boost" else -round(w, 4),
+                }
+            )
+        int_delta = int(round(delta))
+        int_delta = max(-max_abs_delta, min(max_abs_delta, int_delta))
+        return int_delta, matched
+
+
+# path -> ((mtime_ns, size), CalibrationModel)
+_MODELS: Dict[str, Tuple[Tuple[int, int], CalibrationModel]] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def load_calibration_model(path: str | None = None) -> CalibrationModel:
+    """CalibrationModel for the patterns file, rebuilt only when the file changes."""
+    p = path or DEFAULT_PATTERNS_PATH
+    try:
+        st = os.stat(p)
+    except OSError:
+        return CalibrationModel([])
+    key = (st.st_mtime_ns, st.st_size)
+    with _MODELS_LOCK:
+        cached = _MODELS.get(p)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    model = CalibrationModel(_load_patterns(p))
+    with _MODELS_LOCK:
+        _MODELS[p] = (key, model)
+    return model
+
+
 def compute_calibration_delta(
     jd_text: str,
     title: str = "",
     company: str = "",
-    patterns: List[LearnedPattern] | None = None,
+    patterns: List[LearnedPattern] | CalibrationModel | None = None,
     max_abs_delta: int = 15,
 ) -> Tuple[int, List[Dict[str, Any]]]:
     """
     Sum pattern contributions: boost adds, penalize subtracts.
     Each pattern matches if pattern_value (lowercased) appears in haystack.
     Delta is clamped to [-max_abs_delta, max_abs_delta].
+    patterns: a compiled CalibrationModel (load_calibration_model), a pattern list, or None for the
+    default patterns file.
     """
     hay = " ".join(
         [
@@ -67,32 +150,13 @@ def compute_calibration_delta(
     if not hay.strip():
         return 0, []
 
-    plist = patterns if patterns is not None else _load_patterns()
-    delta = 0.0
-    matched: List[Dict[str, Any]] = []
-
-    for pat in plist:
-        pv = (pat.pattern_value or "").strip().lower()
-        if len(pv) < 2:
-            continue
-        if pv not in hay:
-            continue
-        w = pat.weight_adjustment * max(0.1, min(1.0, pat.confidence))
-        if pat.pattern_type == "penalize":
-            delta -= w
-        else:
-            delta += w
-        matched.append(
-            {
-                "pattern_type": pat.pattern_type,
-                "pattern_value": pat.pattern_value,
-                "contribution": round(w, 4) if pat.pattern_type == "boost" else -round(w, 4),
-            }
-        )
-
-    int_delta = int(round(delta))
-    int_delta = max(-max_abs_delta, min(max_abs_delta, int_delta))
-    return int_delta, matched
+    if patterns is None:
+        model = load_calibration_model()
+    elif isinstance(patterns, CalibrationModel):
+        model = patterns
+    else:
+        model = CalibrationModel(patterns)
+    return model.delta(hay, max_abs_delta)
 
 
 def apply_calibration(
@@ -100,7 +164,7 @@ def apply_calibration(
     jd_text: str,
     title: str = "",
     company: str = "",
-    patterns: List[LearnedPattern] | None = None,
+    patterns: List[LearnedPattern] | CalibrationModel | None = None,
     max_abs_delta: int = 15,
     cycle_id: str = "",
 ) -> Tuple[int, DecisionAudit]:
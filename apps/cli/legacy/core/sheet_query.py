@@ -0,0 +1,100 @@
+"""
+Column-projected reads for status / score queries on a daily tab (GoogleSheetsClient.select_rows,
+count_rows, count_by_column).
+
+get_all_records() downloads every column, including the large Reasoning / Decision Audit / Evidence
+JSON cells, to test one or two fields. A projected query instead:
+  1. resolves header positions from the cached header row (one row_values(1) per worksheet);
+  2. fetches only the filter columns (e.g. Status + Apply Score) in one batch_get;
+  3. when full rows are needed, fetches just the matching rows, coalesced into contiguous ranges.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping
+
+from gspread.utils import numericise_all, rowcol_to_a1
+
+# Rows per batch_get when fetching matched rows (each contiguous run is one range).
+ROW_FETCH_MAX_RANGES = 100
+
+
+def column_letter(col_idx0: int) -> str:
+    return "".join(ch for ch in rowcol_to_a1(1, col_idx0 + 1) if ch.isalpha())
+
+
+def header_positions(headers: list, names: Iterable[str]) -> dict[str, int]:
+    """0-based positions of the given header names (exact match after strip); missing names omitted."""
+    stripped = [str(h).strip() for h in headers or []]
+    out: dict[str, int] = {}
+    for name in names:
+        if name in stripped:
+            out[name] = stripped.index(name)
+    return out
+
+
+def cell_matches(key: str, actual: Any, target: Any) -> bool:
+    """Equality used by _get_jobs_by_criteria: strip + case-insensitive; Match Type ignores '*'."""
+    a = str(actual if actual is not None else "").strip()
+    if key == "Match Type":
+        a = a.replace("*", "")
+    return a.lower() == str(target).strip().lower()
+
+
+def score_value(raw: Any) -> float:
+    try:
+        return float(str(raw if raw is not None else "0").strip() or "0")
+    except ValueError:
+        return 0.0
+
+
+def matching_rows(
+    columns: Mapping[str, list],
+    where: Mapping[str, Any] | None = None,
+    min_values: Mapping[str, float] | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    """1-based sheet rows (data starts at row 2) whose projected cells satisfy where / min_values."""
+    n = max((len(v) for v in columns.values()), default=0)
+    out: list[int] = []
+    for i in range(n):
+        ok = True
+        for key, target in (where or {}).items():
+            col = columns.get(key) or []
+            if not cell_matches(key, col[i] if i < len(col) else "", target):
+                ok = False
+                break
+        if ok:
+            for key, floor in (min_values or {}).items():
+                col = columns.get(key) or []
+                if score_value(col[i] if i < len(col) else "") < float(floor):
+                    ok = False
+                    break
+        if ok:
+            out.append(i + 2)
+            if limit is not None and len(out) >= limit:
+                break
+    return out
+
+
+def row_runs(rows: list[int]) -> list[tuple[int, int]]:
+    """Coalesce sorted row numbers into inclusive (first, last) runs."""
+    runs: list[tuple[int, int]] = []
+    for r in rows:
+        if runs and r == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], r)
+        else:
+            runs.append((r, r))
+    return runs
+
+
+def records_from_rows(headers: list, rows: Mapping[int, list]) -> list[dict[str, Any]]:
+    """get_all_records()-shaped dicts (numericised, blank-padded) keyed by header, plus _row_index."""
+    out: list[dict[str, Any]] = []
+    width = len(headers)
+    for row_ix in sorted(rows):
+        values = list(rows[row_ix])[:width]
+        values += [""] * (width - len(values))
+        record: dict[str, Any] = dict(zip(headers, numericise_all(values)))
+        record["_row_index"] = row_ix
+        out.append(record)
+    return out
@@ -0,0 +1,149 @@
+"""
+Process-wide Sheets API pacing and call counters (GoogleSheetsClient._with_retries).
+
+Google enforces per-minute read and write request quotas (60/min per user and 300/min per project by
+default). Instead of firing requests until a 429 and then sleeping, every call takes a token from the
+read or write bucket first: buckets refill at sheet.quota_read_per_min / quota_write_per_min and allow
+a burst of quota_burst_sec worth of requests. A 429 empties the bucket so the following calls pace
+themselves. All GoogleSheetsClient instances in a process share one SheetsQuota (same credentials,
+same quota). Env SHEETS_READ_QUOTA_PER_MIN / SHEETS_WRITE_QUOTA_PER_MIN override; 0 = no pacing.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from apps.cli.legacy.core.config import get_sheet_config
+
+DEFAULT_READ_PER_MIN = 60.0
+DEFAULT_WRITE_PER_MIN = 60.0
+DEFAULT_BURST_SEC = 10.0
+
+# op_name fragments that mark a write request; only consulted when a call site passes no explicit kind
+# (GoogleSheetsClient._with_retries call sites all do).
+_WRITE_OP_MARKERS = ("update", "append", "clear", "ensure_columns", "sort_range", "format", "resize", "flush", "add_")
+
+
+def is_write_op(op_name: str, kind: str | None = None) -> bool:
+    if kind:
+        return kind == "write"
+    name = (op_name or "").lower()
+    return any(m in name for m in _WRITE_OP_MARKERS)
+
+
+class TokenBucket:
+    """Reservation token bucket: acquire() books a token (possibly in the future) and sleeps until it is due."""
+
+    def __init__(
+        self,
+        per_min: float,
+        burst_sec: float = DEFAULT_BURST_SEC,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = max(0.0, float(per_min)) / 60.0
+        self.capacity = max(1.0, self.rate * max(0.0, float(burst_sec)))
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """Take one token; returns seconds slept (0 when a token was available or pacing is off)."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            self.tokens -= 1.0
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def drain(self) -> None:
+        """Empty the bucket (after a 429) so the next caller waits a full token interval."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0)
+
+
+@dataclass
+class SheetsCallStats:
+    reads: int = 0
+    writes: int = 0
+    bytes_sent: int = 0
+    throttle_wait_sec: float = 0.0
+    quota_errors: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["requests"] = self.reads + self.writes
+        out["throttle_wait_sec"] = round(self.throttle_wait_sec, 3)
+        return out
+
+
+class SheetsQuota:
+    def __init__(self, read_per_min: float, write_per_min: float, burst_sec: float = DEFAULT_BURST_SEC, **bucket_kwargs):
+        self.read = TokenBucket(read_per_min, burst_sec, **bucket_kwargs)
+        self.write = TokenBucket(write_per_min, burst_sec, **bucket_kwargs)
+        self.stats = SheetsCallStats()
+        self._lock = threading.Lock()
+
+    def _bucket(self, op_name: str, kind: str | None = None) -> TokenBucket:
+        return self.write if is_write_op(op_name, kind) else self.read
+
+    def acquire(self, op_name: str, kind: str | None = None) -> float:
+        waited = self._bucket(op_name, kind).acquire()
+        if waited:
+            with self._lock:
+                self.stats.throttle_wait_sec += waited
+        return waited
+
+    def record(self, op_name: str, kind: str | None = None) -> None:
+        with self._lock:
+            if is_write_op(op_name, kind):
+                self.stats.writes += 1
+            else:
+                self.stats.reads += 1
+
+    def add_bytes(self, n: int) -> None:
+        with self._lock:
+            self.stats.bytes_sent += max(0, int(n or 0))
+
+    def on_quota_error(self, op_name: str, kind: str | None = None) -> None:
+        self._bucket(op_name, kind).drain()
+        with self._lock:
+            self.stats.quota_errors += 1
+
+
+def _rate(env_key: str, cfg_key: str, default: float) -> float:
+    raw = os.environ.get(env_key, "").strip()
+    if raw:
+        return float(raw)
+    return float(get_sheet_config().get(cfg_key, default) or 0)
+
+
+_QUOTA: SheetsQuota | None = None
+_QUOTA_LOCK = threading.Lock()
+
+
+def get_sheets_quota() -> SheetsQuota:
+    """The process-wide SheetsQuota, sized from sheet config / env on first use."""
+    global _QUOTA
+    with _QUOTA_LOCK:
+        if _QUOTA is None:
+            _QUOTA = SheetsQuota(
+                _rate("SHEETS_READ_QUOTA_PER_MIN", "quota_read_per_min", DEFAULT_READ_PER_MIN),
+                _rate("SHEETS_WRITE_QUOTA_PER_MIN", "quota_write_per_min", DEFAULT_WRITE_PER_MIN),
+                float(get_sheet_config().get("quota_burst_sec", DEFAULT_BURST_SEC) or 0),
+            )
+        return _QUOTA
@@ -0,0 +1,115 @@
+"""
+Per-worksheet header schema: required column sets and the single batch_update that appends any
+missing headers (GoogleSheetsClient.ensure_columns).
+
+The old path resolved each column with _get_or_create_col_index, costing update_cell + format
+(+ resize) per missing column and a row_values(1) per call. ensure_columns appends every missing
+header in one batch_update (grid growth, values and bold formatting together) and keeps the header
+row in the client's per-worksheet cache, so later name -> index lookups make no API calls.
+"""
+from __future__ import annotations
+
+from apps.cli.legacy.core.learning_schemas import (
+    SHEET_COL_ACTION_LINK,
+    SHEET_COL_BASE_LLM_SCORE,
+    SHEET_COL_CALIBRATION_DELTA,
+    SHEET_COL_DECISION_AUDIT,
+    SHEET_COL_DIGEST_STATUS,
+    SHEET_COL_EVIDENCE_JSON,
+    SHEET_COL_FEEDBACK,
+    SHEET_COL_FEEDBACK_NOTE,
+)
+
+# Written by update_evaluated_jobs (Status is always column A).
+EVALUATION_COLUMNS = (
+    "Match Type",
+    "Apply Score",
+    "Recommended Resume",
+    "H1B Sponsorship",
+    "Reasoning",
+    "Missing Skills",
+    SHEET_COL_CALIBRATION_DELTA,
+    SHEET_COL_DECISION_AUDIT,
+    SHEET_COL_BASE_LLM_SCORE,
+    SHEET_COL_EVIDENCE_JSON,
+    SHEET_COL_FEEDBACK,
+    SHEET_COL_FEEDBACK_NOTE,
+    SHEET_COL_DIGEST_STATUS,
+    SHEET_COL_ACTION_LINK,
+    "Apply Bucket",
+    "Role Judge Score",
+    "Role Judge Verdict",
+    "Role Judge Notes",
+    "ATS Match %",
+    "ATS Critical Gaps",
+)
+
+# Written by update_resume_for_row.
+RESUME_COLUMNS = ("Resume Status", "Resume Path", "Reviewer Notes")
+
+# Numeric helper column maintained by sort_daily_jobs (sheet_sort.py) for the server-side sortRange.
+SORT_KEY_COLUMN = "Sort Key"
+
+# Ensured on the daily tab at connect time.
+DAILY_TAB_COLUMNS = EVALUATION_COLUMNS + RESUME_COLUMNS + (SORT_KEY_COLUMN,)
+
+# Extra columns added when the grid has to grow, so a later new column rarely needs another resize.
+GRID_GROWTH_HEADROOM = 2
+
+# Header rows are re-read after this long (sheet.header_cache_ttl_sec) to pick up manual column edits.
+HEADER_CACHE_DEFAULT_TTL_SEC = 900.0
+
+
+def column_positions(headers: list, names) -> dict[str, int]:
+    """1-based column index per name (exact match after strip); names not present are omitted."""
+    stripped = [str(h).strip() for h in headers or []]
+    out: dict[str, int] = {}
+    for name in names:
+        if name in stripped:
+            out[name] = stripped.index(name) + 1
+    return out
+
+
+def missing_columns(headers: list, names) -> list[str]:
+    present = {str(h).strip() for h in headers or []}
+    out: list[str] = []
+    for name in names:
+        if name not in present and name not in out:
+            out.append(name)
+    return out
+
+
+def append_headers_requests(sheet_id: int, first_col0: int, names: list[str], col_count: int) -> list[dict]:
+    """batch_update requests that grow the grid if needed and write bold header cells at row 1."""
+    requests: list[dict] = []
+    needed = first_col0 + len(names)
+    if needed > col_count:
+        requests.append(
+            {
+                "appendDimension": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "length": needed - col_count + GRID_GROWTH_HEADROOM,
+                }
+            }
+        )
+    requests.append(
+        {
+            "updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": first_col0},
+                "rows": [
+                    {
+                        "values": [
+                            {
+                                "userEnteredValue": {"stringValue": name},
+                                "userEnteredFormat": {"textFormat": {"bold": True}},
+                            }
+                            for name in names
+                        ]
+                    }
+                ],
+                "fields": "userEnteredValue,userEnteredFormat.textFormat.bold",
+            }
+        }
+    )
+    return requests
@@ -0,0 +1,147 @@
+"""
+Single-pass workbook snapshot for dedupe URL sets (GoogleSheetsClient.get_existing_urls,
+get_applied_urls, get_already_evaluated_or_applied_canonical_urls).
+
+Instead of get_all_values() on every tab for each of the three sets, one snapshot costs:
+  1. spreadsheet.worksheets()                        (metadata)
+  2. values_batch_get(['tab'!1:1, ...])              (header rows of all tabs)
+  3. values_batch_get(['tab'!E2:E, 'tab'!A2:A, ...]) (only Job Link / Status / Applied / Score columns)
+with steps 2-3 chunked to BATCH_GET_MAX_RANGES ranges per request. All three URL sets are derived in
+one scan; the snapshot expires after sheet.url_snapshot_ttl_sec (config/pipeline.yaml).
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+# Keeps batchGet request URLs well under Google's length limit.
+BATCH_GET_MAX_RANGES = 100
+DEFAULT_TTL_SEC = 600.0
+
+# Column roles read for dedupe: header match rules mirror the original per-method scans.
+URL_COL = "url"
+STATUS_COL = "status"
+APPLIED_COL = "applied"
+SCORE_COL = "score"
+
+Caller = Callable[[Callable[[], Any], str], Any]
+
+
+def direct_call(fn: Callable[[], Any], _op_name: str) -> Any:
+    return fn()
+
+
+def dedupe_column_indices(headers: list) -> dict[str, int]:
+    """0-based positions of Job Link / Status / Apply Score / first "applied" header (missing roles omitted)."""
+    out: dict[str, int] = {}
+    for i, h in enumerate(headers or []):
+        name = str(h).strip().lower()
+        if name == "job link" and URL_COL not in out:
+            out[URL_COL] = i
+        elif name == "status" and STATUS_COL not in out:
+            out[STATUS_COL] = i
+        elif name == "apply score" and SCORE_COL not in out:
+            out[SCORE_COL] = i
+        if "applied" in name and APPLIED_COL not in out:
+            out[APPLIED_COL] = i
+    return out
+
+
+def _column_range(title: str, col_idx0: int) -> str:
+    col = "".join(ch for ch in rowcol_to_a1(1, col_idx0 + 1) if ch.isalpha())
+    return absolute_range_name(title, f"{col}2:{col}")
+
+
+def _chunks(items: list, n: int) -> Iterable[list]:
+    for i in range(0, len(items), n):
+        yield items[i : i + n]
+
+
+def batch_get_ranges(spreadsheet, ranges: list[str], call: Caller = direct_call, major_dimension: str = "ROWS") -> list[list]:
+    """values_batch_get in chunks; returns each range's values (list of rows, or columns) in order."""
+    out: list[list] = []
+    for chunk in _chunks(ranges, BATCH_GET_MAX_RANGES):
+        params = {"majorDimension": major_dimension}
+        resp = call(lambda c=chunk: spreadsheet.values_batch_get(c, params=params), "values_batch_get")
+        value_ranges = (resp or {}).get("valueRanges") or []
+        for i in range(len(chunk)):
+            out.append((value_ranges[i].get("values") if i < len(value_ranges) else None) or [])
+    return out
+
+
+def read_dedupe_columns(spreadsheet, titles: list[str], call: Caller = direct_call) -> dict[str, dict[str, list[str]]]:
+    """
+    {tab title: {"url": [...], "status": [...], "applied": [...]}} for data rows (row 2 onward);
+    roles whose header is missing in a tab are absent. Two batched reads regardless of tab count.
+    """
+    headers = batch_get_ranges(spreadsheet, [absolute_range_name(t, "1:1") for t in titles], call)
+    wanted: list[tuple[str, str]] = []
+    ranges: list[str] = []
+    for title, rows in zip(titles, headers):
+        for role, idx in dedupe_column_indices(rows[0] if rows else []).items():
+            wanted.append((title, role))
+            ranges.append(_column_range(title, idx))
+    out: dict[str, dict[str, list[str]]] = {t: {} for t in titles}
+    if not ranges:
+        return out
+    for (title, role), cols in zip(wanted, batch_get_ranges(spreadsheet, ranges, call, major_dimension="COLUMNS")):
+        out[title][role] = [str(v) for v in (cols[0] if cols else [])]
+    return out
+
+
+def iter_dedupe_rows(columns: dict[str, list[str]]) -> Iterable[tuple[int, str, str, str, str]]:
+    """(sheet_row, url, STATUS upper, applied upper, score) for rows with a Job Link."""
+    urls = columns.get(URL_COL) or []
+    status = columns.get(STATUS_COL) or []
+    applied = columns.get(APPLIED_COL) or []
+    score = columns.get(SCORE_COL) or []
+    for i, url in enumerate(urls):
+        if not url:
+            continue
+        s = status[i].strip().upper() if i < len(status) else ""
+        a = applied[i].strip().upper() if i < len(applied) else ""
+        sc = score[i].strip() if i < len(score) else ""
+        yield i + 2, url, s, a, sc
+
+
+@dataclass
+class WorkbookUrlSnapshot:
+    """Canonical URL sets derived from one workbook read; see module docstring."""
+
+    existing_urls: set[str] = field(default_factory=set)
+    applied_urls: set[str] = field(default_factory=set)
+    evaluated_or_applied_urls: set[str] = field(default_factory=set)
+    tabs: int = 0
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    def is_fresh(self, ttl_sec: float = DEFAULT_TTL_SEC) -> bool:
+        return ttl_sec > 0 and (time.monotonic() - self.fetched_at) < ttl_sec
+
+    def add_rows(self, columns: dict[str, list[str]], normalize: Callable[[str], str]) -> None:
+        for _row, url, status, applied, _score in iter_dedupe_rows(columns):
+            self.add(normalize(url), status, applied)
+        self.tabs += 1
+
+    def add(self, canonical: str, status: str, applied: str) -> None:
+        if not canonical:
+            return
+        self.existing_urls.add(canonical)
+        is_applied = applied.startswith("Y")
+        if is_applied:
+            self.applied_urls.add(canonical)
+        if status == "EVALUATED" or is_applied:
+            self.evaluated_or_applied_urls.add(canonical)
+
+
+def fetch_workbook_url_snapshot(spreadsheet, normalize: Callable[[str], str], call: Caller = direct_call) -> WorkbookUrlSnapshot:
+    """Read every tab's dedupe columns (three API reads + chunking) and derive all URL sets."""
+    worksheets = call(spreadsheet.worksheets, "worksheets")
+    titles = [ws.title for ws in worksheets]
+    snap = WorkbookUrlSnapshot()
+    for title, columns in read_dedupe_columns(spreadsheet, titles, call).items():
+        snap.add_rows(columns, normalize)
+    snap.fetched_at = time.monotonic()
+    return snap
@@ -0,0 +1,69 @@
+"""
+Server-side sort of a daily tab (GoogleSheetsClient.sort_daily_jobs).
+
+The old sort downloaded the whole tab, sorted it in Python, cleared the worksheet and re-uploaded
+every row, leaving the tab empty for a moment and costing an O(rows) upload per evaluate_all. Now:
+  1. read only the sort inputs (Apply Score / Match Type / Role Title / Recommended Resume / Job Link)
+     and the numeric "Sort Key" helper column (one batch_get);
+  2. write Sort Key cells whose value changed (usually just the rows evaluated since the last sort);
+  3. one sortRange request on the helper column: the rows move server-side, nothing is cleared.
+The key preserves get_sort_key_for_row ordering: Apply Score desc, Match Type priority, PM boost.
+"""
+from __future__ import annotations
+
+from typing import Callable, Mapping
+
+from apps.cli.legacy.core.sheet_schema import SORT_KEY_COLUMN
+
+# Columns read to (re)compute Sort Key; Job Link / Status mark rows that hold a job.
+SORT_INPUT_COLUMNS = ("Apply Score", "Match Type", "Role Title", "Recommended Resume", "Job Link", "Status")
+
+_SCORE_LIMIT = 9999
+_PRIORITY_LIMIT = 99
+
+
+def encode_sort_key(key: tuple[int, int, int]) -> int:
+    """Map (-score, status_priority, pm_boost) to one non-negative int with the same ascending order."""
+    neg_score, priority, pm_boost = key
+    neg_score = max(-_SCORE_LIMIT, min(_SCORE_LIMIT, int(neg_score)))
+    priority = max(0, min(_PRIORITY_LIMIT, int(priority)))
+    return ((neg_score + _SCORE_LIMIT) * 100 + priority) * 10 + (1 if pm_boost else 0)
+
+
+def _parse_key(raw) -> int | None:
+    try:
+        return int(str(raw).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def changed_sort_keys(
+    columns: Mapping[str, list],
+    row_key: Callable[[list, list], tuple],
+) -> list[tuple[int, int]]:
+    """
+    (sheet_row, encoded key) for data rows whose Sort Key cell is missing or stale. row_key is
+    called with a projected row and its header list (GoogleSheetsClient.get_sort_key_for_row).
+    """
+    names = [n for n in SORT_INPUT_COLUMNS if n in columns]
+    current = list(columns.get(SORT_KEY_COLUMN) or [])
+    n = max((len(columns[name]) for name in names), default=0)
+    out: list[tuple[int, int]] = []
+    for i in range(n):
+        values = [columns[name][i] if i < len(columns[name]) else "" for name in names]
+        if not any(str(v).strip() for v in values):
+            continue
+        key = encode_sort_key(row_key(values, names))
+        if _parse_key(current[i] if i < len(current) else "") != key:
+            out.append((i + 2, key))
+    return out
+
+
+def sort_range_request(sheet_id: int, sort_col0: int) -> dict:
+    """sortRange over every data row (row 2 to the end of the grid), ascending on the helper column."""
+    return {
+        "sortRange": {
+            "range": {"sheetId": sheet_id, "startRowIndex": 1},
+            "sortSpecs": [{"dimensionIndex": sort_col0, "sortOrder": "ASCENDING"}],
+        }
+    }
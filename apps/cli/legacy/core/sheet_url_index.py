@@ -0,0 +1,210 @@
+"""
+Persistent local URL-status index: canonical Job Link -> (tab, row, status, applied, score) for every
+tab of the workbook, so historical daily tabs are not re-downloaded on each run.
+
+Sync (sync_url_index) reads worksheets() metadata once, then re-reads the dedupe columns
+(sheet_snapshot.read_dedupe_columns) only for tabs that need it:
+  - the current daily tab (always);
+  - tabs not yet indexed, and tabs whose grid size (row_count / col_count) changed;
+  - daily tabs within sheet.url_index_recent_days of the current tab (default 0 = none);
+  - every tab on cold start, after sheet.url_index_full_resync_hours, or when the database was built
+    for another spreadsheet.
+When the Drive modifiedTime of the workbook is unchanged since the last sync, nothing is re-read.
+Tabs deleted from the workbook are dropped from the index.
+
+Path: sheet.url_index_path or SHEET_URL_INDEX_DB.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+from apps.cli.legacy.core.config import get_sheet_config
+from apps.cli.legacy.core.sheet_snapshot import (
+    Caller,
+    WorkbookUrlSnapshot,
+    direct_call,
+    iter_dedupe_rows,
+    read_dedupe_columns,
+)
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+
+DEFAULT_DB_PATH = "data/sheet_url_index.db"
+DEFAULT_FULL_RESYNC_HOURS = 168.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS url_status (
+    tab TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    canonical_url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT '',
+    applied TEXT NOT NULL DEFAULT '',
+    score TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (tab, row)
+);
+CREATE INDEX IF NOT EXISTS idx_url_status_url ON url_status (canonical_url);
+CREATE TABLE IF NOT EXISTS tab_sync (
+    tab TEXT PRIMARY KEY,
+    sheet_id INTEGER,
+    row_count INTEGER,
+    col_count INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_DATE_TAB_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def resolve_url_index_db_path() -> str:
+    """Absolute path to the URL-status index database."""
+    return resolve_db_path("SHEET_URL_INDEX_DB", "url_index_path", DEFAULT_DB_PATH, get_sheet_config())
+
+
+def _connect(path: str | None = None) -> sqlite3.Connection:
+    return open_wal_db(path or resolve_url_index_db_path(), SCHEMA)
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _is_recent_daily_tab(title: str, current_tab: str, recent_days: int) -> bool:
+    if recent_days <= 0 or not _DATE_TAB_RE.match(title) or not _DATE_TAB_RE.match(current_tab or ""):
+        return False
+    try:
+        delta = datetime.strptime(current_tab, "%Y-%m-%d") - datetime.strptime(title, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return 0 <= delta.days <= recent_days
+
+
+def _workbook_modified_time(spreadsheet, call: Caller) -> str | None:
+    getter = getattr(spreadsheet, "get_lastUpdateTime", None)
+    if getter is None:
+        return None
+    try:
+        return str(call(getter, "drive_modified_time") or "") or None
+    except Exception:
+        return None  # Drive scope missing: fall back to grid-size change detection
+
+
+def sync_url_index(
+    spreadsheet,
+    current_tab: str,
+    normalize: Callable[[str], str],
+    call: Caller = direct_call,
+    db_path: str | None = None,
+    recent_days: int | None = None,
+    full_resync_hours: float | None = None,
+    force_full: bool = False,
+) -> dict[str, Any]:
+    """Bring the index up to date with the workbook (see module docstring). Returns sync stats."""
+    cfg = get_sheet_config()
+    if recent_days is None:
+        recent_days = int(cfg.get("url_index_recent_days", 0) or 0)
+    if full_resync_hours is None:
+        full_resync_hours = float(cfg.get("url_index_full_resync_hours", DEFAULT_FULL_RESYNC_HOURS) or 0)
+    now = time.time()
+    conn = _connect(db_path)
+    try:
+        workbook_id = str(getattr(spreadsheet, "id", "") or "")
+        last_full = float(_get_meta(conn, "last_full_sync") or 0)
+        full = (
+            force_full
+            or last_full <= 0
+            or _get_meta(conn, "spreadsheet_id") != workbook_id
+            or (full_resync_hours > 0 and now - last_full > full_resync_hours * 3600)
+        )
+        known = {
+            r[0]: (r[1], r[2], r[3])
+            for r in conn.execute("SELECT tab, sheet_id, row_count, col_count FROM tab_sync")
+        }
+        # Read before the columns: edits made while we read move modifiedTime and trigger the next sync.
+        modified = _workbook_modified_time(spreadsheet, call)
+        if not full and modified and modified == _get_meta(conn, "workbook_modified") and current_tab in known:
+            return {"full": False, "tabs_total": len(known), "tabs_refreshed": 0, "rows": 0, "unchanged": True}
+
+        worksheets = call(spreadsheet.worksheets, "worksheets")
+        grid = {ws.title: (getattr(ws, "id", None), getattr(ws, "row_count", None), getattr(ws, "col_count", None)) for ws in worksheets}
+        if full:
+            refresh = list(grid)
+        else:
+            refresh = [
+                t
+                for t, g in grid.items()
+                if t == current_tab or known.get(t) != g or _is_recent_daily_tab(t, current_tab, recent_days)
+            ]
+        columns = read_dedupe_columns(spreadsheet, refresh, call) if refresh else {}
+
+        rows = 0
+        with conn:
+            if full:
+                conn.execute("DELETE FROM url_status")
+                conn.execute("DELETE FROM tab_sync")
+            for gone in set(known) - set(grid):
+                conn.execute("DELETE FROM url_status WHERE tab = ?", (gone,))
+                conn.execute("DELETE FROM tab_sync WHERE tab = ?", (gone,))
+            for title, cols in columns.items():
+                conn.execute("DELETE FROM url_status WHERE tab = ?", (title,))
+                batch = []
+                for row, url, status, applied, score in iter_dedupe_rows(cols):
+                    canonical = normalize(url)
+                    if canonical:
+                        batch.append((title, row, canonical, status, applied, score))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO url_status (tab, row, canonical_url, status, applied, score) VALUES (?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+                rows += len(batch)
+                sheet_id, row_count, col_count = grid[title]
+                conn.execute(
+                    "INSERT OR REPLACE INTO tab_sync (tab, sheet_id, row_count, col_count, synced_at) VALUES (?, ?, ?, ?, ?)",
+                    (title, sheet_id, row_count, col_count, now),
+                )
+            _set_meta(conn, "spreadsheet_id", workbook_id)
+            if full:
+                _set_meta(conn, "last_full_sync", str(now))
+            if modified:
+                _set_meta(conn, "workbook_modified", modified)
+        return {"full": full, "tabs_total": len(grid), "tabs_refreshed": len(refresh), "rows": rows, "unchanged": False}
+    finally:
+        conn.close()
+
+
+def load_url_snapshot(db_path: str | None = None) -> WorkbookUrlSnapshot:
+    """Dedupe URL sets (existing / applied / evaluated-or-applied) from the local index."""
+    conn = _connect(db_path)
+    try:
+        snap = WorkbookUrlSnapshot()
+        for canonical, status, applied in conn.execute("SELECT canonical_url, status, applied FROM url_status"):
+            snap.add(canonical, status, applied)
+        snap.tabs = int(conn.execute("SELECT COUNT(*) FROM tab_sync").fetchone()[0])
+        return snap
+    finally:
+        conn.close()
+
+
+def lookup_url(canonical_url: str, db_path: str | None = None) -> list[dict[str, Any]]:
+    """All indexed occurrences of a canonical URL: [{"tab", "row", "status", "applied", "score"}]."""
+    conn = _connect(db_path)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT tab, row, status, applied, score FROM url_status WHERE canonical_url = ? ORDER BY tab, row",
+            (canonical_url,),
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
@@ -0,0 +1,92 @@
+"""
+Per-worksheet cell write coalescer (GoogleSheetsClient._write_cells / flush_writes).
+
+update_evaluated_jobs, update_resume_for_row, the Manual_JD_Tailor updates and the sort-key refresh
+queue gspread.Cell writes here instead of each issuing update_cells (which also sends a null-padded
+rectangle spanning every touched row and column). A flush sends one values batchUpdate per worksheet:
+each row becomes one range from its first to last written column (gaps are null = left unchanged), and
+consecutive rows with the same span are merged into one rectangle. Later writes to a cell replace
+earlier ones. Writes are held for sheet.write_coalesce_sec (0 = flush at the end of every call).
+"""
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Iterable
+
+from gspread.utils import rowcol_to_a1
+
+# Flush regardless of age once this many cells are pending (keeps request bodies well under 10 MB).
+MAX_PENDING_CELLS = 20000
+
+
+class SheetWriteBuffer:
+    def __init__(self):
+        self._pending: dict[Any, dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(worksheet) -> Any:
+        key = getattr(worksheet, "id", None)
+        return worksheet.title if key is None else key
+
+    def add(self, worksheet, cells: Iterable) -> None:
+        entry = self._pending.setdefault(
+            self._key(worksheet), {"worksheet": worksheet, "cells": {}, "since": time.monotonic()}
+        )
+        for cell in cells:
+            entry["cells"][(int(cell.row), int(cell.col))] = cell.value
+
+    def requeue(self, worksheet, cells: dict[tuple[int, int], Any]) -> None:
+        """Put back cells from a failed flush; cells queued again since then keep their newer value."""
+        entry = self._pending.setdefault(
+            self._key(worksheet), {"worksheet": worksheet, "cells": {}, "since": time.monotonic()}
+        )
+        for key, value in cells.items():
+            entry["cells"].setdefault(key, value)
+
+    def pending_cells(self) -> int:
+        return sum(len(e["cells"]) for e in self._pending.values())
+
+    def due(self, max_age_sec: float) -> bool:
+        if not self._pending:
+            return False
+        if max_age_sec <= 0 or self.pending_cells() >= MAX_PENDING_CELLS:
+            return True
+        oldest = min(e["since"] for e in self._pending.values())
+        return time.monotonic() - oldest >= max_age_sec
+
+    def take(self, worksheet=None) -> list[tuple[Any, dict[tuple[int, int], Any]]]:
+        """Remove and return (worksheet, {(row, col): value}) for one worksheet or all of them."""
+        keys = list(self._pending) if worksheet is None else [self._key(worksheet)]
+        out = []
+        for key in keys:
+            entry = self._pending.pop(key, None)
+            if entry and entry["cells"]:
+                out.append((entry["worksheet"], entry["cells"]))
+        return out
+
+
+def value_ranges(cells: dict[tuple[int, int], Any]) -> list[dict[str, Any]]:
+    """Worksheet.batch_update data: one rectangle per run of consecutive rows sharing a column span."""
+    by_row: dict[int, dict[int, Any]] = {}
+    for (r, c), v in cells.items():
+        by_row.setdefault(r, {})[c] = v
+    blocks: list[tuple[int, int, int, int, list[list[Any]]]] = []  # first_row, last_row, first_col, last_col, values
+    for r in sorted(by_row):
+        row = by_row[r]
+        c0, c1 = min(row), max(row)
+        values = [row.get(c) for c in range(c0, c1 + 1)]
+        if blocks and blocks[-1][1] == r - 1 and blocks[-1][2:4] == (c0, c1):
+            first, _, _, _, rows = blocks[-1]
+            rows.append(values)
+            blocks[-1] = (first, r, c0, c1, rows)
+        else:
+            blocks.append((r, r, c0, c1, [values]))
+    return [
+        {"range": f"{rowcol_to_a1(r0, c0)}:{rowcol_to_a1(r1, c1)}", "values": rows}
+        for r0, r1, c0, c1, rows in blocks
+    ]
+
+
+def payload_bytes(data: Any) -> int:
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
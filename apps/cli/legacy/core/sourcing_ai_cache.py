@@ -0,0 +1,132 @@
+"""
+Persistent cache of sourcing AI sniff / tag results (SourcingAgent.normalize_and_save).
+
+The same posting comes back from LinkedIn, Indeed and Google via JobSpy and again on every iteration
+of the interleaved loop, so results are content-addressed: the key is a SHA-256 of the normalized
+(title, company, snippet). Tags depend only on the posting. Sniff verdicts also depend on the
+candidate constraints in the prompt, so their key mixes in a fingerprint of that context.
+Entries live for sourcing.ai_cache_ttl_days (default 7; 0 = cache off). "LLM failed" answers are
+never stored.
+
+Path: sourcing.ai_cache_path or SOURCING_AI_CACHE_DB. Lookups go through an in-process dict first.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable
+
+from apps.cli.legacy.core.config import get_sourcing_config
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+from apps.cli.legacy.core.title_fit_verdicts import normalize_title
+
+DEFAULT_DB_PATH = "data/sourcing_ai_cache.db"
+DEFAULT_TTL_DAYS = 7.0
+SNIPPET_CHARS = 800
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+"""
+
+SNIFF = "sniff"
+TAG = "tag"
+
+
+def content_key(job: dict[str, Any], context: str = "") -> str:
+    """Hex SHA-256 of normalized title / company / snippet (plus an optional prompt-context fingerprint)."""
+    snippet = " ".join(str(job.get("description") or "")[:SNIPPET_CHARS].lower().split())
+    parts = [normalize_title(job.get("title", "")), normalize_title(job.get("company", "")), snippet, context]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def resolve_sourcing_ai_cache_path() -> str:
+    """Absolute path to the sniff / tag cache database."""
+    return resolve_db_path("SOURCING_AI_CACHE_DB", "ai_cache_path", DEFAULT_DB_PATH)
+
+
+class SourcingAICache:
+    def __init__(self, db_path: str | None = None, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_sec = max(0.0, float(ttl_days)) * 86400.0
+        self._memory: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self.ttl_sec <= 0:
+            return None
+        if self._conn is None:
+            self._conn = open_wal_db(self.db_path or resolve_sourcing_ai_cache_path(), SCHEMA)
+        return self._conn
+
+    def _fresh(self, created_at: float, now: float) -> bool:
+        return self.ttl_sec > 0 and now - created_at < self.ttl_sec
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> dict[str, Any]:
+        """Fresh cached values of one kind (SNIFF / TAG); counts hits / misses per distinct key."""
+        now = time.time()
+        wanted = list(dict.fromkeys(keys))
+        out: dict[str, Any] = {}
+        with self._lock:
+            missing = []
+            for key in wanted:
+                cached = self._memory.get((kind, key))
+                if cached and self._fresh(cached[1], now):
+                    out[key] = cached[0]
+                else:
+                    missing.append(key)
+            conn = self._connect() if missing else None
+            for key in missing if conn is not None else []:
+                row = conn.execute(
+                    "SELECT value, created_at FROM results WHERE kind = ? AND key = ?", (kind, key)
+                ).fetchone()
+                if row and self._fresh(row[1], now):
+                    value = json.loads(row[0])
+                    self._memory[(kind, key)] = (value, row[1])
+                    out[key] = value
+            self.hits += len(out)
+            self.misses += len(wanted) - len(out)
+        return out
+
+    def put_many(self, kind: str, values: dict[str, Any]) -> None:
+        """Store JSON-serializable values of one kind."""
+        if not values:
+            return
+        now = time.time()
+        with self._lock:
+            for key, value in values.items():
+                self._memory[(kind, key)] = (value, now)
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (kind, key, value, created_at) VALUES (?, ?, ?, ?)",
+                [(kind, key, json.dumps(value), now) for key, value in values.items()],
+            )
+            conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_sec,))
+            conn.commit()
+
+
+_CACHE: SourcingAICache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_sourcing_ai_cache() -> SourcingAICache:
+    """Process-wide SourcingAICache at the configured path / TTL."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            cfg = get_sourcing_config()
+            _CACHE = SourcingAICache(ttl_days=float(cfg.get("ai_cache_ttl_days", DEFAULT_TTL_DAYS) or 0))
+        return _CACHE
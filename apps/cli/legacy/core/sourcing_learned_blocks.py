@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Tuple
 
 import yaml
 
+from apps.cli.legacy.core.phrase_automaton import AhoCorasick
+
 # Generic role words that rarely discriminate bad vs good fits (skip as mined blocks)
 _STOP_FEATURES = frozenset(
     {
@@ -109,40 +111,103 @@ def mine_blocking_phrases(
     return out
 
 
-_CACHE: tuple[float, tuple[str, ...]] | None = None
+_WORD_RE = re.compile(r"\w+")
 
 
-def load_learned_blocked_phrases_for_filter(
-    *,
-    project_root: str | None = None,
-    sourcing_cfg: Dict[str, Any] | None = None,
-) -> List[str]:
-    """Return lowercase phrases to match against job titles when apply flag is on."""
-    global _CACHE
+class LearnedBlockMatcher:
+    """
+    learned_block_hit over a fixed phrase list in O(title length): single \\w+ words are looked up
+    among the title's word runs (same as a \\b...\\b search), multi-word phrases go through one
+    Aho-Corasick scan, and the earliest phrase in list order wins. Other single tokens (with
+    punctuation) keep the per-phrase regex.
+    """
+
+    def __init__(self, phrases: List[str]):
+        self.phrases: List[str] = []
+        self._words: Dict[str, int] = {}
+        self._other: List[Tuple[int, "re.Pattern[str]"]] = []
+        multi: List[str] = []
+        multi_rank: List[int] = []
+        for p in phrases:
+            pl = (p or "").strip().lower()
+            if not pl:
+                continue
+            rank = len(self.phrases)
+            self.phrases.append(pl)
+            if " " in pl:
+                multi.append(pl)
+                multi_rank.append(rank)
+            elif _WORD_RE.fullmatch(pl):
+                self._words.setdefault(pl, rank)
+            else:
+                self._other.append((rank, re.compile(r"\b" + re.escape(pl) + r"\b")))
+        self._multi = AhoCorasick(multi) if multi else None
+        self._multi_rank = multi_rank
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def first_hit(self, title: str) -> str | None:
+        title_lower = str(title or "").lower()
+        if not self.phrases or not title_lower.strip():
+            return None
+        best = len(self.phrases)
+        if self._words:
+            for w in _WORD_RE.findall(title_lower):
+                rank = self._words.get(w)
+                if rank is not None and rank < best:
+                    best = rank
+        if self._multi is not None:
+            for _, idx in self._multi.iter_matches(title_lower):
+                rank = self._multi_rank[idx]
+                if rank < best:
+                    best = rank
+        for rank, pattern in self._other:
+            if rank >= best:
+                break
+            if pattern.search(title_lower):
+                best = rank
+                break
+        return self.phrases[best] if best < len(self.phrases) else None
+
+
+_EMPTY_MATCHER = LearnedBlockMatcher([])
+
+# (path, mtime_ns, size) -> phrases and their compiled matcher, for the last file read.
+_CACHE: tuple[tuple[str, int, int], tuple[str, ...], LearnedBlockMatcher] | None = None
+
+
+def _learned_blocks_path(project_root: str | None, sourcing_cfg: Dict[str, Any] | None) -> str | None:
+    """Learned-blocks YAML path when apply_learned_title_blocks is on, else None."""
     if sourcing_cfg is None:
         from apps.cli.legacy.core.config import get_sourcing_config
 
         sourcing_cfg = get_sourcing_config()
     if not sourcing_cfg.get("apply_learned_title_blocks"):
-        return []
-
+        return None
     root = (project_root or "").strip() or os.getcwd()
     rel = sourcing_cfg.get("learned_title_blocks_path", "data/sourcing_learned_title_blocks.yaml")
-    path = rel if os.path.isabs(rel) else os.path.join(root, rel)
-    if not os.path.isfile(path):
-        return []
+    return rel if os.path.isabs(rel) else os.path.join(root, rel)
+
+
+def _load_learned_blocks(path: str | None) -> tuple[tuple[str, ...], LearnedBlockMatcher]:
+    """Phrases + matcher for path, parsed and compiled once per file version."""
+    global _CACHE
+    if path is None:
+        return (), _EMPTY_MATCHER
     try:
-        mtime = os.path.getmtime(path)
+        st = os.stat(path)
     except OSError:
-        return []
-    if _CACHE is not None and _CACHE[0] == mtime:
-        return list(_CACHE[1])
+        return (), _EMPTY_MATCHER
+    key = (path, st.st_mtime_ns, st.st_size)
+    if _CACHE is not None and _CACHE[0] == key:
+        return _CACHE[1], _CACHE[2]
 
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
     except OSError:
-        return []
+        return (), _EMPTY_MATCHER
 
     raw = data.get("blocked_phrases") or []
     out: List[str] = []
@@ -154,29 +219,31 @@ def load_learned_blocked_phrases_for_filter(
             if t:
                 out.append(t.lower())
     # de-dup preserve order
-    seen = set()
-    deduped = []
-    for p in out:
-        if p not in seen:
-            seen.add(p)
-            deduped.append(p)
-    _CACHE = (mtime, tuple(deduped))
-    return deduped
+    deduped = tuple(dict.fromkeys(out))
+    _CACHE = (key, deduped, LearnedBlockMatcher(list(deduped)))
+    return _CACHE[1], _CACHE[2]
+
+
+def load_learned_blocked_phrases_for_filter(
+    *,
+    project_root: str | None = None,
+    sourcing_cfg: Dict[str, Any] | None = None,
+) -> List[str]:
+    """Return lowercase phrases to match against job titles when apply flag is on."""
+    return list(_load_learned_blocks(_learned_blocks_path(project_root, sourcing_cfg))[0])
+
+
+def load_learned_block_matcher(
+    *,
+    project_root: str | None = None,
+    sourcing_cfg: Dict[str, Any] | None = None,
+) -> LearnedBlockMatcher:
+    """Compiled matcher for the learned phrases (empty when the apply flag is off); cached per file version."""
+    return _load_learned_blocks(_learned_blocks_path(project_root, sourcing_cfg))[1]
 
 
-def learned_block_hit(title: str, phrases: List[str]) -> str | None:
+def learned_block_hit(title: str, phrases: List[str] | LearnedBlockMatcher) -> str | None:
     """Return matched phrase or None. Multi-word = substring; single word = word boundary."""
-    title_lower = str(title or "").lower()
-    if not title_lower.strip():
-        return None
-    for p in phrases:
-        pl = (p or "").strip().lower()
-        if not pl:
-            continue
-        if " " in pl:
-            if pl in title_lower:
-                return pl
-        else:
-            if re.search(r"\b" + re.escape(pl) + r"\b", title_lower):
-                return pl
-    return None
+    if not isinstance(phrases, LearnedBlockMatcher):
+        phrases = LearnedBlockMatcher(phrases)
+    return phrases.first_hit(title)
@@ -0,0 +1,38 @@
+"""
+Shared setup for the local sqlite stores (board snapshots, sourcing AI cache, HTTP validators,
+title-fit verdicts, sheet URL index): stdlib sqlite3, WAL journal so readers never block the writer.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import Any, Mapping
+
+from apps.cli.legacy.core.config import get_sourcing_config
+
+
+def resolve_db_path(env: str, cfg_key: str, default: str, cfg: Mapping[str, Any] | None = None) -> str:
+    """
+    Absolute database path: $env if set, else cfg[cfg_key] (cfg defaults to the sourcing section),
+    else default. Relative paths resolve against the working directory.
+    """
+    p = os.environ.get(env, "").strip()
+    if not p:
+        if cfg is None:
+            cfg = get_sourcing_config()
+        p = str(cfg.get(cfg_key) or default).strip() or default
+    if os.path.isabs(p):
+        return p
+    return os.path.abspath(os.path.join(os.getcwd(), p))
+
+
+def open_wal_db(path: str, schema: str) -> sqlite3.Connection:
+    """Open (creating parent dirs) a WAL-mode connection usable across threads, with schema applied."""
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(schema)
+    conn.commit()
+    return conn
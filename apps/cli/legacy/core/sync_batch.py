@@ -0,0 +1,63 @@
+"""
+Deferred sync state for sourcing scrapes (conditional-GET validators in http_client.py, ATS board
+snapshots in board_snapshots.py).
+
+Recording "seen up to here" as soon as a feed is fetched lets a crash, a failed sheet write or a dry
+run drop postings: the next run gets a 304 (or an unchanged snapshot diff) and never sees them again.
+Scrapers hand such writes to defer_until_saved() instead; SourcingAgent runs each source inside
+staged_sync() and commits the batch only after normalize_and_save succeeded for it. Outside a batch the writes are dropped, so standalone
+scraper runs never advance the sync state.
+
+The current batch lives in a ContextVar; board_fanout.fan_out copies the context into its worker
+threads, so board fetches made for a source land in that source's batch.
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+
+class SyncBatch:
+    def __init__(self) -> None:
+        self._pending: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def defer(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            self._pending.append(fn)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def commit(self) -> None:
+        """Apply the deferred writes in the order they were recorded (call once the postings are saved)."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fn in pending:
+            fn()
+
+
+_CURRENT: ContextVar[SyncBatch | None] = ContextVar("sourcing_sync_batch", default=None)
+
+
+@contextlib.contextmanager
+def staged_sync() -> Iterator[SyncBatch]:
+    """Collect deferred sync writes made inside the block (and in fan_out workers it starts)."""
+    batch = SyncBatch()
+    token = _CURRENT.set(batch)
+    try:
+        yield batch
+    finally:
+        _CURRENT.reset(token)
+
+
+def defer_until_saved(fn: Callable[[], None]) -> bool:
+    """Queue fn on the current batch; False (fn dropped) when no staged_sync() is active."""
+    batch = _CURRENT.get()
+    if batch is None:
+        return False
+    batch.defer(fn)
+    return True
@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from apps.cli.legacy.core.filter_engine import OrderedMatcher, word_pattern
+
 logger = logging.getLogger(__name__)
 
 # Stripped from track YAML unless user sets include_internship_entry_signals: true
@@ -125,22 +127,6 @@ def merge_track_with_user_overrides(
     return t
 
 
-def _title_matches_track(title_lower: str, patterns: List[str]) -> bool:
-    for p in patterns:
-        s = str(p).strip().lower()
-        if not s:
-            continue
-        if s.startswith("regex:"):
-            try:
-                if re.search(s[6:].strip(), title_lower, re.IGNORECASE):
-                    return True
-            except re.error:
-                continue
-        elif s in title_lower:
-            return True
-    return False
-
-
 def _match_score(title_lower: str, patterns: List[str]) -> int:
     n = 0
     for p in patterns:
@@ -177,75 +163,36 @@ def pick_best_track(
     return best_id
 
 
-def _word_or_phrase_in_title(title_lower: str, token: str) -> bool:
-    tok = token.strip().lower()
-    if not tok:
-        return False
-    if " " in tok:
-        return tok in title_lower
-    return bool(re.search(r"\b" + re.escape(tok) + r"\b", title_lower))
-
-
-def _has_any_block(title_lower: str, tokens: List[str]) -> Optional[str]:
-    for tok in tokens:
-        if _word_or_phrase_in_title(title_lower, str(tok)):
-            return str(tok)
-    return None
+_ROUTER: Any = None
 
+# Transient failures: retried next time instead of being cached as verdicts.
+_UNCACHEABLE_VERDICTS = ("LLM failed", "LLM import failed", "LLM JSON missing", "LLM parse error")
 
-def _has_prefer_signal(title_lower: str, tokens: List[str]) -> bool:
-    for tok in tokens:
-        if _word_or_phrase_in_title(title_lower, str(tok)):
-            return True
-    return False
 
+def _llm_router() -> Any:
+    """One LLMRouter (HTTP session, context-cache registry) shared by every disambiguation call."""
+    global _ROUTER
+    if _ROUTER is None:
+        from apps.cli.legacy.core.llm_router import LLMRouter
 
-def _has_ambiguous_signal(title_lower: str, tokens: List[str]) -> bool:
-    for tok in tokens:
-        if _word_or_phrase_in_title(title_lower, str(tok)):
-            return True
-    return False
+        _ROUTER = LLMRouter()
+    return _ROUTER
 
 
-def _max_required_yoe_from_text(text: str, patterns: List[str]) -> Optional[int]:
-    best: Optional[int] = None
-    for pat in patterns:
-        try:
-            for m in re.finditer(str(pat), text, re.IGNORECASE):
-                g = m.groups()
-                if g:
-                    try:
-                        val = int(g[0])
-                        best = max(best or 0, val)
-                    except ValueError:
-                        continue
-        except re.error:
-            continue
-    return best
+def _candidate_context(user: Dict[str, Any], yoe: Optional[float]) -> Dict[str, Any]:
+    return {
+        "effective_yoe": yoe,
+        "policy": user.get("policy", "conservative"),
+        "flags": user.get("first_formal_role_flags") or {},
+    }
 
 
-def _strict_entry_violation(
-    title_lower: str,
-    track: Dict[str, Any],
-    user: Dict[str, Any],
-    track_id: str,
-) -> bool:
-    subs = track.get("strict_entry_substrings_when_untitled_pm") or []
-    if not subs:
-        return False
-    flag_key = TRACK_STRICT_FLAG_KEY.get(track_id)
-    if not flag_key:
-        return False
-    flags = user.get("first_formal_role_flags") or {}
-    if flags.get(flag_key, True):
-        return False
-    hit_plain = any(s.strip().lower() in title_lower for s in subs if str(s).strip())
-    if not hit_plain:
-        return False
-    prefer = track.get("prefer_title_tokens") or []
-    if _has_prefer_signal(title_lower, prefer):
-        return False
-    return True
+def _parse_verdict(obj: Any) -> Tuple[bool, str]:
+    v = str(obj.get("verdict", "")).lower().strip()
+    r = str(obj.get("reason", "")).strip()
+    if v == "pass":
+        return True, r or "LLM pass"
+    return False, r or "LLM reject"
 
 
 def _llm_disambiguate(
@@ -257,7 +204,7 @@ def _llm_disambiguate(
     model: Optional[str],
 ) -> Tuple[bool, str]:
     try:
-        from apps.cli.legacy.core.llm_router import LLMRouter
+        router = _llm_router()
     except ImportError:
         return False, "LLM import failed"
 
@@ -271,14 +218,12 @@ def _llm_disambiguate(
             "title": title,
             "snippet": (snippet or "")[:800],
             "track": track.get("display_name", track.get("id")),
-            "effective_yoe": yoe,
-            "policy": user.get("policy", "conservative"),
-            "flags": user.get("first_formal_role_flags") or {},
+            **_candidate_context(user, yoe),
         },
         ensure_ascii=False,
     )
     fmt = "\n\nReturn ONLY valid JSON, no markdown fences."
-    raw, engine = LLMRouter().generate_content(system, user_blob, formatting_instruction=fmt, model=model)
+    raw, engine = router.generate_content(system, user_blob, formatting_instruction=fmt, model=model)
     if engine == "FAILED" or not (raw or "").strip():
         return False, "LLM failed"
     t = raw.strip()
@@ -287,16 +232,354 @@ def _llm_disambiguate(
     if a == -1 or b <= a:
         return False, "LLM JSON missing"
     try:
-        obj = json.loads(t[a : b + 1])
-        v = str(obj.get("verdict", "")).lower().strip()
-        r = str(obj.get("reason", "")).strip()
-        if v == "pass":
-            return True, r or "LLM pass"
-        return False, r or "LLM reject"
+        return _parse_verdict(json.loads(t[a : b + 1]))
     except json.JSONDecodeError:
         return False, "LLM parse error"
 
 
+def _llm_disambiguate_many(
+    items: List[Tuple[str, str, Dict[str, Any]]],
+    user: Dict[str, Any],
+    yoe: Optional[float],
+    model: Optional[str],
+) -> List[Optional[Tuple[bool, str]]]:
+    """
+    Classify several (title, snippet, track) items in one prompt; the model answers with a JSON array
+    of {"id", "verdict", "reason"}. None for items missing from the answer (caller retries them alone).
+    """
+    try:
+        router = _llm_router()
+    except ImportError:
+        return [(False, "LLM import failed")] * len(items)
+
+    system = (
+        "You classify whether each job title is appropriate for the candidate's seniority. "
+        "Return ONLY one JSON array with one object per job: "
+        '[{"id":<job id>,"verdict":"pass"|"reject","reason":"short string"}]'
+    )
+    user_blob = json.dumps(
+        {
+            "candidate": _candidate_context(user, yoe),
+            "jobs": [
+                {
+                    "id": i,
+                    "title": title,
+                    "snippet": (snippet or "")[:300],
+                    "track": track.get("display_name", track.get("id")),
+                }
+                for i, (title, snippet, track) in enumerate(items)
+            ],
+        },
+        ensure_ascii=False,
+    )
+    fmt = "\n\nReturn ONLY valid JSON, no markdown fences."
+    raw, engine = router.generate_content(system, user_blob, formatting_instruction=fmt, model=model)
+    if engine == "FAILED" or not (raw or "").strip():
+        return [(False, "LLM failed")] * len(items)
+    t = raw.strip()
+    a = t.find("[")
+    b = t.rfind("]")
+    out: List[Optional[Tuple[bool, str]]] = [None] * len(items)
+    if a == -1 or b <= a:
+        return out
+    try:
+        answers = json.loads(t[a : b + 1])
+    except json.JSONDecodeError:
+        return out
+    for obj in answers if isinstance(answers, list) else []:
+        if not isinstance(obj, dict):
+            continue
+        try:
+            i = int(obj.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= i < len(items):
+            out[i] = _parse_verdict(obj)
+    return out
+
+
+def _compile_title_patterns(patterns: List[str]) -> List[Any]:
+    """title_match entries as compiled regexes (regex:) or lowercase substrings, like _match_score."""
+    out: List[Any] = []
+    for p in patterns:
+        s = str(p).strip().lower()
+        if not s:
+            continue
+        if s.startswith("regex:"):
+            try:
+                out.append(re.compile(s[6:].strip(), re.IGNORECASE))
+            except re.error:
+                continue
+        else:
+            out.append(s)
+    return out
+
+
+def _token_pattern(token: str) -> Optional[str]:
+    tok = str(token).strip().lower()
+    if not tok:
+        return None
+    return re.escape(tok) if " " in tok else word_pattern(tok)
+
+
+def _token_matcher(tokens: List[str]) -> OrderedMatcher:
+    """First token (list order) present in the title: whole word, or substring for multi-word phrases."""
+    entries = []
+    for tok in tokens:
+        pat = _token_pattern(str(tok))
+        if pat is not None:
+            entries.append((str(tok), pat))
+    return OrderedMatcher(entries)
+
+
+class _CompiledTrack:
+    """One active track merged with the user overrides, with its patterns compiled."""
+
+    def __init__(self, track_id: str, track: Dict[str, Any]):
+        self.id = track_id
+        self.track = track
+        self.title_match = _compile_title_patterns(list(track.get("title_match") or []))
+        self.block = _token_matcher(list(track.get("block_title_tokens") or []))
+        self.prefer = _token_matcher(list(track.get("prefer_title_tokens") or []))
+        self.ambiguous = _token_matcher(list(track.get("ambiguous_title_tokens") or []))
+        self.min_yoe: List[re.Pattern] = []
+        for pat in track.get("min_yoe_patterns") or []:
+            try:
+                self.min_yoe.append(re.compile(str(pat), re.IGNORECASE))
+            except re.error:
+                continue
+        self.strict_subs = [
+            str(x).strip().lower() for x in (track.get("strict_entry_substrings_when_untitled_pm") or []) if str(x).strip()
+        ]
+        self.slack = float(track.get("slack_years_above_required", 1.0) or 0.0)
+
+    def score(self, title_lower: str) -> int:
+        return sum(
+            1
+            for p in self.title_match
+            if (p in title_lower if isinstance(p, str) else p.search(title_lower) is not None)
+        )
+
+    def required_yoe(self, text: str) -> Optional[int]:
+        best: Optional[int] = None
+        for pattern in self.min_yoe:
+            for m in pattern.finditer(text):
+                g = m.groups()
+                if g:
+                    try:
+                        best = max(best or 0, int(g[0]))
+                    except (TypeError, ValueError):
+                        continue
+        return best
+
+    def strict_entry_violation(self, title_lower: str, user: Dict[str, Any]) -> bool:
+        if not self.strict_subs:
+            return False
+        flag_key = TRACK_STRICT_FLAG_KEY.get(self.id)
+        if not flag_key:
+            return False
+        flags = user.get("first_formal_role_flags") or {}
+        if flags.get(flag_key, True):
+            return False
+        if not any(s in title_lower for s in self.strict_subs):
+            return False
+        return self.prefer.search(title_lower) is None
+
+
+class TitleFitEngine:
+    """
+    evaluate_title_fit with the user profile, active tracks (merged with user overrides), their
+    title/block/prefer/ambiguous token patterns, the YOE regexes and effective YOE resolved and
+    compiled once. Build via get_title_fit_engine() to reuse one engine until the files change.
+    """
+
+    def __init__(
+        self,
+        title_fit_cfg: Dict[str, Any],
+        user: Optional[Dict[str, Any]],
+        all_tracks: Dict[str, Dict[str, Any]],
+    ):
+        self.cfg = title_fit_cfg
+        self.user = user
+        self.skipped: Optional[str] = None
+        self.tracks: List[_CompiledTrack] = []
+        self.yoe: Optional[float] = None
+        if user is None:
+            self.skipped = "no_user_file"
+            return
+        active = [str(x).strip() for x in (user.get("active_tracks") or []) if str(x).strip()]
+        if not active:
+            self.skipped = "no_active_tracks"
+            return
+        for tid in active:
+            t = all_tracks.get(tid)
+            if t:
+                self.tracks.append(_CompiledTrack(tid, merge_track_with_user_overrides(t, user)))
+        self.yoe = effective_yoe_from_profile(user)
+        self.policy = str(user.get("policy", "conservative")).lower().strip()
+        self.snippet_max_chars = int(title_fit_cfg.get("snippet_max_chars", 1200))
+
+    def _skip_result(self) -> Tuple[bool, str, Dict[str, Any]]:
+        if self.skipped == "no_user_file":
+            logger.warning(
+                "title_fit.enabled but no title_fit_user.yaml at %s — skipping gate.",
+                title_fit_user_yaml_path(),
+            )
+        else:
+            logger.warning("title_fit: active_tracks empty — skipping gate.")
+        return True, "", {"skipped": self.skipped}
+
+    def _best_track(self, title_lower: str) -> Optional[_CompiledTrack]:
+        best: Optional[_CompiledTrack] = None
+        best_score = 0
+        for t in self.tracks:
+            sc = t.score(title_lower)
+            if sc > best_score:
+                best_score = sc
+                best = t
+        return best
+
+    def evaluate(self, title: str, snippet: str) -> Tuple[bool, str, Dict[str, Any]]:
+        """Returns (passed, reason, detail_dict)."""
+        return self.evaluate_many([title], [snippet])[0]
+
+    def evaluate_many(self, titles: List[str], snippets: List[str]) -> List[Tuple[bool, str, Dict[str, Any]]]:
+        """(passed, reason, detail_dict) per (title, snippet) pair, in order."""
+        if not self.cfg.get("enabled", False):
+            return [(True, "", {"skipped": "disabled"}) for _ in titles]
+        if self.skipped:
+            skip = self._skip_result()
+            return [(skip[0], skip[1], dict(skip[2])) for _ in titles]
+        results: List[Any] = []
+        pending: List[Tuple[int, str, str, _CompiledTrack]] = []
+        for i, (title, snippet) in enumerate(zip(titles, snippets)):
+            result = self._evaluate_one(title, snippet)
+            if isinstance(result, _CompiledTrack):
+                pending.append((i, str(title or ""), str(snippet or "")[: self.snippet_max_chars], result))
+                result = None
+            results.append(result)
+        if pending:
+            verdicts = self._disambiguate([(t, s, track) for _, t, s, track in pending])
+            for (i, _, _, track), (ok, why) in zip(pending, verdicts):
+                detail = {"track_id": track.id, "effective_yoe": self.yoe, "llm_disambiguation": why}
+                results[i] = (True, "", detail) if ok else (False, f"Title fit: {why}", detail)
+        return results
+
+    def _disambiguate(self, items: List[Tuple[str, str, _CompiledTrack]]) -> List[Tuple[bool, str]]:
+        """
+        LLM verdicts for ambiguous titles: cached verdicts first (title_fit_verdicts), then one
+        request per title_fit.llm_batch_size distinct uncached titles (1 = one request per title).
+        """
+        from apps.cli.legacy.core.config import get_evaluation_config
+        from apps.cli.legacy.core.title_fit_verdicts import get_verdict_cache, verdict_key
+
+        eval_cfg = get_evaluation_config()
+        mdl = self.cfg.get("disambiguation_model") or eval_cfg.get(
+            "sourcing_model"
+        ) or eval_cfg.get("gemini_model")
+        cache = get_verdict_cache()
+        keys = [verdict_key(title, track.id, self.yoe, self.user) for title, _, track in items]
+        known = cache.get_many(keys)
+
+        todo: Dict[Any, Tuple[str, str, _CompiledTrack]] = {}
+        for key, item in zip(keys, items):
+            if key not in known:
+                todo.setdefault(key, item)
+        batch_size = max(1, int(self.cfg.get("llm_batch_size", 20) or 1))
+        todo_keys = list(todo)
+        fresh: Dict[Any, Tuple[bool, str]] = {}
+        for start in range(0, len(todo_keys), batch_size):
+            chunk = todo_keys[start : start + batch_size]
+            if len(chunk) == 1:
+                answers: List[Optional[Tuple[bool, str]]] = [None]
+            else:
+                answers = _llm_disambiguate_many(
+                    [(t, s, track.track) for t, s, track in (todo[k] for k in chunk)], self.user, self.yoe, mdl
+                )
+            for key, answer in zip(chunk, answers):
+                if answer is None:
+                    title, snip, track = todo[key]
+                    answer = _llm_disambiguate(title, snip, track.track, self.user, self.yoe, mdl)
+                known[key] = answer
+                if answer[1] not in _UNCACHEABLE_VERDICTS:
+                    fresh[key] = answer
+        cache.put_many(fresh)
+        return [known[key] for key in keys]
+
+    def _evaluate_one(self, title: str, snippet: str) -> Any:
+        """Result tuple, or the matched _CompiledTrack when the title needs LLM disambiguation."""
+        detail: Dict[str, Any] = {}
+        title_lower = str(title or "").lower().strip()
+        snip = str(snippet or "")[: self.snippet_max_chars]
+        combined = (title_lower + " " + snip.lower()).strip()
+
+        best = self._best_track(title_lower)
+        if best is None:
+            if bool(self.cfg.get("require_track_match", True)):
+                return False, "Title fit: no matching track", {"track": None}
+            return True, "", {"track": None, "note": "no_track_match_allowed"}
+        detail["track_id"] = best.id
+
+        blk = best.block.search(title_lower)
+        if blk:
+            return False, f"Title fit: blocked token ({blk})", detail
+
+        yoe = self.yoe
+        detail["effective_yoe"] = yoe
+        req_yoe = best.required_yoe(combined)
+        if req_yoe is not None and yoe is not None and req_yoe > yoe + best.slack:
+            return False, f"Title fit: requires ~{req_yoe}+ YOE (you: {yoe})", detail
+
+        if best.strict_entry_violation(title_lower, self.user):
+            return False, "Title fit: plain title without entry signal", detail
+
+        if best.ambiguous.search(title_lower) is not None:
+            if self.cfg.get("llm_disambiguation_enabled"):
+                return best
+
+            if self.policy == "aggressive":
+                return True, "", detail
+            if self.policy == "conservative":
+                return False, "Title fit: ambiguous title (conservative; enable LLM or relax policy)", detail
+            default = str(self.cfg.get("ambiguous_default", "reject")).lower()
+            if default == "pass":
+                return True, "", detail
+            return False, "Title fit: ambiguous seniority in title", detail
+
+        return True, "", detail
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _engine_sources_key() -> Tuple[Any, ...]:
+    """Identity of every file a TitleFitEngine reads (user yaml, track yamls, dense matrix for YOE)."""
+    user_path = title_fit_user_yaml_path()
+    track_paths = sorted(glob.glob(os.path.join(tracks_dir(), "*.yaml")))
+    matrix_path = os.path.join(_project_root(), "data", "dense_master_matrix.json")
+    return tuple((p, _stat_key(p)) for p in [user_path, matrix_path, *track_paths])
+
+
+# (title_fit_cfg, files key, engine): one engine per title_fit config snapshot and file state.
+_engine_cache: Tuple[Any, Any, Optional[TitleFitEngine]] = (None, None, None)
+
+
+def get_title_fit_engine(title_fit_cfg: Dict[str, Any]) -> TitleFitEngine:
+    """TitleFitEngine for the on-disk user profile and tracks, rebuilt when cfg or any file changes."""
+    global _engine_cache
+    key = _engine_sources_key()
+    cached_cfg, cached_key, engine = _engine_cache
+    if engine is None or cached_cfg is not title_fit_cfg or cached_key != key:
+        engine = TitleFitEngine(title_fit_cfg, load_title_fit_user_config(), load_all_track_definitions())
+        _engine_cache = (title_fit_cfg, key, engine)
+    return engine
+
+
 def evaluate_title_fit(
     title: str,
     snippet: str,
@@ -306,85 +589,20 @@ def evaluate_title_fit(
     all_tracks: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Tuple[bool, str, Dict[str, Any]]:
     """
-    Returns (passed, reason, detail_dict).
+    Returns (passed, reason, detail_dict). Without user / all_tracks the cached engine for the
+    on-disk profile is used; batch callers should use get_title_fit_engine(cfg).evaluate_many.
     """
-    detail: Dict[str, Any] = {}
     if not title_fit_cfg.get("enabled", False):
         return True, "", {"skipped": "disabled"}
-
-    user = user if user is not None else load_title_fit_user_config()
-    if user is None:
-        logger.warning(
-            "title_fit.enabled but no title_fit_user.yaml at %s — skipping gate.",
-            title_fit_user_yaml_path(),
+    if user is None and all_tracks is None:
+        engine = get_title_fit_engine(title_fit_cfg)
+    else:
+        engine = TitleFitEngine(
+            title_fit_cfg,
+            user if user is not None else load_title_fit_user_config(),
+            all_tracks if all_tracks is not None else load_all_track_definitions(),
         )
-        return True, "", {"skipped": "no_user_file"}
-
-    all_tracks = all_tracks if all_tracks is not None else load_all_track_definitions()
-    active = [str(x).strip() for x in (user.get("active_tracks") or []) if str(x).strip()]
-    if not active:
-        logger.warning("title_fit: active_tracks empty — skipping gate.")
-        return True, "", {"skipped": "no_active_tracks"}
-
-    title_lower = str(title or "").lower().strip()
-    snip = str(snippet or "")[: int(title_fit_cfg.get("snippet_max_chars", 1200))]
-    combined = (title_lower + " " + snip.lower()).strip()
-
-    best = pick_best_track(title_lower, active, all_tracks)
-    require = bool(title_fit_cfg.get("require_track_match", True))
-    if not best:
-        if require:
-            return False, "Title fit: no matching track", {"track": None}
-        return True, "", {"track": None, "note": "no_track_match_allowed"}
-
-    base_track = all_tracks.get(best) or {}
-    track = merge_track_with_user_overrides(base_track, user)
-    detail["track_id"] = best
-
-    blk = _has_any_block(title_lower, list(track.get("block_title_tokens") or []))
-    if blk:
-        return False, f"Title fit: blocked token ({blk})", detail
-
-    yoe = effective_yoe_from_profile(user)
-    detail["effective_yoe"] = yoe
-    patterns = list(track.get("min_yoe_patterns") or [])
-    req_yoe = _max_required_yoe_from_text(combined, patterns)
-    if req_yoe is not None and yoe is not None:
-        slack = float(track.get("slack_years_above_required", 1.0) or 0.0)
-        if req_yoe > yoe + slack:
-            return False, f"Title fit: requires ~{req_yoe}+ YOE (you: {yoe})", detail
-
-    if _strict_entry_violation(title_lower, track, user, best):
-        return False, "Title fit: plain title without entry signal", detail
-
-    amb_tokens = list(track.get("ambiguous_title_tokens") or [])
-    policy = str(user.get("policy", "conservative")).lower().strip()
-    ambiguous_hit = _has_ambiguous_signal(title_lower, amb_tokens)
-
-    if ambiguous_hit:
-        if title_fit_cfg.get("llm_disambiguation_enabled"):
-            from apps.cli.legacy.core.config import get_evaluation_config
-
-            eval_cfg = get_evaluation_config()
-            mdl = title_fit_cfg.get("disambiguation_model") or eval_cfg.get(
-                "sourcing_model"
-            ) or eval_cfg.get("gemini_model")
-            ok, why = _llm_disambiguate(title, snip, track, user, yoe, mdl)
-            detail["llm_disambiguation"] = why
-            if ok:
-                return True, "", detail
-            return False, f"Title fit: {why}", detail
-
-        if policy == "aggressive":
-            return True, "", detail
-        if policy == "conservative":
-            return False, "Title fit: ambiguous title (conservative; enable LLM or relax policy)", detail
-        default = str(title_fit_cfg.get("ambiguous_default", "reject")).lower()
-        if default == "pass":
-            return True, "", detail
-        return False, "Title fit: ambiguous seniority in title", detail
-
-    return True, "", detail
+    return engine.evaluate(title, snippet)
 
 
 def sniffer_role_bullet_text(user: Optional[Dict[str, Any]] = None) -> str:
@@ -0,0 +1,144 @@
+"""
+Persistent cache of LLM title-fit disambiguation verdicts (title_fit_gate.TitleFitEngine).
+
+Ambiguous titles ("Product Manager II", "Business Analyst") recur across sources and days, and the
+verdict only depends on the title and the candidate context, so one verdict is stored per
+(normalized title, track, effective YOE, policy + role flags) and reused for title_fit.llm_cache_ttl_days
+(default 14; 0 = cache off). Failed / unparseable LLM answers are never stored.
+
+Path: title_fit.llm_cache_path or TITLE_FIT_VERDICT_DB. Lookups go through an in-process dict first.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable
+
+from apps.cli.legacy.core.config import get_title_fit_config
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+
+DEFAULT_DB_PATH = "data/title_fit_verdicts.db"
+DEFAULT_TTL_DAYS = 14.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    title TEXT NOT NULL,
+    track TEXT NOT NULL,
+    yoe TEXT NOT NULL,
+    policy TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (title, track, yoe, policy)
+);
+"""
+
+VerdictKey = tuple[str, str, str, str]
+
+_NON_WORD_RE = re.compile(r"[^\w+#/&]+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, punctuation to spaces, collapse whitespace ("Product Manager - II" -> "product manager ii")."""
+    return " ".join(_NON_WORD_RE.sub(" ", str(title or "").lower()).split())
+
+
+def verdict_key(title: str, track_id: str, yoe: float | None, user: dict[str, Any]) -> VerdictKey:
+    policy = {
+        "policy": str(user.get("policy", "conservative")).lower().strip(),
+        "flags": user.get("first_formal_role_flags") or {},
+    }
+    return (
+        normalize_title(title),
+        str(track_id or ""),
+        "" if yoe is None else f"{float(yoe):g}",
+        json.dumps(policy, sort_keys=True, default=str),
+    )
+
+
+def resolve_verdict_db_path() -> str:
+    """Absolute path to the verdict cache database."""
+    return resolve_db_path("TITLE_FIT_VERDICT_DB", "llm_cache_path", DEFAULT_DB_PATH, get_title_fit_config())
+
+
+class VerdictCache:
+    def __init__(self, db_path: str | None = None, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.db_path = db_path
+        self.ttl_sec = max(0.0, float(ttl_days)) * 86400.0
+        self._memory: dict[VerdictKey, tuple[bool, str, float]] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self.ttl_sec <= 0:
+            return None
+        if self._conn is None:
+            self._conn = open_wal_db(self.db_path or resolve_verdict_db_path(), SCHEMA)
+        return self._conn
+
+    def _fresh(self, created_at: float, now: float) -> bool:
+        return self.ttl_sec > 0 and now - created_at < self.ttl_sec
+
+    def get_many(self, keys: Iterable[VerdictKey]) -> dict[VerdictKey, tuple[bool, str]]:
+        """Fresh cached verdicts for the given keys; counts hits / misses per distinct key."""
+        now = time.time()
+        wanted = list(dict.fromkeys(keys))
+        out: dict[VerdictKey, tuple[bool, str]] = {}
+        with self._lock:
+            missing = []
+            for key in wanted:
+                cached = self._memory.get(key)
+                if cached and self._fresh(cached[2], now):
+                    out[key] = (cached[0], cached[1])
+                else:
+                    missing.append(key)
+            conn = self._connect() if missing else None
+            for key in missing if conn is not None else []:
+                row = conn.execute(
+                    "SELECT passed, reason, created_at FROM verdicts"
+                    " WHERE title = ? AND track = ? AND yoe = ? AND policy = ?",
+                    key,
+                ).fetchone()
+                if row and self._fresh(row[2], now):
+                    self._memory[key] = (bool(row[0]), row[1], row[2])
+                    out[key] = (bool(row[0]), row[1])
+            self.hits += len(out)
+            self.misses += len(wanted) - len(out)
+        return out
+
+    def put_many(self, verdicts: dict[VerdictKey, tuple[bool, str]]) -> None:
+        if not verdicts:
+            return
+        now = time.time()
+        with self._lock:
+            for key, (passed, reason) in verdicts.items():
+                self._memory[key] = (bool(passed), reason, now)
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (title, track, yoe, policy, passed, reason, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*key, int(bool(p)), r, now) for key, (p, r) in verdicts.items()],
+            )
+            conn.execute("DELETE FROM verdicts WHERE created_at < ?", (now - self.ttl_sec,))
+            conn.commit()
+
+
+_CACHE: VerdictCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Process-wide VerdictCache at the configured path / TTL."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            cfg = get_title_fit_config()
+            _CACHE = VerdictCache(ttl_days=float(cfg.get("llm_cache_ttl_days", DEFAULT_TTL_DAYS) or 0))
+        return _CACHE
@@ -1,5 +1,7 @@
 import requests
 
+from apps.cli.legacy.core.http_client import http_get
+
 class ArbeitnowScraper:
     def __init__(self):
         self.base_url = "https://www.arbeitnow.com/api/job-board-api"
@@ -14,7 +16,7 @@ class ArbeitnowScraper:
             print(f"Fetching from Arbeitnow API for '{query}'...")
             try:
                 # The API supports 'search' parameter, although we might need to paginate if we want more
-                response = requests.get(f"{self.base_url}?search={query}")
+                response = http_get(self.base_url, params={"search": query})
                 response.raise_for_status()
                 data = response.json()
                 
@@ -2,7 +2,8 @@
 Ashby job board API. No auth. Slug = company identifier (e.g. Ashby, Notion, Figma).
 https://developers.ashbyhq.com/docs/public-job-posting-api
 """
-import requests
+from apps.cli.legacy.core.http_client import http_get, not_modified
+from apps.cli.legacy.scrapers.board_fanout import fan_out, provider_limiter
 
 ASHBY_BASE = "https://api.ashbyhq.com/posting-api/job-board"
 
@@ -15,8 +16,9 @@ class AshbyScraper:
         jobs = []
         try:
             url = f"{ASHBY_BASE}/{slug}"
-            response = requests.get(url, timeout=15)
-            if response.status_code == 404:
+            provider_limiter("ashby").wait()
+            response = http_get(url, timeout=15, conditional=True)
+            if response.status_code == 404 or not_modified(response):
                 return []
             response.raise_for_status()
             data = response.json()
@@ -43,10 +45,13 @@ class AshbyScraper:
             print(f"Ashby board {slug}: {e}")
         return jobs
 
+    def iter_boards(self):
+        """(slug, jobs) per board, yielded as each board finishes."""
+        yield from fan_out(self.scrape_board, self.boards)
+
     def scrape_all(self):
         all_jobs = []
-        for slug in self.boards:
-            jobs = self.scrape_board(slug)
+        for slug, jobs in self.iter_boards():
             if jobs:
                 print(f"Ashby ({slug}): {len(jobs)} jobs.")
                 all_jobs.extend(jobs)
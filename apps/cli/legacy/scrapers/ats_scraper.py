@@ -1,53 +1,135 @@
-import requests
+import functools
+import hashlib
+import html
+import json
+
+from bs4 import BeautifulSoup
+
+from apps.cli.legacy.core.board_snapshots import get_board_snapshots
+from apps.cli.legacy.core.http_client import http_get, not_modified
+from apps.cli.legacy.core.sync_batch import defer_until_saved
+from apps.cli.legacy.scrapers.board_fanout import fan_out, provider_limiter
+
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards"
+# Above this many new / updated postings one ?content=true listing beats per-posting requests.
+GREENHOUSE_BULK_CONTENT_MIN = 25
+
+
+def _greenhouse_text(content):
+    """Greenhouse `content` is entity-escaped HTML; plain text, capped like the other API scrapers."""
+    if not content:
+        return ""
+    return BeautifulSoup(html.unescape(content), "html.parser").get_text(separator="\n").strip()[:8000]
 
 
 class ATS_Scraper:
+    """
+    Greenhouse / Lever boards, synced incrementally: each board's postings are diffed against the
+    last snapshot (core/board_snapshots.py) and only new or updated postings are returned. The new
+    snapshot is recorded when the caller's sync_batch.staged_sync() batch commits (after the postings
+    were saved), so a failed save re-emits them next run.
+    """
+
     def __init__(self, greenhouse_boards=None, lever_boards=None):
         self.greenhouse_boards = greenhouse_boards or ["canva", "discord", "figma"]
         self.lever_boards = lever_boards or ["netflix", "palantir", "discord"]
 
+    def _greenhouse_content(self, board_token, ids):
+        """{posting id: JD text} for the given ids: one bulk listing for many, else one request each."""
+        out = {}
+        if len(ids) > GREENHOUSE_BULK_CONTENT_MIN:
+            provider_limiter("greenhouse").wait()
+            response = http_get(f"{GREENHOUSE_API}/{board_token}/jobs", params={"content": "true"})
+            response.raise_for_status()
+            for job in response.json().get("jobs", []):
+                if str(job.get("id")) in ids:
+                    out[str(job.get("id"))] = _greenhouse_text(job.get("content"))
+            return out
+        for pid in ids:
+            try:
+                provider_limiter("greenhouse").wait()
+                response = http_get(f"{GREENHOUSE_API}/{board_token}/jobs/{pid}")
+                response.raise_for_status()
+                out[pid] = _greenhouse_text(response.json().get("content"))
+            except Exception as e:
+                print(f"Greenhouse {board_token} posting {pid}: no content ({e})")
+        return out
+
     def scrape_greenhouse(self, board_token):
-        """Scrapes jobs from Greenhouse Board API v1."""
-        url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs?content=true"
+        """
+        Scrapes jobs from Greenhouse Board API v1: light listing (id, updated_at) first, full content
+        only for postings that are new or updated since the last sync.
+        """
+        url = f"{GREENHOUSE_API}/{board_token}/jobs"
         all_jobs = []
         try:
             print(f"Fetching from Greenhouse API for {board_token}...")
-            response = requests.get(url)
+            provider_limiter("greenhouse").wait()
+            response = http_get(url, conditional=True)
             # If 404, it means the board_token is wrong or they disabled it
             if response.status_code == 404:
                 return []
+            if not_modified(response):
+                print(f"Greenhouse board {board_token} unchanged since last sync.")
+                return []
             response.raise_for_status()
             data = response.json()
-            jobs = data.get('jobs', [])
-            
-            for job in jobs:
+            jobs = [j for j in data.get('jobs', []) if j.get('id') is not None]
+
+            snapshots = get_board_snapshots()
+            board = f"greenhouse:{board_token}"
+            versions = {str(j['id']): str(j.get('updated_at') or j.get('absolute_url') or '') for j in jobs}
+            changed, full = snapshots.diff(board, versions)
+            fresh = [j for j in jobs if str(j['id']) in changed]
+            content = self._greenhouse_content(board_token, {str(j['id']) for j in fresh}) if fresh else {}
+
+            for job in fresh:
                 location = job.get('location', {}).get('name', 'Unknown')
                 all_jobs.append({
                     'title': job.get('title'),
                     'company': board_token.capitalize(), # Best guess unless we hit the standard /boards API first
                     'location': location,
                     'url': job.get('absolute_url'),
-                    'source': 'ATS_Greenhouse'
+                    'source': 'ATS_Greenhouse',
+                    'description': content.get(str(job['id']), ''),
                 })
-            print(f"Parsed {len(jobs)} jobs for {board_token}.")
+            defer_until_saved(functools.partial(snapshots.commit, board, versions, full))
+            print(f"Parsed {len(jobs)} jobs for {board_token} ({len(fresh)} new or updated).")
         except Exception as e:
             print(f"Error fetching Greenhouse board {board_token}: {e}")
+            return []
         return all_jobs
 
     def scrape_lever(self, site_token):
-        """Scrapes jobs from Lever API v0."""
+        """
+        Scrapes jobs from Lever API v0. Lever has no light listing, so postings are diffed on a hash
+        of their JSON and only new or changed ones are returned.
+        """
         # Note: Lever API v0 doesn't always require auth for public postings
         url = f"https://api.lever.co/v0/postings/{site_token}"
         all_jobs = []
         try:
             print(f"Fetching from Lever API for {site_token}...")
-            response = requests.get(url)
+            provider_limiter("lever").wait()
+            response = http_get(url, conditional=True)
             if response.status_code == 404:
                 return []
+            if not_modified(response):
+                print(f"Lever board {site_token} unchanged since last sync.")
+                return []
             response.raise_for_status()
-            data = response.json()
-            
-            for job in data:
+            data = [j for j in response.json() if j.get('id')]
+
+            snapshots = get_board_snapshots()
+            board = f"lever:{site_token}"
+            versions = {
+                str(j['id']): hashlib.sha1(json.dumps(j, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+                for j in data
+            }
+            changed, full = snapshots.diff(board, versions)
+            fresh = [j for j in data if str(j['id']) in changed]
+
+            for job in fresh:
                 location = job.get('categories', {}).get('location', 'Unknown')
                 all_jobs.append({
                     'title': job.get('text'), # Lever uses "text" for the job title
@@ -56,17 +138,23 @@ class ATS_Scraper:
                     'url': job.get('hostedUrl'),
                     'source': 'ATS_Lever'
                 })
-            print(f"Parsed {len(data)} jobs for {site_token}.")
+            defer_until_saved(functools.partial(snapshots.commit, board, versions, full))
+            print(f"Parsed {len(data)} jobs for {site_token} ({len(fresh)} new or updated).")
         except Exception as e:
             print(f"Error fetching Lever board {site_token}: {e}")
+            return []
         return all_jobs
 
+    def iter_boards(self):
+        """((provider, board), jobs) per Greenhouse / Lever board, yielded as each board finishes."""
+        fetch = {"greenhouse": self.scrape_greenhouse, "lever": self.scrape_lever}
+        boards = [("greenhouse", b) for b in self.greenhouse_boards] + [("lever", b) for b in self.lever_boards]
+        yield from fan_out(lambda pb: fetch[pb[0]](pb[1]), boards)
+
     def scrape_all(self):
         all_jobs = []
-        for board in self.greenhouse_boards:
-            all_jobs.extend(self.scrape_greenhouse(board))
-        for board in self.lever_boards:
-            all_jobs.extend(self.scrape_lever(board))
+        for _board, jobs in self.iter_boards():
+            all_jobs.extend(jobs)
         return all_jobs
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""
+Concurrent fan-out over ATS board slugs (Greenhouse / Lever, Ashby, SmartRecruiters, Recruitee).
+
+portal_seeds.yml can grow the board lists to hundreds of companies, so each scraper's iter_boards()
+fetches boards on a bounded thread pool (sourcing.board_workers) and yields (board, jobs) as each
+board finishes. Request starts are capped per provider (sourcing.board_rate_limits, requests per
+second, shared by every thread in the process) so a wide fan-out stays polite to one API.
+Each board fetch runs in a copy of the caller's context, so deferred sync writes
+(core/sync_batch.py) land in the caller's batch.
+"""
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from apps.cli.legacy.core.config import get_sourcing_config
+
+DEFAULT_WORKERS = 8
+DEFAULT_RATE_PER_SEC = 5.0
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """At most `per_sec` request starts per second across threads (0 = unlimited)."""
+
+    def __init__(self, per_sec: float):
+        self.interval = 1.0 / per_sec if per_sec and per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_LIMITERS: dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def provider_limiter(provider: str) -> RateLimiter:
+    """Process-wide RateLimiter for one provider at its sourcing.board_rate_limits rate."""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            rates = get_sourcing_config().get("board_rate_limits") or {}
+            limiter = _LIMITERS[provider] = RateLimiter(float(rates.get(provider, DEFAULT_RATE_PER_SEC) or 0))
+        return limiter
+
+
+def fan_out(fetch: Callable[[T], Any], boards: Iterable[T], workers: int | None = None) -> Iterator[tuple[T, Any]]:
+    """(board, fetch(board)) for every board, yielded in completion order; serial with one worker."""
+    boards = list(boards)
+    if workers is None:
+        workers = int(get_sourcing_config().get("board_workers", DEFAULT_WORKERS) or 1)
+    workers = min(max(1, workers), len(boards))
+    if workers <= 1:
+        for board in boards:
+            yield board, fetch(board)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="boards") as executor:
+        futures = {executor.submit(contextvars.copy_context().run, fetch, board): board for board in boards}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
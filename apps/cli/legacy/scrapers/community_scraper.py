@@ -2,6 +2,8 @@ import requests
 from bs4 import BeautifulSoup
 import re
 
+from apps.cli.legacy.core.http_client import http_get, not_modified
+
 class CommunityScraper:
     def __init__(self):
         self.sources = {
@@ -15,7 +17,10 @@ class CommunityScraper:
         """
         print(f"Fetching community list from {url}...")
         try:
-            response = requests.get(url)
+            response = http_get(url, conditional=True)
+            if not_modified(response):
+                print("  README unchanged since last sync.")
+                return []
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             print(f"Error fetching {url}: {e}")
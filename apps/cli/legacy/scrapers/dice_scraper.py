@@ -1,10 +1,12 @@
-import requests # type: ignore
 from bs4 import BeautifulSoup # type: ignore
 import json
 import logging
 import urllib.parse
 import time
 
+from apps.cli.legacy.core.http_client import http_get
+
+
 class DiceScraper:
     """
     A scraper for Dice.com job listings.
@@ -52,7 +54,7 @@ class DiceScraper:
         encoded_params = urllib.parse.urlencode(params)
         url = f"{self.search_url}?{encoded_params}"
         
-        response = requests.get(url, headers=self.headers, timeout=15)
+        response = http_get(url, headers=self.headers, timeout=15)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.text, 'html.parser')
@@ -2,6 +2,7 @@ import re
 import requests
 
 from apps.cli.legacy.core.config import get_sourcing_config
+from apps.cli.legacy.core.http_client import http_get, not_modified
 
 _RAW_README = "https://raw.githubusercontent.com/jobright-ai/{repo}/master/README.md"
 
@@ -50,13 +51,19 @@ class JobrightScraper:
         return text, ""
 
     def _fetch_readme_text(self, url: str) -> str:
-        """GET raw README; if default branch is main, retry after 404 on master."""
+        """
+        GET raw README; if default branch is main, retry after 404 on master.
+        Conditional GET: "" when the README is unchanged since the last sync.
+        """
         print(f"Fetching Jobright list from {url}...")
-        r = requests.get(url, timeout=30)
+        r = http_get(url, timeout=30, conditional=True)
         if r.status_code == 404 and "/master/README.md" in url:
             alt = url.replace("/master/README.md", "/main/README.md")
             print(f"  master 404, trying {alt}...")
-            r = requests.get(alt, timeout=30)
+            r = http_get(alt, timeout=30, conditional=True)
+        if not_modified(r):
+            print("  README unchanged since last sync.")
+            return ""
         r.raise_for_status()
         return r.text
 
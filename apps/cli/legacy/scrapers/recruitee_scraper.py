@@ -3,7 +3,8 @@ Recruitee careers API scraper.
 Endpoint: GET https://{company}.recruitee.com/api/offers/
 """
 
-import requests
+from apps.cli.legacy.core.http_client import http_get, not_modified
+from apps.cli.legacy.scrapers.board_fanout import fan_out, provider_limiter
 
 
 class RecruiteeScraper:
@@ -14,8 +15,9 @@ class RecruiteeScraper:
         jobs = []
         url = f"https://{company}.recruitee.com/api/offers/"
         try:
-            response = requests.get(url, timeout=20)
-            if response.status_code == 404:
+            provider_limiter("recruitee").wait()
+            response = http_get(url, timeout=20, conditional=True)
+            if response.status_code == 404 or not_modified(response):
                 return []
             response.raise_for_status()
             data = response.json()
@@ -49,8 +51,12 @@ class RecruiteeScraper:
             print(f"Recruitee ({company}): {len(jobs)} jobs.")
         return jobs
 
+    def iter_boards(self):
+        """(company, jobs) per company, yielded as each company finishes."""
+        yield from fan_out(self.scrape_company, self.companies)
+
     def scrape_all(self):
         all_jobs = []
-        for company in self.companies:
-            all_jobs.extend(self.scrape_company(company))
+        for _company, jobs in self.iter_boards():
+            all_jobs.extend(jobs)
         return all_jobs
@@ -2,7 +2,7 @@
 Remote OK remote jobs. Free JSON API at remoteok.com/api.
 Returns a large array; we take the first N and normalize.
 """
-import requests
+from apps.cli.legacy.core.http_client import http_get, not_modified
 
 REMOTEOK_API = "https://remoteok.com/api"
 
@@ -15,7 +15,10 @@ class RemoteOKScraper:
         all_jobs = []
         try:
             # API returns array; first element can be metadata
-            response = requests.get(REMOTEOK_API, headers={"User-Agent": "JobAutomation/1.0"}, timeout=30)
+            response = http_get(REMOTEOK_API, headers={"User-Agent": "JobAutomation/1.0"}, timeout=30, conditional=True)
+            if not_modified(response):
+                print("RemoteOK: feed unchanged since last sync.")
+                return all_jobs
             response.raise_for_status()
             raw = response.json()
             if not isinstance(raw, list):
@@ -2,7 +2,7 @@
 Remotive remote jobs API. Free; use sparingly (max ~4 requests/day).
 Must credit Remotive and link back. Jobs delayed 24h.
 """
-import requests
+from apps.cli.legacy.core.http_client import http_get, not_modified
 
 REMOTIVE_API = "https://remotive.com/api/remote-jobs"
 
@@ -14,7 +14,10 @@ class RemotiveScraper:
     def scrape(self):
         all_jobs = []
         try:
-            response = requests.get(REMOTIVE_API, params={"limit": self.limit}, timeout=15)
+            response = http_get(REMOTIVE_API, params={"limit": self.limit}, timeout=15, conditional=True)
+            if not_modified(response):
+                print("Remotive: feed unchanged since last sync.")
+                return all_jobs
             response.raise_for_status()
             data = response.json()
             jobs = data.get("jobs", [])
@@ -3,7 +3,8 @@ SmartRecruiters public postings API scraper.
 Endpoint: GET https://api.smartrecruiters.com/v1/companies/{company}/postings
 """
 
-import requests
+from apps.cli.legacy.core.http_client import http_get
+from apps.cli.legacy.scrapers.board_fanout import fan_out, provider_limiter
 
 
 class SmartRecruitersScraper:
@@ -18,7 +19,8 @@ class SmartRecruitersScraper:
             url = f"https://api.smartrecruiters.com/v1/companies/{company}/postings"
             params = {"limit": self.page_size, "offset": offset}
             try:
-                response = requests.get(url, params=params, timeout=20)
+                provider_limiter("smartrecruiters").wait()
+                response = http_get(url, params=params, timeout=20)
                 if response.status_code == 404:
                     break
                 response.raise_for_status()
@@ -62,8 +64,12 @@ class SmartRecruitersScraper:
             print(f"SmartRecruiters ({company}): {len(jobs)} jobs.")
         return jobs
 
+    def iter_boards(self):
+        """(company, jobs) per company, yielded as each company finishes."""
+        yield from fan_out(self.scrape_company, self.companies)
+
     def scrape_all(self):
         all_jobs = []
-        for company in self.companies:
-            all_jobs.extend(self.scrape_company(company))
+        for _company, jobs in self.iter_boards():
+            all_jobs.extend(jobs)
         return all_jobs
@@ -155,15 +155,13 @@ def _preflight_checks(cfg):
 
 
 def _count_eval_backlog(client, sample_limit: int = 5000):
-    """Return counts for today's NEW / NEEDS_REVIEW / LLM_FAILED buckets."""
-    new_jobs, _ = client.get_new_jobs(limit=sample_limit)
-    needs_review_jobs, _ = client.get_needs_review_jobs(limit=sample_limit)
-    llm_failed_jobs, _ = client.get_llm_failed_jobs(limit=sample_limit)
-    return {
-        "NEW": len(new_jobs or []),
-        "NEEDS_REVIEW": len(needs_review_jobs or []),
-        "LLM_FAILED": len(llm_failed_jobs or []),
-    }
+    """Return counts for today's NEW / NEEDS_REVIEW / LLM_FAILED buckets (one Status-column read)."""
+    try:
+        by_status = client.count_by_column("Status")
+    except Exception as e:
+        print(f"Error counting evaluation backlog: {e}")
+        by_status = {}
+    return {k: min(int(by_status.get(k, 0)), sample_limit) for k in ("NEW", "NEEDS_REVIEW", "LLM_FAILED")}
 
 
 def _is_sheets_read_failure(exc: Exception) -> bool:
@@ -453,6 +451,13 @@ def run_full_pipeline():
     print("\n--- Final Sorting ---")
     client.sort_daily_jobs()
 
+    stats = client.sheets_call_stats()
+    print(
+        f"  Sheets API: {stats['requests']} requests ({stats['reads']} reads / {stats['writes']} writes), "
+        f"{stats['bytes_sent']} bytes sent, {stats['throttle_wait_sec']}s throttled, "
+        f"{stats['quota_errors']} quota errors"
+    )
+
     print("\n--- Cycle hooks (digest / feedback / sourcing hints) ---")
     _run_cycle_hooks(cycle_id)
 
@@ -1,7 +1,10 @@
 import os
 import sys
 import logging
+import queue
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
@@ -10,6 +13,7 @@ from jobspy import scrape_jobs
 from apps.cli.legacy.core.google_sheets_client import GoogleSheetsClient, normalize_job_url
 from apps.cli.legacy.core.config import get_sourcing_config, get_evaluation_config
 from apps.cli.legacy.core.job_filters import (
+    filter_sourcing_frame,
     filter_sourcing_jobs,
     print_sourcing_filter_summary,
 )
@@ -23,7 +27,11 @@ from apps.cli.legacy.scrapers.ashby_scraper import AshbyScraper
 from apps.cli.legacy.scrapers.dice_scraper import DiceScraper
 from apps.cli.legacy.scrapers.smartrecruiters_scraper import SmartRecruitersScraper
 from apps.cli.legacy.scrapers.recruitee_scraper import RecruiteeScraper
+from apps.cli.legacy.core.http_client import http_get
+from apps.cli.legacy.core.sync_batch import staged_sync
+from apps.cli.legacy.core.browser_pool import JD_SELECTORS, get_browser_pool, playwright_available
 from apps.cli.legacy.core.llm_router import LLMRouter
+from apps.cli.legacy.core.sourcing_ai_cache import SNIFF, TAG, content_key, get_sourcing_ai_cache
 from apps.cli.legacy.core.title_fit_gate import (
     sniffer_constraints_paragraph,
     sniffer_role_bullet_text,
@@ -32,16 +40,22 @@ from apps.cli.legacy.core.title_fit_gate import (
 import pandas as pd # type: ignore
 import json
 import os
-import requests # type: ignore
 from bs4 import BeautifulSoup # type: ignore
-try:
-    from playwright.sync_api import sync_playwright
-except ImportError:
-    sync_playwright = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Failed-call answers: let the job through untagged, and never cache them.
+_SNIFF_FAILED_REASON = "LLM failed - allowing through"
+_TAGS_UNKNOWN = "Tags: Unknown"
+# Multi-board sources hand jobs to normalize_and_save once this many have accumulated across boards.
+_BOARD_SAVE_BATCH = 25
+
+# Tag fields shared by tag_job and the batched classifier prompt.
+_TAG_FIELDS = """1. Work Style: Remote, Hybrid, or Onsite
+        2. Seniority: Intern, Junior, Mid, Senior, Lead, or Director
+        3. Industry: Tech, Finance, Health, Retail, or Other"""
+
 
 def _playwright_error_is_missing_browser(exc: Exception) -> bool:
     """Detect Playwright's 'please run playwright install' / missing browser binary errors."""
@@ -54,6 +68,23 @@ def _playwright_error_is_missing_browser(exc: Exception) -> bool:
     )
 
 
+class _HostLimiter:
+    """At most `per_host` concurrent requests per URL host (politeness cap for the JD fetch stage)."""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._sems = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url):
+        host = urlparse(url or "").netloc.lower()
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = self._sems[host] = threading.BoundedSemaphore(self.per_host)
+        return sem
+
+
 # After the first "browser not installed" launch failure, skip Playwright for this process.
 _playwright_browser_missing_process_wide: bool = False
 
@@ -81,6 +112,14 @@ class SourcingAgent:
             companies=cfg.get("recruitee_companies") or []
         )
         self.llm = LLMRouter()
+        # Concurrent sniff/tag LLM calls per normalize_and_save stage (1 = serial).
+        self.ai_max_in_flight = max(1, int(cfg.get("ai_max_in_flight", 4) or 1))
+        # Jobs per batched sniff/tag prompt (<= 1: one prompt per job).
+        self.ai_batch_size = int(cfg.get("ai_batch_size", 10) or 1)
+        # JD resolution stage: static fetch threads, per-host cap, Playwright lane (= browser pool size).
+        self.jd_fetch_workers = max(1, int(cfg.get("jd_fetch_workers", 8) or 1))
+        self.jd_fetch_per_host = max(1, int(cfg.get("jd_fetch_per_host", 2) or 1))
+        self.playwright_lane_workers = max(1, int(cfg.get("playwright_pool_size", 2) or 1))
         self._last_sourcing_filter_stats: dict[str, int] = {}
         _pw_env = str(os.environ.get("DISABLE_PLAYWRIGHT_JD", "")).strip().lower()
         self._playwright_jd_disabled = (
@@ -108,12 +147,15 @@ class SourcingAgent:
         Run only Jobright GitHub README feeds (config sourcing.jobright_github_repos).
         Returns parsed row count before dedupe/filters; 0 if repos disabled or empty.
         """
-        jobs = self.jobright_scraper.scrape_all()
+        with staged_sync() as sync:
+            jobs = self.jobright_scraper.scrape_all()
         if not jobs:
             print("Jobright (GitHub): no jobs returned (empty repo list or parse miss).")
+            sync.commit()
             return 0
         print(f"Jobright (GitHub): {len(jobs)} rows parsed → filter & save...")
         self.normalize_and_save(jobs, use_ai_filter=use_ai_filter)
+        sync.commit()
         return len(jobs)
 
     def scrape_community_sources_once(self, queries=None, skip_jobright: bool = False):
@@ -142,21 +184,62 @@ class SourcingAgent:
         if skip_jobright:
             sources = [s for s in sources if s[0] != "Jobright"]
             print("(Skipping Jobright here; already run at pipeline start.)")
-        for name, scraper, use_queries in sources:
+
+        results = queue.Queue()
+
+        def _scrape(name, scraper, use_queries):
+            print(f"Scraping {name}...")
+            sync = None
             try:
-                print(f"Scraping {name}...")
-                if use_queries:
-                    jobs = scraper.scrape(queries=queries)
-                elif name in ("Remotive", "RemoteOK"):
-                    jobs = scraper.scrape()
-                else:
-                    jobs = scraper.scrape_all()
-                if jobs:
-                    print(f"Found {len(jobs)} jobs from {name}. Filtering and saving...")
-                    self.normalize_and_save(jobs)
-                    all_jobs.extend(jobs)
+                with staged_sync() as sync:
+                    if use_queries:
+                        results.put((name, "jobs", scraper.scrape(queries=queries)))
+                    elif name in ("Remotive", "RemoteOK"):
+                        results.put((name, "jobs", scraper.scrape()))
+                    elif hasattr(scraper, "iter_boards"):
+                        # Hand boards over as they finish (a few at a time) instead of after the whole fan-out.
+                        batch = []
+                        for _board, jobs in scraper.iter_boards():
+                            batch.extend(jobs or [])
+                            if len(batch) >= _BOARD_SAVE_BATCH:
+                                results.put((name, "jobs", batch))
+                                batch = []
+                        results.put((name, "jobs", batch))
+                    else:
+                        results.put((name, "jobs", scraper.scrape_all()))
             except Exception as e:
-                print(f"Error scraping {name}: {e}")
+                results.put((name, "error", e))
+            finally:
+                results.put((name, "done", sync))
+
+        # Sources are independent: scrape them concurrently (multi-board scrapers fan out further in
+        # iter_boards) and filter / save each delivery on this thread as soon as it arrives. A source's
+        # sync state (conditional-GET validators) is committed only once all of its jobs are saved.
+        failed = set()
+        with ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="sources") as executor:
+            for source in sources:
+                executor.submit(_scrape, *source)
+            pending = len(sources)
+            while pending:
+                name, kind, payload = results.get()
+                if kind == "done":
+                    pending -= 1
+                    if payload is not None and name not in failed:
+                        try:
+                            payload.commit()
+                        except Exception as e:
+                            print(f"Error recording sync state for {name}: {e}")
+                elif kind == "error":
+                    failed.add(name)
+                    print(f"Error scraping {name}: {payload}")
+                elif payload:
+                    print(f"Found {len(payload)} jobs from {name}. Filtering and saving...")
+                    try:
+                        self.normalize_and_save(payload)
+                        all_jobs.extend(payload)
+                    except Exception as e:
+                        failed.add(name)
+                        print(f"Error saving {name} jobs: {e}")
         return all_jobs
 
     def _jobspy_site_names(self):
@@ -166,8 +249,33 @@ class SourcingAgent:
             return sites
         return ["linkedin", "indeed", "google", "zip_recruiter"]
 
+    @staticmethod
+    def _prefilter_jobspy_frame(jobs):
+        """
+        Normalize a JobSpy DataFrame to the sourcing job keys and run the static rules column-wise
+        (filter_sourcing_frame); only survivors become dicts. Returns (jobs, reject stats, raw count).
+        """
+        columns = {
+            "title": "title",
+            "company": "company",
+            "url": "job_url",
+            "location": "location",
+            "source": "site",
+            "description": "description",
+        }
+        frame = pd.DataFrame(index=jobs.index)
+        for key, src in columns.items():
+            col = jobs[src].astype(object) if src in jobs.columns else pd.Series("", index=jobs.index, dtype=object)
+            frame[key] = col.map(lambda v: "" if pd.isna(v) else str(v or "")).astype(object)
+        mask, reasons = filter_sourcing_frame(frame)
+        stats = {str(k): int(v) for k, v in reasons[~mask].value_counts().items()}
+        return frame[mask].to_dict("records"), stats, len(frame)
+
     def _jobspy_one(self, query, location, results_wanted):
-        """Run JobSpy for one (query, location). Returns list of job dicts (empty on error)."""
+        """
+        Run JobSpy for one (query, location). Returns (job dicts that passed the static filter,
+        reject stats, raw count); ([], {}, 0) on error.
+        """
         try:
             jobs = scrape_jobs(
                 site_name=self._jobspy_site_names(),
@@ -178,22 +286,11 @@ class SourcingAgent:
                 country_indeed="USA",
             )
             if jobs.empty:
-                return []
-            jobs_dict = jobs.to_dict("records")
-            return [
-                {
-                    "title": str(jd.get("title") or ""),
-                    "company": str(jd.get("company") or ""),
-                    "url": str(jd.get("job_url") or ""),
-                    "location": str(jd.get("location") or ""),
-                    "source": str(jd.get("site") or ""),
-                    "description": str(jd.get("description") or ""),
-                }
-                for jd in jobs_dict
-            ]
+                return [], {}, 0
+            return self._prefilter_jobspy_frame(jobs)
         except Exception as e:
             logging.warning(f"JobSpy failed for '{query}' in '{location}': {e}")
-            return []
+            return [], {}, 0
 
     def scrape_jobspy_parallel(self, queries, locations, max_workers=4, use_ai_filter=False):
         """
@@ -216,11 +313,13 @@ class SourcingAgent:
             for future in as_completed(future_to_task):
                 q, loc = future_to_task[future]
                 try:
-                    batch = future.result()
-                    if batch:
-                        print(f"JobSpy '{q}' in '{loc}': {len(batch)} jobs → saving...")
-                        self.normalize_and_save(batch, use_ai_filter=use_ai_filter)
-                        total += len(batch)
+                    batch, stats, raw_n = future.result()
+                    if raw_n:
+                        print(f"JobSpy '{q}' in '{loc}': {raw_n} jobs → saving...")
+                        self.normalize_and_save(
+                            batch, use_ai_filter=use_ai_filter, prefilter_stats=stats, raw_count=raw_n
+                        )
+                        total += raw_n
                 except Exception as e:
                     logging.warning(f"Task ({q}, {loc}) failed: {e}")
         print(f"JobSpy parallel run complete. Total jobs processed from JobSpy: {total}.")
@@ -257,11 +356,9 @@ class SourcingAgent:
         title = job.get("title", "")
         desc = job.get("description", "")[:400]
         
-        system_prompt = """
+        system_prompt = f"""
         Analyze the job title and snippet. Extract:
-        1. Work Style: Remote, Hybrid, or Onsite
-        2. Seniority: Intern, Junior, Mid, Senior, Lead, or Director
-        3. Industry: Tech, Finance, Health, Retail, or Other
+        {_TAG_FIELDS}
         
         Output EXACTLY: Style: [Style] | Seniority: [Seniority] | Industry: [Industry]
         """
@@ -269,7 +366,7 @@ class SourcingAgent:
         
         text, engine = self.llm.generate_content(system_prompt, user_prompt)
         if engine == "FAILED":
-            return "Tags: Unknown"
+            return _TAGS_UNKNOWN
         return text.strip()
 
     def scrape(self, queries=["Product", "Analytics", "Operations", "Strategy", "Data", "Manager", "Scrum"], locations=None, results_wanted=50, include_community_sources=True, expand_ai_queries=False):
@@ -304,23 +401,11 @@ class SourcingAgent:
                     )
                     
                     if not jobs.empty:
-                        # Convert DataFrame to list of dicts
-                        jobs_dict = jobs.to_dict('records')
-                        batch = []
-                        for jd in jobs_dict:
-                            # Standardize job dict keys for the filter matching
-                            batch.append({
-                                'title': jd.get('title'),
-                                'company': jd.get('company'),
-                                'url': jd.get('job_url'),
-                                'location': jd.get('location'),
-                                'source': jd.get('site'),
-                                'description': jd.get('description', '')
-                            })
-                        
+                        batch, stats, raw_n = self._prefilter_jobspy_frame(jobs)
+
                         # NEW: Checkpoint Save for JobSpy batch
-                        print(f"Found {len(batch)} jobs for {query}. Filtering and saving checkpoint...")
-                        self.normalize_and_save(batch)
+                        print(f"Found {raw_n} jobs for {query}. Filtering and saving checkpoint...")
+                        self.normalize_and_save(batch, prefilter_stats=stats, raw_count=raw_n)
                         
                     else:
                         print(f"No jobs found for {query} via JobSpy.")
@@ -343,23 +428,87 @@ class SourcingAgent:
         1. Fast Scrape (Requests/BS4)
         2. Deep Scrape (Playwright) for JS-heavy sites
         """
+        jd, ok, method, needs_deep = self._jd_fast_tier(url)
+        if needs_deep:
+            return self._jd_deep_tier(url, jd, method)
+        return jd, ok, method
+
+    def _jd_fast_tier(self, url: str) -> tuple[str, bool, str, bool]:
+        """Tier 1 of _fetch_jd_manually: (jd, ok, method, needs_deep); needs_deep = go on to Playwright."""
         if not url or "google.com" in url:
-            return "", False, "skipped"
+            return "", False, "skipped", False
         
-        # 1. Fast Scrape
         jd, ok, method = self._fetch_jd_static(url)
         if ok and len(jd) > 300:
-            return jd, True, method
-            
-        # 2. Deep Scrape (Playwright Fallback)
-        if sync_playwright and not self._playwright_jd_disabled:
-            print(f"    🔄 Fast Scrape too short ({len(jd)} chars). Trying Playwright...")
-            jd_deep, ok2, method2 = self._fetch_jd_playwright(url)
-            if ok2 and len(jd_deep) > len(jd):
-                return jd_deep, True, method2
-        
+            return jd, True, method, False
+        if playwright_available() and not self._playwright_jd_disabled:
+            return jd, False, method, True
+        return jd, False, method or "static_unverified", False
+
+    def _jd_deep_tier(self, url: str, jd: str, method: str) -> tuple[str, bool, str]:
+        """Tier 2 of _fetch_jd_manually: Playwright, kept only when it beats the static text."""
+        print(f"    🔄 Fast Scrape too short ({len(jd)} chars). Trying Playwright...")
+        jd_deep, ok2, method2 = self._fetch_jd_playwright(url)
+        if ok2 and len(jd_deep) > len(jd):
+            return jd_deep, True, method2
         return jd, False, method or "static_unverified"
 
+    def _resolve_jds(self, jobs):
+        """
+        JD resolution stage of normalize_and_save (hard-gated, selector-only verification):
+        (description, jd_verified, jd_fetch_method, jd_fetch_reason) per job, in input order.
+        Jobs without a usable source description are fetched concurrently: the static tier on
+        jd_fetch_workers threads with at most jd_fetch_per_host requests per host in flight, and
+        static misses feed a smaller Playwright lane (playwright_pool_size threads, one per pooled page).
+        """
+        results = [None] * len(jobs)
+        pending = []
+        for i, job in enumerate(jobs):
+            desc = job.get("description", "")
+            if desc and isinstance(desc, str) and len(desc) >= 200 and desc.lower() != "none":
+                results[i] = (desc, True, "source", "")
+            elif job.get("url"):
+                pending.append(i)
+            else:
+                results[i] = (desc, False, "source", "")
+        if not pending:
+            return results
+
+        print(f"--- Resolving JDs for {len(pending)} jobs ({self.jd_fetch_workers} workers, {self.jd_fetch_per_host}/host) ---")
+        hosts = _HostLimiter(self.jd_fetch_per_host)
+
+        def _fast(i):
+            url = jobs[i].get("url")
+            with hosts.slot(url):
+                return self._jd_fast_tier(url)
+
+        def _deep(i, jd, method):
+            url = jobs[i].get("url")
+            with hosts.slot(url):
+                return self._jd_deep_tier(url, jd, method)
+
+        def _finish(i, fetched):
+            desc, ok, method = fetched
+            if ok and desc:
+                results[i] = (desc, True, method, "")
+            else:
+                results[i] = ("", False, method, "selector_only_jd_not_found")
+
+        with ThreadPoolExecutor(max_workers=min(self.jd_fetch_workers, len(pending)), thread_name_prefix="jd-static") as static_lane, \
+                ThreadPoolExecutor(max_workers=self.playwright_lane_workers, thread_name_prefix="jd-playwright") as deep_lane:
+            static_futures = {static_lane.submit(_fast, i): i for i in pending}
+            deep_futures = {}
+            for future in as_completed(static_futures):
+                i = static_futures[future]
+                jd, ok, method, needs_deep = future.result()
+                if needs_deep:
+                    deep_futures[deep_lane.submit(_deep, i, jd, method)] = i
+                else:
+                    _finish(i, (jd, ok, method))
+            for future, i in deep_futures.items():
+                _finish(i, future.result())
+        return results
+
     def _fetch_jd_static(self, url: str) -> tuple[str, bool, str]:
         """Fast, static HTML extraction. Selector-only (no full-page fallback)."""
         print(f"    🔍 Static JD Fetch: {url}...")
@@ -367,21 +516,14 @@ class SourcingAgent:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
-            r = requests.get(url, headers=headers, timeout=10)
+            r = http_get(url, headers=headers, timeout=10)
             r.raise_for_status()
             
             soup = BeautifulSoup(r.text, "html.parser")
             for script in soup(["script", "style", "nav", "footer", "header"]):
                 script.decompose()
                 
-            # Common ATS selectors
-            selectors = [
-                ".job-description", "#job-description", ".description", 
-                ".posting-description", "#content", "main", "[data-automation-id='job-posting-description']",
-                ".jd-content", ".careers-job-description"
-            ]
-            
-            for selector in selectors:
+            for selector in JD_SELECTORS:
                 found = soup.select_one(selector)
                 if found:
                     content = found.get_text(separator="\n").strip()
@@ -395,44 +537,20 @@ class SourcingAgent:
             return "", False, "static:error"
 
     def _fetch_jd_playwright(self, url: str) -> tuple[str, bool, str]:
-        """Deep scrape using headless browser for JS-heavy sites. Selector-only (no full-page fallback)."""
-        if not sync_playwright:
+        """
+        Deep scrape via the shared headless browser pool (core/browser_pool.py) for JS-heavy sites.
+        Selector-only (no full-page fallback).
+        """
+        if not playwright_available():
             return "", False, "playwright:unavailable"
         if self._playwright_jd_disabled:
             return "", False, "playwright:disabled"
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, wait_until="networkidle", timeout=20000)
-                
-                # Give it a tiny bit extra for late-loading React components
-                page.wait_for_timeout(2000)
-                
-                # Check same selectors in browser context
-                content = ""
-                selectors = [
-                    ".job-description", "#job-description", ".description", 
-                    ".posting-description", "#content", "main", "[data-automation-id='job-posting-description']",
-                    ".jd-content", ".careers-job-description"
-                ]
-                
-                for selector in selectors:
-                    try:
-                        element = page.query_selector(selector)
-                        if element:
-                            text = element.inner_text()
-                            if len(text) > 100:
-                                content = text
-                                break
-                    except:
-                        continue
-                
-                browser.close()
-                if len(content) > 100:
-                    print(f"    ✅ Playwright fetch successful ({len(content)} chars).")
-                    return self._clean_text(content), True, "playwright:selector"
+            content, _selector = get_browser_pool().fetch(url)
+            if content:
+                print(f"    ✅ Playwright fetch successful ({len(content)} chars).")
+                return self._clean_text(content), True, "playwright:selector"
         except Exception as e:
             if _playwright_error_is_missing_browser(e):
                 global _playwright_browser_missing_process_wide
@@ -474,19 +592,10 @@ class SourcingAgent:
         """
         title = job.get("title", "")
         desc = job.get("description", "")[:800] # Slightly larger snippet for YOE search
-        
-        traits = self.dense_matrix.get("global_traits", {})
-        clearance = traits.get("clearance", "None")
-        role_families = sniffer_role_bullet_text()
-        constraints = sniffer_constraints_paragraph()
 
         system_prompt = f"""
         You are a recruitment classifier. Analyze the Job Title and Snippet against these HARD CONSTRAINTS:
-        1. Seniority vs candidate: {constraints}
-           If the job strictly demands far more experience than the candidate (e.g. 5+ or 7+ years required when they have less), or is clearly a senior/staff/principal/director bar, answer NO.
-        2. User Security Clearance: {clearance}. If the job strictly requires an active clearance (Secret, Top Secret, TS/SCI), answer NO.
-        3. Role relevance: Is this role in one of these target families (or clearly adjacent same function)? {role_families}
-           If the job is an unrelated profession, answer NO.
+        {self._sniff_constraints()}
 
         Answer ONLY YES or NO.
         """
@@ -499,32 +608,204 @@ class SourcingAgent:
         text, engine = self.llm.generate_content(system_prompt, user_prompt, model=sourcing_model)
         
         if engine == "FAILED":
-            return True, "LLM failed - allowing through"
+            return True, _SNIFF_FAILED_REASON
             
         result = text.strip().upper()
         if "YES" in result:
             return True, f"AI confirmed relevance ({engine} - {sourcing_model})"
         return False, f"AI rejected: Sniffer Mismatch ({engine} - {sourcing_model})"
 
-    def normalize_and_save(self, raw_jobs, use_ai_filter=False):
+    def _sniff_constraints(self):
+        """Numbered HARD CONSTRAINTS block shared by the single-job and batched sniff prompts."""
+        traits = self.dense_matrix.get("global_traits", {})
+        clearance = traits.get("clearance", "None")
+        role_families = sniffer_role_bullet_text()
+        constraints = sniffer_constraints_paragraph()
+        return f"""1. Seniority vs candidate: {constraints}
+           If the job strictly demands far more experience than the candidate (e.g. 5+ or 7+ years required when they have less), or is clearly a senior/staff/principal/director bar, answer NO.
+        2. User Security Clearance: {clearance}. If the job strictly requires an active clearance (Secret, Top Secret, TS/SCI), answer NO.
+        3. Role relevance: Is this role in one of these target families (or clearly adjacent same function)? {role_families}
+           If the job is an unrelated profession, answer NO."""
+
+    def _classify_batch(self, jobs, sniff=True):
+        """
+        One LLM call for a numbered batch of jobs. With sniff=True the prompt carries the sniff
+        constraints and each answer has relevance and tags; otherwise tags only.
+        Returns one (passed, reason, tags) per job in order; None for jobs missing from the answer.
+        """
+        parts = []
+        for i, job in enumerate(jobs, start=1):
+            snippet = str(job.get("description") or "")[: 800 if sniff else 400]
+            parts.append(
+                f"### JOB {i}\nTitle: {job.get('title', '')}\nCompany: {job.get('company', '')}\nSnippet: {snippet}"
+            )
+        fields = '"style": "...", "seniority": "...", "industry": "..."'
+        if sniff:
+            model = get_evaluation_config().get("sourcing_model", "gemini-2.5-flash-lite")
+            system_prompt = f"""
+        You are a recruitment classifier. For EACH numbered job, decide relevance against these HARD CONSTRAINTS
+        (relevant=false wherever a constraint says answer NO):
+        {self._sniff_constraints()}
+
+        Also extract for each job:
+        {_TAG_FIELDS}
+        """
+            fields = '"relevant": true|false, ' + fields
+        else:
+            model = None
+            system_prompt = f"""
+        Analyze each numbered job title and snippet. Extract:
+        {_TAG_FIELDS}
+        """
+        user_prompt = "\n\n".join(parts) + (
+            f"\n\nAnswer for each job separately: ONLY one JSON array with {len(jobs)} objects "
+            f'[{{"id": <job number>, {fields}}}].'
+        )
+        fmt = "\n\nReturn ONLY valid JSON, no markdown fences."
+        text, engine = self.llm.generate_content(system_prompt, user_prompt, formatting_instruction=fmt, model=model)
+        if engine == "FAILED":
+            return [(True, _SNIFF_FAILED_REASON, _TAGS_UNKNOWN)] * len(jobs)
+
+        out = [None] * len(jobs)
+        t = (text or "").strip()
+        a, b = t.find("["), t.rfind("]")
+        try:
+            answers = json.loads(t[a : b + 1]) if a != -1 and b > a else []
+        except json.JSONDecodeError:
+            answers = []
+        for obj in answers if isinstance(answers, list) else []:
+            if not isinstance(obj, dict):
+                continue
+            try:
+                i = int(obj.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= i < len(jobs):
+                continue
+            tags = " | ".join(
+                f"{label}: {str(obj.get(key) or '').strip() or 'Unknown'}"
+                for label, key in (("Style", "style"), ("Seniority", "seniority"), ("Industry", "industry"))
+            )
+            if not sniff:
+                out[i] = (True, "", tags)
+                continue
+            relevant = obj.get("relevant")
+            if isinstance(relevant, str):
+                relevant = {"true": True, "yes": True, "false": False, "no": False}.get(relevant.strip().lower())
+            if not isinstance(relevant, bool):
+                continue
+            if relevant:
+                out[i] = (True, f"AI confirmed relevance ({engine} - {model}, batch)", tags)
+            else:
+                out[i] = (False, f"AI rejected: Sniffer Mismatch ({engine} - {model}, batch)", tags)
+        return out
+
+    def _sniff_context(self):
+        """Fingerprint of everything in the sniff prompt besides the job (cache key context)."""
+        model = get_evaluation_config().get("sourcing_model", "gemini-2.5-flash-lite")
+        return f"{model}\n{self._sniff_constraints()}"
+
+    def _classify_jobs(self, jobs, sniff=True):
+        """
+        (passed, reason, tags) per job, in order, answered from the sniff / tag cache (sourcing_ai_cache)
+        where possible. Each distinct posting left over goes to the LLM once; its answer is stored
+        unless the call failed.
+        """
+        jobs = list(jobs)
+        cache = get_sourcing_ai_cache()
+        if sniff:
+            context = self._sniff_context()
+            keys = [content_key(job, context) for job in jobs]
+            known = {k: (bool(v[0]), v[1], None) for k, v in cache.get_many(SNIFF, keys).items()}
+        else:
+            keys = [content_key(job) for job in jobs]
+            known = {k: (True, "", v) for k, v in cache.get_many(TAG, keys).items()}
+        todo = {}
+        for key, job in zip(keys, jobs):
+            if key not in known:
+                todo.setdefault(key, job)
+
+        answers = self._classify_uncached(list(todo.values()), sniff)
+        sniffed, tagged = {}, {}
+        for (key, job), answer in zip(todo.items(), answers):
+            known[key] = answer
+            passed, reason, tags = answer
+            if sniff and reason != _SNIFF_FAILED_REASON:
+                sniffed[key] = [passed, reason]
+            if tags is not None and tags != _TAGS_UNKNOWN:
+                tagged[content_key(job)] = tags
+        cache.put_many(SNIFF, sniffed)
+        cache.put_many(TAG, tagged)
+        return [known[key] for key in keys]
+
+    def _classify_uncached(self, jobs, sniff=True):
+        """
+        (passed, reason, tags) per job, in order. Batches of ai_batch_size go through _classify_batch
+        (ai_max_in_flight batches at a time); jobs missing from a batch answer fall back to
+        ai_sniff_relevance / tag_job. With ai_batch_size <= 1 only the single-job calls are used and
+        sniffing leaves tags as None (tag_job runs later, for deduped survivors only).
+        """
+        jobs = list(jobs)
+        size = self.ai_batch_size
+        if size > 1 and len(jobs) > 1:
+            chunks = [jobs[i : i + size] for i in range(0, len(jobs), size)]
+            results = [r for chunk in self._ai_map(lambda c: self._classify_batch(c, sniff), chunks) for r in chunk]
+        else:
+            results = [None] * len(jobs)
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            if sniff:
+                singles = [(ok, why, None) for ok, why in self._ai_map(self.ai_sniff_relevance, [jobs[i] for i in missing])]
+            else:
+                singles = [(True, "", tags) for tags in self._ai_map(self.tag_job, [jobs[i] for i in missing])]
+            for i, r in zip(missing, singles):
+                results[i] = r
+        return results
+
+    def _ai_map(self, fn, jobs):
+        """
+        fn(job) for every job with at most ai_max_in_flight calls in flight; results in input order.
+        Provider pacing (GEMINI_REQUEST_DELAY_SEC, 429 backoff) still applies per request in LLMRouter.
+        """
+        jobs = list(jobs)
+        workers = min(self.ai_max_in_flight, len(jobs))
+        if workers <= 1:
+            return [fn(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sourcing-ai") as executor:
+            return list(executor.map(fn, jobs))
+
+    def normalize_and_save(self, raw_jobs, use_ai_filter=False, prefilter_stats=None, raw_count=None):
         """
         Normalizes job data, applies filters, and saves to Google Sheets.
+        prefilter_stats / raw_count: raw_jobs already passed the static rules (JobSpy frame path);
+        skip filter_jobs and report these reject counts instead.
         """
-        raw_n = len(raw_jobs or [])
         # 1. Static Rule Filter
-        filtered_raw_jobs = self.filter_jobs(raw_jobs)
-        static_stats = dict(self._last_sourcing_filter_stats)
+        if prefilter_stats is None:
+            raw_n = len(raw_jobs or [])
+            filtered_raw_jobs = self.filter_jobs(raw_jobs)
+            static_stats = dict(self._last_sourcing_filter_stats)
+        else:
+            raw_n = raw_count if raw_count is not None else len(raw_jobs or [])
+            filtered_raw_jobs = list(raw_jobs or [])
+            static_stats = dict(prefilter_stats)
+            self._last_sourcing_filter_stats = static_stats
+            print(f"Filtered down to {len(filtered_raw_jobs)} jobs from {raw_n}.")
         after_static_count = len(filtered_raw_jobs)
         
         # 2. AI Pre-filter (Optional)
+        ai_cache = get_sourcing_ai_cache()
+        cache_hits, cache_misses = ai_cache.hits, ai_cache.misses
         ai_rejected = 0
+        sniff_tags = {}  # id(job) -> tags from the batched sniff prompt
         if use_ai_filter and filtered_raw_jobs:
             print(f"--- AI Sniffing {len(filtered_raw_jobs)} jobs for relevance ---")
             ai_passed = []
-            for job in filtered_raw_jobs:
-                passed, reason = self.ai_sniff_relevance(job)
+            for job, (passed, reason, tags) in zip(filtered_raw_jobs, self._classify_jobs(filtered_raw_jobs)):
                 if passed:
                     ai_passed.append(job)
+                    if tags is not None:
+                        sniff_tags[id(job)] = tags
                 else:
                     ai_rejected += 1
                     logging.info("AI Filtered: %s [%s]", reason, job.get("title", ""))
@@ -538,36 +819,26 @@ class SourcingAgent:
         except Exception as e:
             logging.warning("Could not load existing URL set for early dedupe: %s", e)
 
-        # 4. Final Normalize & Tagging
-        clean_jobs = []
+        # 4. Final Normalize & Tagging (dedupe first so only new jobs are tagged; tags fetched concurrently)
+        new_jobs = []
         for job in filtered_raw_jobs:
             if not job:
                 continue
             canonical = normalize_job_url(job.get("url") or job.get("job_url") or "")
             if canonical and canonical in existing_seen:
                 continue
-            # Optional: Add tags to the description/metadata if needed, 
-            # Or just store them in a way the evaluator can see.
-            # For now, we'll just log them or add to a side-car field.
-            tags = self.tag_job(job)
-            
-            # JD resolution (hard-gated): selector-only verification.
-            desc = job.get("description", "")
-            jd_verified = bool(desc and isinstance(desc, str) and len(desc) >= 200 and desc.lower() != "none")
-            jd_fetch_method = "source"
-            jd_fetch_reason = ""
-            if (not jd_verified) and job.get("url"):
-                manual_desc, ok, method = self._fetch_jd_manually(job.get("url"))
-                if ok and manual_desc:
-                    desc = manual_desc
-                    jd_verified = True
-                    jd_fetch_method = method
-                else:
-                    desc = ""
-                    jd_verified = False
-                    jd_fetch_method = method
-                    jd_fetch_reason = "selector_only_jd_not_found"
-            
+            if canonical:
+                existing_seen.add(canonical)
+            new_jobs.append(job)
+        untagged = [job for job in new_jobs if id(job) not in sniff_tags]
+        for job, (_, _, tags) in zip(untagged, self._classify_jobs(untagged, sniff=False)):
+            sniff_tags[id(job)] = tags
+        all_tags = [sniff_tags[id(job)] for job in new_jobs]
+
+        clean_jobs = []
+        for job, tags, (desc, jd_verified, jd_fetch_method, jd_fetch_reason) in zip(
+            new_jobs, all_tags, self._resolve_jds(new_jobs)
+        ):
             clean_job = {
                 "title": job.get("title", ""),
                 "company": job.get("company", ""),
@@ -581,8 +852,6 @@ class SourcingAgent:
                 "jd_fetch_reason": jd_fetch_reason,
             }
             clean_jobs.append(clean_job)
-            if canonical:
-                existing_seen.add(canonical)
 
         print_sourcing_filter_summary(
             static_stats,
@@ -590,6 +859,8 @@ class SourcingAgent:
             after_static=after_static_count,
             ai_rejected=ai_rejected,
             saved_count=len(clean_jobs),
+            ai_cache_hits=ai_cache.hits - cache_hits,
+            ai_cache_misses=ai_cache.misses - cache_misses,
         )
         self.sheets_client.add_jobs(clean_jobs)
 
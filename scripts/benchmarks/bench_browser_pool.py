@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark deep JD fetch throughput (URLs/min): launch-per-URL Playwright (SourcingAgent._fetch_jd_playwright
+before BrowserPool, kept here as the baseline) vs the pooled BrowserPool at a few pool sizes.
+
+Pages are served from a local http.server: each job page renders its description from JS after a
+short delay (like a React ATS page) and references an image, a web font and a video that the pool
+blocks (the server delays those responses to make asset loading visible). Both paths must return
+the same JD text for every URL before timing.
+
+Needs playwright and a Chromium build (pip install playwright && playwright install chromium).
+
+Usage (from repo root):
+  python scripts/benchmarks/bench_browser_pool.py
+  python scripts/benchmarks/bench_browser_pool.py --urls 60 --sizes 1 2 4 --legacy-urls 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core.browser_pool import JD_SELECTORS, BrowserPool, playwright_available  # noqa: E402
+
+_PAGE = """<!doctype html><html><head><title>Job {n}</title>
+<link rel="preload" href="/asset/font{n}.woff2" as="font" crossorigin>
+<style>@font-face {{ font-family: F; src: url(/asset/font{n}.woff2); }} body {{ font-family: F; }}</style>
+</head><body><header>Careers</header><img src="/asset/logo{n}.png"><video src="/asset/intro{n}.mp4" autoplay muted></video>
+<div id="app">Loading...</div>
+<script>setTimeout(() => {{
+  document.getElementById("app").innerHTML = '<div class="job-description">{jd}</div>';
+}}, {render_ms});</script></body></html>"""
+
+
+def _jd(n: int) -> str:
+    return f"Job {n}: own the product roadmap, partner with engineering and design, and ship. " * 4
+
+
+def _handler(render_ms: int, asset_ms: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            if self.path.startswith("/asset/"):
+                time.sleep(asset_ms / 1000)
+                body, ctype = b"\0" * 2048, "application/octet-stream"
+            else:
+                n = int(self.path.rsplit("/", 1)[-1] or 0)
+                body = _PAGE.format(n=n, jd=_jd(n), render_ms=render_ms).encode("utf-8")
+                ctype = "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def legacy_fetch(url: str) -> str:
+    """_fetch_jd_playwright as it was before BrowserPool: new Chromium, networkidle + 2s, selector scan."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.goto(url, wait_until="networkidle", timeout=20000)
+        page.wait_for_timeout(2000)
+        content = ""
+        for selector in JD_SELECTORS:
+            element = page.query_selector(selector)
+            if element:
+                text = element.inner_text()
+                if len(text) > 100:
+                    content = text
+                    break
+        browser.close()
+    return content
+
+
+def _rate(label: str, urls: list[str], fetch, workers: int) -> float:
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        texts = list(ex.map(fetch, urls))
+    dt = time.perf_counter() - t0
+    bad = [u for u, t in zip(urls, texts) if t.strip() != _jd(int(u.rsplit("/", 1)[-1])).strip()]
+    if bad:
+        sys.exit(f"{label}: wrong JD text for {len(bad)} URLs, e.g. {bad[:3]}")
+    rate = len(urls) / dt * 60
+    print(f"  {label:<36} {rate:>10,.0f} URLs/min  ({dt:.1f} s for {len(urls)})")
+    return rate
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--urls", type=int, default=40)
+    ap.add_argument("--legacy-urls", type=int, default=5, help="launch-per-URL is slow; time fewer URLs")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--render-ms", type=int, default=300, help="JS delay before the JD is rendered")
+    ap.add_argument("--asset-ms", type=int, default=500, help="server delay on image / font / media requests")
+    args = ap.parse_args()
+
+    if not playwright_available():
+        sys.exit("playwright is not installed (pip install playwright && playwright install chromium)")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(args.render_ms, args.asset_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/job"
+    urls = [f"{base}/{n}" for n in range(args.urls)]
+    print(f"{args.urls} local job pages (JD rendered after {args.render_ms} ms, assets delayed {args.asset_ms} ms)")
+
+    try:
+        before = _rate("launch per URL (before)", urls[: args.legacy_urls], legacy_fetch, 1)
+        for size in args.sizes:
+            pool = BrowserPool(size=size)
+            try:
+                pool.fetch(urls[0])  # browser start is paid once per process; report steady state
+                after = _rate(f"BrowserPool size={size} (after)", urls, lambda u: pool.fetch(u)[0], size)
+            finally:
+                pool.close()
+            print(f"    speedup vs before: {after / before:.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark JD store codecs: on-disk size vs the legacy jd_cache.json, and per-lookup decode latency.
+
+Loads JDs from an existing cache (legacy jd_cache.json, or the store behind it) or, when none is
+available, generates a synthetic corpus with EEO / benefits / "about us" boilerplate. Each codec
+gets a fresh store in a temp dir: raw, zlib, and zlib with a trained shared dictionary.
+
+Usage (from repo root):
+  python scripts/benchmarks/bench_jd_store.py
+  python scripts/benchmarks/bench_jd_store.py --cache config/jd_cache.json --lookups 5000
+  python scripts/benchmarks/bench_jd_store.py --synthetic 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core import jd_store  # noqa: E402
+from apps.cli.legacy.core.jd_store import JDStore, get_jd_store  # noqa: E402
+
+_COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell"]
+_ABOUT = "{c} is building the future of work. We are a fast-growing team backed by leading investors."
+_EEO = (
+    "{c} is an equal opportunity employer. All qualified applicants will receive consideration for "
+    "employment without regard to race, color, religion, sex, sexual orientation, gender identity, "
+    "national origin, disability, or veteran status."
+)
+_BENEFITS = [
+    "Competitive salary and equity package.",
+    "Medical, dental, and vision insurance for you and your dependents.",
+    "401(k) plan with company match.",
+    "Flexible time off and paid parental leave.",
+    "Learning and development stipend.",
+]
+_DUTIES = [
+    "Own the product roadmap for {area} and align stakeholders on priorities.",
+    "Partner with engineering and design to ship {area} features iteratively.",
+    "Define success metrics for {area} and run experiments to improve them.",
+    "Write clear requirements and user stories for the {area} backlog.",
+    "Analyze customer feedback and usage data to inform {area} strategy.",
+]
+_AREAS = ["payments", "onboarding", "search", "billing", "analytics", "mobile", "growth", "platform"]
+
+
+def synthetic_corpus(n: int, seed: int = 7) -> dict[str, str]:
+    rnd = random.Random(seed)
+    out: dict[str, str] = {}
+    for i in range(n):
+        c = rnd.choice(_COMPANIES)
+        area = rnd.choice(_AREAS)
+        duties = rnd.sample(_DUTIES, 3)
+        parts = [
+            f"{rnd.choice(['Senior ', '', 'Associate '])}Product Manager, {area.title()} (req {i})",
+            _ABOUT.format(c=c),
+            "What you'll do:",
+            *[d.format(area=area) for d in duties],
+            f"Requirements: {rnd.randint(2, 8)}+ years of product experience; {rnd.randint(1, 4)} years in {area}.",
+            "Benefits:",
+            *_BENEFITS,
+            _EEO.format(c=c),
+        ]
+        out[f"https://jobs.example.com/{c.lower()}/{i}"] = "\n".join(parts)
+    return out
+
+
+def load_corpus(cache_path: str) -> dict[str, str]:
+    if os.path.isfile(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {u: (v.get("jd", "") if isinstance(v, dict) else str(v)) for u, v in data.items()}
+    store = get_jd_store(cache_path)
+    return {u: store.get_jd(u) for u in store.keys()}
+
+
+def _disk_bytes(store: JDStore) -> int:
+    paths = list(store.log_paths)
+    if store._dict_id:
+        paths.append(store.dict_path(store._dict_id))
+    return sum(os.path.getsize(p) for p in paths if os.path.isfile(p))
+
+
+def bench_codec(label: str, corpus: dict[str, str], codec: str, train: bool, lookups: int, tmp: str) -> dict:
+    os.environ["JD_STORE_CODEC"] = codec
+    path = os.path.join(tmp, label, "jd_cache.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    store = JDStore(path)
+    ts = "2026-01-01"
+    t0 = time.perf_counter()
+    store.put_many({u: {"jd": jd, "timestamp": ts} for u, jd in corpus.items()})
+    if train and not store._dict_id:
+        store.train_dictionary()
+    write_s = time.perf_counter() - t0
+    store.close()
+
+    store = JDStore(path)
+    urls = list(corpus)
+    rnd = random.Random(11)
+    sample = [rnd.choice(urls) for _ in range(lookups)]
+    store.get(sample[0])  # load index + mmap
+    t0 = time.perf_counter()
+    for u in sample:
+        store._hot.clear()  # measure decode, not the hot cache
+        store.get(u)
+    per_lookup_us = (time.perf_counter() - t0) / max(1, lookups) * 1e6
+    out = {
+        "label": label,
+        "disk_bytes": _disk_bytes(store),
+        "write_s": write_s,
+        "lookup_us": per_lookup_us,
+        "dict": store._dict_id or "-",
+    }
+    store.close()
+    return out
+
+
+def bench_legacy_json(corpus: dict[str, str], lookups: int, tmp: str) -> dict:
+    path = os.path.join(tmp, "legacy.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({u: {"jd": jd, "timestamp": "2026-01-01"} for u, jd in corpus.items()}, f, ensure_ascii=False, indent=0)
+    urls = list(corpus)
+    n = max(1, min(lookups, 50))  # full reload per lookup is slow; sample fewer
+    t0 = time.perf_counter()
+    for u in random.Random(11).sample(urls, min(n, len(urls))):
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f).get(u)
+    return {
+        "label": "legacy json (reload/lookup)",
+        "disk_bytes": os.path.getsize(path),
+        "write_s": 0.0,
+        "lookup_us": (time.perf_counter() - t0) / n * 1e6,
+        "dict": "-",
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="JD store compression ratio + decode latency benchmark.")
+    ap.add_argument("--cache", default=os.path.join(PROJECT_ROOT, "config", "jd_cache.json"))
+    ap.add_argument("--synthetic", type=int, default=0, help="Use N synthetic JDs instead of --cache.")
+    ap.add_argument("--lookups", type=int, default=2000)
+    args = ap.parse_args()
+
+    corpus = {} if args.synthetic else load_corpus(args.cache)
+    if not corpus:
+        corpus = synthetic_corpus(args.synthetic or 2000)
+        print(f"Corpus: {len(corpus)} synthetic JDs")
+    else:
+        print(f"Corpus: {len(corpus)} JDs from {args.cache}")
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [bench_legacy_json(corpus, args.lookups, tmp)]
+        jd_store.DICT_TRAIN_MIN_ENTRIES = 10**9  # no automatic training for the raw / plain zlib runs
+        rows.append(bench_codec("raw", corpus, "none", False, args.lookups, tmp))
+        rows.append(bench_codec("zlib", corpus, "zlib", False, args.lookups, tmp))
+        rows[-1]["label"] = "zlib (no dict)"
+        jd_store.DICT_TRAIN_MIN_ENTRIES = 1  # train on the whole corpus regardless of size
+        rows.append(bench_codec("zlib_dict", corpus, "zlib", True, args.lookups, tmp))
+        rows[-1]["label"] = "zlib + trained dict"
+
+    base = rows[0]["disk_bytes"] or 1
+    print(f"\n{'backend':<30} {'disk':>12} {'ratio':>7} {'write s':>8} {'lookup µs':>10}  dict")
+    for r in rows:
+        print(
+            f"{r['label']:<30} {r['disk_bytes']:>12,} {r['disk_bytes'] / base:>7.2f} "
+            f"{r['write_s']:>8.2f} {r['lookup_us']:>10.1f}  {r['dict']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sourcing keyword filter: per-keyword re.search loops (the pre-compiled-engine rules,
+kept here as the baseline) vs CompiledJobFilters (filter_engine.py), plus full filter_sourcing_jobs
+and the columnar filter_sourcing_frame (JobSpy DataFrame path).
+
+Jobs come from a raw sheet export (Role Title / Location / Job Link keys, e.g.
+data/raw_jobs_2026-02-23.json), repeated to --jobs rows. Reject reasons of both rule sets are
+compared job by job before timing.
+
+Usage (from repo root):
+  python scripts/benchmarks/bench_job_filters.py
+  python scripts/benchmarks/bench_job_filters.py --input data/raw_jobs_2026-02-23.json --jobs 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core.job_filters import (  # noqa: E402
+    TITLE_NON_US_MARKERS,
+    _filter_settings,
+    compiled_filters,
+    filter_sourcing_frame,
+    filter_sourcing_jobs,
+    normalize_sourcing_location,
+    passes_sourcing_filter,
+)
+
+
+def load_jobs(path: str, n: int) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    base = [
+        {
+            "title": r.get("Role Title") or r.get("title") or "",
+            "location": r.get("Location") or r.get("location") or "",
+            "url": r.get("Job Link") or r.get("url") or "",
+            "description": r.get("Job Description") or r.get("description") or "",
+        }
+        for r in rows
+    ]
+    return [dict(base[i % len(base)]) for i in range(n)] if base else []
+
+
+def legacy_keyword_reason(job: dict) -> str:
+    """The keyword stage of passes_sourcing_filter as it was before filter_engine.py."""
+    fs = _filter_settings()
+    title = str(job.get("title", "")).lower()
+    location = normalize_sourcing_location(str(job.get("location", "")), str(job.get("title", "")))
+    desc = (str(job.get("description", "")) + " " + str(job.get("url", ""))).lower()
+
+    found = False
+    for inc in fs["inclusions"]:
+        if len(inc) <= 3:
+            if re.search(r"\b" + re.escape(inc) + r"\b", title):
+                found = True
+                break
+        elif inc.lower() in title:
+            found = True
+            break
+    if not found:
+        found = (
+            ("business" in title and "analyst" in title)
+            or ("product" in title and "manager" in title)
+            or ("product" in title and "director" in title)
+            or ("program" in title and "director" in title)
+        )
+    if not found:
+        return "Title match fail"
+    if any(m in title for m in TITLE_NON_US_MARKERS):
+        return "Non-US marker in title"
+    soft = {x.strip().lower() for x in fs["seniority_soft_exclusions"]}
+    bypass = [b.lower() for b in fs["seniority_soft_bypass_substrings"]]
+    for kw in [k for k in fs["seniority_exclusions"] if k.lower() not in soft]:
+        if re.search(r"\b" + re.escape(kw) + r"\b", title):
+            return "Seniority exclusion"
+    for kw in soft:
+        if re.search(r"\b" + re.escape(kw) + r"\b", title) and not any(b in title for b in bypass):
+            return "Seniority exclusion"
+    if any(kw in title for kw in fs["level_exclusions"]):
+        return "Intern/level exclusion"
+    if not any(loc in location for loc in fs["allowed_locations"]):
+        return "Location region mismatch"
+    for exc in fs["forbidden_locations"]:
+        e = exc.strip().lower()
+        if not e:
+            continue
+        pattern = re.escape(e) if " " in e else r"\b" + re.escape(e) + r"\b"
+        if re.search(pattern, location) or re.search(pattern, title):
+            return f"Location exclusion ({exc})"
+    if any(kw in (title + " " + desc) for kw in fs["clearance_keywords"]):
+        return "Requires security clearance"
+    for kw in fs["unrelated_keywords"]:
+        if re.search(r"\b" + re.escape(kw) + r"\b", title):
+            return f"Unrelated field ({kw})"
+    for keyword in fs["unrelated_text_keywords"]:
+        kw = str(keyword or "").strip().lower()
+        if not kw:
+            continue
+        if (kw in desc) if " " in kw else re.search(r"\b" + re.escape(kw) + r"\b", desc):
+            return f"Unrelated field text ({keyword})"
+    return ""
+
+
+def compiled_keyword_reason(job: dict, cf) -> str:
+    return passes_sourcing_filter(job, filters=cf, learned_phrases=[], title_fit_cfg={"enabled": False})[1]
+
+
+def _rate(label: str, n: int, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"  {label:<48} {n / dt:>12,.0f} jobs/s  ({dt * 1000:.1f} ms)")
+    return n / dt
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--input", default=os.path.join(PROJECT_ROOT, "data", "raw_jobs_2026-02-23.json"))
+    ap.add_argument("--jobs", type=int, default=20000)
+    args = ap.parse_args()
+
+    jobs = load_jobs(args.input, args.jobs)
+    if not jobs:
+        sys.exit(f"no jobs in {args.input}")
+    cf = compiled_filters()
+    mismatches = [j["title"] for j in jobs[:2000] if legacy_keyword_reason(j) != compiled_keyword_reason(j, cf)]
+    print(f"{len(jobs)} jobs from {os.path.relpath(args.input, PROJECT_ROOT)}; reason mismatches: {len(mismatches)}")
+    if mismatches:
+        sys.exit(f"reject reasons differ, e.g. {mismatches[:3]}")
+
+    before = _rate("keyword rules, per-keyword re.search (before)", len(jobs), lambda: [legacy_keyword_reason(j) for j in jobs])
+    after = _rate("keyword rules, CompiledJobFilters (after)", len(jobs), lambda: [compiled_keyword_reason(j, cf) for j in jobs])
+    print(f"  speedup: {after / before:.1f}x")
+    _rate("filter_sourcing_jobs (full, one matcher per batch)", len(jobs), lambda: filter_sourcing_jobs(jobs))
+    frame = pd.DataFrame(jobs).astype(object)
+    _rate("filter_sourcing_frame (columnar, DataFrame in)", len(jobs), lambda: filter_sourcing_frame(frame))
+    _, frame_reasons = filter_sourcing_frame(frame)
+    row_reasons = [passes_sourcing_filter(j)[1] for j in jobs]
+    print(f"  frame vs row reason mismatches: {sum(a != b for a, b in zip(frame_reasons, row_reasons))}")
+    corpus = jobs[: len({j["url"] for j in jobs})]
+    passed, reasons = filter_sourcing_jobs(corpus)
+    print(f"  one corpus pass: {len(passed)}/{len(corpus)} passed; rejects {json.dumps(reasons, ensure_ascii=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark learned title blocks: per-phrase linear scan (learned_block_hit before LearnedBlockMatcher,
+kept here as the baseline) vs the compiled LearnedBlockMatcher, with thousands of phrases.
+
+Phrases are mined from the titles in a raw sheet export (title_features unigrams / bigrams, the same
+shape learn_sourcing_filters_from_sheet writes), padded with synthetic phrases up to --phrases, and
+shuffled so hits are spread over the list. Results of both matchers are compared title by title
+before timing.
+
+Usage (from repo root):
+  python scripts/benchmarks/bench_learned_blocks.py
+  python scripts/benchmarks/bench_learned_blocks.py --phrases 5000 --titles 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core.sourcing_learned_blocks import LearnedBlockMatcher, title_features  # noqa: E402
+
+
+def legacy_block_hit(title: str, phrases: list[str]) -> str | None:
+    """learned_block_hit as it was before LearnedBlockMatcher."""
+    title_lower = str(title or "").lower()
+    if not title_lower.strip():
+        return None
+    for p in phrases:
+        pl = (p or "").strip().lower()
+        if not pl:
+            continue
+        if " " in pl:
+            if pl in title_lower:
+                return pl
+        else:
+            if re.search(r"\b" + re.escape(pl) + r"\b", title_lower):
+                return pl
+    return None
+
+
+def load_titles(path: str, n: int) -> list[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    base = [str(r.get("Role Title") or r.get("title") or "") for r in rows]
+    base = [t for t in base if t.strip()]
+    return [base[i % len(base)] for i in range(n)] if base else []
+
+
+def make_phrases(titles: list[str], n: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    mined = list(dict.fromkeys(f for t in set(titles) for f in title_features(t)))
+    rng.shuffle(mined)
+    phrases = mined[: n // 4]
+    i = 0
+    while len(phrases) < n:
+        phrases.append(f"synthetic{i}" if i % 2 else f"synthetic {i} phrase")
+        i += 1
+    rng.shuffle(phrases)
+    return phrases
+
+
+def _rate(label: str, n: int, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"  {label:<44} {n / dt:>12,.0f} titles/s  ({dt * 1000:.1f} ms)")
+    return n / dt
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--input", default=os.path.join(PROJECT_ROOT, "data", "raw_jobs_2026-02-23.json"))
+    ap.add_argument("--titles", type=int, default=1000)
+    ap.add_argument("--phrases", type=int, default=3000)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    titles = load_titles(args.input, args.titles)
+    if not titles:
+        sys.exit(f"no titles in {args.input}")
+    phrases = make_phrases(titles, args.phrases, args.seed)
+
+    t0 = time.perf_counter()
+    matcher = LearnedBlockMatcher(phrases)
+    build_ms = (time.perf_counter() - t0) * 1000
+    mismatches = [t for t in titles[:500] if legacy_block_hit(t, phrases) != matcher.first_hit(t)]
+    hits = sum(1 for t in titles if matcher.first_hit(t))
+    print(
+        f"{len(titles)} titles, {len(phrases)} phrases; matcher build {build_ms:.1f} ms; "
+        f"blocked {hits}; mismatches: {len(mismatches)}"
+    )
+    if mismatches:
+        sys.exit(f"results differ, e.g. {mismatches[:3]}")
+
+    before = _rate("per-phrase scan (before)", len(titles), lambda: [legacy_block_hit(t, phrases) for t in titles])
+    after = _rate("LearnedBlockMatcher (after)", len(titles), lambda: [matcher.first_hit(t) for t in titles])
+    print(f"  speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
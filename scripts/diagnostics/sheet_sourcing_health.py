@@ -23,14 +23,18 @@ from apps.cli.legacy.core.google_sheets_client import GoogleSheetsClient  # noqa
 
 
 def _jd_cache_stats(path: str) -> tuple[int, bool]:
-    import json
-
-    if not os.path.isfile(path):
+    from apps.cli.legacy.core.jd_store import get_jd_store
+
+    store = get_jd_store(path)
+    exists = (
+        any(os.path.isfile(p) for p in store.log_paths)
+        or os.path.isfile(store.index_path)
+        or os.path.isfile(path)
+    )
+    if not exists:
         return 0, False
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return (len(data) if isinstance(data, dict) else 0, True)
+        return len(store), True
     except OSError:
         return 0, False
 
@@ -0,0 +1,144 @@
+"""In-memory stand-ins for gspread Spreadsheet / Worksheet used by the Sheets read-path tests."""
+import re
+
+from gspread.utils import a1_to_rowcol
+
+HEADERS = ["Status", "Role Title", "Company", "Location", "Job Link", "Source", "Apply Score", "Applied? (Y/N)", "Applied At"]
+
+
+def row(status, url, applied="", score=""):
+    return [status, "PM", "Acme", "NYC", url, "LinkedIn", score, applied, ""]
+
+
+class FakeWorksheet:
+    def __init__(self, title, rows, sheet_id=0, row_count=1000, col_count=26):
+        self.title = title
+        self.rows = rows
+        self.id = sheet_id
+        self.row_count = row_count
+        self.col_count = col_count
+        self.spreadsheet_id = "wb1"
+        self.client = _FakeClient(self)
+        self.calls: list[str] = []
+        self.value_batches: list[list] = []
+
+    def get_all_values(self):
+        raise AssertionError("whole-tab downloads are not expected on this path")
+
+    def get_all_records(self):
+        raise AssertionError("whole-tab downloads are not expected on this path")
+
+    def row_values(self, n):
+        self.calls.append(f"row_values:{n}")
+        return list(self.rows[n - 1]) if len(self.rows) >= n else []
+
+    def resize(self, rows=None, cols=None):
+        self.calls.append("resize")
+        if rows is not None:
+            self.row_count = rows
+        if cols is not None:
+            self.col_count = cols
+
+    def update_cells(self, cells, record=True):
+        if record:
+            self.calls.append("update_cells")
+        for cell in cells:
+            while len(self.rows) < cell.row:
+                self.rows.append([])
+            rw = self.rows[cell.row - 1]
+            rw.extend([""] * (cell.col - len(rw)))
+            rw[cell.col - 1] = cell.value
+
+    def batch_update(self, data, raw=True):
+        self.calls.append("values_batch_update")
+        self.value_batches.append(data)
+        for block in data:
+            first, _last = block["range"].split(":")
+            r0, c0 = a1_to_rowcol(first)
+            for dr, values in enumerate(block["values"]):
+                cells = [type("C", (), {"row": r0 + dr, "col": c0 + dc, "value": v}) for dc, v in enumerate(values) if v is not None]
+                self.update_cells(cells, record=False)
+        return {}
+
+    def batch_get(self, ranges, major_dimension=None):
+        self.calls.append("batch_get")
+        out = []
+        for a1 in ranges:
+            first, last = a1.split(":")
+            r0, c0 = _rowcol(first)
+            r1, c1 = _rowcol(last)
+            r1 = r1 or len(self.rows)
+            block = [list(rw[c0 - 1 : c1]) for rw in self.rows[r0 - 1 : r1]]
+            if major_dimension == "COLUMNS":
+                block = [[rw[0] if rw else "" for rw in block]]
+            out.append(block)
+        return out
+
+
+class _FakeClient:
+    """worksheet.client: applies appendDimension / updateCells / sortRange requests from batch_update."""
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+
+    def batch_update(self, spreadsheet_id, body):
+        ws = self.worksheet
+        ws.calls.append("batch_update")
+        for req in body["requests"]:
+            if "appendDimension" in req:
+                ws.col_count += req["appendDimension"]["length"]
+            elif "updateCells" in req:
+                start = req["updateCells"]["start"]
+                col0 = start["columnIndex"]
+                values = [v["userEnteredValue"]["stringValue"] for v in req["updateCells"]["rows"][0]["values"]]
+                assert col0 + len(values) <= ws.col_count, "header written past the grid"
+                if not ws.rows:
+                    ws.rows.append([])
+                header = ws.rows[start["rowIndex"]]
+                header.extend([""] * (col0 - len(header)))
+                header[col0 : col0 + len(values)] = values
+            elif "sortRange" in req:
+                col = req["sortRange"]["sortSpecs"][0]["dimensionIndex"]
+                cell = lambda rw: rw[col] if col < len(rw) and rw[col] != "" else None  # noqa: E731
+                data = ws.rows[1:]
+                keyed = sorted((rw for rw in data if cell(rw) is not None), key=lambda rw: float(cell(rw)))
+                ws.rows[1:] = keyed + [rw for rw in data if cell(rw) is None]
+        return {}
+
+
+def _rowcol(a1):
+    m = re.match(r"^([A-Z]+)(\d*)$", a1)
+    letters, digits = m.groups()
+    return (int(digits) if digits else 0), a1_to_rowcol(letters + "1")[1]
+
+
+class FakeSpreadsheet:
+    def __init__(self, tabs, sheet_id="wb1"):
+        self.tabs = tabs
+        self.id = sheet_id
+        self.batch_calls = 0
+        self.ranges_read: list[str] = []
+        self.modified = "2026-04-01T00:00:00Z"
+
+    def worksheets(self):
+        return self.tabs
+
+    def get_lastUpdateTime(self):
+        return self.modified
+
+    def values_batch_get(self, ranges, params=None):
+        self.batch_calls += 1
+        by_title = {t.title: t.rows for t in self.tabs}
+        out = []
+        for r in ranges:
+            self.ranges_read.append(r)
+            title, a1 = re.match(r"^'(.*)'!(.+)$", r).groups()
+            rows = by_title[title.replace("''", "'")]
+            if a1 == "1:1":
+                out.append({"values": rows[:1]})
+                continue
+            col = a1_to_rowcol(a1.split(":")[0])[1] - 1
+            column = [rw[col] if col < len(rw) else "" for rw in rows[1:]]
+            assert (params or {}).get("majorDimension") == "COLUMNS"
+            out.append({"values": [column]})
+        return {"valueRanges": out}
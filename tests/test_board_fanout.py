@@ -0,0 +1,88 @@
+"""Board fan-out: bounded concurrency, completion-order yield, per-provider rate caps."""
+import threading
+import time
+from unittest.mock import patch
+
+from apps.cli.legacy.scrapers import board_fanout
+from apps.cli.legacy.scrapers.ats_scraper import ATS_Scraper
+from apps.cli.legacy.scrapers.board_fanout import RateLimiter, fan_out
+from apps.cli.legacy.scrapers.recruitee_scraper import RecruiteeScraper
+
+
+def test_fan_out_is_bounded_and_yields_as_boards_finish():
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def _fetch(delay):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(delay)
+        with lock:
+            state["now"] -= 1
+        return [delay]
+
+    delays = [0.2, 0.01, 0.05, 0.01, 0.01, 0.01]
+    got = list(fan_out(_fetch, delays, workers=3))
+    assert sorted(got) == sorted((d, [d]) for d in delays)
+    assert got[-1] == (0.2, [0.2])
+    assert state["peak"] == 3
+    assert list(fan_out(_fetch, [0.02, 0.01], workers=1)) == [(0.02, [0.02]), (0.01, [0.01])]
+    assert list(fan_out(_fetch, [], workers=4)) == []
+
+
+def test_rate_limiter_spaces_request_starts_across_threads():
+    limiter = RateLimiter(per_sec=50)
+    starts = []
+
+    def _go():
+        limiter.wait()
+        starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=_go) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Six starts at 50/s span at least five 20 ms intervals.
+    assert max(starts) - min(starts) >= 0.095
+    RateLimiter(0).wait()
+
+
+def test_ats_scrape_all_fans_out_greenhouse_and_lever():
+    scraper = ATS_Scraper(greenhouse_boards=["a", "b"], lever_boards=["c"])
+    with patch.object(scraper, "scrape_greenhouse", side_effect=lambda b: [{"board": b, "p": "gh"}]), patch.object(
+        scraper, "scrape_lever", side_effect=lambda b: [{"board": b, "p": "lever"}]
+    ):
+        boards = dict(scraper.iter_boards())
+        assert boards == {
+            ("greenhouse", "a"): [{"board": "a", "p": "gh"}],
+            ("greenhouse", "b"): [{"board": "b", "p": "gh"}],
+            ("lever", "c"): [{"board": "c", "p": "lever"}],
+        }
+        assert sorted(j["board"] for j in scraper.scrape_all()) == ["a", "b", "c"]
+
+
+def test_provider_limiter_applies_to_each_board_request(monkeypatch):
+    waits = []
+
+    class _Limiter:
+        def wait(self):
+            waits.append(1)
+
+    monkeypatch.setattr(board_fanout, "_LIMITERS", {"recruitee": _Limiter()})
+    with patch("apps.cli.legacy.scrapers.recruitee_scraper.http_get") as mock_get:
+        mock_get.return_value.status_code = 404
+        assert RecruiteeScraper(companies=["a", "b", "c"]).scrape_all() == []
+    assert len(waits) == 3
+
+
+def test_fan_out_workers_defer_into_the_callers_sync_batch():
+    from apps.cli.legacy.core.sync_batch import defer_until_saved, staged_sync
+
+    done = []
+    with staged_sync() as sync:
+        list(fan_out(lambda b: defer_until_saved(lambda: done.append(b)), ["a", "b", "c"], workers=3))
+    assert done == [] and len(sync) == 3
+    sync.commit()
+    assert sorted(done) == ["a", "b", "c"]
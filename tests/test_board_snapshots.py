@@ -0,0 +1,110 @@
+"""Incremental ATS sync: only postings new or updated since the last board snapshot are emitted."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.cli.legacy.core import board_snapshots
+from apps.cli.legacy.core.board_snapshots import BoardSnapshotStore
+from apps.cli.legacy.core.sync_batch import staged_sync
+from apps.cli.legacy.scrapers.ats_scraper import ATS_Scraper
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    s = BoardSnapshotStore(str(tmp_path / "snapshots.db"))
+    monkeypatch.setattr(board_snapshots, "_STORE", s)
+    return s
+
+
+def _response(payload, status=200):
+    r = MagicMock()
+    r.status_code = status
+    r.json.return_value = payload
+    return r
+
+
+def _greenhouse(listing):
+    """http_get stand-in: light listing for /jobs, per-posting content for /jobs/<id>."""
+    calls = []
+
+    def _get(url, **kwargs):
+        calls.append(url)
+        if url.endswith("/jobs"):
+            return _response({"jobs": listing})
+        pid = url.rsplit("/", 1)[1]
+        return _response({"id": int(pid), "content": f"&lt;p&gt;JD {pid}&lt;/p&gt;"})
+
+    return _get, calls
+
+
+def _synced(scrape, token):
+    """One scrape whose postings are saved: the staged snapshot commits (as SourcingAgent does)."""
+    with staged_sync() as sync:
+        jobs = scrape(token)
+    sync.commit()
+    return jobs
+
+
+def _gh(pid, updated):
+    return {"id": pid, "title": f"Role {pid}", "updated_at": updated, "absolute_url": f"https://x/{pid}",
+            "location": {"name": "Remote"}}
+
+
+def test_greenhouse_second_sync_emits_only_new_or_updated(store):
+    listing = [_gh(1, "2026-01-01"), _gh(2, "2026-01-01"), _gh(3, "2026-01-01")]
+    fake, calls = _greenhouse(listing)
+    with patch("apps.cli.legacy.scrapers.ats_scraper.http_get", side_effect=fake):
+        first = _synced(ATS_Scraper().scrape_greenhouse, "acme")
+        assert [j["url"] for j in first] == ["https://x/1", "https://x/2", "https://x/3"]
+        assert first[0]["description"] == "JD 1"
+
+        listing[1] = _gh(2, "2026-02-01")
+        listing.append(_gh(4, "2026-02-01"))
+        del listing[0]
+        calls.clear()
+        second = _synced(ATS_Scraper().scrape_greenhouse, "acme")
+
+    assert sorted(j["url"] for j in second) == ["https://x/2", "https://x/4"]
+    # Unchanged posting 3 is neither emitted nor has its content fetched.
+    assert not any(c.endswith("/jobs/3") for c in calls)
+    assert store.diff("greenhouse:acme", {"1": "2026-01-01"}) == ({"1"}, False)
+
+
+def test_full_resync_emits_every_posting(tmp_path, monkeypatch):
+    monkeypatch.setattr(board_snapshots, "_STORE", BoardSnapshotStore(str(tmp_path / "off.db"), resync_days=0))
+    fake, _ = _greenhouse([_gh(1, "2026-01-01"), _gh(2, "2026-01-01")])
+    with patch("apps.cli.legacy.scrapers.ats_scraper.http_get", side_effect=fake):
+        assert len(_synced(ATS_Scraper().scrape_greenhouse, "acme")) == 2
+        assert len(_synced(ATS_Scraper().scrape_greenhouse, "acme")) == 2
+
+    due = BoardSnapshotStore(str(tmp_path / "due.db"), resync_days=7)
+    due.commit("b", {"1": "v"}, full=True)
+    assert due.diff("b", {"1": "v", "2": "v"}) == ({"2"}, False)
+    with due._connect() as conn:
+        conn.execute("UPDATE boards SET full_synced_at = full_synced_at - 8 * 86400")
+    assert due.diff("b", {"1": "v", "2": "v"}) == ({"1", "2"}, True)
+
+
+def test_lever_diffs_on_posting_content(store):
+    postings = [
+        {"id": "a", "text": "Engineer", "hostedUrl": "https://l/a", "categories": {"location": "NYC"}},
+        {"id": "b", "text": "Designer", "hostedUrl": "https://l/b", "categories": {"location": "SF"}},
+    ]
+    with patch("apps.cli.legacy.scrapers.ats_scraper.http_get", side_effect=lambda *a, **k: _response(postings)):
+        assert len(_synced(ATS_Scraper().scrape_lever, "acme")) == 2
+        assert _synced(ATS_Scraper().scrape_lever, "acme") == []
+        postings[1] = dict(postings[1], text="Senior Designer")
+        assert [j["title"] for j in _synced(ATS_Scraper().scrape_lever, "acme")] == ["Senior Designer"]
+
+
+def test_snapshot_waits_for_the_batch_commit(store):
+    fake, _ = _greenhouse([_gh(1, "2026-01-01"), _gh(2, "2026-01-01")])
+    with patch("apps.cli.legacy.scrapers.ats_scraper.http_get", side_effect=fake):
+        # Save failed (batch never committed) and a standalone run outside any batch: nothing recorded.
+        with staged_sync():
+            assert len(ATS_Scraper().scrape_greenhouse("acme")) == 2
+        assert len(ATS_Scraper().scrape_greenhouse("acme")) == 2
+        assert store.diff("greenhouse:acme", {"1": "2026-01-01"}) == ({"1"}, True)
+
+        assert len(_synced(ATS_Scraper().scrape_greenhouse, "acme")) == 2
+        assert _synced(ATS_Scraper().scrape_greenhouse, "acme") == []
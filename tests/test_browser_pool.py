@@ -0,0 +1,139 @@
+"""BrowserPool: one browser reused across fetches, assets blocked, selector wait instead of networkidle."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from apps.cli.legacy.core import browser_pool
+from apps.cli.legacy.core.browser_pool import BrowserPool
+
+JD = "Own the roadmap and partner with engineering. " * 5
+
+
+@pytest.fixture
+def site():
+    asset_hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            if self.path.startswith("/asset/"):
+                asset_hits.append(self.path)
+                body = b"\0"
+            elif self.path == "/empty":
+                body = b"<html><body><main>short</main></body></html>"
+            else:
+                body = (
+                    '<html><body><img src="/asset/logo.png"><div id="app"></div><script>'
+                    "setTimeout(() => { document.getElementById('app').innerHTML = "
+                    f"'<div class=\"job-description\">{JD}</div>'; }}, 200);</script></body></html>"
+                ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", asset_hits
+    server.shutdown()
+
+
+def test_pool_reuses_browser_and_recycles_pages(site):
+    pytest.importorskip("playwright.async_api")
+    base, asset_hits = site
+    pool = BrowserPool(size=2, page_max_uses=2, selector_timeout_ms=3000)
+    try:
+        try:
+            first = pool.fetch(f"{base}/job/0")
+        except Exception as e:
+            pytest.skip(f"chromium not available: {e}")
+        assert first == (JD.strip(), ".job-description")
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            results = list(ex.map(lambda n: pool.fetch(f"{base}/job/{n}")[0], range(1, 7)))
+        assert results == [JD.strip()] * 6
+        assert pool.fetch(f"{base}/empty") == ("", "")
+        assert pool.launches == 1
+        assert asset_hits == []
+    finally:
+        pool.close()
+
+
+class _FakeElement:
+    async def inner_text(self):
+        return JD
+
+
+class _FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def goto(self, url, **kwargs):
+        if not self.browser.connected:
+            raise RuntimeError("Target page, context or browser has been closed")
+
+    async def wait_for_function(self, *args, **kwargs):
+        pass
+
+    async def query_selector(self, selector):
+        return _FakeElement()
+
+    async def close(self):
+        pass
+
+
+class _FakeContext(_FakePage):
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return _FakePage(self.browser)
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        if not self.connected:
+            raise RuntimeError("Browser has been closed")
+        return _FakeContext(self)
+
+    async def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self, browsers):
+        self.chromium = self
+        self.browsers = browsers
+
+    async def launch(self, **kwargs):
+        self.browsers.append(_FakeBrowser())
+        return self.browsers[-1]
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+def test_disconnected_browser_is_relaunched(monkeypatch):
+    browsers = []
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: _FakePlaywright(browsers))
+    pool = BrowserPool(size=2)
+    try:
+        assert pool.fetch("https://x/1")[0] == JD
+        browsers[0].connected = False  # Chromium crashed / OOM-killed mid-run
+        assert pool.fetch("https://x/2")[0] == JD
+        assert pool.fetch("https://x/3")[0] == JD
+        assert pool.launches == 2 and browsers[1].connected
+    finally:
+        pool.close()
@@ -0,0 +1,75 @@
+"""Memoized config snapshots (config.load_pipeline_config / get_sourcing_config / reload)."""
+import copy
+import os
+
+import pytest
+import yaml
+
+from apps.cli.legacy.core import config
+
+
+@pytest.fixture
+def cfg_dir(tmp_path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "pipeline.yaml").write_text("sourcing:\n  max_workers: 7\n  ats_boards:\n    greenhouse: [figma]\n")
+    (tmp_path / "config" / "portal_seeds.yml").write_text("ats_boards:\n  greenhouse: [Figma, stripe]\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PIPELINE_CONFIG", raising=False)
+    config.reload()
+    yield tmp_path
+    config.reload()
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    real = yaml.safe_load
+
+    def counting(stream):
+        calls.append(getattr(stream, "name", ""))
+        return real(stream)
+
+    monkeypatch.setattr(config.yaml, "safe_load", counting)
+    return calls
+
+
+def test_yaml_parsed_once_per_file_version(cfg_dir, monkeypatch):
+    calls = _count_parses(monkeypatch)
+    for _ in range(50):
+        sc = config.get_sourcing_config()
+        config.get_sheet_config()
+        config.get_title_fit_config()
+    assert sc["max_workers"] == 7
+    assert list(sc["ats_boards"]["greenhouse"]) == ["figma", "stripe"]
+    assert len(calls) == 2  # pipeline.yaml + portal_seeds.yml
+    assert config.get_sourcing_config() is sc
+
+    path = cfg_dir / "config" / "pipeline.yaml"
+    path.write_text("sourcing:\n  max_workers: 9\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert config.get_sourcing_config()["max_workers"] == 9
+    assert len(calls) == 3
+
+    config.reload()
+    config.get_sourcing_config()
+    assert len(calls) == 5
+
+
+def test_snapshots_are_read_only_but_deepcopy_is_mutable(cfg_dir):
+    sc = config.get_sourcing_config()
+    assert isinstance(sc, dict) and isinstance(sc["ats_boards"]["greenhouse"], list)
+    with pytest.raises(TypeError):
+        sc["max_workers"] = 1
+    with pytest.raises(TypeError):
+        sc["ats_boards"]["greenhouse"].append("x")
+    mutable = copy.deepcopy(sc)
+    mutable["ats_boards"]["greenhouse"].append("x")
+    assert type(mutable) is dict and "x" not in config.get_sourcing_config()["ats_boards"]["greenhouse"]
+
+
+def test_missing_file_falls_back_to_defaults(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PIPELINE_CONFIG", raising=False)
+    config.reload()
+    assert config.get_sheet_config()["url_snapshot_ttl_sec"] == config._default["sheet"]["url_snapshot_ttl_sec"]
+    config.reload()
@@ -0,0 +1,89 @@
+"""Compiled keyword matchers (filter_engine.py) keep passes_sourcing_filter reasons unchanged."""
+import pandas as pd
+
+from apps.cli.legacy.core import job_filters
+from apps.cli.legacy.core.filter_engine import CompiledJobFilters
+from apps.cli.legacy.core.job_filters import filter_sourcing_frame, filter_sourcing_jobs, passes_sourcing_filter
+from apps.cli.legacy.core.sourcing_learned_blocks import LearnedBlockMatcher
+
+FS = {
+    "inclusions": ["product manager", "pm", "business analyst"],
+    "seniority_exclusions": ["senior", "sr.", "lead", "director"],
+    "seniority_soft_exclusions": ["lead", "director"],
+    "seniority_soft_bypass_substrings": ["product manager", "product director"],
+    "level_exclusions": ["intern"],
+    "clearance_keywords": ["clearance", "ts/sci"],
+    "unrelated_keywords": ["rn", "architect", "software engineer"],
+    "unrelated_text_keywords": ["nursing license", "cdl"],
+    "allowed_locations": ["united states", "remote", ", ny", ", in"],
+    "forbidden_locations": ["india", "new delhi", "uk"],
+}
+
+
+def _reason(title, location="New York, NY", description="", url="https://x.com/1"):
+    job = {"title": title, "location": location, "description": description, "url": url}
+    return passes_sourcing_filter(
+        job, filters=CompiledJobFilters(FS), learned_phrases=[], title_fit_cfg={"enabled": False}
+    )[1]
+
+
+def test_reasons_match_per_keyword_rules():
+    assert _reason("Product Manager") == ""
+    assert _reason("PM, Growth") == ""
+    assert _reason("Pmo Coordinator") == "Title match fail"  # short inclusions need word boundaries
+    assert _reason("Program Director") == "Seniority exclusion"
+    assert _reason("Lead Product Manager") == ""  # soft keyword bypassed
+    assert _reason("Senior Product Manager") == "Seniority exclusion"
+    assert _reason("Product Manager Intern") == "Intern/level exclusion"
+    assert _reason("Product Manager", location="Toronto") == "Location region mismatch"
+    assert _reason("Product Manager", location="Indianapolis, IN") == ""  # India needs a word boundary
+    assert _reason("Product Manager - India", location="Remote") == "Location exclusion (india)"
+    assert _reason("Product Manager", location="Remote, New Delhi") == "Location exclusion (new delhi)"
+    assert _reason("Product Manager", description="Active TS/SCI required") == "Requires security clearance"
+    assert _reason("Product Manager, Software Engineer RN") == "Unrelated field (rn)"  # first keyword in config order
+    assert _reason("Product Manager", description="CDL and nursing license") == "Unrelated field text (nursing license)"
+    assert _reason("Product Manager", description="CDLs welcome") == ""
+
+
+def test_filter_sourcing_jobs_counts_reasons():
+    jobs = [
+        {"title": "Product Manager", "location": "Remote", "description": "", "url": "https://x.com/1"},
+        {"title": "Nurse RN", "location": "Remote", "description": "", "url": "https://x.com/2"},
+    ]
+    passed, counts = filter_sourcing_jobs(jobs)
+    assert [j["url"] for j in passed] == ["https://x.com/1"]
+    assert sum(counts.values()) == 1
+
+
+def test_frame_reasons_match_row_filter(monkeypatch):
+    monkeypatch.setattr(job_filters, "compiled_filters", lambda: CompiledJobFilters(FS))
+    monkeypatch.setattr(job_filters, "load_learned_block_matcher", lambda **_: LearnedBlockMatcher(["product owner"]))
+    monkeypatch.setattr(job_filters, "get_title_fit_config", lambda: {"enabled": False})
+    rows = [
+        ("Product Manager", "New York, NY", ""),
+        ("Pmo Coordinator", "Remote", ""),
+        ("Product Manager (m/w/d)", "Remote", ""),
+        ("Senior Product Manager", "Remote", ""),
+        ("Lead Product Manager", "Remote", ""),
+        ("Product Manager Intern", "Remote", ""),
+        ("Product Manager", "Toronto", ""),
+        ("Product Manager (Remote)", "", ""),
+        ("Product Manager", "Remote, New Delhi", ""),
+        ("Product Manager - India", "Remote", ""),
+        ("Product Manager", "U.S.A.", "Active TS/SCI required"),
+        ("Product Manager, Software Engineer RN", "Remote", ""),
+        ("Product Manager", "Remote", "CDL and nursing license"),
+        ("Business Analyst / Product Owner", "Remote", ""),
+    ]
+    frame = pd.DataFrame(
+        [{"title": t, "location": loc, "description": d, "url": f"https://x.com/{i}"} for i, (t, loc, d) in enumerate(rows)],
+        index=range(10, 10 + len(rows)),
+    )
+    mask, reasons = filter_sourcing_frame(frame)
+    expected = [passes_sourcing_filter(job, filters=CompiledJobFilters(FS), learned_phrases=["product owner"],
+                                       title_fit_cfg={"enabled": False})
+                for job in frame.to_dict("records")]
+    assert list(reasons) == [r for _, r in expected]
+    assert list(mask) == [ok for ok, _ in expected]
+    assert reasons.iloc[-1] == "Learned title block (product owner)"
+    assert list(frame[mask]["title"]) == ["Product Manager", "Lead Product Manager", "Product Manager (Remote)"]
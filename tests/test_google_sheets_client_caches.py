@@ -1,7 +1,7 @@
 """GoogleSheetsClient URL cache invalidation and run_pipeline Sheets gate helpers."""
 
 from apps.cli.legacy.core.google_sheets_client import GoogleSheetsClient, SheetsReadError
-from apps.cli.run_pipeline import _is_sheets_read_failure
+from apps.cli.run_pipeline import _count_eval_backlog, _is_sheets_read_failure
 
 
 def test_invalidate_sheet_url_caches_clears_all():
@@ -57,3 +57,19 @@ def test_with_retries_respects_sheets_retry_max(monkeypatch):
 
 def test_is_sheets_read_failure_429_message():
     assert _is_sheets_read_failure(RuntimeError("APIError: [429]: Quota exceeded"))
+
+
+def test_count_eval_backlog_uses_one_status_column_read():
+    from collections import Counter
+
+    class _Client:
+        calls = 0
+
+        def count_by_column(self, column):
+            self.calls += 1
+            assert column == "Status"
+            return Counter({"NEW": 7, "EVALUATED": 3, "LLM_FAILED": 1})
+
+    c = _Client()
+    assert _count_eval_backlog(c, sample_limit=5) == {"NEW": 5, "NEEDS_REVIEW": 0, "LLM_FAILED": 1}
+    assert c.calls == 1
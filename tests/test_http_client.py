@@ -0,0 +1,102 @@
+"""http_client: pooled per-host sessions, retries on 5xx, persisted ETag / Last-Modified validators."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from apps.cli.legacy.core import http_client
+from apps.cli.legacy.core.http_client import ValidatorStore, http_get, not_modified, session_for
+from apps.cli.legacy.core.sync_batch import staged_sync
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client, "_STORE", ValidatorStore(str(tmp_path / "validators.db")))
+    state = {"fail_next": 0, "requests": [], "etag": '"v1"'}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802
+            state["requests"].append((self.path, self.headers.get("If-None-Match"), self.client_address[1]))
+            if state["fail_next"]:
+                state["fail_next"] -= 1
+                status, body = 503, b"busy"
+            elif self.headers.get("If-None-Match") == state["etag"]:
+                status, body = 304, b""
+            else:
+                status, body = 200, b'{"jobs": []}'
+            self.send_response(status)
+            if status != 503:
+                self.send_header("ETag", state["etag"])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", state
+    httpd.shutdown()
+    http_client.close_sessions()
+
+
+def _synced_get(url, **kwargs):
+    """http_get whose validators are committed right away (as if the postings were saved)."""
+    with staged_sync() as sync:
+        r = http_get(url, conditional=True, **kwargs)
+    sync.commit()
+    return r
+
+
+def test_conditional_get_returns_304_until_the_board_changes(server, tmp_path):
+    base, state = server
+    first = _synced_get(f"{base}/board")
+    assert first.status_code == 200 and not not_modified(first)
+
+    again = _synced_get(f"{base}/board")
+    assert not_modified(again)
+    assert state["requests"][-1][1] == '"v1"'
+
+    # Validators are persisted, keyed by the full URL (params included).
+    assert ValidatorStore(str(tmp_path / "validators.db")).get(f"{base}/board") == ('"v1"', "")
+    assert _synced_get(f"{base}/board", params={"page": 2}).status_code == 200
+
+    state["etag"] = '"v2"'
+    assert _synced_get(f"{base}/board").status_code == 200
+    assert not_modified(_synced_get(f"{base}/board"))
+    assert http_get(f"{base}/board").status_code == 200  # plain GETs never send validators
+
+
+def test_validators_wait_for_the_batch_commit(server):
+    base, state = server
+    # Outside a batch, or in one that is never committed (save failed / dry run), nothing is stored.
+    http_get(f"{base}/board", conditional=True)
+    with staged_sync() as sync:
+        assert http_get(f"{base}/board", conditional=True).status_code == 200
+    assert len(sync) == 1
+    assert http_get(f"{base}/board", conditional=True).status_code == 200
+    assert [h for _, h, _ in state["requests"]] == [None, None, None]
+
+    sync.commit()
+    assert not_modified(http_get(f"{base}/board", conditional=True))
+
+
+def test_retries_5xx_and_reuses_the_host_session(server):
+    base, state = server
+    state["fail_next"] = 2
+    r = http_get(f"{base}/flaky")
+    assert r.status_code == 200
+    assert len(state["requests"]) == 3
+    assert session_for(f"{base}/a") is session_for(f"{base}/b")
+    assert len({port for _, _, port in state["requests"]}) == 1  # one keep-alive connection
+
+
+def test_ttl_zero_disables_conditional_requests(server, tmp_path, monkeypatch):
+    base, state = server
+    monkeypatch.setattr(http_client, "_STORE", ValidatorStore(str(tmp_path / "off.db"), ttl_days=0))
+    _synced_get(f"{base}/board")
+    assert _synced_get(f"{base}/board").status_code == 200
+    assert [h for _, h, _ in state["requests"]] == [None, None]
@@ -0,0 +1,101 @@
+"""JD boilerplate stripping (jd_normalizer.py): shingle model, protected blocks, compact store wiring."""
+import pytest
+
+from apps.cli.legacy.core import jd_normalizer, jd_store
+from apps.cli.legacy.core.jd_normalizer import (
+    OMITTED_MARKER,
+    BoilerplateModel,
+    compact_cache_path,
+    get_boilerplate_model,
+    normalize_whitespace,
+)
+
+_EEO = (
+    "{c} is an equal opportunity employer and all qualified applicants will receive consideration "
+    "for employment without regard to race, color, religion, sex, national origin or disability."
+)
+_BENEFITS = "Benefits:\nMedical, dental and vision.\n401(k) with match.\nFlexible time off."
+_SPONSOR = "We are unable to sponsor or take over sponsorship of an employment visa at this time."
+
+
+_AREAS = ["payments", "search", "billing", "onboarding", "analytics", "mobile", "growth", "platform", "ads", "trust"]
+_VERBS = ["own", "shape", "drive", "define", "scale", "rebuild", "launch", "steer", "grow", "lead"]
+
+
+def _jd(company: str, i: int) -> str:
+    area, verb, other = _AREAS[i % 10], _VERBS[i % 10], _AREAS[(i + 3) % 10]
+    duties = [
+        f"You will {verb} the {area} roadmap end to end, turning {other} insights into {area} bets.",
+        f"Partner with {other} engineers to {verb} experiments on {area} pricing and {other} retention flows.",
+        f"Requirements: shipped {area} products; comfortable with SQL and {other} dashboards.",
+    ]
+    return "\n".join([f"Product Manager, {area.title()}", *duties, _BENEFITS, _SPONSOR, _EEO.format(c=company)])
+
+
+@pytest.fixture(autouse=True)
+def _reset_registries():
+    jd_normalizer.close_all_models()
+    jd_store.close_all_stores()
+    yield
+    jd_normalizer.close_all_models()
+    jd_store.close_all_stores()
+
+
+def _trained(tmp_path, companies=("Acme", "Globex", "Initech", "Hooli", "Umbrella", "Stark")):
+    model = BoilerplateModel(str(tmp_path / "m.jdshingles"))
+    for i, c in enumerate(companies):
+        model.observe(_jd(c, i), c.lower())
+    return model
+
+
+def test_normalize_whitespace():
+    assert normalize_whitespace("a  b​ \r\n\n\n\nc  ") == "a b\n\nc"
+
+
+def test_cross_company_boilerplate_is_stripped_but_sponsorship_kept(tmp_path):
+    model = _trained(tmp_path)
+    out = model.compact(_jd("Wayne", 99), "wayne")
+    assert "equal opportunity employer" not in out
+    assert "401(k)" not in out
+    assert OMITTED_MARKER in out
+    assert _SPONSOR in out
+    assert "You will lead the trust roadmap" in out
+
+
+def test_same_role_reposted_by_one_company_is_not_boilerplate(tmp_path):
+    model = BoilerplateModel(str(tmp_path / "m.jdshingles"))
+    for _ in range(10):
+        model.observe(_jd("Acme", 1), "acme")
+    out = model.compact(_jd("Acme", 1), "acme")
+    assert out == normalize_whitespace(_jd("Acme", 1))
+
+
+def test_model_persists_and_reloads(tmp_path):
+    model = _trained(tmp_path)
+    model.flush()
+    again = BoilerplateModel(model.path)
+    assert again.existed and len(again) == len(model)
+    assert again.compact(_jd("Wayne", 99), "wayne") == model.compact(_jd("Wayne", 99), "wayne")
+
+
+def test_client_writes_compact_variant_and_backfills_old_entries(tmp_path, monkeypatch):
+    import apps.cli.legacy.core.google_sheets_client as gsc
+
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "jd_cache.json")
+    c = gsc.GoogleSheetsClient(jd_cache_path=path)
+    companies = ["Acme", "Globex", "Initech", "Hooli", "Umbrella", "Stark"]
+    c._save_jd_cache(
+        {f"https://example.com/{co}/{i}": {"jd": _jd(co, i), "timestamp": "2026-04-10", "company": co}
+         for i, co in enumerate(companies)}
+    )
+    url = "https://example.com/Stark/5"
+    assert c.get_jd_for_url(url) == _jd("Stark", 5)
+    prompt = c.get_prompt_jd_for_url(url)
+    assert "equal opportunity" not in prompt and _SPONSOR in prompt
+    assert jd_store.get_jd_store(compact_cache_path(path)).get_jd(url) == prompt
+
+    # Entry written to the raw store only (e.g. before compaction existed) is compacted on read.
+    jd_store.get_jd_store(path).put("https://example.com/wayne/7", _jd("Wayne", 7), "2026-04-10")
+    assert "equal opportunity" not in c.get_prompt_jd_for_url("https://example.com/wayne/7")
+    assert get_boilerplate_model(path).docs == len(companies)
@@ -0,0 +1,302 @@
+"""Indexed JD store (jd_store.py): offset index, segments, compaction, TTL, legacy JSON migration."""
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from apps.cli.legacy.core import jd_store
+from apps.cli.legacy.core.jd_store import JDStore, get_jd_store, train_zlib_dictionary
+from apps.cli.legacy.core.utils import cleanup_jd_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_store_registry():
+    jd_store.close_all_stores()
+    yield
+    jd_store.close_all_stores()
+
+
+def test_put_get_roundtrip_and_reopen(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put("https://example.com/a", "Alpha JD ✓", "2026-04-01")
+    s.put("https://example.com/b", "Beta JD", "2026-04-02")
+    assert s.get_jd("https://example.com/a") == "Alpha JD ✓"
+    assert s.get("https://example.com/b") == {"jd": "Beta JD", "timestamp": "2026-04-02"}
+    assert s.get("https://example.com/missing") is None
+    s.close()
+
+    s2 = JDStore(path)
+    assert len(s2) == 2
+    assert s2.get_jd("https://example.com/a") == "Alpha JD ✓"
+
+
+def test_upsert_latest_wins_and_identical_put_skips_append(tmp_path):
+    s = JDStore(str(tmp_path / "jd_cache.json"))
+    s.put("u", "v1", "2026-04-01")
+    s.put("u", "v2", "2026-04-02")
+    assert s.get_jd("u") == "v2"
+    size = s.stats()["total_bytes"]
+    s.put("u", "v2", "2026-04-03")
+    assert s.stats()["total_bytes"] == size
+
+
+def test_replays_records_appended_after_index_snapshot(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put("u1", "one")
+    s.flush()
+    s.put("u2", "two")  # not in the snapshot
+
+    s2 = JDStore(path)
+    assert s2.get_jd("u1") == "one"
+    assert s2.get_jd("u2") == "two"
+
+
+def test_torn_tail_record_is_truncated(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put("u1", "one")
+    with open(s.log_paths[-1], "ab") as f:
+        f.write(b'{"u": "u2", "t": "2026-04-01", "n": 50}\nshort')
+
+    s2 = JDStore(path)
+    assert s2.get_jd("u1") == "one"
+    assert "u2" not in s2
+    s2.put("u3", "three")
+    assert JDStore(path).get_jd("u3") == "three"
+
+
+def test_migrates_legacy_json_both_formats(tmp_path):
+    path = tmp_path / "jd_cache.json"
+    path.write_text(
+        json.dumps(
+            {
+                "https://example.com/new": {"jd": "new format", "timestamp": "2026-04-01"},
+                "https://example.com/old": "old string format",
+            }
+        ),
+        encoding="utf-8",
+    )
+    s = JDStore(str(path))
+    assert s.get("https://example.com/new") == {"jd": "new format", "timestamp": "2026-04-01"}
+    assert s.get_jd("https://example.com/old") == "old string format"
+    s.put("https://example.com/new", "store wins")
+    s.close()
+
+    # Unchanged JSON is not re-imported; store writes are not overwritten.
+    s2 = JDStore(str(path))
+    assert s2.get_jd("https://example.com/new") == "store wins"
+
+
+def test_registry_shares_store_per_path(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    assert get_jd_store(path) is get_jd_store(path)
+
+
+def test_client_write_through_and_lookup(tmp_path, monkeypatch):
+    import apps.cli.legacy.core.google_sheets_client as gsc
+
+    monkeypatch.chdir(tmp_path)
+    c = gsc.GoogleSheetsClient(jd_cache_path=str(tmp_path / "jd_cache.json"))
+    c._save_jd_cache({"https://example.com/job/1": {"jd": "full jd", "timestamp": "2026-04-10"}})
+    assert c.get_jd_for_url("https://example.com/job/1/?utm_source=x") == "full jd"
+    assert c._load_jd_cache() == {"https://example.com/job/1": {"jd": "full jd", "timestamp": "2026-04-10"}}
+
+
+def test_active_segment_rotates(tmp_path, monkeypatch):
+    monkeypatch.setattr(jd_store, "SEGMENT_MAX_BYTES", 64)
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    for i in range(5):
+        s.put(f"u{i}", "x" * 40, "2026-04-01")
+    assert len(s.log_paths) >= 3
+    s.close()
+    s2 = JDStore(path)
+    assert [s2.get_jd(f"u{i}") for i in range(5)] == ["x" * 40] * 5
+
+
+def test_compaction_drops_superseded_records(tmp_path, monkeypatch):
+    monkeypatch.setattr(jd_store, "COMPACT_MIN_BYTES", 0)
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put("keep", "k" * 100, "2026-04-01")
+    for i in range(5):
+        s.put("hot", f"{i}" * 100, "2026-04-01")
+    st = s.stats()
+    assert st["garbage_bytes"] <= st["total_bytes"] - st["garbage_bytes"]
+    assert s.get_jd("hot") == "4" * 100
+    assert s.get_jd("keep") == "k" * 100
+    s.close()
+    assert JDStore(path).get_jd("hot") == "4" * 100
+
+
+def test_evict_expired_and_cleanup_jd_cache(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    old = (datetime.now() - timedelta(days=45)).strftime("%Y-%m-%d")
+    today = datetime.now().strftime("%Y-%m-%d")
+    s = get_jd_store(path)
+    s.put("old", "stale jd", old)
+    s.put("new", "fresh jd", today)
+    s.put("weird", "kept", "not-a-date")
+    removed, migrated = cleanup_jd_cache(path, ttl_days=30)
+    assert (removed, migrated) == (1, 0)
+    assert "old" not in s
+    assert s.get_jd("new") == "fresh jd"
+    assert s.get_jd("weird") == "kept"
+    s.compact()
+    s.close()
+    assert "old" not in JDStore(path)
+
+
+def test_second_instance_sees_appends_from_first(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    a = JDStore(path)
+    b = JDStore(path)
+    a.put("u1", "one")
+    assert b.get_jd("u1") == "one"  # miss triggers replay of a's tail
+    b.put("u2", "two")
+    assert a.get_jd("u2") == "two"
+
+
+def test_segments_left_by_interrupted_compaction_are_discarded(tmp_path, monkeypatch):
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put("u", "v1")
+    s.put("u", "v2")
+    stale = s.log_paths[0]
+    with open(stale, "rb") as f:
+        stale_bytes = f.read()
+    s.compact()
+    s.close()
+    with open(stale, "wb") as f:  # compaction crashed before deleting its input
+        f.write(stale_bytes)
+    s2 = JDStore(path)
+    assert s2.get_jd("u") == "v2"
+    assert not os.path.exists(stale)
+
+
+_BOILERPLATE = (
+    "We are an equal opportunity employer and value diversity at our company.\n"
+    "All qualified applicants will receive consideration without regard to race, color, religion.\n"
+    "Benefits include medical, dental and vision insurance, 401(k) matching and unlimited PTO.\n"
+)
+
+
+def _jd(i: int) -> str:
+    return f"Role {i}: own the roadmap for product area {i * 7919 % 1000}.\n" + _BOILERPLATE
+
+
+def test_train_zlib_dictionary_keeps_recurring_lines():
+    d = train_zlib_dictionary([_jd(i) for i in range(5)], min_doc_freq=3)
+    assert b"equal opportunity employer" in d
+    assert b"Role 1:" not in d
+
+
+def test_compressed_records_roundtrip_with_trained_dictionary(tmp_path, monkeypatch):
+    monkeypatch.setattr(jd_store, "DICT_TRAIN_MIN_ENTRIES", 10)
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    s.put_many({f"u{i}": {"jd": _jd(i), "timestamp": "2026-04-01"} for i in range(12)})
+    assert s._dict_id
+    assert all(loc[4] == f"zd:{s._dict_id}" for loc in s._index.values())
+    raw_bytes = sum(len(_jd(i).encode("utf-8")) for i in range(12))
+    assert s.stats()["live_payload_bytes"] < raw_bytes / 2
+    s.close()
+
+    s2 = JDStore(path)
+    assert [s2.get_jd(f"u{i}") for i in range(12)] == [_jd(i) for i in range(12)]
+    s2.put("late", _jd(99))
+    assert JDStore(path).get_jd("late") == _jd(99)
+
+
+def test_codec_none_and_raw_records_stay_readable(tmp_path, monkeypatch):
+    path = str(tmp_path / "jd_cache.json")
+    monkeypatch.setenv("JD_STORE_CODEC", "none")
+    s = JDStore(path)
+    s.put("raw", _jd(1))
+    assert s._index["raw"][4] == ""
+    s.close()
+    monkeypatch.setenv("JD_STORE_CODEC", "zlib")
+    s2 = JDStore(path)
+    s2.put("zipped", _jd(2))
+    assert s2._index["zipped"][4] == "z"
+    assert s2.get_jd("raw") == _jd(1)
+    assert s2.get_jd("zipped") == _jd(2)
+
+
+def test_miss_only_resyncs_when_segments_changed(tmp_path, monkeypatch):
+    path = str(tmp_path / "jd_cache.json")
+    a = JDStore(path)
+    b = JDStore(path)
+    a.put("u1", "one")
+    assert b.get_jd("u1") == "one"
+
+    syncs = []
+    real_sync = b._sync_from_disk
+    monkeypatch.setattr(b, "_sync_from_disk", lambda: syncs.append(1) or real_sync())
+    for i in range(20):
+        assert b.get(f"missing-{i}") is None
+    assert syncs == []
+
+    a.put("u2", "two")
+    assert b.get_jd("u2") == "two"
+    assert len(syncs) == 1
+
+
+def test_evicted_entries_stay_gone_after_rebuild_and_in_other_processes(tmp_path):
+    path = str(tmp_path / "jd_cache.json")
+    old = (datetime.now() - timedelta(days=45)).strftime("%Y-%m-%d")
+    a = JDStore(path)
+    other = JDStore(path)
+    a.put("old", "stale jd", old)
+    a.put("new", "fresh jd")
+    assert other.get_jd("old") == "stale jd"
+
+    assert a.evict_expired(ttl_days=30) == 1
+    a.close()
+    other.put("x", "from another process")  # replays a's tombstone
+    assert "old" not in other
+
+    os.remove(a.index_path)  # rebuild from the segments alone
+    rebuilt = JDStore(path)
+    assert "old" not in rebuilt
+    assert rebuilt.get_jd("new") == "fresh jd"
+    assert rebuilt.stats()["garbage_bytes"] > 0
+
+
+def test_failed_dictionary_training_waits_for_the_store_to_double(tmp_path, monkeypatch):
+    monkeypatch.setattr(jd_store, "DICT_TRAIN_MIN_ENTRIES", 10)
+    attempts = []
+    real_train = jd_store.train_zlib_dictionary
+
+    def _train(texts, **kw):
+        attempts.append(1)
+        return real_train(texts, **kw)
+
+    monkeypatch.setattr(jd_store, "train_zlib_dictionary", _train)
+    path = str(tmp_path / "jd_cache.json")
+    s = JDStore(path)
+    for i in range(19):
+        s.put(f"u{i}", f"unique posting number {i} with nothing shared")
+    assert len(attempts) == 1 and not s._dict_id
+    reopened = JDStore(path)
+    reopened._ensure_loaded()
+    assert reopened._dict_trained_entries == 10  # persisted in the index snapshot
+    s.put("u19", "unique posting number 19 with nothing shared")
+    assert len(attempts) == 2
+
+
+def test_sheet_sourcing_health_reports_segmented_store(tmp_path):
+    import importlib.util
+
+    script = os.path.join(os.path.dirname(__file__), "..", "scripts", "diagnostics", "sheet_sourcing_health.py")
+    spec = importlib.util.spec_from_file_location("sheet_sourcing_health", script)
+    health = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(health)
+
+    path = str(tmp_path / "jd_cache.json")
+    assert health._jd_cache_stats(path) == (0, False)
+    get_jd_store(path).put("https://example.com/a", "Alpha JD", "2026-04-01")
+    assert health._jd_cache_stats(path) == (1, True)
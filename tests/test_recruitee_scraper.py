@@ -17,7 +17,7 @@ def _resp(payload, status=200):
     return m
 
 
-@patch("apps.cli.legacy.scrapers.recruitee_scraper.requests.get")
+@patch("apps.cli.legacy.scrapers.recruitee_scraper.http_get")
 def test_recruitee_scrape_company_normalizes(mock_get):
     mock_get.return_value = _resp(
         {
@@ -40,7 +40,7 @@ def test_recruitee_scrape_company_normalizes(mock_get):
     assert jobs[0]["location"] == "New York, US"
 
 
-@patch("apps.cli.legacy.scrapers.recruitee_scraper.requests.get")
+@patch("apps.cli.legacy.scrapers.recruitee_scraper.http_get")
 def test_recruitee_skips_invalid_rows(mock_get):
     mock_get.return_value = _resp({"offers": [{"title": "Missing URL"}]})
     jobs = RecruiteeScraper(companies=["acme"]).scrape_company("acme")
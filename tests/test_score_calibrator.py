@@ -0,0 +1,81 @@
+"""score_calibrator: compiled CalibrationModel keeps compute_calibration_delta / DecisionAudit unchanged."""
+from __future__ import annotations
+
+import random
+
+import yaml
+
+from apps.cli.legacy.core.learning_schemas import LearnedPattern
+from apps.cli.legacy.core.score_calibrator import (
+    CalibrationModel,
+    apply_calibration,
+    compute_calibration_delta,
+    load_calibration_model,
+)
+
+
+def _legacy_delta(hay, patterns, max_abs_delta=15):
+    delta = 0.0
+    matched = []
+    for pat in patterns:
+        pv = (pat.pattern_value or "").strip().lower()
+        if len(pv) < 2 or pv not in hay:
+            continue
+        w = pat.weight_adjustment * max(0.1, min(1.0, pat.confidence))
+        delta = delta - w if pat.pattern_type == "penalize" else delta + w
+        matched.append(
+            {
+                "pattern_type": pat.pattern_type,
+                "pattern_value": pat.pattern_value,
+                "contribution": round(w, 4) if pat.pattern_type == "boost" else -round(w, 4),
+            }
+        )
+    return max(-max_abs_delta, min(max_abs_delta, int(round(delta)))), matched
+
+
+def test_model_matches_per_pattern_scan():
+    rng = random.Random(3)
+    words = ["sql", "python", "stakeholder", "roadmap", "clearance", "onsite", "agile", "b2b", "saas", "a"]
+    patterns = [
+        LearnedPattern(
+            pattern_type=rng.choice(["boost", "penalize"]),
+            pattern_value=" ".join(rng.sample(words, rng.randint(1, 2))).upper() if i % 3 else rng.choice(words),
+            weight_adjustment=rng.uniform(0.5, 6.0),
+            confidence=rng.uniform(0.0, 1.2),
+        )
+        for i in range(400)
+    ]
+    model = CalibrationModel(patterns)
+    assert model._automaton is not None
+    for _ in range(50):
+        jd = " ".join(rng.choice(words) for _ in range(rng.randint(0, 40)))
+        hay = " ".join([jd, "Product Manager", "Acme"]).lower()
+        assert compute_calibration_delta(jd, "Product Manager", "Acme", patterns=model) == _legacy_delta(hay, patterns)
+        assert compute_calibration_delta(jd, "Product Manager", "Acme", patterns=patterns[:50]) == _legacy_delta(
+            hay, patterns[:50]
+        )
+
+
+def test_audit_unchanged_and_model_cached_per_file_version(tmp_path):
+    path = tmp_path / "learned_patterns.yaml"
+    rows = [
+        {"pattern_type": "boost", "pattern_value": "Roadmap", "weight_adjustment": 4.0, "confidence": 0.5},
+        {"pattern_type": "penalize", "pattern_value": "clearance", "weight_adjustment": 10.0, "confidence": 1.0},
+    ]
+    path.write_text(yaml.safe_dump({"patterns": rows}), encoding="utf-8")
+
+    model = load_calibration_model(str(path))
+    assert load_calibration_model(str(path)) is model
+    final, audit = apply_calibration(70, "Own the roadmap; clearance required", patterns=model, cycle_id="c1")
+    assert final == 62
+    assert audit.to_json() == (
+        '{"base_llm_score": 70, "calibration_delta": -8, "final_score": 62, "matched_patterns": '
+        '[{"pattern_type": "boost", "pattern_value": "Roadmap", "contribution": 2.0}, '
+        '{"pattern_type": "penalize", "pattern_value": "clearance", "contribution": -10.0}], '
+        '"cycle_id": "c1", "notes": ""}'
+    )
+
+    path.write_text(yaml.safe_dump({"patterns": rows[:1]}) + "\n", encoding="utf-8")
+    reloaded = load_calibration_model(str(path))
+    assert reloaded is not model and len(reloaded) == 1
+    assert len(load_calibration_model(str(tmp_path / "missing.yaml"))) == 0
@@ -68,7 +68,7 @@ def test_jd_cache_saved_before_append(tmp_path, monkeypatch):
             self.get_existing_urls = MagicMock(return_value=set())
             self.get_applied_urls = MagicMock(return_value=set())
 
-        def _with_retries(self, fn, op_name="operation", retries=None, base_sleep=None):
+        def _with_retries(self, fn, op_name="operation", retries=None, base_sleep=None, kind=None):
             return track_with_retries(fn, op_name=op_name, retries=retries, base_sleep=base_sleep)
 
     monkeypatch.setattr(gsc, "get_worksheet_tab_date", lambda: "2026-04-10")
@@ -0,0 +1,54 @@
+"""Column-projected status / score queries (sheet_query.py + GoogleSheetsClient.select_rows)."""
+from fake_sheets import HEADERS, FakeWorksheet, row
+
+import apps.cli.legacy.core.google_sheets_client as gsc
+
+TAB = "2026-04-03"
+
+
+def _client(monkeypatch):
+    monkeypatch.setenv("SHEET_TAB_DATE", TAB)
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+    ws = FakeWorksheet(
+        TAB,
+        [
+            HEADERS,
+            row("EVALUATED", "https://x.com/1", score="91"),
+            row("NEW", "https://x.com/2"),
+            row("EVALUATED", "https://x.com/3", score="72"),
+            row("new", "https://x.com/4"),
+            row("NEEDS_REVIEW", "https://x.com/5"),
+            row("EVALUATED", "https://x.com/6", score="n/a"),
+        ],
+        sheet_id=7,
+    )
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c.sheet = ws
+    c._worksheet_header_row_cache = {}
+    return c, ws
+
+
+def test_count_evaluated_min_score_reads_only_two_columns(monkeypatch):
+    c, ws = _client(monkeypatch)
+    assert c.count_evaluated_jobs_min_score(80) == 1
+    assert c.count_evaluated_jobs_min_score(70) == 2
+    assert ws.calls == ["row_values:1", "batch_get", "batch_get"]  # header row cached after first call
+
+
+def test_get_jobs_by_criteria_fetches_only_matching_rows(monkeypatch):
+    c, ws = _client(monkeypatch)
+    jobs, got_ws = c.get_new_jobs(limit=10)
+    assert got_ws is ws
+    assert [j["_row_index"] for j in jobs] == [3, 5]
+    assert jobs[0]["Job Link"] == "https://x.com/2" and jobs[0]["Role Title"] == "PM"
+    assert jobs[0]["_worksheet"] is ws
+    assert c.get_new_jobs(limit=1)[0][0]["_row_index"] == 3
+
+
+def test_select_rows_projection_and_backlog_counts(monkeypatch):
+    c, _ws = _client(monkeypatch)
+    out = c.select_rows(where={"Status": "EVALUATED"}, min_values={"Apply Score": 90}, columns=["Job Link"])
+    assert out == [{"Job Link": "https://x.com/1", "_row_index": 2}]
+    counts = c.count_by_column("Status")
+    assert (counts["NEW"], counts["NEEDS_REVIEW"], counts["LLM_FAILED"]) == (2, 1, 0)
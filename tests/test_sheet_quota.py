@@ -0,0 +1,138 @@
+"""Sheets write coalescing (sheet_write_buffer.py) and quota pacing (sheet_quota.py)."""
+import gspread
+import pytest
+from fake_sheets import HEADERS, FakeWorksheet, row
+
+import apps.cli.legacy.core.google_sheets_client as gsc
+from apps.cli.legacy.core.sheet_quota import SheetsQuota, TokenBucket, is_write_op
+from apps.cli.legacy.core.sheet_write_buffer import value_ranges
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, s):
+        self.slept.append(s)
+        self.now += s
+
+
+def test_token_bucket_allows_burst_then_paces_to_rate():
+    clock = _Clock()
+    bucket = TokenBucket(60, burst_sec=3, clock=clock, sleep=clock.sleep)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == [1.0, 1.0]
+    bucket.drain()
+    assert bucket.acquire() == 1.0
+    assert TokenBucket(0, clock=clock, sleep=clock.sleep).acquire() == 0.0
+
+
+def test_quota_counts_reads_writes_and_wait():
+    clock = _Clock()
+    q = SheetsQuota(60, 60, burst_sec=1, clock=clock, sleep=clock.sleep)
+    for op in ("batch_get_columns", "flush_writes", "append_rows"):
+        q.acquire(op)
+        q.record(op)
+    q.add_bytes(120)
+    q.on_quota_error("append_rows")
+    stats = q.stats.as_dict()
+    assert (stats["reads"], stats["writes"], stats["requests"]) == (1, 2, 3)
+    assert stats["bytes_sent"] == 120 and stats["quota_errors"] == 1
+    assert stats["throttle_wait_sec"] == 1.0
+    assert is_write_op("ensure_columns") and not is_write_op("header_row")
+
+
+def test_value_ranges_merges_rows_with_the_same_span():
+    cells = {(2, 1): "EVALUATED", (2, 3): "91", (3, 1): "EVALUATED", (3, 3): "70", (5, 2): "x"}
+    assert value_ranges(cells) == [
+        {"range": "A2:C3", "values": [["EVALUATED", None, "91"], ["EVALUATED", None, "70"]]},
+        {"range": "B5:B5", "values": [["x"]]},
+    ]
+
+
+def test_coalesced_writes_flush_once_before_a_read(monkeypatch):
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+    monkeypatch.setenv("SHEET_TAB_DATE", "2026-04-03")
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS), row("NEW", "https://x.com/1"), row("NEW", "https://x.com/2")])
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c.sheet = ws
+    c._worksheet_header_row_cache = {}
+    c._write_coalesce_sec = 60
+    update = (2, "Strong", "PM", "Yes", "Confirmed", "", 91, "fits")
+    c.update_evaluated_jobs(ws, [update])
+    c.update_evaluated_jobs(ws, [(3,) + update[1:]])
+    c.update_resume_for_row(ws, 2, "/tmp/r.pdf")
+    assert "values_batch_update" not in ws.calls
+
+    c.count_rows(where={"Status": "EVALUATED"})
+    assert ws.calls.count("values_batch_update") == 1
+    assert ws.calls.index("values_batch_update") < ws.calls.index("batch_get")
+    assert [r[0] for r in ws.rows[1:]] == ["EVALUATED", "EVALUATED"]
+    assert ws.rows[1][ws.rows[0].index("Resume Path")] == "/tmp/r.pdf"
+
+
+def test_failed_flush_keeps_cells_queued(monkeypatch):
+    monkeypatch.setenv("SHEETS_RETRY_MAX", "1")
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS)])
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+
+    def boom(data, raw=True):
+        raise RuntimeError("backend error")
+
+    ws.batch_update = boom
+    try:
+        c._write_cells(ws, [gspread.Cell(2, 1, "EVALUATED")])
+    except RuntimeError:
+        pass
+    assert c._write_buffer.pending_cells() == 1
+
+
+def test_failed_worksheet_does_not_drop_other_worksheets_writes(monkeypatch):
+    monkeypatch.setenv("SHEETS_RETRY_MAX", "1")
+    bad = FakeWorksheet("bad", [list(HEADERS)], sheet_id=1)
+    good = FakeWorksheet("good", [list(HEADERS)], sheet_id=2)
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c._write_coalesce_sec = 60
+
+    def boom(data, raw=True):
+        raise RuntimeError("backend error")
+
+    bad.batch_update = boom
+    c._write_cells(bad, [gspread.Cell(2, 1, "old")])
+    c._write_cells(good, [gspread.Cell(2, 1, "EVALUATED")])
+    with pytest.raises(gsc.SheetsWriteError, match="'bad'"):
+        c.flush_writes()
+    assert good.rows[1][0] == "EVALUATED"
+    assert c._write_buffer.pending_cells() == 1
+
+    # Reads log the failure instead of raising; cells queued meanwhile win over the requeued ones.
+    c.flush_writes(raise_errors=False)
+    c._write_buffer.add(bad, [gspread.Cell(2, 1, "new")])
+    c._write_buffer.requeue(bad, {(2, 1): "old", (3, 1): "x"})
+    assert c._write_buffer.take(bad)[0][1] == {(2, 1): "new", (3, 1): "x"}
+
+
+def test_every_sheets_call_site_declares_read_or_write():
+    import ast
+    import inspect
+
+    tree = ast.parse(inspect.getsource(gsc))
+    sites = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "attr", "") == "_with_retries":
+            kw = {k.arg: k.value for k in node.keywords}
+            # Every call site declares its bucket, including the pass-through callers (op_name variable).
+            assert isinstance(kw.get("kind"), ast.Constant), ast.unparse(node)
+            if isinstance(kw.get("op_name"), ast.Constant):
+                sites[kw["op_name"].value] = kw["kind"].value
+    assert sites["manual_tailor_add_header"] == sites["manual_tailor_add_resume_col"] == "write"
+    assert sites["manual_tailor_header_resume"] == "read"  # row_values(1)
+    # The op_name fallback agrees with every declared kind.
+    assert {op: ("write" if is_write_op(op) else "read") for op in sites} == sites
+    assert is_write_op("header_row", kind="write") and not is_write_op("flush_writes", kind="read")
@@ -0,0 +1,83 @@
+"""Per-worksheet header schema (sheet_schema.py + GoogleSheetsClient.ensure_columns)."""
+from fake_sheets import HEADERS, FakeWorksheet, row
+
+import apps.cli.legacy.core.google_sheets_client as gsc
+from apps.cli.legacy.core.sheet_schema import (
+    DAILY_TAB_COLUMNS,
+    EVALUATION_COLUMNS,
+    append_headers_requests,
+    missing_columns,
+)
+
+
+def _client(monkeypatch, ws):
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c.sheet = ws
+    c._worksheet_header_row_cache = {}
+    c._header_cache_ttl_sec = 900
+    return c
+
+
+def test_missing_columns_and_single_request_grid_growth():
+    assert missing_columns([" Status ", "Apply Score"], ["Status", "Reasoning", "Reasoning", "Apply Score"]) == ["Reasoning"]
+    reqs = append_headers_requests(7, 9, ["A", "B", "C"], col_count=10)
+    assert reqs[0]["appendDimension"]["length"] == 4  # 2 short + headroom
+    assert [v["userEnteredValue"]["stringValue"] for v in reqs[1]["updateCells"]["rows"][0]["values"]] == ["A", "B", "C"]
+    assert len(append_headers_requests(7, 0, ["A"], col_count=26)) == 1
+
+
+def test_ensure_columns_adds_all_missing_headers_in_one_batch(monkeypatch):
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS), row("NEW", "https://x.com/1")], col_count=10)
+    c = _client(monkeypatch, ws)
+    cols = c.ensure_columns(ws, DAILY_TAB_COLUMNS)
+    assert ws.calls == ["row_values:1", "resize", "batch_update"]
+    assert ws.col_count >= len(ws.rows[0])
+    assert ws.rows[0][: len(HEADERS)] == HEADERS
+    assert cols["Apply Score"] == HEADERS.index("Apply Score") + 1
+    assert all(ws.rows[0][cols[name] - 1] == name for name in DAILY_TAB_COLUMNS)
+    assert c.ensure_columns(ws, EVALUATION_COLUMNS) == {n: cols[n] for n in EVALUATION_COLUMNS}
+    assert ws.calls == ["row_values:1", "resize", "batch_update"]
+
+
+def test_repeated_evaluation_writes_make_no_header_calls(monkeypatch):
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS), row("NEW", "https://x.com/1"), row("NEW", "https://x.com/2")])
+    c = _client(monkeypatch, ws)
+    c.ensure_columns(ws, DAILY_TAB_COLUMNS)  # what connect() does for the daily tab
+    update = (2, "Strong", "PM", "Yes", "Confirmed", "", 91, "fits")
+    c.update_evaluated_jobs(ws, [update])
+    c.update_evaluated_jobs(ws, [(3,) + update[1:]])
+    c.update_resume_for_row(ws, 2, "/tmp/r.pdf")
+    assert ws.calls == [
+        "row_values:1",
+        "resize",
+        "batch_update",
+        "values_batch_update",
+        "values_batch_update",
+        "values_batch_update",
+    ]
+    headers = ws.rows[0]
+    assert ws.rows[2][headers.index("Apply Bucket")] == "MUST_APPLY"
+    assert ws.rows[1][headers.index("Resume Path")] == "/tmp/r.pdf"
+
+
+def test_header_cache_expires_after_ttl(monkeypatch):
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS)])
+    c = _client(monkeypatch, ws)
+    c._header_row(ws)
+    key = c._worksheet_cache_key(ws)
+    headers, fetched = c._worksheet_header_row_cache[key]
+    c._worksheet_header_row_cache[key] = (headers, fetched - 901)
+    c._header_row(ws)
+    assert ws.calls == ["row_values:1", "row_values:1"]
+
+
+def test_get_or_create_col_index_keeps_caller_headers_in_sync(monkeypatch):
+    ws = FakeWorksheet("2026-04-03", [list(HEADERS)])
+    c = _client(monkeypatch, ws)
+    headers = list(HEADERS)
+    assert c._get_or_create_col_index(ws, "Digest Sent", headers) == len(HEADERS) + 1
+    assert headers[-1] == "Digest Sent"
+    assert c._get_or_create_col_index(ws, "Digest Sent") == len(HEADERS) + 1
+    assert ws.calls == ["batch_update"]
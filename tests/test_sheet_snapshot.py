@@ -0,0 +1,49 @@
+"""Workbook URL snapshot (sheet_snapshot.py): batched column reads shared by the dedupe URL-set methods."""
+from fake_sheets import HEADERS, FakeSpreadsheet, FakeWorksheet, row
+
+import apps.cli.legacy.core.google_sheets_client as gsc
+from apps.cli.legacy.core.sheet_snapshot import fetch_workbook_url_snapshot
+
+
+def _workbook():
+    return FakeSpreadsheet(
+        [
+            FakeWorksheet("2026-04-01", [HEADERS, row("EVALUATED", "https://x.com/a?utm_source=z"), row("NEW", "https://x.com/b", "Y")]),
+            FakeWorksheet("Bob's tab", [HEADERS, row("NEW", "https://x.com/c"), row("", "")]),
+            FakeWorksheet("Notes", [["Free text"]]),
+            FakeWorksheet("Empty", []),
+        ]
+    )
+
+
+def test_snapshot_derives_all_sets_in_two_batch_reads():
+    wb = _workbook()
+    snap = fetch_workbook_url_snapshot(wb, gsc.normalize_job_url)
+    assert wb.batch_calls == 2
+    assert snap.existing_urls == {"https://x.com/a", "https://x.com/b", "https://x.com/c"}
+    assert snap.applied_urls == {"https://x.com/b"}
+    assert snap.evaluated_or_applied_urls == {"https://x.com/a", "https://x.com/b"}
+    assert snap.tabs == 4
+
+
+def test_client_url_methods_share_one_snapshot_until_ttl(monkeypatch):
+    wb = _workbook()
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c._cached_existing_urls = c._cached_applied_urls = c._cached_evaluated_or_applied_urls = None
+    c._workbook_snapshot = None
+    c._url_snapshot_ttl_sec = 600
+    c._open_workbook = lambda: wb
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+
+    assert "https://x.com/c" in c.get_existing_urls()
+    assert c.get_applied_urls() == {"https://x.com/b"}
+    assert c.get_already_evaluated_or_applied_canonical_urls() == {"https://x.com/a", "https://x.com/b"}
+    assert wb.batch_calls == 2
+
+    c._workbook_snapshot.fetched_at -= 601
+    c.get_applied_urls()
+    assert wb.batch_calls == 4
+    gsc.GoogleSheetsClient.invalidate_sheet_url_caches(c)
+    c.get_existing_urls()
+    assert wb.batch_calls == 6
@@ -0,0 +1,61 @@
+"""Server-side daily tab sort (sheet_sort.py + GoogleSheetsClient.sort_daily_jobs)."""
+from fake_sheets import FakeWorksheet
+
+import apps.cli.legacy.core.google_sheets_client as gsc
+from apps.cli.legacy.core.sheet_sort import encode_sort_key
+
+TAB = "2026-04-03"
+HEADERS = ["Status", "Role Title", "Company", "Job Link", "Apply Score", "Match Type", "Recommended Resume"]
+
+
+def _row(url, score, match, title="Analyst", rec=""):
+    return ["EVALUATED", title, "Acme", url, score, match, rec]
+
+
+def _client(monkeypatch, ws):
+    monkeypatch.setenv("SHEET_TAB_DATE", TAB)
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c.sheet = ws
+    c._worksheet_header_row_cache = {}
+    return c
+
+
+def test_encode_sort_key_preserves_tuple_order():
+    keys = [(-95, 1, 1), (-95, 1, 0), (-70, 2, 0), (-70, 1, 1), (0, 99, 1), (0, 5, 0), (-120, 1, 1)]
+    assert sorted(keys) == sorted(keys, key=encode_sort_key)
+
+
+def test_sort_uses_sort_range_and_matches_python_order(monkeypatch):
+    rows = [
+        _row("https://x.com/1", "60", "⚖️ Worth Considering"),
+        _row("https://x.com/2", "91", "🚀 Must-Apply"),
+        _row("https://x.com/3", "", "", title="Product Manager"),
+        _row("https://x.com/4", "91", "🚀 Must-Apply", title="Product Manager"),
+        _row("https://x.com/5", "72", "✅ Strong Match"),
+    ]
+    ws = FakeWorksheet(TAB, [list(HEADERS)] + [list(r) for r in rows], col_count=8)
+    c = _client(monkeypatch, ws)
+    expected = [r[3] for r in sorted(rows, key=lambda r: c.get_sort_key_for_row(r, HEADERS))]
+
+    c.sort_daily_jobs()
+    assert [r[3] for r in ws.rows[1:]] == expected
+    assert ws.calls == ["row_values:1", "batch_update", "batch_get", "values_batch_update", "batch_update"]
+
+    c.sort_daily_jobs()  # nothing written since the last sort
+    assert len(ws.calls) == 5
+
+    ws.rows[-1][4] = "99"  # e.g. re-evaluated row
+    c._sort_pending = True
+    c.sort_daily_jobs()
+    assert ws.rows[1][3] == expected[-1]
+    assert ws.calls[5:] == ["batch_get", "values_batch_update", "batch_update"]
+
+
+def test_sort_without_changed_keys_sends_only_sort_range(monkeypatch):
+    ws = FakeWorksheet(TAB, [list(HEADERS), _row("https://x.com/1", "80", "✅ Strong Match")], col_count=8)
+    c = _client(monkeypatch, ws)
+    c.sort_daily_jobs()
+    c.sort_daily_jobs(force=True)
+    assert ws.calls[-2:] == ["batch_get", "batch_update"]
@@ -0,0 +1,92 @@
+"""Persistent URL-status index (sheet_url_index.py): cold full pull, then only current / changed tabs."""
+from fake_sheets import HEADERS, FakeSpreadsheet, FakeWorksheet, row
+
+from apps.cli.legacy.core.google_sheets_client import normalize_job_url
+from apps.cli.legacy.core.sheet_url_index import load_url_snapshot, lookup_url, sync_url_index
+
+
+def _workbook():
+    return FakeSpreadsheet(
+        [
+            FakeWorksheet("2026-04-01", [HEADERS, row("EVALUATED", "https://x.com/a", score="88")], sheet_id=1),
+            FakeWorksheet("2026-04-02", [HEADERS, row("NEW", "https://x.com/b", "Y")], sheet_id=2),
+            FakeWorksheet("2026-04-03", [HEADERS, row("NEW", "https://x.com/c")], sheet_id=3),
+        ]
+    )
+
+
+def _sync(wb, db, **kw):
+    return sync_url_index(wb, "2026-04-03", normalize_job_url, db_path=db, recent_days=0, full_resync_hours=168, **kw)
+
+
+def _tabs_read(wb):
+    return {r.split("!")[0].strip("'") for r in wb.ranges_read}
+
+
+def test_cold_start_reads_all_tabs_then_only_current_tab(tmp_path):
+    db = str(tmp_path / "idx.db")
+    wb = _workbook()
+    assert _sync(wb, db)["full"] is True
+    assert _tabs_read(wb) == {"2026-04-01", "2026-04-02", "2026-04-03"}
+    snap = load_url_snapshot(db)
+    assert snap.existing_urls == {"https://x.com/a", "https://x.com/b", "https://x.com/c"}
+    assert snap.applied_urls == {"https://x.com/b"}
+    assert lookup_url("https://x.com/a", db) == [
+        {"tab": "2026-04-01", "row": 2, "status": "EVALUATED", "applied": "", "score": "88"}
+    ]
+
+    # Untouched workbook: nothing re-read.
+    wb.ranges_read.clear()
+    assert _sync(wb, db)["unchanged"] is True
+    assert wb.ranges_read == []
+
+    # Today's tab grows: only today's tab is re-read.
+    wb.modified = "2026-04-03T10:00:00Z"
+    wb.tabs[2].rows.append(row("NEW", "https://x.com/d"))
+    stats = _sync(wb, db)
+    assert stats["full"] is False and _tabs_read(wb) == {"2026-04-03"}
+    assert "https://x.com/d" in load_url_snapshot(db).existing_urls
+
+
+def test_resized_tab_is_refreshed_and_deleted_tab_dropped(tmp_path):
+    db = str(tmp_path / "idx.db")
+    wb = _workbook()
+    _sync(wb, db)
+    wb.modified = "2026-04-03T11:00:00Z"
+    wb.tabs[0].rows.append(row("NEW", "https://x.com/e"))
+    wb.tabs[0].row_count = 2000
+    del wb.tabs[1]
+    wb.ranges_read.clear()
+    _sync(wb, db)
+    assert _tabs_read(wb) == {"2026-04-01", "2026-04-03"}
+    snap = load_url_snapshot(db)
+    assert "https://x.com/e" in snap.existing_urls
+    assert "https://x.com/b" not in snap.existing_urls
+
+
+def test_other_spreadsheet_forces_full_resync(tmp_path):
+    db = str(tmp_path / "idx.db")
+    _sync(_workbook(), db)
+    other = FakeSpreadsheet([FakeWorksheet("2026-04-03", [HEADERS, row("NEW", "https://y.com/z")])], sheet_id="wb2")
+    assert _sync(other, db)["full"] is True
+    assert load_url_snapshot(db).existing_urls == {"https://y.com/z"}
+
+
+def test_client_dedupe_sets_come_from_index(tmp_path, monkeypatch):
+    import apps.cli.legacy.core.google_sheets_client as gsc
+
+    monkeypatch.setenv("SHEET_URL_INDEX_DB", str(tmp_path / "idx.db"))
+    monkeypatch.setenv("SHEET_TAB_DATE", "2026-04-03")
+    monkeypatch.setenv("SHEETS_MIN_REQUEST_INTERVAL_SEC", "0")
+    wb = _workbook()
+    c = gsc.GoogleSheetsClient.__new__(gsc.GoogleSheetsClient)
+    c.client = object()
+    c._cached_existing_urls = c._cached_applied_urls = c._cached_evaluated_or_applied_urls = None
+    c._workbook_snapshot = None
+    c._url_snapshot_ttl_sec = 0
+    c._url_index_enabled = True
+    c._open_workbook = lambda: wb
+    assert c.get_applied_urls() == {"https://x.com/b"}
+    wb.ranges_read.clear()
+    assert c.get_already_evaluated_or_applied_canonical_urls() == {"https://x.com/a", "https://x.com/b"}
+    assert wb.ranges_read == []  # workbook unchanged since the index sync
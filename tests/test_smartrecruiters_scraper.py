@@ -17,7 +17,7 @@ def _resp(payload, status=200):
     return m
 
 
-@patch("apps.cli.legacy.scrapers.smartrecruiters_scraper.requests.get")
+@patch("apps.cli.legacy.scrapers.smartrecruiters_scraper.http_get")
 def test_smartrecruiters_scrape_company_paginates(mock_get):
     mock_get.side_effect = [
         _resp({
@@ -51,7 +51,7 @@ def test_smartrecruiters_scrape_company_paginates(mock_get):
     assert jobs[1]["company"] == "acme"
 
 
-@patch("apps.cli.legacy.scrapers.smartrecruiters_scraper.requests.get")
+@patch("apps.cli.legacy.scrapers.smartrecruiters_scraper.http_get")
 def test_smartrecruiters_scrape_all_aggregates(mock_get):
     mock_get.return_value = _resp({"content": [], "totalFound": 0})
     jobs = SmartRecruitersScraper(companies=["one", "two"]).scrape_all()
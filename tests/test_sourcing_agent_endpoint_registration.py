@@ -31,13 +31,17 @@ def test_community_once_registers_new_sources_when_enabled():
     agent.community_scraper.scrape_all = lambda: []
     agent.jobright_scraper.scrape_all = lambda: []
     agent.arbeitnow_scraper.scrape = lambda queries=None: []
-    agent.ats_scraper.scrape_all = lambda: []
+    agent.ats_scraper.iter_boards = lambda: iter([])
     agent.remotive_scraper.scrape = lambda: []
     agent.remoteok_scraper.scrape = lambda: []
-    agent.ashby_scraper.scrape_all = lambda: []
+    agent.ashby_scraper.iter_boards = lambda: iter([])
     agent.dice_scraper.scrape = lambda queries=None, locations=None, limit=20: []
-    agent.smartrecruiters_scraper.scrape_all = lambda: [{"title": "PM", "company": "Acme", "url": "u", "location": "Remote", "source": "ATS_SmartRecruiters"}]
-    agent.recruitee_scraper.scrape_all = lambda: [{"title": "BA", "company": "Acme", "url": "u2", "location": "Remote", "source": "ATS_Recruitee"}]
+    agent.smartrecruiters_scraper.iter_boards = lambda: iter(
+        [("acme", [{"title": "PM", "company": "Acme", "url": "u", "location": "Remote", "source": "ATS_SmartRecruiters"}])]
+    )
+    agent.recruitee_scraper.iter_boards = lambda: iter(
+        [("acme", [{"title": "BA", "company": "Acme", "url": "u2", "location": "Remote", "source": "ATS_Recruitee"}])]
+    )
 
     with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
         out = agent.scrape_community_sources_once(skip_jobright=True)
@@ -45,3 +49,75 @@ def test_community_once_registers_new_sources_when_enabled():
     assert len(out) == 2
     assert any(j[0]["source"] == "ATS_SmartRecruiters" for j in captured if j)
     assert any(j[0]["source"] == "ATS_Recruitee" for j in captured if j)
+
+
+def test_community_once_commits_sync_state_only_for_saved_sources():
+    from apps.cli.legacy.core.sync_batch import defer_until_saved
+
+    cfg = {"ats_boards": {"greenhouse": [], "lever": [], "ashby": []}}
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        agent = SourcingAgent(sheets_client=None)
+
+    committed = []
+
+    def _source(name):
+        def _scrape(*args, **kwargs):
+            defer_until_saved(lambda: committed.append(name))  # e.g. the feed's ETag
+            return [{"title": "PM", "company": name, "url": f"https://x/{name}", "source": name}]
+
+        return _scrape
+
+    def _save(raw_jobs, use_ai_filter=False):
+        if raw_jobs[0]["source"] == "Remotive":
+            raise RuntimeError("sheet write failed")
+
+    agent.normalize_and_save = _save
+    agent.community_scraper.scrape_all = _source("Community")
+    agent.arbeitnow_scraper.scrape = lambda queries=None: []
+    agent.ats_scraper.iter_boards = lambda: iter([])
+    agent.remotive_scraper.scrape = _source("Remotive")
+    agent.remoteok_scraper.scrape = lambda: []
+    agent.ashby_scraper.iter_boards = lambda: iter([])
+    agent.dice_scraper.scrape = lambda queries=None, locations=None, limit=20: []
+
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        agent.scrape_community_sources_once(skip_jobright=True)
+
+    assert committed == ["Community"]
+
+
+def test_multi_board_sources_are_saved_before_the_fan_out_finishes(monkeypatch):
+    import threading
+
+    from core_agents.sourcing_agent import agent as agent_mod
+
+    monkeypatch.setattr(agent_mod, "_BOARD_SAVE_BATCH", 2)
+    cfg = {"ats_boards": {"greenhouse": [], "lever": [], "ashby": []}}
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        agent = SourcingAgent(sheets_client=None)
+
+    first_saved = threading.Event()
+    saved = []
+
+    def _save(raw_jobs, use_ai_filter=False):
+        saved.append([j["url"] for j in raw_jobs])
+        first_saved.set()
+
+    def _boards():
+        yield "a", [{"url": "a1"}, {"url": "a2"}]
+        # The last board only finishes after the first two jobs were filtered and saved.
+        assert first_saved.wait(5)
+        yield "b", [{"url": "b1"}]
+
+    agent.normalize_and_save = _save
+    for name in ("community_scraper", "arbeitnow_scraper", "remotive_scraper", "remoteok_scraper", "dice_scraper"):
+        scraper = getattr(agent, name)
+        scraper.scrape_all = scraper.scrape = lambda *a, **k: []
+    agent.ashby_scraper.iter_boards = lambda: iter([])
+    agent.ats_scraper.iter_boards = _boards
+
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        out = agent.scrape_community_sources_once(skip_jobright=True)
+
+    assert saved == [["a1", "a2"], ["b1"]]
+    assert len(out) == 3
@@ -0,0 +1,101 @@
+"""normalize_and_save: batched sniff + tag prompts, with single-job fallback for missing answers."""
+import json
+import os
+import re
+import sys
+from unittest.mock import patch
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core import sourcing_ai_cache  # noqa: E402
+from core_agents.sourcing_agent.agent import SourcingAgent  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _tmp_ai_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sourcing_ai_cache, "_CACHE", sourcing_ai_cache.SourcingAICache(str(tmp_path / "ai.db")))
+
+
+class _Sheets:
+    def __init__(self):
+        self.saved = []
+
+    def get_existing_urls(self):
+        return set()
+
+    def add_jobs(self, jobs):
+        self.saved.extend(jobs)
+
+
+class _FakeLLM:
+    def __init__(self):
+        self.calls = []
+
+    def generate_content(self, system_prompt, user_prompt, formatting_instruction=None, model=None):
+        titles = re.findall(r"### JOB (\d+)\nTitle: (.*)", user_prompt)
+        if titles:
+            self.calls.append(("batch", [t for _, t in titles]))
+            sniff = "HARD CONSTRAINTS" in system_prompt
+            answers = []
+            for n, title in titles:
+                if "drop" in title:
+                    continue
+                obj = {"id": int(n), "style": "Remote", "seniority": "Junior", "industry": "Tech"}
+                if sniff:
+                    obj["relevant"] = "Chef" not in title
+                answers.append(obj)
+            return "```json\n" + json.dumps(answers) + "\n```", "fake"
+        title = re.search(r"(?:Title|Job): (.*)", user_prompt).group(1)
+        self.calls.append(("single", title))
+        if "HARD CONSTRAINTS" in system_prompt:
+            return "YES", "fake"
+        return "Style: Onsite | Seniority: Mid | Industry: Other", "fake"
+
+
+def _run(titles, batch_size, use_ai_filter=True):
+    sheets = _Sheets()
+    cfg = {"ats_boards": {}, "ai_max_in_flight": 2, "ai_batch_size": batch_size}
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        agent = SourcingAgent(sheets_client=sheets)
+    agent.llm = _FakeLLM()
+    jobs = [{"title": t, "company": "Acme", "url": f"https://x.test/{i}", "description": "d" * 300} for i, t in enumerate(titles)]
+    agent.normalize_and_save(jobs, use_ai_filter=use_ai_filter, prefilter_stats={}, raw_count=len(jobs))
+    return sheets.saved, agent.llm.calls
+
+
+def test_one_prompt_sniffs_and_tags_each_batch():
+    titles = ["PM 1", "Chef", "PM 2", "PM 3", "PM 4"]
+    saved, calls = _run(titles, batch_size=3)
+
+    assert sorted(c[1] for c in calls) == [["PM 1", "Chef", "PM 2"], ["PM 3", "PM 4"]]
+    assert [j["title"] for j in saved] == ["PM 1", "PM 2", "PM 3", "PM 4"]
+    assert {j["tags"] for j in saved} == {"Style: Remote | Seniority: Junior | Industry: Tech"}
+
+
+def test_jobs_missing_from_batch_answer_fall_back_to_single_calls():
+    saved, calls = _run(["PM 1", "PM (drop) 2", "PM 3"], batch_size=5)
+
+    assert calls[0] == ("batch", ["PM 1", "PM (drop) 2", "PM 3"])
+    # Sniffed alone, then tagged alone (a one-job tag batch is sent as a single tag_job prompt).
+    assert calls[1:] == [("single", "PM (drop) 2"), ("single", "PM (drop) 2")]
+    assert [j["tags"] for j in saved] == [
+        "Style: Remote | Seniority: Junior | Industry: Tech",
+        "Style: Onsite | Seniority: Mid | Industry: Other",
+        "Style: Remote | Seniority: Junior | Industry: Tech",
+    ]
+
+
+def test_tag_only_batches_without_ai_filter():
+    saved, calls = _run(["Chef", "PM 1"], batch_size=5, use_ai_filter=False)
+    assert calls == [("batch", ["Chef", "PM 1"])]
+    assert [j["title"] for j in saved] == ["Chef", "PM 1"]
+
+
+def test_batch_size_one_keeps_per_job_prompts():
+    saved, calls = _run(["PM 1", "PM 2"], batch_size=1)
+    assert [kind for kind, _ in calls] == ["single"] * 4
+    assert len(saved) == 2
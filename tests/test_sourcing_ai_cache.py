@@ -0,0 +1,93 @@
+"""Content-addressed sniff / tag cache in front of the sourcing LLM calls."""
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core import sourcing_ai_cache  # noqa: E402
+from apps.cli.legacy.core.sourcing_ai_cache import TAG, SourcingAICache, content_key  # noqa: E402
+from core_agents.sourcing_agent.agent import SourcingAgent  # noqa: E402
+
+
+class _Sheets:
+    def __init__(self):
+        self.saved = []
+
+    def get_existing_urls(self):
+        return set()
+
+    def add_jobs(self, jobs):
+        self.saved.extend(jobs)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    c = SourcingAICache(str(tmp_path / "ai.db"))
+    monkeypatch.setattr(sourcing_ai_cache, "_CACHE", c)
+    return c
+
+
+def _agent(calls, engine="fake"):
+    cfg = {"ats_boards": {}, "ai_max_in_flight": 1, "ai_batch_size": 1}
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        agent = SourcingAgent(sheets_client=_Sheets())
+
+    def _sniff(job):
+        calls.append(("sniff", job["title"]))
+        return (True, "LLM failed - allowing through") if engine == "FAILED" else (True, "ok")
+
+    def _tag(job):
+        calls.append(("tag", job["title"]))
+        return "Tags: Unknown" if engine == "FAILED" else f"Tagged {job['title']}"
+
+    agent.ai_sniff_relevance = _sniff
+    agent.tag_job = _tag
+    return agent
+
+
+def _jobs(site):
+    desc = "Own the roadmap. " * 20
+    return [
+        {"title": "Product Manager", "company": "Acme", "url": f"https://{site}.test/1", "description": desc},
+        {"title": "Business Analyst", "company": "Beta", "url": f"https://{site}.test/2", "description": desc},
+    ]
+
+
+def test_repeat_postings_skip_the_llm_and_summary_reports_hits(cache, capsys):
+    calls = []
+    agent = _agent(calls)
+    agent.normalize_and_save(_jobs("linkedin") + _jobs("indeed"), use_ai_filter=True, prefilter_stats={}, raw_count=4)
+    assert sorted(calls) == sorted(
+        [("sniff", "Product Manager"), ("sniff", "Business Analyst"), ("tag", "Product Manager"), ("tag", "Business Analyst")]
+    )
+    assert [j["tags"] for j in agent.sheets_client.saved] == ["Tagged Product Manager", "Tagged Business Analyst"] * 2
+
+    calls.clear()
+    capsys.readouterr()
+    agent.normalize_and_save(_jobs("google"), use_ai_filter=True, prefilter_stats={}, raw_count=2)
+    assert calls == []
+    assert agent.sheets_client.saved[-1]["tags"] == "Tagged Business Analyst"
+    assert "AI sniff/tag cache: 4 hits, 0 misses" in capsys.readouterr().out
+
+
+def test_failed_answers_are_not_cached(cache):
+    calls = []
+    _agent(calls, engine="FAILED").normalize_and_save(_jobs("a"), use_ai_filter=True, prefilter_stats={}, raw_count=2)
+    calls.clear()
+    _agent(calls).normalize_and_save(_jobs("b"), use_ai_filter=True, prefilter_stats={}, raw_count=2)
+    assert len(calls) == 4
+
+
+def test_results_persist_and_key_ignores_case_and_spacing(cache, tmp_path):
+    job = {"title": "Product  Manager", "company": "ACME", "description": "Own the\n roadmap"}
+    same = {"title": "product manager", "company": "Acme", "description": "own the roadmap"}
+    assert content_key(job) == content_key(same) != content_key(same, "other context")
+
+    cache.put_many(TAG, {content_key(job): "Style: Remote"})
+    assert SourcingAICache(str(tmp_path / "ai.db")).get_many(TAG, [content_key(same)]) == {content_key(same): "Style: Remote"}
+    assert SourcingAICache(str(tmp_path / "ai.db"), ttl_days=0).get_many(TAG, [content_key(same)]) == {}
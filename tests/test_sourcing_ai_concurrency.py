@@ -0,0 +1,110 @@
+"""normalize_and_save: sniff / tag LLM calls run concurrently, bounded, with results in input order."""
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from apps.cli.legacy.core import sourcing_ai_cache  # noqa: E402
+from core_agents.sourcing_agent.agent import SourcingAgent  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _tmp_ai_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sourcing_ai_cache, "_CACHE", sourcing_ai_cache.SourcingAICache(str(tmp_path / "ai.db")))
+
+
+class _Sheets:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.saved = []
+
+    def get_existing_urls(self):
+        return set(self.existing)
+
+    def add_jobs(self, jobs):
+        self.saved.extend(jobs)
+
+
+def _agent(sheets, max_in_flight, batch_size=1):
+    cfg = {"ats_boards": {}, "ai_max_in_flight": max_in_flight, "ai_batch_size": batch_size}
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value=cfg):
+        return SourcingAgent(sheets_client=sheets)
+
+
+def test_sniff_and_tag_are_bounded_and_order_preserving():
+    sheets = _Sheets(existing={"https://x.test/job/3"})
+    agent = _agent(sheets, max_in_flight=3)
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def _slow(result):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return result
+
+    agent.ai_sniff_relevance = lambda job: _slow((job["n"] % 4 != 1, "fake"))
+    agent.tag_job = lambda job: _slow(f"Tag {job['n']}")
+    jobs = [
+        {"n": i, "title": f"PM {i}", "company": "Acme", "url": f"https://x.test/job/{i % 10}", "description": "d" * 300}
+        for i in range(12)
+    ]
+
+    agent.normalize_and_save(jobs, use_ai_filter=True, prefilter_stats={}, raw_count=len(jobs))
+
+    # n % 4 == 1 rejected by the sniffer, job/3 already on the sheet, n=10 repeats job/0 within the batch.
+    kept = [0, 2, 4, 6, 7, 8, 11]
+    assert [j["title"] for j in sheets.saved] == [f"PM {n}" for n in kept]
+    assert [j["tags"] for j in sheets.saved] == [f"Tag {n}" for n in kept]
+    assert 1 < state["peak"] <= 3
+
+
+def test_max_in_flight_one_runs_serially():
+    agent = _agent(_Sheets(), max_in_flight=1)
+    threads = set()
+
+    def _tag(job):
+        threads.add(threading.get_ident())
+        return "t"
+
+    assert agent._ai_map(_tag, [{}] * 5) == ["t"] * 5
+    assert threads == {threading.get_ident()}
+
+
+def test_shared_router_counts_every_sticky_call_and_failure():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from apps.cli.legacy.core.llm_router import LLMRouter
+
+    cfg = {"provider": "gemini", "provider_stickiness_enabled": True, "provider_stickiness_failures": 1000}
+    with patch("apps.cli.legacy.core.llm_router.get_evaluation_config", return_value=cfg):
+        router = LLMRouter()
+
+        def _slow(text):
+            def _call(*args, **kwargs):
+                time.sleep(0.001)
+                return text
+
+            return _call
+
+        router._sticky_provider, router._sticky_remaining_calls = "openai", 60
+        with patch.object(router, "_generate_openai", side_effect=_slow("ok")):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: router.generate_content("s", "u"), range(40)))
+        assert router._sticky_remaining_calls == 20
+
+        router._sticky_provider, router._sticky_remaining_calls = None, 0
+        with patch.object(router, "_generate_gemini", side_effect=_slow("")):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: router.generate_content("s", "u"), range(40)))
+        assert router._gemini_fail_streak == 40
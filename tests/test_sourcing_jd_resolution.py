@@ -0,0 +1,84 @@
+"""normalize_and_save JD stage: concurrent static fetches with a per-host cap, Playwright lane for misses."""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core_agents.sourcing_agent import agent as agent_mod  # noqa: E402
+from core_agents.sourcing_agent.agent import SourcingAgent  # noqa: E402
+
+JD = "Own the roadmap. " * 30
+
+
+def _agent(**cfg):
+    with patch("core_agents.sourcing_agent.agent.get_sourcing_config", return_value={"ats_boards": {}, **cfg}):
+        return SourcingAgent(sheets_client=None)
+
+
+def test_jds_resolved_concurrently_in_order_with_per_host_cap(monkeypatch):
+    monkeypatch.setattr(agent_mod, "playwright_available", lambda: True)
+    agent = _agent(jd_fetch_workers=6, jd_fetch_per_host=2, playwright_pool_size=1)
+    lock = threading.Lock()
+    in_flight, peak, deep_calls = Counter(), Counter(), []
+
+    def _static(url):
+        host = url.split("/")[2]
+        with lock:
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+        time.sleep(0.02)
+        with lock:
+            in_flight[host] -= 1
+        if url.endswith("js"):
+            return "", False, "static:selector_miss"
+        return JD + url, True, "static:.description"
+
+    def _playwright(url):
+        deep_calls.append(url)
+        if url.endswith("nojs"):
+            return "", False, "playwright:error"
+        return JD + JD + url, True, "playwright:selector"
+
+    agent._fetch_jd_static = _static
+    agent._fetch_jd_playwright = _playwright
+    urls = [f"https://{host}.test/job/{n}" for n in range(4) for host in ("a", "b", "c")]
+    urls[4] += "/js"
+    urls[7] += "/nojs"
+    jobs = [{"url": u, "description": ""} for u in urls]
+    jobs.insert(2, {"url": "https://a.test/src", "description": JD})
+    jobs.insert(5, {"url": "", "description": "short"})
+
+    results = agent._resolve_jds(jobs)
+
+    expected = []
+    for job in jobs:
+        u = job["url"]
+        if job["description"] == JD:
+            expected.append((JD, True, "source", ""))
+        elif not u:
+            expected.append(("short", False, "source", ""))
+        elif u.endswith("/nojs"):
+            expected.append(("", False, "static:selector_miss", "selector_only_jd_not_found"))
+        elif u.endswith("/js"):
+            expected.append((JD + JD + u, True, "playwright:selector", ""))
+        else:
+            expected.append((JD + u, True, "static:.description", ""))
+    assert results == expected
+    assert sorted(deep_calls) == sorted([urls[4], urls[7]])
+    assert max(peak.values()) == 2
+
+
+def test_static_only_when_playwright_unavailable(monkeypatch):
+    monkeypatch.setattr(agent_mod, "playwright_available", lambda: False)
+    agent = _agent()
+    agent._fetch_jd_static = lambda url: ("x" * 150, True, "static:main")
+    assert agent._resolve_jds([{"url": "https://a.test/1"}, {"url": "https://www.google.com/x"}]) == [
+        ("", False, "static:main", "selector_only_jd_not_found"),
+        ("", False, "skipped", "selector_only_jd_not_found"),
+    ]
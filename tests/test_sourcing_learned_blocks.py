@@ -11,8 +11,11 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from apps.cli.legacy.core.phrase_automaton import AhoCorasick  # noqa: E402
 from apps.cli.legacy.core.sourcing_learned_blocks import (  # noqa: E402
+    LearnedBlockMatcher,
     learned_block_hit,
+    load_learned_block_matcher,
     load_learned_blocked_phrases_for_filter,
     mine_blocking_phrases,
     title_features,
@@ -73,3 +76,36 @@ def test_load_learned_respects_apply_flag(tmp_path):
         sourcing_cfg={"apply_learned_title_blocks": True, "learned_title_blocks_path": "lb.yaml"},
     )
     assert got == ["salesforce"]
+
+
+def test_matcher_returns_first_phrase_in_list_order():
+    m = LearnedBlockMatcher(["sales ops", "salesforce", "sr.", "Customer Success", "success"])
+    assert m.first_hit("Customer Success Manager, Salesforce") == "salesforce"
+    assert m.first_hit("Customer Success Manager") == "customer success"
+    assert m.first_hit("Success Sales Ops") == "sales ops"
+    assert m.first_hit("Sr.Analyst") == "sr."
+    assert m.first_hit("Sr. Analyst") is None  # same \b semantics as the per-phrase regex
+    assert m.first_hit("Salesforced Analyst") is None
+    assert m.first_hit("   ") is None
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    ac = AhoCorasick(["he", "she", "his", "hers", ""])
+    assert ac.matched("ushers") == {0, 1, 3}
+    assert sorted(ac.iter_matches("ushers")) == [(3, 0), (3, 1), (5, 3)]
+
+
+def test_matcher_cached_per_file_version(tmp_path):
+    p = tmp_path / "lb.yaml"
+    p.write_text(yaml.dump({"blocked_phrases": ["salesforce"]}), encoding="utf-8")
+    cfg = {"apply_learned_title_blocks": True, "learned_title_blocks_path": "lb.yaml"}
+
+    m = load_learned_block_matcher(project_root=str(tmp_path), sourcing_cfg=cfg)
+    assert load_learned_block_matcher(project_root=str(tmp_path), sourcing_cfg=cfg) is m
+    assert m.first_hit("Salesforce Admin") == "salesforce"
+
+    p.write_text(yaml.dump({"blocked_phrases": ["salesforce", {"text": "Admin Lead"}]}), encoding="utf-8")
+    m2 = load_learned_block_matcher(project_root=str(tmp_path), sourcing_cfg=cfg)
+    assert m2 is not m
+    assert m2.phrases == ["salesforce", "admin lead"]
+    assert len(load_learned_block_matcher(project_root=str(tmp_path), sourcing_cfg={})) == 0
@@ -0,0 +1,26 @@
+"""Shared sqlite setup for the local stores: path resolution and WAL connections."""
+import os
+
+from apps.cli.legacy.core.sqlite_store import open_wal_db, resolve_db_path
+
+
+def test_resolve_db_path_prefers_env_then_config_then_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("X_TEST_DB", raising=False)
+    assert resolve_db_path("X_TEST_DB", "x_path", "data/x.db", {}) == str(tmp_path / "data" / "x.db")
+    assert resolve_db_path("X_TEST_DB", "x_path", "data/x.db", {"x_path": "cfg.db"}) == str(tmp_path / "cfg.db")
+    monkeypatch.setenv("X_TEST_DB", "/abs/env.db")
+    assert resolve_db_path("X_TEST_DB", "x_path", "data/x.db", {"x_path": "cfg.db"}) == "/abs/env.db"
+
+
+def test_open_wal_db_creates_parent_and_applies_schema(tmp_path):
+    path = str(tmp_path / "nested" / "dir" / "s.db")
+    conn = open_wal_db(path, "CREATE TABLE IF NOT EXISTS t (k TEXT PRIMARY KEY);")
+    assert os.path.exists(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    conn.execute("INSERT INTO t VALUES ('a')")
+    conn.commit()
+    # Idempotent schema: reopening an existing database keeps its rows.
+    assert open_wal_db(path, "CREATE TABLE IF NOT EXISTS t (k TEXT PRIMARY KEY);").execute(
+        "SELECT k FROM t"
+    ).fetchall() == [("a",)]
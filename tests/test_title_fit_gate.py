@@ -10,8 +10,12 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+import yaml  # noqa: E402
+
 from apps.cli.legacy.core.title_fit_gate import (  # noqa: E402
+    TitleFitEngine,
     evaluate_title_fit,
+    get_title_fit_engine,
     load_all_track_definitions,
     merge_track_with_user_overrides,
     pick_best_track,
@@ -165,3 +169,31 @@ def test_sniffer_helpers_return_strings():
 
     assert "Product" in sniffer_role_bullet_text() or "product" in sniffer_role_bullet_text().lower()
     assert "YOE" in sniffer_constraints_paragraph() or "yoe" in sniffer_constraints_paragraph().lower()
+
+
+def test_engine_evaluate_many_matches_single_calls(sample_tracks, base_user):
+    cfg = {"enabled": True, "require_track_match": True, "ambiguous_default": "reject"}
+    titles = ["Associate Product Manager", "Senior Product Manager", "Product Manager", "Registered Nurse"]
+    snippets = ["", "", "Minimum 8 years of experience required.", ""]
+    engine = TitleFitEngine(cfg, base_user, sample_tracks)
+    assert engine.evaluate_many(titles, snippets) == [
+        evaluate_title_fit(t, s, title_fit_cfg=cfg, user=base_user, all_tracks=sample_tracks)
+        for t, s in zip(titles, snippets)
+    ]
+
+
+def test_engine_cached_until_user_profile_changes(tmp_path, monkeypatch, base_user):
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    monkeypatch.delenv("MASTER_PROFILE_PATH", raising=False)
+    path = tmp_path / "title_fit_user.yaml"
+    path.write_text(yaml.safe_dump(base_user), encoding="utf-8")
+    cfg = {"enabled": True, "require_track_match": True}
+
+    engine = get_title_fit_engine(cfg)
+    assert get_title_fit_engine(cfg) is engine
+    assert evaluate_title_fit("Registered Nurse", "", title_fit_cfg=cfg)[1] == "Title fit: no matching track"
+
+    path.write_text(yaml.safe_dump({**base_user, "active_tracks": []}) + "\n", encoding="utf-8")
+    rebuilt = get_title_fit_engine(cfg)
+    assert rebuilt is not engine
+    assert rebuilt.evaluate("Registered Nurse", "")[2] == {"skipped": "no_active_tracks"}
@@ -0,0 +1,92 @@
+"""LLM title-fit disambiguation: persistent verdict cache + batched prompts."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from apps.cli.legacy.core import title_fit_gate, title_fit_verdicts
+from apps.cli.legacy.core.title_fit_gate import TitleFitEngine, load_all_track_definitions
+from apps.cli.legacy.core.title_fit_verdicts import VerdictCache, normalize_title
+
+USER = {
+    "active_tracks": ["product_management", "business_analysis"],
+    "effective_yoe": 2.0,
+    "first_formal_role_flags": {"has_titled_pm_role": False, "has_titled_ba_role": False},
+    "policy": "conservative",
+}
+
+
+class _FakeRouter:
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, system, user_prompt, formatting_instruction=None, model=None):
+        blob = json.loads(user_prompt)
+        self.prompts.append(blob)
+        if "jobs" in blob:
+            answers = [
+                {"id": j["id"], "verdict": "reject" if "manager" in j["title"].lower() else "pass", "reason": "ok"}
+                for j in blob["jobs"]
+                if "drop" not in j["title"].lower()
+            ]
+            return json.dumps(answers), "fake"
+        return json.dumps({"verdict": "pass", "reason": "single"}), "fake"
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    fake = _FakeRouter()
+    monkeypatch.setattr(title_fit_gate, "_ROUTER", fake)
+    monkeypatch.setattr(title_fit_verdicts, "_CACHE", VerdictCache(str(tmp_path / "verdicts.db")))
+    return fake
+
+
+def _engine(**cfg):
+    return TitleFitEngine({"enabled": True, "llm_disambiguation_enabled": True, **cfg}, USER, load_all_track_definitions())
+
+
+def test_ambiguous_titles_share_one_prompt_and_cache(router):
+    titles = ["Product Lead, Growth", "Product Lead - Growth", "Business Analyst Manager", "Associate Product Manager"]
+    results = _engine().evaluate_many(titles, [""] * len(titles))
+
+    assert len(router.prompts) == 1
+    assert [j["title"] for j in router.prompts[0]["jobs"]] == ["Product Lead, Growth", "Business Analyst Manager"]
+    assert [ok for ok, _, _ in results] == [True, True, False, True]
+    assert results[2][1] == "Title fit: ok"
+    assert results[0][2]["llm_disambiguation"] == "ok"
+
+    again = _engine().evaluate_many(titles, [""] * len(titles))
+    assert again == results
+    assert len(router.prompts) == 1
+    assert title_fit_verdicts._CACHE.hits == 2
+
+
+def test_verdicts_persist_across_processes(router, tmp_path):
+    _engine().evaluate_many(["Product Lead"], [""])
+    fresh = VerdictCache(str(tmp_path / "verdicts.db"))
+    key = title_fit_verdicts.verdict_key("product lead", "product_management", 2.0, USER)
+    assert fresh.get_many([key]) == {key: (True, "single")}
+    assert VerdictCache(str(tmp_path / "verdicts.db"), ttl_days=0).get_many([key]) == {}
+
+
+def test_titles_missing_from_batch_answer_fall_back_to_single_calls(router):
+    results = _engine().evaluate_many(["Product Lead", "Product Lead (drop)"], ["", ""])
+    assert [len(p.get("jobs", [])) for p in router.prompts] == [2, 0]
+    assert results[1][2]["llm_disambiguation"] == "single"
+
+
+def test_batch_size_one_sends_single_prompts(router):
+    _engine(llm_batch_size=1).evaluate_many(["Product Lead", "Business Analyst Manager"], ["", ""])
+    assert [("jobs" in p) for p in router.prompts] == [False, False]
+
+
+def test_failed_llm_answers_are_not_cached(router, monkeypatch):
+    monkeypatch.setattr(router, "generate_content", lambda *a, **k: ("", "FAILED"))
+    assert _engine().evaluate("Product Lead", "")[1] == "Title fit: LLM failed"
+    assert title_fit_verdicts._CACHE.get_many([title_fit_verdicts.verdict_key("Product Lead", "product_management", 2.0, USER)]) == {}
+
+
+def test_normalize_title():
+    assert normalize_title("  Product Manager - II ") == "product manager ii"
+    assert normalize_title("C++/C# Analyst") == "c++/c# analyst"